@@ -0,0 +1,52 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# micro-benchmark of the metadata parsers, comparing the per-record parse
+# time with the cached etree paths of the parser modules against evaluating
+# every path expression again (as util.nspath_eval does)
+
+import os
+import sys
+import timeit
+
+from owslib import dif, gm03, iso, util
+from owslib.catalogue import csw2
+from owslib.etree import etree
+
+RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'resources')
+
+PARSERS = [
+    ('iso', iso, iso.MD_Metadata, '9250AA67-F3AC-6C12-0CB9-0662231AA181_iso.xml'),
+    ('iso (service)', iso, iso.MD_Metadata, 'iso19139_srv.xml'),
+    ('gm03', gm03, gm03.GM03, 'gm03_example1.xml'),
+    ('dif', dif, dif.DIF, '9250AA67-F3AC-6C12-0CB9-0662231AA181_dif.xml'),
+    ('csw:Record', csw2, csw2.CswRecord, None),
+]
+
+RECORD = b"""<csw:Record xmlns:csw="http://www.opengis.net/cat/csw/2.0.2" xmlns:dc="http://purl.org/dc/elements/1.1/"
+  xmlns:dct="http://purl.org/dc/terms/" xmlns:ows="http://www.opengis.net/ows">
+  <dc:identifier>record</dc:identifier><dc:title>Title</dc:title><dc:type>dataset</dc:type>
+  <dc:subject>one</dc:subject><dc:subject>two</dc:subject><dct:abstract>Abstract</dct:abstract>
+  <dct:modified>2020-01-01</dct:modified><dc:format>text/xml</dc:format>
+  <ows:BoundingBox crs="EPSG:4326"><ows:LowerCorner>-90 -180</ows:LowerCorner>
+  <ows:UpperCorner>90 180</ows:UpperCorner></ows:BoundingBox>
+</csw:Record>"""
+
+number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+print('%-16s %12s %14s %8s' % ('parser', 'cached (us)', 'uncached (us)', 'speedup'))
+for name, module, cls, filename in PARSERS:
+    if filename is None:
+        elem = etree.fromstring(RECORD)
+    else:
+        elem = etree.parse(os.path.join(RESOURCES, filename)).getroot()
+
+    cached = min(timeit.repeat(lambda: cls(elem), number=number, repeat=5)) / number
+    nspath = module._nspath
+    module._nspath = lambda xpath: util.nspath_eval(xpath, module.namespaces)
+    try:
+        uncached = min(timeit.repeat(lambda: cls(elem), number=number, repeat=5)) / number
+    finally:
+        module._nspath = nspath
+
+    print('%-16s %12.1f %14.1f %7.2fx' % (name, cached * 1e6, uncached * 1e6, uncached / cached))
@@ -0,0 +1,103 @@
+"""
+Conversion of the text values of XML documents to numpy arrays
+
+Used by the columnar and array-backed time series (WaterML, SWE Common),
+which collect the text of their values in a single pass over the document
+and convert them in bulk.  numpy is an optional dependency of OWSLib, and
+is only imported once these are used.
+"""
+
+from datetime import timezone
+import re
+import warnings
+
+from dateutil import parser
+
+_numpy = None  # imported by require_numpy
+
+# ISO 8601 date-times parsed by numpy, once their UTC offset is taken apart
+_ISO_DATETIME = re.compile(r'\s*(\d{4}-\d\d-\d\d(?:[T ]\d\d:\d\d(?::\d\d(?:\.\d+)?)?)?)(Z|[+-]\d\d(?::?\d\d)?)?\s*$')
+
+
+def require_numpy(feature):
+    """
+    Return numpy, which is imported on first use
+
+    :param feature: description of what requires numpy, for the message of
+                    the ImportError raised if numpy is not available
+    :returns: numpy module
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('%s require numpy' % feature)
+        _numpy = numpy
+    return _numpy
+
+
+def float64_array(strings):
+    """
+    Return the float64 array of numbers
+
+    :param strings: list of the numbers, as strings
+    :returns: float64 array, NaN where the strings are None or not numeric
+    """
+    np = require_numpy('Arrays of numbers')
+    try:
+        return np.array(strings, dtype=np.float64)
+    except ValueError:
+        pass
+    result = np.empty(len(strings), dtype=np.float64)
+    for i, s in enumerate(strings):
+        try:
+            result[i] = float(s)
+        except (TypeError, ValueError):
+            result[i] = np.nan
+    return result
+
+
+def datetime64_array(strings):
+    """
+    Return the datetime64[ns] array of date-times
+
+    ISO 8601 date-times are parsed by numpy, other formats by dateutil.
+    Date-times with a UTC offset are converted to UTC, the others are kept
+    as is.
+
+    :param strings: list of the date-times, as strings
+    :returns: datetime64[ns] array, NaT where the strings are None
+    """
+    np = require_numpy('Arrays of date-times')
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')  # numpy warns about UTC offsets
+        try:
+            return np.array(strings, dtype='datetime64[ns]')
+        except (ValueError, Warning):
+            pass
+
+    bases, offsets, others = [], [], []
+    for i, s in enumerate(strings):
+        match = None if s is None else _ISO_DATETIME.match(s)
+        if match is None:
+            bases.append(None)
+            offsets.append(0)
+            if s is not None and s != 'NaT':
+                others.append(i)
+            continue
+        base, offset = match.groups()
+        bases.append(base)
+        if offset is None or offset == 'Z':
+            offsets.append(0)
+        else:
+            minutes = int(offset[1:3]) * 60 + int(offset[-2:] if len(offset) > 3 else 0)
+            offsets.append(-minutes if offset[0] == '-' else minutes)
+
+    result = np.array(bases, dtype='datetime64[ns]') - np.array(offsets, dtype='timedelta64[m]')
+    for i in others:
+        d = parser.parse(strings[i])
+        if d.tzinfo is not None:
+            d = d.astimezone(timezone.utc).replace(tzinfo=None)
+        result[i] = np.datetime64(d, 'ns')
+    return result
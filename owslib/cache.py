@@ -0,0 +1,282 @@
+"""
+Persistent cache of GetCapabilities documents
+
+Capabilities documents are stored on disk, keyed by their normalized URL
+and version, and served from there while they are younger than the cache's
+time-to-live.  Stale documents are revalidated with the ``ETag`` and
+``Last-Modified`` HTTP headers of the cached response (or the OWS
+``updateSequence`` of the document, for servers without them), so that an
+unchanged document costs a single ``304 Not Modified`` response instead of
+its download.
+
+The cache is used by the capabilities readers once it has been enabled::
+
+    from owslib.cache import CapabilitiesCache, set_default_cache
+
+    set_default_cache(CapabilitiesCache('/var/cache/owslib', ttl=3600))
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from owslib.etree import etree, ParseError
+from owslib.util import ServiceException, openURL
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CachedResponse(object):
+    """
+    Return object type from the cache.
+
+    Provides the interface of `owslib.util.ResponseWrapper`.
+    """
+    def __init__(self, content, headers, url):
+        self._content = content
+        self._headers = headers
+        self._url = url
+
+    def info(self):
+        return self._headers
+
+    def read(self):
+        return self._content
+
+    def geturl(self):
+        return self._url
+
+
+class CapabilitiesCache(object):
+    """
+    Size-bounded on-disk cache of capabilities documents
+
+    Documents are evicted in least recently used order once the total size
+    of the cache exceeds `max_size`.
+    """
+
+    def __init__(self, directory=None, ttl=3600, max_size=100 * 1024 * 1024):
+        """
+        :param directory: cache directory (default is ``owslib/capabilities``
+                          in the user's cache directory)
+        :param ttl: time (in seconds) during which documents are used without
+                    revalidation
+        :param max_size: maximum total size (in bytes) of the cached documents
+        """
+        if directory is None:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+            directory = os.path.join(base, 'owslib', 'capabilities')
+        self.directory = directory
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, url, version=None, username=None):
+        """
+        Return the cache key of a capabilities document
+
+        :param url: URL of the document
+        :param version: version of the document
+        :param username: user name the document is requested with
+        """
+        key = json.dumps([normalize_url(url), version, username])
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def open(self, url, data=None, version=None, **kwargs):
+        """
+        Return a capabilities document, from the cache if possible
+
+        :param url: URL of the document
+        :param data: (optional) query string to append to `url`
+        :param version: version of the document
+        :param kwargs: keyword arguments of :func:`owslib.util.openURL`
+
+        :returns: `CachedResponse` or `owslib.util.ResponseWrapper`
+        """
+        if data:
+            url = '%s%s%s' % (url, '&' if '?' in url else '?', data)
+        auth = kwargs.get('auth')
+        username = kwargs.get('username') or getattr(auth, 'username', None)
+        key = self.key(url, version, username)
+
+        entry = self._load(key)
+        if entry is not None and time.time() - entry['stored'] < self.ttl:
+            LOGGER.debug('Capabilities cache hit: %s' % url)
+            self.hits += 1
+            return self._response(key, entry)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        request_url = url
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            if entry.get('update_sequence') and 'If-None-Match' not in headers \
+                    and 'If-Modified-Since' not in headers:
+                request_url = '%s%s%s' % (url, '&' if '?' in url else '?',
+                                          urlencode({'updateSequence': entry['update_sequence']}))
+
+        try:
+            response = openURL(request_url, None, 'Get', headers=headers, **kwargs)
+        except ServiceException as err:
+            if request_url == url:
+                raise
+            if 'CurrentUpdateSequence' in str(err):
+                response = None
+            else:  # the server does not support updateSequence
+                response = openURL(url, None, 'Get', headers=headers, **kwargs)
+        else:
+            if request_url != url and response.status_code == 200:
+                # OWS Common servers may answer an unchanged updateSequence
+                # with a document without its sections
+                update_sequence = _update_sequence(response.read())
+                if update_sequence == entry['update_sequence']:
+                    response = None
+                elif update_sequence is None:
+                    response = openURL(url, None, 'Get', headers=headers, **kwargs)
+
+        if entry is not None and (response is None or response.status_code == 304):
+            LOGGER.debug('Capabilities cache revalidated: %s' % url)
+            self.revalidations += 1
+            entry['stored'] = time.time()
+            self._write(key + '.json', json.dumps(entry).encode('utf-8'))
+            return self._response(key, entry)
+
+        LOGGER.debug('Capabilities cache miss: %s' % url)
+        self.misses += 1
+        content = response.read()
+        info = response.info()
+        self._store(key, content, {
+            'url': url,
+            'version': version,
+            'stored': time.time(),
+            'content_type': info.get('Content-Type'),
+            'etag': info.get('ETag'),
+            'last_modified': info.get('Last-Modified'),
+            'update_sequence': _update_sequence(content),
+        })
+        return response
+
+    def clear(self):
+        """Remove all documents from the cache"""
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if name.endswith(('.xml', '.json')):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _load(self, key):
+        if not os.path.exists(self._path(key + '.xml')):
+            return None
+        try:
+            with open(self._path(key + '.json'), 'rb') as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _response(self, key, entry):
+        with open(self._path(key + '.xml'), 'rb') as f:
+            content = f.read()
+        os.utime(self._path(key + '.xml'))  # least recently used order
+        headers = {}
+        if entry.get('content_type'):
+            headers['Content-Type'] = entry['content_type']
+        return CachedResponse(content, headers, entry['url'])
+
+    def _write(self, name, content):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp, self._path(name))
+
+    def _store(self, key, content, entry):
+        with self._lock:
+            self._write(key + '.xml', content)
+            self._write(key + '.json', json.dumps(entry).encode('utf-8'))
+            self._evict()
+
+    def _evict(self):
+        documents = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.xml'):
+                try:
+                    stat = os.stat(self._path(name))
+                except OSError:
+                    continue
+                documents.append((stat.st_mtime, stat.st_size, name))
+
+        size = sum(document[1] for document in documents)
+        for _, document_size, name in sorted(documents):
+            if size <= self.max_size:
+                break
+            LOGGER.debug('Evicting %s from the capabilities cache' % name)
+            for path in (self._path(name), self._path(name[:-4] + '.json')):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            size -= document_size
+
+    def __repr__(self):
+        return '<%s directory=%r ttl=%s max_size=%s>' % (
+            self.__class__.__name__, self.directory, self.ttl, self.max_size)
+
+
+def normalize_url(url):
+    """
+    Normalize a URL for use as a cache key
+
+    The scheme and host are lowercased, and the query parameters sorted by
+    their (case-insensitive) name.
+    """
+    parts = urlsplit(url)
+    query = sorted((k.lower(), v) for k, v in parse_qsl(parts.query, keep_blank_values=True))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', urlencode(query), ''))
+
+
+def _update_sequence(content):
+    """Return the updateSequence of a capabilities document, if any"""
+    parser = etree.XMLPullParser(events=('start',))
+    try:
+        parser.feed(content[:65536])
+        for _, element in parser.read_events():
+            return element.get('updateSequence')
+    except (ParseError, ValueError):
+        pass
+    return None
+
+
+_default_cache = None
+
+
+def get_default_cache():
+    """
+    Return the capabilities cache used when no cache is given
+
+    :returns: `CapabilitiesCache`, or ``None`` if caching is disabled
+    """
+
+    return _default_cache
+
+
+def set_default_cache(cache):
+    """
+    Set the capabilities cache used when no cache is given
+
+    :param cache: `CapabilitiesCache`, or ``None`` to disable caching
+    """
+
+    global _default_cache
+    _default_cache = cache
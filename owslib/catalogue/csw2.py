@@ -9,12 +9,16 @@
 
 """ CSW 2.0.2 request and response processor """
 
-import inspect
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+import os
 import warnings
 from io import BytesIO
+from itertools import chain
 import random
 from urllib.parse import urlencode
 
+from owslib.cache import get_default_cache
 from owslib.etree import etree
 from owslib import fes
 from owslib import util
@@ -38,6 +42,7 @@ def get_namespaces():
 
 
 namespaces = get_namespaces()
+_nspath = util.nspath_cache(namespaces)  # etree paths of the namespaced path expressions
 schema = 'http://schemas.opengis.net/csw/2.0.2/CSW-discovery.xsd'
 schema_location = '%s %s' % (namespaces['csw'], schema)
 
@@ -45,7 +50,7 @@ schema_location = '%s %s' % (namespaces['csw'], schema)
 class CatalogueServiceWeb(object):
     """ csw request class """
     def __init__(self, url, lang='en-US', version='2.0.2', timeout=10, skip_caps=False,
-                 username=None, password=None, auth=None, headers=None):
+                 username=None, password=None, auth=None, headers=None, session=None, parse_processes=0):
         """
 
         Construct and process a GetCapabilities request
@@ -62,6 +67,9 @@ class CatalogueServiceWeb(object):
         - password: password for HTTP basic authentication
         - auth: instance of owslib.util.Authentication
         - headers: HTTP headers to send with requests
+        - session: instance of owslib.util.HTTPSession (default is the shared session)
+        - parse_processes: number of processes parsing the ISO 19139 records of responses, None for the
+          number of CPUs (default is 0, records are parsed in this process)
 
         """
         if auth:
@@ -75,8 +83,12 @@ class CatalogueServiceWeb(object):
         self.timeout = timeout
         self.auth = auth or Authentication(username, password)
         self.headers = headers
+        self.session = session
         self.service = 'CSW'
         self.exceptionreport = None
+        self.parse_processes = parse_processes
+        self._process_pool = None
+        self._operation_urls = {}
         self.owscommon = ows.OwsCommon('1.0.0')
 
         if not skip_caps:  # process GetCapabilities
@@ -86,36 +98,36 @@ class CatalogueServiceWeb(object):
 
             self.request = urlencode(data)
 
-            self._invoke()
+            self._invoke('GetCapabilities', capabilities=True)
 
             if self.exceptionreport is None:
                 self.updateSequence = self._exml.getroot().attrib.get('updateSequence')
 
                 # ServiceIdentification
-                val = self._exml.find(util.nspath_eval('ows:ServiceIdentification', namespaces))
+                val = self._exml.find(_nspath('ows:ServiceIdentification'))
                 if val is not None:
                     self.identification = ows.ServiceIdentification(val, self.owscommon.namespace)
                 else:
                     self.identification = None
                 # ServiceProvider
-                val = self._exml.find(util.nspath_eval('ows:ServiceProvider', namespaces))
+                val = self._exml.find(_nspath('ows:ServiceProvider'))
                 if val is not None:
                     self.provider = ows.ServiceProvider(val, self.owscommon.namespace)
                 else:
                     self.provider = None
                 # ServiceOperations metadata
                 self.operations = []
-                for elem in self._exml.findall(util.nspath_eval('ows:OperationsMetadata/ows:Operation', namespaces)):
+                for elem in self._exml.findall(_nspath('ows:OperationsMetadata/ows:Operation')):
                     self.operations.append(ows.OperationsMetadata(elem, self.owscommon.namespace))
                 self.constraints = {}
-                for elem in self._exml.findall(util.nspath_eval('ows:OperationsMetadata/ows:Constraint', namespaces)):
+                for elem in self._exml.findall(_nspath('ows:OperationsMetadata/ows:Constraint')):
                     self.constraints[elem.attrib['name']] = ows.Constraint(elem, self.owscommon.namespace)
                 self.parameters = {}
-                for elem in self._exml.findall(util.nspath_eval('ows:OperationsMetadata/ows:Parameter', namespaces)):
+                for elem in self._exml.findall(_nspath('ows:OperationsMetadata/ows:Parameter')):
                     self.parameters[elem.attrib['name']] = ows.Parameter(elem, self.owscommon.namespace)
 
                 # FilterCapabilities
-                val = self._exml.find(util.nspath_eval('ogc:Filter_Capabilities', namespaces))
+                val = self._exml.find(_nspath('ogc:Filter_Capabilities'))
                 self.filters = fes.FilterCapabilities(val)
 
     def describerecord(self, typename='csw:Record', format=outputformat):
@@ -137,16 +149,28 @@ class CatalogueServiceWeb(object):
         node0.set('version', self.version)
         node0.set('outputFormat', format)
         node0.set('schemaLanguage', namespaces['xs2'])
-        node0.set(util.nspath_eval('xsi:schemaLocation', namespaces), schema_location)
-        etree.SubElement(node0, util.nspath_eval('csw:TypeName', namespaces)).text = typename
+        node0.set(_nspath('xsi:schemaLocation'), schema_location)
+        etree.SubElement(node0, _nspath('csw:TypeName')).text = typename
 
         self.request = node0
 
-        self._invoke()
+        self._invoke('DescribeRecord')
 
         # parse result
         # TODO: process the XML Schema (you're on your own for now with self.response)
 
+    def close(self):
+        """ Shut down the process pool parsing records, if any """
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def getdomain(self, dname, dtype='parameter'):
         """
 
@@ -165,29 +189,29 @@ class CatalogueServiceWeb(object):
         node0 = self._setrootelement('csw:GetDomain')
         node0.set('service', self.service)
         node0.set('version', self.version)
-        node0.set(util.nspath_eval('xsi:schemaLocation', namespaces), schema_location)
+        node0.set(_nspath('xsi:schemaLocation'), schema_location)
         if dtype == 'property':
             dtypename = 'PropertyName'
-        etree.SubElement(node0, util.nspath_eval('csw:%s' % dtypename, namespaces)).text = dname
+        etree.SubElement(node0, _nspath('csw:%s' % dtypename)).text = dname
 
         self.request = node0
 
         try:
-            self._invoke()
+            self._invoke('GetDomain')
 
             if self.exceptionreport is None:
                 self.results = {}
 
-                val = self._exml.find(util.nspath_eval('csw:DomainValues', namespaces)).attrib.get('type')
+                val = self._exml.find(_nspath('csw:DomainValues')).attrib.get('type')
                 self.results['type'] = util.testXMLValue(val, True)
 
-                val = self._exml.find(util.nspath_eval('csw:DomainValues/csw:%s' % dtypename, namespaces))
+                val = self._exml.find(_nspath('csw:DomainValues/csw:%s' % dtypename))
                 self.results[dtype] = util.testXMLValue(val)
 
                 # get the list of values associated with the Domain
                 self.results['values'] = []
 
-                for f in self._exml.findall(util.nspath_eval('csw:DomainValues/csw:ListOfValues/csw:Value', namespaces)): # noqa
+                for f in self._exml.findall(_nspath('csw:DomainValues/csw:ListOfValues/csw:Value')): # noqa
                     self.results['values'].append(util.testXMLValue(f))
         except Exception:
             self.results = {'values': []}
@@ -225,7 +249,7 @@ class CatalogueServiceWeb(object):
 
         if xml is not None:
             self.request = etree.fromstring(xml)
-            val = self.request.find(util.nspath_eval('csw:Query/csw:ElementSetName', namespaces))
+            val = self.request.find(_nspath('csw:Query/csw:ElementSetName'))
             if val is not None:
                 esn = util.testXMLValue(val)
         else:
@@ -239,12 +263,12 @@ class CatalogueServiceWeb(object):
             if startposition > 0:
                 node0.set('startPosition', str(startposition))
             node0.set('maxRecords', str(maxrecords))
-            node0.set(util.nspath_eval('xsi:schemaLocation', namespaces), schema_location)
+            node0.set(_nspath('xsi:schemaLocation'), schema_location)
 
-            node1 = etree.SubElement(node0, util.nspath_eval('csw:Query', namespaces))
+            node1 = etree.SubElement(node0, _nspath('csw:Query'))
             node1.set('typeNames', typenames)
 
-            etree.SubElement(node1, util.nspath_eval('csw:ElementSetName', namespaces)).text = esn
+            etree.SubElement(node1, _nspath('csw:ElementSetName')).text = esn
 
             self._setconstraint(node1, qtype, propertyname, keywords, bbox, cql, None)
 
@@ -253,19 +277,19 @@ class CatalogueServiceWeb(object):
 
             self.request = node0
 
-        self._invoke()
+        self._invoke('GetRecords')
 
         if self.exceptionreport is None:
             self.results = {}
 
             # process search results attributes
             val = self._exml.find(
-                util.nspath_eval('csw:SearchResults', namespaces)).attrib.get('numberOfRecordsMatched')
+                _nspath('csw:SearchResults')).attrib.get('numberOfRecordsMatched')
             self.results['matches'] = int(util.testXMLValue(val, True))
             val = self._exml.find(
-                util.nspath_eval('csw:SearchResults', namespaces)).attrib.get('numberOfRecordsReturned')
+                _nspath('csw:SearchResults')).attrib.get('numberOfRecordsReturned')
             self.results['returned'] = int(util.testXMLValue(val, True))
-            val = self._exml.find(util.nspath_eval('csw:SearchResults', namespaces)).attrib.get('nextRecord')
+            val = self._exml.find(_nspath('csw:SearchResults')).attrib.get('nextRecord')
             self.results['nextrecord'] = int(util.testXMLValue(val, True))
 
             # process list of matching records
@@ -301,7 +325,7 @@ class CatalogueServiceWeb(object):
 
         self.request = urlencode(data)
 
-        self._invoke()
+        self._invoke('GetRecordById')
 
         if self.exceptionreport is None:
             self.results = {}
@@ -343,7 +367,7 @@ class CatalogueServiceWeb(object):
 
             if startswith_xml:
                 self.request = etree.fromstring(xml)
-                val = self.request.find(util.nspath_eval('csw:Query/csw:ElementSetName', namespaces))
+                val = self.request.find(_nspath('csw:Query/csw:ElementSetName'))
                 if val is not None:
                     esn = util.testXMLValue(val)
                 val = self.request.attrib.get('outputSchema')
@@ -353,67 +377,86 @@ class CatalogueServiceWeb(object):
                 self.request = xml
         else:
             # construct request
-            node0 = self._setrootelement('csw:GetRecords')
-            node0.set('outputSchema', outputschema)
-            node0.set('outputFormat', format)
-            node0.set('version', self.version)
-            node0.set('service', self.service)
-            node0.set('resultType', resulttype)
-            if startposition > 0:
-                node0.set('startPosition', str(startposition))
-            node0.set('maxRecords', str(maxrecords))
-            node0.set(util.nspath_eval('xsi:schemaLocation', namespaces), schema_location)
-
-            if distributedsearch:
-                etree.SubElement(node0, util.nspath_eval('csw:DistributedSearch', namespaces), hopCount=str(hopcount))
-
-            node1 = etree.SubElement(node0, util.nspath_eval('csw:Query', namespaces))
-            node1.set('typeNames', typenames)
+            self.request = self._setgetrecords(constraints, sortby, typenames, esn, outputschema, format,
+                                               startposition, maxrecords, cql, resulttype, distributedsearch,
+                                               hopcount)
 
-            etree.SubElement(node1, util.nspath_eval('csw:ElementSetName', namespaces)).text = esn
-
-            if any([len(constraints) > 0, cql is not None]):
-                node2 = etree.SubElement(node1, util.nspath_eval('csw:Constraint', namespaces))
-                node2.set('version', '1.1.0')
-                flt = fes.FilterRequest()
-                if len(constraints) > 0:
-                    node2.append(flt.setConstraintList(constraints))
-                # Now add a CQL filter if passed in
-                elif cql is not None:
-                    etree.SubElement(node2, util.nspath_eval('csw:CqlText', namespaces)).text = cql
-
-            if sortby is not None and isinstance(sortby, fes.SortBy):
-                node1.append(sortby.toXML())
-
-            self.request = node0
-
-        self._invoke()
+        self._invoke('GetRecords')
 
         if self.exceptionreport is None:
-            self.results = {}
-
             # process search results attributes
-            val = self._exml.find(
-                util.nspath_eval('csw:SearchResults', namespaces)).attrib.get('numberOfRecordsMatched')
-            self.results['matches'] = int(util.testXMLValue(val, True))
-            val = self._exml.find(
-                util.nspath_eval('csw:SearchResults', namespaces)).attrib.get('numberOfRecordsReturned')
-            self.results['returned'] = int(util.testXMLValue(val, True))
-            val = self._exml.find(util.nspath_eval('csw:SearchResults', namespaces)).attrib.get('nextRecord')
-            if val is not None:
-                self.results['nextrecord'] = int(util.testXMLValue(val, True))
-            else:
+            self.results = self._parsesearchresults(self._exml)
+            if self.results['nextrecord'] is None:
                 warnings.warn("""CSW Server did not supply a nextRecord value (it is optional), so the client
                 should page through the results in another way.""")
                 # For more info, see:
                 # https://github.com/geopython/OWSLib/issues/100
-                self.results['nextrecord'] = None
 
             # process list of matching records
             self.records = OrderedDict()
 
             self._parserecords(outputschema, esn)
 
+    def iter_records(self, constraints=[], sortby=None, typenames='csw:Record', esn='summary',
+                     outputschema=namespaces['csw'], format=outputformat, startposition=1, page_size=10, cql=None):
+        """
+
+        Iterate over all the records matching a query, paging through the
+        results of GetRecords requests
+
+        The next page is requested while the records of the current page are
+        parsed, and the records are neither kept in `records` nor the
+        responses in `response`, so that large catalogues can be harvested
+        in constant memory.
+
+        Parameters
+        ----------
+
+        - constraints: the list of constraints (OgcExpression from owslib.fes module)
+        - sortby: an OGC SortBy object (SortBy from owslib.fes module)
+        - typenames: the typeNames to query against (default is csw:Record)
+        - esn: the ElementSetName 'full', 'brief' or 'summary' (default is 'summary')
+        - outputschema: the outputSchema (default is 'http://www.opengis.net/cat/csw/2.0.2')
+        - format: the outputFormat (default is 'application/xml')
+        - startposition: position of the first record (default is 1)
+        - page_size: the number of records requested per page (default is 10)
+        - cql: common query language text, used when no constraints are given
+
+        Yields (identifier, record) tuples, in the order of the results
+
+        """
+
+        request_url = self._operation_url('GetRecords', False)
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        def fetch(position):
+            request = self._setgetrecords(constraints, sortby, typenames, esn, outputschema, format,
+                                          position, page_size, cql)
+            request, response = self._send(request_url, request)
+            return self._parseresponse(response, request_url, request)
+
+        future = executor.submit(fetch, startposition)
+        try:
+            while future is not None:
+                exml = future.result()
+                future = None
+                results = self._parsesearchresults(exml)
+                nextrecord = results['nextrecord']
+                if nextrecord is None:  # page through the results by their count
+                    nextrecord = startposition + results['returned']
+                    if nextrecord > results['matches']:
+                        nextrecord = 0
+                if results['returned'] > 0 and nextrecord > startposition:
+                    startposition = nextrecord
+                    future = executor.submit(fetch, startposition)
+                for identifier, record in self._iterrecords(exml, outputschema, esn):
+                    yield identifier, record
+                del exml
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def transaction(self, ttype=None, typename='csw:Record', record=None, propertyname=None, propertyvalue=None,
                     bbox=None, keywords=[], cql=None, identifier=None):
         """
@@ -439,14 +482,14 @@ class CatalogueServiceWeb(object):
         node0 = self._setrootelement('csw:Transaction')
         node0.set('version', self.version)
         node0.set('service', self.service)
-        node0.set(util.nspath_eval('xsi:schemaLocation', namespaces), schema_location)
+        node0.set(_nspath('xsi:schemaLocation'), schema_location)
 
         validtransactions = ['insert', 'update', 'delete']
 
         if ttype not in validtransactions:  # invalid transaction
             raise RuntimeError('Invalid transaction \'%s\'.' % ttype)
 
-        node1 = etree.SubElement(node0, util.nspath_eval('csw:%s' % ttype.capitalize(), namespaces))
+        node1 = etree.SubElement(node0, _nspath('csw:%s' % ttype.capitalize()))
 
         if ttype != 'update':
             node1.set('typeName', typename)
@@ -461,9 +504,9 @@ class CatalogueServiceWeb(object):
                 node1.append(etree.fromstring(record))
             else:
                 if propertyname is not None and propertyvalue is not None:
-                    node2 = etree.SubElement(node1, util.nspath_eval('csw:RecordProperty', namespaces))
-                    etree.SubElement(node2, util.nspath_eval('csw:Name', namespaces)).text = propertyname
-                    etree.SubElement(node2, util.nspath_eval('csw:Value', namespaces)).text = propertyvalue
+                    node2 = etree.SubElement(node1, _nspath('csw:RecordProperty'))
+                    etree.SubElement(node2, _nspath('csw:Name')).text = propertyname
+                    etree.SubElement(node2, _nspath('csw:Value')).text = propertyvalue
                     self._setconstraint(node1, None, propertyname, keywords, bbox, cql, identifier)
 
         if ttype == 'delete':
@@ -471,7 +514,7 @@ class CatalogueServiceWeb(object):
 
         self.request = node0
 
-        self._invoke()
+        self._invoke('Transaction')
         self.results = {}
 
         if self.exceptionreport is None:
@@ -498,27 +541,27 @@ class CatalogueServiceWeb(object):
         node0 = self._setrootelement('csw:Harvest')
         node0.set('version', self.version)
         node0.set('service', self.service)
-        node0.set(util.nspath_eval('xsi:schemaLocation', namespaces), schema_location)
-        etree.SubElement(node0, util.nspath_eval('csw:Source', namespaces)).text = source
-        etree.SubElement(node0, util.nspath_eval('csw:ResourceType', namespaces)).text = resourcetype
+        node0.set(_nspath('xsi:schemaLocation'), schema_location)
+        etree.SubElement(node0, _nspath('csw:Source')).text = source
+        etree.SubElement(node0, _nspath('csw:ResourceType')).text = resourcetype
         if resourceformat is not None:
-            etree.SubElement(node0, util.nspath_eval('csw:ResourceFormat', namespaces)).text = resourceformat
+            etree.SubElement(node0, _nspath('csw:ResourceFormat')).text = resourceformat
         if harvestinterval is not None:
-            etree.SubElement(node0, util.nspath_eval('csw:HarvestInterval', namespaces)).text = harvestinterval
+            etree.SubElement(node0, _nspath('csw:HarvestInterval')).text = harvestinterval
         if responsehandler is not None:
-            etree.SubElement(node0, util.nspath_eval('csw:ResponseHandler', namespaces)).text = responsehandler
+            etree.SubElement(node0, _nspath('csw:ResponseHandler')).text = responsehandler
 
         self.request = node0
 
-        self._invoke()
+        self._invoke('Harvest')
         self.results = {}
 
         if self.exceptionreport is None:
-            val = self._exml.find(util.nspath_eval('csw:Acknowledgement', namespaces))
+            val = self._exml.find(_nspath('csw:Acknowledgement'))
             if util.testXMLValue(val) is not None:
                 ts = val.attrib.get('timeStamp')
                 self.timestamp = util.testXMLValue(ts, True)
-                id = val.find(util.nspath_eval('csw:RequestId', namespaces))
+                id = val.find(_nspath('csw:RequestId'))
                 self.id = util.testXMLValue(id)
             else:
                 self._parsetransactionsummary()
@@ -554,59 +597,132 @@ class CatalogueServiceWeb(object):
 
     def _parseinsertresult(self):
         self.results['insertresults'] = []
-        for i in self._exml.findall('.//' + util.nspath_eval('csw:InsertResult', namespaces)):
-            for j in i.findall(util.nspath_eval('csw:BriefRecord/dc:identifier', namespaces)):
+        for i in self._exml.findall('.//' + _nspath('csw:InsertResult')):
+            for j in i.findall(_nspath('csw:BriefRecord/dc:identifier')):
                 self.results['insertresults'].append(util.testXMLValue(j))
 
     def _parserecords(self, outputschema, esn):
+        for identifier, record in self._iterrecords(self._exml, outputschema, esn):
+            self.records[identifier] = record
+
+    def _iterrecords(self, exml, outputschema, esn):
+        """ Yield the (identifier, record) tuples of a GetRecords or GetRecordById response """
         if outputschema == namespaces['gmd']:  # iso 19139
-            for i in self._exml.findall('.//' + util.nspath_eval('gmd:MD_Metadata', namespaces)) or \
-                    self._exml.findall('.//' + util.nspath_eval('gmi:MI_Metadata', namespaces)):
-                val = i.find(util.nspath_eval('gmd:fileIdentifier/gco:CharacterString', namespaces))
+            elems = exml.findall('.//' + _nspath('gmd:MD_Metadata')) or \
+                exml.findall('.//' + _nspath('gmi:MI_Metadata'))
+            if self.parse_processes != 0 and len(elems) > 1:
+                records = self._parseisorecords(elems)
+            else:
+                records = (MD_Metadata(i) for i in elems)
+            for i, record in zip(elems, records):
+                val = i.find(_nspath('gmd:fileIdentifier/gco:CharacterString'))
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = MD_Metadata(i)
-            for i in self._exml.findall('.//' + util.nspath_eval('gfc:FC_FeatureCatalogue', namespaces)):
+                yield identifier, record
+            for i in exml.findall('.//' + _nspath('gfc:FC_FeatureCatalogue')):
                 identifier = self._setidentifierkey(util.testXMLValue(i.attrib['uuid'], attrib=True))
-                self.records[identifier] = FC_FeatureCatalogue(i)
+                yield identifier, FC_FeatureCatalogue(i)
         elif outputschema == namespaces['fgdc']:  # fgdc csdgm
-            for i in self._exml.findall('.//metadata'):
+            for i in exml.findall('.//metadata'):
                 val = i.find('idinfo/datasetid')
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = Metadata(i)
+                yield identifier, Metadata(i)
         elif outputschema == namespaces['dif']:  # nasa dif
-            for i in self._exml.findall('.//' + util.nspath_eval('dif:DIF', namespaces)):
-                val = i.find(util.nspath_eval('dif:Entry_ID', namespaces))
+            for i in exml.findall('.//' + _nspath('dif:DIF')):
+                val = i.find(_nspath('dif:Entry_ID'))
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = DIF(i)
+                yield identifier, DIF(i)
         elif outputschema == namespaces['gm03']:  # GM03
-            for i in self._exml.findall('.//' + util.nspath_eval('gm03:TRANSFER', namespaces)):
-                val = i.find(util.nspath_eval('gm03:fileIdentifier', namespaces))
+            for i in exml.findall('.//' + _nspath('gm03:TRANSFER')):
+                val = i.find(_nspath('gm03:fileIdentifier'))
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = GM03(i)
+                yield identifier, GM03(i)
         elif MD_Metadata3.handles(outputschema):  # ISO 19115 Part 3 XML
-            for elem, id in MD_Metadata3.find_ids(self._exml):
-                self.records[self._setidentifierkey(id)] = MD_Metadata3(elem)
-            for i in self._exml.findall('.//' + util.nspath_eval('gfc:FC_FeatureCatalogue', namespaces)):
+            for elem, id in MD_Metadata3.find_ids(exml):
+                yield self._setidentifierkey(id), MD_Metadata3(elem)
+            for i in exml.findall('.//' + _nspath('gfc:FC_FeatureCatalogue')):
                 identifier = self._setidentifierkey(util.testXMLValue(i.attrib['uuid'], attrib=True))
-                self.records[identifier] = FC_FeatureCatalogue3(i)
+                yield identifier, FC_FeatureCatalogue3(i)
         else:  # process default
-            for i in self._exml.findall('.//' + util.nspath_eval('csw:%s' % self._setesnel(esn), namespaces)):
-                val = i.find(util.nspath_eval('dc:identifier', namespaces))
+            for i in exml.findall('.//' + _nspath('csw:%s' % self._setesnel(esn))):
+                val = i.find(_nspath('dc:identifier'))
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = CswRecord(i)
+                yield identifier, CswRecord(i)
+
+    def _parseisorecords(self, elems):
+        """ Parse ISO 19139 records in the process pool, in chunks, keeping their order """
+        if self._process_pool is None:
+            # spawned, as forking would copy the threads of this process (e.g. the read-ahead of iter_records)
+            self._process_pool = ProcessPoolExecutor(max_workers=self.parse_processes,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+        processes = self.parse_processes or os.cpu_count() or 1
+        size = max(1, -(-len(elems) // (processes * 4)))
+        chunks = [[(etree.tostring(i, with_tail=False), i.tail) for i in elems[k:k + size]]
+                  for k in range(0, len(elems), size)]
+        records = chain.from_iterable(self._process_pool.map(_parse_iso_records, chunks))
+        for i, record in zip(elems, records):
+            record.md = i  # elements cannot be pickled
+            yield record
+
+    def _parsesearchresults(self, exml):
+        """ Return the matches, returned and nextrecord attributes of the search results of a response """
+        results = {}
+        val = exml.find(_nspath('csw:SearchResults'))
+        results['matches'] = int(util.testXMLValue(val.attrib.get('numberOfRecordsMatched'), True))
+        results['returned'] = int(util.testXMLValue(val.attrib.get('numberOfRecordsReturned'), True))
+        nextrecord = val.attrib.get('nextRecord')
+        results['nextrecord'] = int(util.testXMLValue(nextrecord, True)) if nextrecord is not None else None
+        return results
 
     def _parsetransactionsummary(self):
-        val = self._exml.find(util.nspath_eval('csw:TransactionResponse/csw:TransactionSummary', namespaces))
+        val = self._exml.find(_nspath('csw:TransactionResponse/csw:TransactionSummary'))
         if val is not None:
             rid = val.attrib.get('requestId')
             self.results['requestid'] = util.testXMLValue(rid, True)
-            ts = val.find(util.nspath_eval('csw:totalInserted', namespaces))
+            ts = val.find(_nspath('csw:totalInserted'))
             self.results['inserted'] = int(util.testXMLValue(ts))
-            ts = val.find(util.nspath_eval('csw:totalUpdated', namespaces))
+            ts = val.find(_nspath('csw:totalUpdated'))
             self.results['updated'] = int(util.testXMLValue(ts))
-            ts = val.find(util.nspath_eval('csw:totalDeleted', namespaces))
+            ts = val.find(_nspath('csw:totalDeleted'))
             self.results['deleted'] = int(util.testXMLValue(ts))
 
+    def _setgetrecords(self, constraints=[], sortby=None, typenames='csw:Record', esn='summary',
+                       outputschema=namespaces['csw'], format=outputformat, startposition=0,
+                       maxrecords=10, cql=None, resulttype='results', distributedsearch=False, hopcount=1):
+        """ Construct a GetRecords request """
+        node0 = self._setrootelement('csw:GetRecords')
+        node0.set('outputSchema', outputschema)
+        node0.set('outputFormat', format)
+        node0.set('version', self.version)
+        node0.set('service', self.service)
+        node0.set('resultType', resulttype)
+        if startposition > 0:
+            node0.set('startPosition', str(startposition))
+        node0.set('maxRecords', str(maxrecords))
+        node0.set(_nspath('xsi:schemaLocation'), schema_location)
+
+        if distributedsearch:
+            etree.SubElement(node0, _nspath('csw:DistributedSearch'), hopCount=str(hopcount))
+
+        node1 = etree.SubElement(node0, _nspath('csw:Query'))
+        node1.set('typeNames', typenames)
+
+        etree.SubElement(node1, _nspath('csw:ElementSetName')).text = esn
+
+        if any([len(constraints) > 0, cql is not None]):
+            node2 = etree.SubElement(node1, _nspath('csw:Constraint'))
+            node2.set('version', '1.1.0')
+            flt = fes.FilterRequest()
+            if len(constraints) > 0:
+                node2.append(flt.setConstraintList(constraints))
+            # Now add a CQL filter if passed in
+            elif cql is not None:
+                etree.SubElement(node2, _nspath('csw:CqlText')).text = cql
+
+        if sortby is not None and isinstance(sortby, fes.SortBy):
+            node1.append(sortby.toXML())
+
+        return node0
+
     def _setesnel(self, esn):
         """ Set the element name to parse depending on the ElementSetName requested """
         el = 'Record'
@@ -623,12 +739,12 @@ class CatalogueServiceWeb(object):
             return el
 
     def _setrootelement(self, el):
-        return etree.Element(util.nspath_eval(el, namespaces), nsmap=namespaces)
+        return etree.Element(_nspath(el), nsmap=namespaces)
 
     def _setconstraint(self, parent, qtype=None, propertyname='csw:AnyText', keywords=[], bbox=None, cql=None,
                        identifier=None):
         if keywords or bbox is not None or qtype is not None or cql is not None or identifier is not None:
-            node0 = etree.SubElement(parent, util.nspath_eval('csw:Constraint', namespaces))
+            node0 = etree.SubElement(parent, _nspath('csw:Constraint'))
             node0.set('version', '1.1.0')
 
             if identifier is not None:  # set identifier filter, overrides all other parameters
@@ -636,97 +752,130 @@ class CatalogueServiceWeb(object):
                 node0.append(flt.set(identifier=identifier))
             elif cql is not None:  # send raw CQL query
                 # CQL passed, overrides all other parameters
-                node1 = etree.SubElement(node0, util.nspath_eval('csw:CqlText', namespaces))
+                node1 = etree.SubElement(node0, _nspath('csw:CqlText'))
                 node1.text = cql
             else:  # construct a Filter request
                 flt = fes.FilterRequest()
                 node0.append(flt.set(qtype=qtype, keywords=keywords, propertyname=propertyname, bbox=bbox))
 
-    def _invoke(self):
-        # do HTTP request
-
-        request_url = self.url
+    def _invoke(self, operation, capabilities=False):
+        # do HTTP request, through the capabilities cache for GetCapabilities
 
         # Get correct URL based on Operation list.
+        request_url = self._operation_url(operation, isinstance(self.request, str))
+
+        self.request, self.response = self._send(request_url, self.request, capabilities)
+        self._exml = self._parseresponse(self.response, request_url, self.request)
+        self.exceptionreport = None
 
+    def _operation_url(self, name, get):
+        """ Return the URL of an operation for GET (KVP) or POST (XML) requests """
         # If skip_caps=True, then self.operations has not been set, so use
         # default URL.
-        if hasattr(self, 'operations'):
-            caller = inspect.stack()[1][3]
-            if caller == 'getrecords2':
-                caller = 'getrecords'
-            try:
-                op = self.get_operation_by_name(caller)
-                if isinstance(self.request, str):  # GET KVP
-                    get_verbs = [x for x in op.methods if x.get('type').lower() == 'get']
-                    request_url = get_verbs[0].get('url')
-                else:
-                    post_verbs = [x for x in op.methods if x.get('type').lower() == 'post']
-                    if len(post_verbs) > 1:
-                        # Filter by constraints.  We must match a PostEncoding of "XML"
-                        found_xml = False
-                        for pv in post_verbs:
-                            for const in pv.get('constraints'):
-                                if const.name.lower() == 'postencoding':
-                                    values = [v.lower() for v in const.values]
-                                    if 'xml' in values:
-                                        request_url = pv.get('url')
-                                        found_xml = True
-                                        break
-                        if not found_xml:  # Well, just use the first one.
-                            request_url = post_verbs[0].get('url')
-                    elif len(post_verbs) == 1:
+        if not hasattr(self, 'operations'):
+            return self.url
+        key = (name.lower(), get)
+        if key not in self._operation_urls:
+            self._operation_urls[key] = self._find_operation_url(name, get)
+        return self._operation_urls[key]
+
+    def _find_operation_url(self, name, get):
+        request_url = self.url
+        try:
+            op = self.get_operation_by_name(name)
+            if get:  # GET KVP
+                get_verbs = [x for x in op.methods if x.get('type').lower() == 'get']
+                request_url = get_verbs[0].get('url')
+            else:
+                post_verbs = [x for x in op.methods if x.get('type').lower() == 'post']
+                if len(post_verbs) > 1:
+                    # Filter by constraints.  We must match a PostEncoding of "XML"
+                    found_xml = False
+                    for pv in post_verbs:
+                        for const in pv.get('constraints'):
+                            if const.name.lower() == 'postencoding':
+                                values = [v.lower() for v in const.values]
+                                if 'xml' in values:
+                                    request_url = pv.get('url')
+                                    found_xml = True
+                                    break
+                    if not found_xml:  # Well, just use the first one.
                         request_url = post_verbs[0].get('url')
-            except Exception:  # no such luck, just go with request_url
-                pass
-
-        if isinstance(self.request, str):  # GET KVP
-            self.request = '%s%s' % (bind_url(request_url), self.request)
-            self.response = openURL(
-                self.request, None, 'Get', timeout=self.timeout, auth=self.auth,
-                headers=self.headers).read()
+                elif len(post_verbs) == 1:
+                    request_url = post_verbs[0].get('url')
+        except Exception:  # no such luck, just go with request_url
+            pass
+        return request_url
+
+    def _send(self, request_url, request, capabilities=False):
+        """ Send a request, and return the request as sent and the response content """
+        if isinstance(request, str):  # GET KVP
+            request = '%s%s' % (bind_url(request_url), request)
+            cache = get_default_cache() if capabilities else None
+            if cache is not None:
+                response = cache.open(
+                    request, version=self.version, timeout=self.timeout, auth=self.auth,
+                    headers=self.headers, session=self.session).read()
+            else:
+                response = openURL(
+                    request, None, 'Get', timeout=self.timeout, auth=self.auth,
+                    headers=self.headers, session=self.session).read()
         else:
-            self.request = cleanup_namespaces(self.request)
+            request = cleanup_namespaces(request)
             # Add any namespaces used in the "typeNames" attribute of the
             # csw:Query element to the query's xml namespaces.
-            for query in self.request.findall(util.nspath_eval('csw:Query', namespaces)):
+            for query in request.findall(_nspath('csw:Query')):
                 ns = query.get("typeNames", None)
                 if ns is not None:
                     # Pull out "gmd" from something like "gmd:MD_Metadata" from the list
                     # of typenames
                     ns_keys = [x.split(':')[0] for x in ns.split(' ')]
-                    self.request = add_namespaces(self.request, ns_keys)
-            self.request = add_namespaces(self.request, 'ows')
+                    request = add_namespaces(request, ns_keys)
+            request = add_namespaces(request, 'ows')
 
-            self.request = util.element_to_string(self.request, encoding='utf-8')
+            request = util.element_to_string(request, encoding='utf-8')
 
-            self.response = http_post(request_url, self.request, self.lang, self.timeout,
-                                      auth=self.auth, headers=self.headers).content
+            response = http_post(request_url, request, self.lang, self.timeout,
+                                 auth=self.auth, headers=self.headers, session=self.session).content
+        return request, response
 
+    def _parseresponse(self, response, request_url, request):
+        """ Parse a response, raising an ExceptionReport for OGC exceptions """
         # parse result see if it's XML
-        self._exml = etree.parse(BytesIO(self.response))
+        exml = etree.parse(BytesIO(response))
 
         # it's XML.  Attempt to decipher whether the XML response is CSW-ish """
         valid_xpaths = [
-            util.nspath_eval('ows:ExceptionReport', namespaces),
-            util.nspath_eval('csw:Capabilities', namespaces),
-            util.nspath_eval('csw:DescribeRecordResponse', namespaces),
-            util.nspath_eval('csw:GetDomainResponse', namespaces),
-            util.nspath_eval('csw:GetRecordsResponse', namespaces),
-            util.nspath_eval('csw:GetRecordByIdResponse', namespaces),
-            util.nspath_eval('csw:HarvestResponse', namespaces),
-            util.nspath_eval('csw:TransactionResponse', namespaces)
+            _nspath('ows:ExceptionReport'),
+            _nspath('csw:Capabilities'),
+            _nspath('csw:DescribeRecordResponse'),
+            _nspath('csw:GetDomainResponse'),
+            _nspath('csw:GetRecordsResponse'),
+            _nspath('csw:GetRecordByIdResponse'),
+            _nspath('csw:HarvestResponse'),
+            _nspath('csw:TransactionResponse')
         ]
 
-        if self._exml.getroot().tag not in valid_xpaths:
-            raise RuntimeError(f'Document is XML, but not CSW-ish, {request_url}?{self.request}')
+        if exml.getroot().tag not in valid_xpaths:
+            raise RuntimeError(f'Document is XML, but not CSW-ish, {request_url}?{request}')
 
         # check if it's an OGC Exception
-        val = self._exml.find(util.nspath_eval('ows:Exception', namespaces))
+        val = exml.find(_nspath('ows:Exception'))
         if val is not None:
-            raise ows.ExceptionReport(self._exml, self.owscommon.namespace)
-        else:
-            self.exceptionreport = None
+            raise ows.ExceptionReport(exml, self.owscommon.namespace)
+        return exml
+
+
+def _parse_iso_records(documents):
+    """ Return the ISO 19139 records of a list of (document, tail) tuples, without their element """
+    records = []
+    for document, tail in documents:
+        elem = etree.fromstring(document)
+        elem.tail = tail  # as serialized in the xml of records parsed in the response
+        record = MD_Metadata(elem)
+        record.md = None
+        records.append(record)
+    return records
 
 
 class CswRecord(object):
@@ -742,7 +891,7 @@ class CswRecord(object):
         # rdf:RDF/rdf:Description container
         # (child content model is identical)
         self.rdf = False
-        rdf = record.find(util.nspath_eval('rdf:Description', namespaces))
+        rdf = record.find(_nspath('rdf:Description'))
         if rdf is not None:
             self.rdf = True
             record = rdf
@@ -750,48 +899,48 @@ class CswRecord(object):
         # some CSWs return records with multiple identifiers based on
         # different schemes.  Use the first dc:identifier value to set
         # self.identifier, and set self.identifiers as a list of dicts
-        val = record.find(util.nspath_eval('dc:identifier', namespaces))
+        val = record.find(_nspath('dc:identifier'))
         self.identifier = util.testXMLValue(val)
 
         self.identifiers = []
-        for i in record.findall(util.nspath_eval('dc:identifier', namespaces)):
+        for i in record.findall(_nspath('dc:identifier')):
             d = {}
             d['scheme'] = i.attrib.get('scheme')
             d['identifier'] = i.text
             self.identifiers.append(d)
 
-        val = record.find(util.nspath_eval('dc:type', namespaces))
+        val = record.find(_nspath('dc:type'))
         self.type = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:title', namespaces))
+        val = record.find(_nspath('dc:title'))
         self.title = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:alternative', namespaces))
+        val = record.find(_nspath('dct:alternative'))
         self.alternative = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:isPartOf', namespaces))
+        val = record.find(_nspath('dct:isPartOf'))
         self.ispartof = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:abstract', namespaces))
+        val = record.find(_nspath('dct:abstract'))
         self.abstract = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:date', namespaces))
+        val = record.find(_nspath('dc:date'))
         self.date = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:created', namespaces))
+        val = record.find(_nspath('dct:created'))
         self.created = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:issued', namespaces))
+        val = record.find(_nspath('dct:issued'))
         self.issued = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:relation', namespaces))
+        val = record.find(_nspath('dc:relation'))
         self.relation = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:temporal', namespaces))
+        val = record.find(_nspath('dct:temporal'))
         self.temporal = util.testXMLValue(val)
 
         self.uris = []  # list of dicts
-        for i in record.findall(util.nspath_eval('dc:URI', namespaces)):
+        for i in record.findall(_nspath('dc:URI')):
             uri = {}
             uri['protocol'] = util.testXMLValue(i.attrib.get('protocol'), True)
             uri['name'] = util.testXMLValue(i.attrib.get('name'), True)
@@ -801,61 +950,61 @@ class CswRecord(object):
             self.uris.append(uri)
 
         self.references = []  # list of dicts
-        for i in record.findall(util.nspath_eval('dct:references', namespaces)):
+        for i in record.findall(_nspath('dct:references')):
             ref = {}
             ref['scheme'] = util.testXMLValue(i.attrib.get('scheme'), True)
             ref['url'] = util.testXMLValue(i)
 
             self.references.append(ref)
 
-        val = record.find(util.nspath_eval('dct:modified', namespaces))
+        val = record.find(_nspath('dct:modified'))
         self.modified = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:creator', namespaces))
+        val = record.find(_nspath('dc:creator'))
         self.creator = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:publisher', namespaces))
+        val = record.find(_nspath('dc:publisher'))
         self.publisher = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:coverage', namespaces))
+        val = record.find(_nspath('dc:coverage'))
         self.coverage = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:contributor', namespaces))
+        val = record.find(_nspath('dc:contributor'))
         self.contributor = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:language', namespaces))
+        val = record.find(_nspath('dc:language'))
         self.language = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:source', namespaces))
+        val = record.find(_nspath('dc:source'))
         self.source = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:rightsHolder', namespaces))
+        val = record.find(_nspath('dct:rightsHolder'))
         self.rightsholder = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:accessRights', namespaces))
+        val = record.find(_nspath('dct:accessRights'))
         self.accessrights = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:license', namespaces))
+        val = record.find(_nspath('dct:license'))
         self.license = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:format', namespaces))
+        val = record.find(_nspath('dc:format'))
         self.format = util.testXMLValue(val)
 
         self.subjects = []
-        for i in record.findall(util.nspath_eval('dc:subject', namespaces)):
+        for i in record.findall(_nspath('dc:subject')):
             self.subjects.append(util.testXMLValue(i))
 
         self.rights = []
-        for i in record.findall(util.nspath_eval('dc:rights', namespaces)):
+        for i in record.findall(_nspath('dc:rights')):
             self.rights.append(util.testXMLValue(i))
 
-        val = record.find(util.nspath_eval('ows:BoundingBox', namespaces))
+        val = record.find(_nspath('ows:BoundingBox'))
         if val is not None:
             self.bbox = ows.BoundingBox(val, namespaces['ows'])
         else:
             self.bbox = None
 
-        val = record.find(util.nspath_eval('dct:spatial', namespaces))
+        val = record.find(_nspath('dct:spatial'))
         self.spatial = None
         if val is not None:
             val = util.testXMLValue(val)
@@ -869,7 +1018,7 @@ class CswRecord(object):
             else:
                 self.spatial = val
 
-        val = record.find(util.nspath_eval('ows:WGS84BoundingBox', namespaces))
+        val = record.find(_nspath('ows:WGS84BoundingBox'))
         if val is not None:
             self.bbox_wgs84 = ows.WGS84BoundingBox(val, namespaces['ows'])
         else:
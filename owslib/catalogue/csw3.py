@@ -9,12 +9,16 @@
 
 """ CSW 3.0.0 request and response processor """
 
-import inspect
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+import os
 import warnings
 from io import BytesIO
+from itertools import chain
 import random
 from urllib.parse import urlencode
 
+from owslib.cache import get_default_cache
 from owslib.etree import etree
 from owslib import fes2
 from owslib import util
@@ -38,6 +42,7 @@ def get_namespaces():
 
 
 namespaces = get_namespaces()
+_nspath = util.nspath_cache(namespaces)  # etree paths of the namespaced path expressions
 schema = 'http://schemas.opengis.net/cat/csw/3.0/cswAll.xsd'
 schema_location = '%s %s' % (namespaces['csw30'], schema)
 
@@ -45,7 +50,7 @@ schema_location = '%s %s' % (namespaces['csw30'], schema)
 class CatalogueServiceWeb(object):
     """ csw request class """
     def __init__(self, url, lang='en-US', version='3.0.0', timeout=10, skip_caps=False,
-                 username=None, password=None, auth=None, headers=None):
+                 username=None, password=None, auth=None, headers=None, session=None, parse_processes=0):
         """
 
         Construct and process a GetCapabilities request
@@ -62,6 +67,9 @@ class CatalogueServiceWeb(object):
         - password: password for HTTP basic authentication
         - auth: instance of owslib.util.Authentication
         - headers: HTTP headers to send with requests
+        - session: instance of owslib.util.HTTPSession (default is the shared session)
+        - parse_processes: number of processes parsing the ISO 19139 records of responses, None for the
+          number of CPUs (default is 0, records are parsed in this process)
 
         """
         if auth:
@@ -75,8 +83,12 @@ class CatalogueServiceWeb(object):
         self.timeout = timeout
         self.auth = auth or Authentication(username, password)
         self.headers = headers
+        self.session = session
         self.service = 'CSW'
         self.exceptionreport = None
+        self.parse_processes = parse_processes
+        self._process_pool = None
+        self._operation_urls = {}
         self.owscommon = ows.OwsCommon('2.0.0')
 
         if not skip_caps:  # process GetCapabilities
@@ -86,38 +98,50 @@ class CatalogueServiceWeb(object):
 
             self.request = urlencode(data)
 
-            self._invoke()
+            self._invoke('GetCapabilities', capabilities=True)
 
             if self.exceptionreport is None:
                 self.updateSequence = self._exml.getroot().attrib.get('updateSequence')
 
                 # ServiceIdentification
-                val = self._exml.find(util.nspath_eval('ows200:ServiceIdentification', namespaces))
+                val = self._exml.find(_nspath('ows200:ServiceIdentification'))
                 if val is not None:
                     self.identification = ows.ServiceIdentification(val, self.owscommon.namespace)
                 else:
                     self.identification = None
                 # ServiceProvider
-                val = self._exml.find(util.nspath_eval('ows200:ServiceProvider', namespaces))
+                val = self._exml.find(_nspath('ows200:ServiceProvider'))
                 if val is not None:
                     self.provider = ows.ServiceProvider(val, self.owscommon.namespace)
                 else:
                     self.provider = None
                 # ServiceOperations metadata
                 self.operations = []
-                for elem in self._exml.findall(util.nspath_eval('ows200:OperationsMetadata/ows200:Operation', namespaces)):  # noqa
+                for elem in self._exml.findall(_nspath('ows200:OperationsMetadata/ows200:Operation')):  # noqa
                     self.operations.append(ows.OperationsMetadata(elem, self.owscommon.namespace))
                 self.constraints = {}
-                for elem in self._exml.findall(util.nspath_eval('ows200:OperationsMetadata/ows200:Constraint', namespaces)):  # noqa
+                for elem in self._exml.findall(_nspath('ows200:OperationsMetadata/ows200:Constraint')):  # noqa
                     self.constraints[elem.attrib['name']] = ows.Constraint(elem, self.owscommon.namespace)
                 self.parameters = {}
-                for elem in self._exml.findall(util.nspath_eval('ows200:OperationsMetadata/ows200:Parameter', namespaces)):  # noqa
+                for elem in self._exml.findall(_nspath('ows200:OperationsMetadata/ows200:Parameter')):  # noqa
                     self.parameters[elem.attrib['name']] = ows.Parameter(elem, self.owscommon.namespace)
 
                 # FilterCapabilities
-                val = self._exml.find(util.nspath_eval('fes:Filter_Capabilities', namespaces))
+                val = self._exml.find(_nspath('fes:Filter_Capabilities'))
                 self.filters = fes2.FilterCapabilities(val)
 
+    def close(self):
+        """ Shut down the process pool parsing records, if any """
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def getdomain(self, dname, dtype='parameter'):
         """
 
@@ -136,31 +160,31 @@ class CatalogueServiceWeb(object):
         node0 = self._setrootelement('csw30:GetDomain')
         node0.set('service', self.service)
         node0.set('version', self.version)
-        node0.set(util.nspath_eval('xsi:schemaLocation', namespaces), schema_location)
+        node0.set(_nspath('xsi:schemaLocation'), schema_location)
         if dtype == 'property':
             dtypename = 'ValueReference'
         else:
             dtypename = 'ParameterName'
 
-        etree.SubElement(node0, util.nspath_eval('csw30:%s' % dtypename, namespaces)).text = dname
+        etree.SubElement(node0, _nspath('csw30:%s' % dtypename)).text = dname
 
         self.request = node0
         try:  # getdomain operation is optional on CSW3, return empty if failing
-            self._invoke()
+            self._invoke('GetDomain')
 
             if self.exceptionreport is None:
                 self.results = {}
 
-                val = self._exml.find(util.nspath_eval('csw30:DomainValues', namespaces)).attrib.get('type')
+                val = self._exml.find(_nspath('csw30:DomainValues')).attrib.get('type')
                 self.results['type'] = util.testXMLValue(val, True)
 
-                val = self._exml.find(util.nspath_eval('csw30:DomainValues/csw30:%s' % dtypename, namespaces))
+                val = self._exml.find(_nspath('csw30:DomainValues/csw30:%s' % dtypename))
                 self.results[dtype] = util.testXMLValue(val)
 
                 # get the list of values associated with the Domain
                 self.results['values'] = []
 
-                for f in self._exml.findall(util.nspath_eval('csw30:DomainValues/csw30:ListOfValues/csw30:Value', namespaces)):  # noqa
+                for f in self._exml.findall(_nspath('csw30:DomainValues/csw30:ListOfValues/csw30:Value')):  # noqa
                     self.results['values'].append(util.testXMLValue(f))
         except Exception:
             self.results = {'values': []}
@@ -193,7 +217,7 @@ class CatalogueServiceWeb(object):
 
         self.request = urlencode(data)
 
-        self._invoke()
+        self._invoke('GetRecordById')
 
         if self.exceptionreport is None:
             self.results = {}
@@ -235,7 +259,7 @@ class CatalogueServiceWeb(object):
 
             if startswith_xml:
                 self.request = etree.fromstring(xml)
-                val = self.request.find(util.nspath_eval('csw30:Query/csw30:ElementSetName', namespaces))
+                val = self.request.find(_nspath('csw30:Query/csw30:ElementSetName'))
                 if val is not None:
                     esn = util.testXMLValue(val)
                 val = self.request.attrib.get('outputSchema')
@@ -245,73 +269,87 @@ class CatalogueServiceWeb(object):
                 self.request = xml
         else:
             # construct request
-            node0 = self._setrootelement('csw30:GetRecords')
-            node0.set('outputSchema', outputschema)
-            node0.set('outputFormat', format)
-            node0.set('version', self.version)
-            node0.set('service', self.service)
-            if startposition > 0:
-                node0.set('startPosition', str(startposition))
-            node0.set('maxRecords', str(maxrecords))
-            node0.set(util.nspath_eval('xsi:schemaLocation', namespaces), schema_location)
-
-            if distributedsearch:
-                node00 = etree.SubElement(node0, util.nspath_eval('csw30:DistributedSearch', namespaces),
-                                          hopCount=str(hopcount), clientId='owslib',
-                                          distributedSearchId='owslib-request')
-
-                if federatedcatalogues:
-                    for fc in federatedcatalogues:
-                        etree.SubElement(node00, util.nspath_eval('csw30:federatedCatalogues', namespaces),
-                                         catalogueURL=fc)
-
-            node1 = etree.SubElement(node0, util.nspath_eval('csw30:Query', namespaces))
-            node1.set('typeNames', typenames)
-
-            etree.SubElement(node1, util.nspath_eval('csw30:ElementSetName', namespaces)).text = esn
-
-            if any([len(constraints) > 0, cql is not None]):
-                node2 = etree.SubElement(node1, util.nspath_eval('csw30:Constraint', namespaces))
-                node2.set('version', '1.1.0')
-                flt = fes2.FilterRequest()
-                if len(constraints) > 0:
-                    node2.append(flt.setConstraintList(constraints))
-                # Now add a CQL filter if passed in
-                elif cql is not None:
-                    etree.SubElement(node2, util.nspath_eval('csw30:CqlText', namespaces)).text = cql
+            self.request = self._setgetrecords(constraints, sortby, typenames, esn, outputschema, format,
+                                               startposition, maxrecords, cql, distributedsearch, hopcount,
+                                               federatedcatalogues)
 
-            if sortby is not None and isinstance(sortby, fes2.SortBy):
-                node1.append(sortby.toXML())
-
-            self.request = node0
-
-        self._invoke()
+        self._invoke('GetRecords')
 
         if self.exceptionreport is None:
-            self.results = {}
-
             # process search results attributes
-            val = self._exml.find(
-                util.nspath_eval('csw30:SearchResults', namespaces)).attrib.get('numberOfRecordsMatched')
-            self.results['matches'] = int(util.testXMLValue(val, True))
-            val = self._exml.find(
-                util.nspath_eval('csw30:SearchResults', namespaces)).attrib.get('numberOfRecordsReturned')
-            self.results['returned'] = int(util.testXMLValue(val, True))
-            val = self._exml.find(util.nspath_eval('csw30:SearchResults', namespaces)).attrib.get('nextRecord')
-            if val is not None:
-                self.results['nextrecord'] = int(util.testXMLValue(val, True))
-            else:
+            self.results = self._parsesearchresults(self._exml)
+            if self.results['nextrecord'] is None:
                 warnings.warn("""CSW Server did not supply a nextRecord value (it is optional), so the client
                 should page through the results in another way.""")
                 # For more info, see:
                 # https://github.com/geopython/OWSLib/issues/100
-                self.results['nextrecord'] = None
 
             # process list of matching records
             self.records = OrderedDict()
 
             self._parserecords(outputschema, esn)
 
+    def iter_records(self, constraints=[], sortby=None, typenames='csw30:Record', esn='summary',
+                     outputschema=namespaces['csw30'], format=outputformat, startposition=1, page_size=10,
+                     cql=None):
+        """
+
+        Iterate over all the records matching a query, paging through the
+        results of GetRecords requests
+
+        The next page is requested while the records of the current page are
+        parsed, and the records are neither kept in `records` nor the
+        responses in `response`, so that large catalogues can be harvested
+        in constant memory.
+
+        Parameters
+        ----------
+
+        - constraints: the list of constraints (OgcExpression from owslib.fes2 module)
+        - sortby: an OGC SortBy object (SortBy from owslib.fes2 module)
+        - typenames: the typeNames to query against (default is csw30:Record)
+        - esn: the ElementSetName 'full', 'brief' or 'summary' (default is 'summary')
+        - outputschema: the outputSchema (default is 'http://www.opengis.net/cat/csw/3.0.0')
+        - format: the outputFormat (default is 'application/xml')
+        - startposition: position of the first record (default is 1)
+        - page_size: the number of records requested per page (default is 10)
+        - cql: common query language text, used when no constraints are given
+
+        Yields (identifier, record) tuples, in the order of the results
+
+        """
+
+        request_url = self._operation_url('GetRecords', False)
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        def fetch(position):
+            request = self._setgetrecords(constraints, sortby, typenames, esn, outputschema, format,
+                                          position, page_size, cql)
+            request, response = self._send(request_url, request)
+            return self._parseresponse(response)
+
+        future = executor.submit(fetch, startposition)
+        try:
+            while future is not None:
+                exml = future.result()
+                future = None
+                results = self._parsesearchresults(exml)
+                nextrecord = results['nextrecord']
+                if nextrecord is None:  # page through the results by their count
+                    nextrecord = startposition + results['returned']
+                    if nextrecord > results['matches']:
+                        nextrecord = 0
+                if results['returned'] > 0 and nextrecord > startposition:
+                    startposition = nextrecord
+                    future = executor.submit(fetch, startposition)
+                for identifier, record in self._iterrecords(exml, outputschema, esn):
+                    yield identifier, record
+                del exml
+        finally:
+            if future is not None:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def transaction(self, ttype=None, typename='csw30:Record', record=None, propertyname=None, propertyvalue=None,
                     bbox=None, keywords=[], cql=None, identifier=None):
         """
@@ -337,14 +375,14 @@ class CatalogueServiceWeb(object):
         node0 = self._setrootelement('csw30:Transaction')
         node0.set('version', self.version)
         node0.set('service', self.service)
-        node0.set(util.nspath_eval('xsi:schemaLocation', namespaces), schema_location)
+        node0.set(_nspath('xsi:schemaLocation'), schema_location)
 
         validtransactions = ['insert', 'update', 'delete']
 
         if ttype not in validtransactions:  # invalid transaction
             raise RuntimeError('Invalid transaction \'%s\'.' % ttype)
 
-        node1 = etree.SubElement(node0, util.nspath_eval('csw30:%s' % ttype.capitalize(), namespaces))
+        node1 = etree.SubElement(node0, _nspath('csw30:%s' % ttype.capitalize()))
 
         if ttype != 'update':
             node1.set('typeName', typename)
@@ -359,9 +397,9 @@ class CatalogueServiceWeb(object):
                 node1.append(etree.fromstring(record))
             else:
                 if propertyname is not None and propertyvalue is not None:
-                    node2 = etree.SubElement(node1, util.nspath_eval('csw30:RecordProperty', namespaces))
-                    etree.SubElement(node2, util.nspath_eval('csw30:Name', namespaces)).text = propertyname
-                    etree.SubElement(node2, util.nspath_eval('csw30:Value', namespaces)).text = propertyvalue
+                    node2 = etree.SubElement(node1, _nspath('csw30:RecordProperty'))
+                    etree.SubElement(node2, _nspath('csw30:Name')).text = propertyname
+                    etree.SubElement(node2, _nspath('csw30:Value')).text = propertyvalue
                     self._setconstraint(node1, None, propertyname, keywords, bbox, cql, identifier)
 
         if ttype == 'delete':
@@ -369,7 +407,7 @@ class CatalogueServiceWeb(object):
 
         self.request = node0
 
-        self._invoke()
+        self._invoke('Transaction')
         self.results = {}
 
         if self.exceptionreport is None:
@@ -396,27 +434,27 @@ class CatalogueServiceWeb(object):
         node0 = self._setrootelement('csw30:Harvest')
         node0.set('version', self.version)
         node0.set('service', self.service)
-        node0.set(util.nspath_eval('xsi:schemaLocation', namespaces), schema_location)
-        etree.SubElement(node0, util.nspath_eval('csw30:Source', namespaces)).text = source
-        etree.SubElement(node0, util.nspath_eval('csw30:ResourceType', namespaces)).text = resourcetype
+        node0.set(_nspath('xsi:schemaLocation'), schema_location)
+        etree.SubElement(node0, _nspath('csw30:Source')).text = source
+        etree.SubElement(node0, _nspath('csw30:ResourceType')).text = resourcetype
         if resourceformat is not None:
-            etree.SubElement(node0, util.nspath_eval('csw30:ResourceFormat', namespaces)).text = resourceformat
+            etree.SubElement(node0, _nspath('csw30:ResourceFormat')).text = resourceformat
         if harvestinterval is not None:
-            etree.SubElement(node0, util.nspath_eval('csw30:HarvestInterval', namespaces)).text = harvestinterval
+            etree.SubElement(node0, _nspath('csw30:HarvestInterval')).text = harvestinterval
         if responsehandler is not None:
-            etree.SubElement(node0, util.nspath_eval('csw30:ResponseHandler', namespaces)).text = responsehandler
+            etree.SubElement(node0, _nspath('csw30:ResponseHandler')).text = responsehandler
 
         self.request = node0
 
-        self._invoke()
+        self._invoke('Harvest')
         self.results = {}
 
         if self.exceptionreport is None:
-            val = self._exml.find(util.nspath_eval('csw30:Acknowledgement', namespaces))
+            val = self._exml.find(_nspath('csw30:Acknowledgement'))
             if util.testXMLValue(val) is not None:
                 ts = val.attrib.get('timeStamp')
                 self.timestamp = util.testXMLValue(ts, True)
-                id = val.find(util.nspath_eval('csw30:RequestId', namespaces))
+                id = val.find(_nspath('csw30:RequestId'))
                 self.id = util.testXMLValue(id)
             else:
                 self._parsetransactionsummary()
@@ -452,59 +490,138 @@ class CatalogueServiceWeb(object):
 
     def _parseinsertresult(self):
         self.results['insertresults'] = []
-        for i in self._exml.findall('.//' + util.nspath_eval('csw30:InsertResult', namespaces)):
-            for j in i.findall(util.nspath_eval('csw30:BriefRecord/dc:identifier', namespaces)):
+        for i in self._exml.findall('.//' + _nspath('csw30:InsertResult')):
+            for j in i.findall(_nspath('csw30:BriefRecord/dc:identifier')):
                 self.results['insertresults'].append(util.testXMLValue(j))
 
     def _parserecords(self, outputschema, esn):
+        for identifier, record in self._iterrecords(self._exml, outputschema, esn):
+            self.records[identifier] = record
+
+    def _iterrecords(self, exml, outputschema, esn):
+        """ Yield the (identifier, record) tuples of a GetRecords or GetRecordById response """
         if outputschema == namespaces['gmd']:  # iso 19139
-            for i in self._exml.findall('.//' + util.nspath_eval('gmd:MD_Metadata', namespaces)) or \
-                    self._exml.findall('.//' + util.nspath_eval('gmi:MI_Metadata', namespaces)):
-                val = i.find(util.nspath_eval('gmd:fileIdentifier/gco:CharacterString', namespaces))
+            elems = exml.findall('.//' + _nspath('gmd:MD_Metadata')) or \
+                exml.findall('.//' + _nspath('gmi:MI_Metadata'))
+            if self.parse_processes != 0 and len(elems) > 1:
+                records = self._parseisorecords(elems)
+            else:
+                records = (MD_Metadata(i) for i in elems)
+            for i, record in zip(elems, records):
+                val = i.find(_nspath('gmd:fileIdentifier/gco:CharacterString'))
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = MD_Metadata(i)
-            for i in self._exml.findall('.//' + util.nspath_eval('gfc:FC_FeatureCatalogue', namespaces)):
+                yield identifier, record
+            for i in exml.findall('.//' + _nspath('gfc:FC_FeatureCatalogue')):
                 identifier = self._setidentifierkey(util.testXMLValue(i.attrib['uuid'], attrib=True))
-                self.records[identifier] = FC_FeatureCatalogue(i)
+                yield identifier, FC_FeatureCatalogue(i)
         elif outputschema == namespaces['fgdc']:  # fgdc csdgm
-            for i in self._exml.findall('.//metadata'):
+            for i in exml.findall('.//metadata'):
                 val = i.find('idinfo/datasetid')
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = Metadata(i)
+                yield identifier, Metadata(i)
         elif outputschema == namespaces['dif']:  # nasa dif
-            for i in self._exml.findall('.//' + util.nspath_eval('dif:DIF', namespaces)):
-                val = i.find(util.nspath_eval('dif:Entry_ID', namespaces))
+            for i in exml.findall('.//' + _nspath('dif:DIF')):
+                val = i.find(_nspath('dif:Entry_ID'))
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = DIF(i)
+                yield identifier, DIF(i)
         elif outputschema == namespaces['gm03']:  # GM03
-            for i in self._exml.findall('.//' + util.nspath_eval('gm03:TRANSFER', namespaces)):
-                val = i.find(util.nspath_eval('gm03:fileIdentifier', namespaces))
+            for i in exml.findall('.//' + _nspath('gm03:TRANSFER')):
+                val = i.find(_nspath('gm03:fileIdentifier'))
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = GM03(i)
+                yield identifier, GM03(i)
         elif MD_Metadata3.handles(outputschema):  # ISO 19115 Part 3 XML
-            for elem, id in MD_Metadata3.find_ids(self._exml):
-                self.records[self._setidentifierkey(id)] = MD_Metadata3(elem)
-            for i in self._exml.findall('.//' + util.nspath_eval('gfc:FC_FeatureCatalogue', namespaces)):
+            for elem, id in MD_Metadata3.find_ids(exml):
+                yield self._setidentifierkey(id), MD_Metadata3(elem)
+            for i in exml.findall('.//' + _nspath('gfc:FC_FeatureCatalogue')):
                 identifier = self._setidentifierkey(util.testXMLValue(i.attrib['uuid'], attrib=True))
-                self.records[identifier] = FC_FeatureCatalogue3(i)
+                yield identifier, FC_FeatureCatalogue3(i)
         else:  # process default
-            for i in self._exml.findall('.//' + util.nspath_eval('csw30:%s' % self._setesnel(esn), namespaces)):
-                val = i.find(util.nspath_eval('dc:identifier', namespaces))
+            for i in exml.findall('.//' + _nspath('csw30:%s' % self._setesnel(esn))):
+                val = i.find(_nspath('dc:identifier'))
                 identifier = self._setidentifierkey(util.testXMLValue(val))
-                self.records[identifier] = Csw30Record(i)
+                yield identifier, Csw30Record(i)
+
+    def _parseisorecords(self, elems):
+        """ Parse ISO 19139 records in the process pool, in chunks, keeping their order """
+        if self._process_pool is None:
+            # spawned, as forking would copy the threads of this process (e.g. the read-ahead of iter_records)
+            self._process_pool = ProcessPoolExecutor(max_workers=self.parse_processes,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+        processes = self.parse_processes or os.cpu_count() or 1
+        size = max(1, -(-len(elems) // (processes * 4)))
+        chunks = [[(etree.tostring(i, with_tail=False), i.tail) for i in elems[k:k + size]]
+                  for k in range(0, len(elems), size)]
+        records = chain.from_iterable(self._process_pool.map(_parse_iso_records, chunks))
+        for i, record in zip(elems, records):
+            record.md = i  # elements cannot be pickled
+            yield record
+
+    def _parsesearchresults(self, exml):
+        """ Return the matches, returned and nextrecord attributes of the search results of a response """
+        results = {}
+        val = exml.find(_nspath('csw30:SearchResults'))
+        results['matches'] = int(util.testXMLValue(val.attrib.get('numberOfRecordsMatched'), True))
+        results['returned'] = int(util.testXMLValue(val.attrib.get('numberOfRecordsReturned'), True))
+        nextrecord = val.attrib.get('nextRecord')
+        results['nextrecord'] = int(util.testXMLValue(nextrecord, True)) if nextrecord is not None else None
+        return results
 
     def _parsetransactionsummary(self):
-        val = self._exml.find(util.nspath_eval('csw30:TransactionResponse/csw30:TransactionSummary', namespaces))
+        val = self._exml.find(_nspath('csw30:TransactionResponse/csw30:TransactionSummary'))
         if val is not None:
             rid = val.attrib.get('requestId')
             self.results['requestid'] = util.testXMLValue(rid, True)
-            ts = val.find(util.nspath_eval('csw30:totalInserted', namespaces))
+            ts = val.find(_nspath('csw30:totalInserted'))
             self.results['inserted'] = int(util.testXMLValue(ts))
-            ts = val.find(util.nspath_eval('csw30:totalUpdated', namespaces))
+            ts = val.find(_nspath('csw30:totalUpdated'))
             self.results['updated'] = int(util.testXMLValue(ts))
-            ts = val.find(util.nspath_eval('csw30:totalDeleted', namespaces))
+            ts = val.find(_nspath('csw30:totalDeleted'))
             self.results['deleted'] = int(util.testXMLValue(ts))
 
+    def _setgetrecords(self, constraints=[], sortby=None, typenames='csw30:Record', esn='summary',
+                       outputschema=namespaces['csw30'], format=outputformat, startposition=0,
+                       maxrecords=10, cql=None, distributedsearch=False, hopcount=2, federatedcatalogues=[]):
+        """ Construct a GetRecords request """
+        node0 = self._setrootelement('csw30:GetRecords')
+        node0.set('outputSchema', outputschema)
+        node0.set('outputFormat', format)
+        node0.set('version', self.version)
+        node0.set('service', self.service)
+        if startposition > 0:
+            node0.set('startPosition', str(startposition))
+        node0.set('maxRecords', str(maxrecords))
+        node0.set(_nspath('xsi:schemaLocation'), schema_location)
+
+        if distributedsearch:
+            node00 = etree.SubElement(node0, _nspath('csw30:DistributedSearch'),
+                                      hopCount=str(hopcount), clientId='owslib',
+                                      distributedSearchId='owslib-request')
+
+            if federatedcatalogues:
+                for fc in federatedcatalogues:
+                    etree.SubElement(node00, _nspath('csw30:federatedCatalogues'),
+                                     catalogueURL=fc)
+
+        node1 = etree.SubElement(node0, _nspath('csw30:Query'))
+        node1.set('typeNames', typenames)
+
+        etree.SubElement(node1, _nspath('csw30:ElementSetName')).text = esn
+
+        if any([len(constraints) > 0, cql is not None]):
+            node2 = etree.SubElement(node1, _nspath('csw30:Constraint'))
+            node2.set('version', '1.1.0')
+            flt = fes2.FilterRequest()
+            if len(constraints) > 0:
+                node2.append(flt.setConstraintList(constraints))
+            # Now add a CQL filter if passed in
+            elif cql is not None:
+                etree.SubElement(node2, _nspath('csw30:CqlText')).text = cql
+
+        if sortby is not None and isinstance(sortby, fes2.SortBy):
+            node1.append(sortby.toXML())
+
+        return node0
+
     def _setesnel(self, esn):
         """ Set the element name to parse depending on the ElementSetName requested """
         el = 'Record'
@@ -521,12 +638,12 @@ class CatalogueServiceWeb(object):
             return el
 
     def _setrootelement(self, el):
-        return etree.Element(util.nspath_eval(el, namespaces), nsmap=namespaces)
+        return etree.Element(_nspath(el), nsmap=namespaces)
 
     def _setconstraint(self, parent, qtype=None, propertyname='csw30:AnyText', keywords=[], bbox=None, cql=None,
                        identifier=None):
         if keywords or bbox is not None or qtype is not None or cql is not None or identifier is not None:
-            node0 = etree.SubElement(parent, util.nspath_eval('csw30:Constraint', namespaces))
+            node0 = etree.SubElement(parent, _nspath('csw30:Constraint'))
             node0.set('version', '1.1.0')
 
             if identifier is not None:  # set identifier filter, overrides all other parameters
@@ -534,98 +651,136 @@ class CatalogueServiceWeb(object):
                 node0.append(flt.set(identifier=identifier))
             elif cql is not None:  # send raw CQL query
                 # CQL passed, overrides all other parameters
-                node1 = etree.SubElement(node0, util.nspath_eval('csw30:CqlText', namespaces))
+                node1 = etree.SubElement(node0, _nspath('csw30:CqlText'))
                 node1.text = cql
             else:  # construct a Filter request
                 flt = fes2.FilterRequest()
                 node0.append(flt.set(qtype=qtype, keywords=keywords, propertyname=propertyname, bbox=bbox))
 
-    def _invoke(self):
-        # do HTTP request
-
-        request_url = self.url
+    def _invoke(self, operation, capabilities=False):
+        # do HTTP request, through the capabilities cache for GetCapabilities
 
         # Get correct URL based on Operation list.
+        request_url = self._operation_url(operation, isinstance(self.request, str))
+
+        self.request, self.response = self._send(request_url, self.request, capabilities)
+        self._exml = self._parseresponse(self.response)
+        self.exceptionreport = None
 
+    def _operation_url(self, name, get):
+        """ Return the URL of an operation for GET (KVP) or POST (XML) requests """
         # If skip_caps=True, then self.operations has not been set, so use
         # default URL.
-        if hasattr(self, 'operations'):
-            try:
-                op = self.get_operation_by_name('getrecords')
-                if isinstance(self.request, str):  # GET KVP
-                    get_verbs = [x for x in op.methods if x.get('type').lower() == 'get']
-                    request_url = get_verbs[0].get('url')
-                else:
-                    post_verbs = [x for x in op.methods if x.get('type').lower() == 'post']
-                    if len(post_verbs) > 1:
-                        # Filter by constraints.  We must match a PostEncoding of "XML"
-                        found_xml = False
-                        for pv in post_verbs:
-                            for const in pv.get('constraints'):
-                                if const.name.lower() == 'postencoding':
-                                    values = [v.lower() for v in const.values]
-                                    if 'xml' in values:
-                                        request_url = pv.get('url')
-                                        found_xml = True
-                                        break
-                        if not found_xml:  # Well, just use the first one.
-                            request_url = post_verbs[0].get('url')
-                    elif len(post_verbs) == 1:
+        if not hasattr(self, 'operations'):
+            return self.url
+        key = (name.lower(), get)
+        if key not in self._operation_urls:
+            self._operation_urls[key] = self._find_operation_url(name, get)
+        return self._operation_urls[key]
+
+    def _find_operation_url(self, name, get):
+        request_url = self.url
+        try:
+            op = self.get_operation_by_name(name)
+            if get:  # GET KVP
+                get_verbs = [x for x in op.methods if x.get('type').lower() == 'get']
+                request_url = get_verbs[0].get('url')
+            else:
+                post_verbs = [x for x in op.methods if x.get('type').lower() == 'post']
+                if len(post_verbs) > 1:
+                    # Filter by constraints.  We must match a PostEncoding of "XML"
+                    found_xml = False
+                    for pv in post_verbs:
+                        for const in pv.get('constraints'):
+                            if const.name.lower() == 'postencoding':
+                                values = [v.lower() for v in const.values]
+                                if 'xml' in values:
+                                    request_url = pv.get('url')
+                                    found_xml = True
+                                    break
+                    if not found_xml:  # Well, just use the first one.
                         request_url = post_verbs[0].get('url')
-            except Exception:  # no such luck, just go with request_url
-                pass
-
-        if isinstance(self.request, str):  # GET KVP
-            self.request = '%s%s' % (bind_url(request_url), self.request)
+                elif len(post_verbs) == 1:
+                    request_url = post_verbs[0].get('url')
+        except Exception:  # no such luck, just go with request_url
+            pass
+        return request_url
+
+    def _send(self, request_url, request, capabilities=False):
+        """ Send a request, and return the request as sent and the response content """
+        if isinstance(request, str):  # GET KVP
+            request = '%s%s' % (bind_url(request_url), request)
             headers_ = {'Accept': outputformat}
             if self.headers:
                 headers_.update(self.headers)
-            self.response = openURL(
-                self.request, None, 'Get', timeout=self.timeout, auth=self.auth, headers=headers_
-            ).read()
+            cache = get_default_cache() if capabilities else None
+            if cache is not None:
+                response = cache.open(
+                    request, version=self.version, timeout=self.timeout, auth=self.auth, headers=headers_,
+                    session=self.session
+                ).read()
+            else:
+                response = openURL(
+                    request, None, 'Get', timeout=self.timeout, auth=self.auth, headers=headers_,
+                    session=self.session
+                ).read()
         else:
-            self.request = cleanup_namespaces(self.request)
+            request = cleanup_namespaces(request)
             # Add any namespaces used in the "typeNames" attribute of the
             # csw30:Query element to the query's xml namespaces.
-            for query in self.request.findall(util.nspath_eval('csw30:Query', namespaces)):
+            for query in request.findall(_nspath('csw30:Query')):
                 ns = query.get("typeNames", None)
                 if ns is not None:
                     # Pull out "gmd" from something like "gmd:MD_Metadata" from the list
                     # of typenames
                     ns_keys = [x.split(':')[0] for x in ns.split(' ')]
-                    self.request = add_namespaces(self.request, ns_keys)
-            self.request = add_namespaces(self.request, 'fes')
+                    request = add_namespaces(request, ns_keys)
+            request = add_namespaces(request, 'fes')
 
-            self.request = util.element_to_string(self.request, encoding='utf-8')
+            request = util.element_to_string(request, encoding='utf-8')
 
-            self.response = http_post(request_url, self.request, self.lang, self.timeout,
-                                      auth=self.auth, headers=self.headers).content
+            response = http_post(request_url, request, self.lang, self.timeout,
+                                 auth=self.auth, headers=self.headers, session=self.session).content
+        return request, response
 
+    def _parseresponse(self, response):
+        """ Parse a response, raising an ExceptionReport for OGC exceptions """
         # parse result see if it's XML
-        self._exml = etree.parse(BytesIO(self.response))
+        exml = etree.parse(BytesIO(response))
 
         # it's XML.  Attempt to decipher whether the XML response is CSW-ish """
         valid_xpaths = [
-            util.nspath_eval('ows200:ExceptionReport', namespaces),
-            util.nspath_eval('csw30:Capabilities', namespaces),
-            util.nspath_eval('csw30:DescribeRecordResponse', namespaces),
-            util.nspath_eval('csw30:GetDomainResponse', namespaces),
-            util.nspath_eval('csw30:GetRecordsResponse', namespaces),
-            util.nspath_eval('csw30:GetRecordByIdResponse', namespaces),
-            util.nspath_eval('csw30:HarvestResponse', namespaces),
-            util.nspath_eval('csw30:TransactionResponse', namespaces),
-            util.nspath_eval('csw30:Record', namespaces)
+            _nspath('ows200:ExceptionReport'),
+            _nspath('csw30:Capabilities'),
+            _nspath('csw30:DescribeRecordResponse'),
+            _nspath('csw30:GetDomainResponse'),
+            _nspath('csw30:GetRecordsResponse'),
+            _nspath('csw30:GetRecordByIdResponse'),
+            _nspath('csw30:HarvestResponse'),
+            _nspath('csw30:TransactionResponse'),
+            _nspath('csw30:Record')
         ]
 
-        if self._exml.getroot().tag not in valid_xpaths:
+        if exml.getroot().tag not in valid_xpaths:
             raise RuntimeError('Document is XML, but not CSW-ish')
 
         # check if it's an OGC Exception
-        val = self._exml.find(util.nspath_eval('ows200:Exception', namespaces))
+        val = exml.find(_nspath('ows200:Exception'))
         if val is not None:
-            raise ows.ExceptionReport(self._exml, self.owscommon.namespace)
-        else:
-            self.exceptionreport = None
+            raise ows.ExceptionReport(exml, self.owscommon.namespace)
+        return exml
+
+
+def _parse_iso_records(documents):
+    """ Return the ISO 19139 records of a list of (document, tail) tuples, without their element """
+    records = []
+    for document, tail in documents:
+        elem = etree.fromstring(document)
+        elem.tail = tail  # as serialized in the xml of records parsed in the response
+        record = MD_Metadata(elem)
+        record.md = None
+        records.append(record)
+    return records
 
 
 class Csw30Record(object):
@@ -641,7 +796,7 @@ class Csw30Record(object):
         # rdf:RDF/rdf:Description container
         # (child content model is identical)
         self.rdf = False
-        rdf = record.find(util.nspath_eval('rdf:Description', namespaces))
+        rdf = record.find(_nspath('rdf:Description'))
         if rdf is not None:
             self.rdf = True
             record = rdf
@@ -649,48 +804,48 @@ class Csw30Record(object):
         # some CSWs return records with multiple identifiers based on
         # different schemes.  Use the first dc:identifier value to set
         # self.identifier, and set self.identifiers as a list of dicts
-        val = record.find(util.nspath_eval('dc:identifier', namespaces))
+        val = record.find(_nspath('dc:identifier'))
         self.identifier = util.testXMLValue(val)
 
         self.identifiers = []
-        for i in record.findall(util.nspath_eval('dc:identifier', namespaces)):
+        for i in record.findall(_nspath('dc:identifier')):
             d = {}
             d['scheme'] = i.attrib.get('scheme')
             d['identifier'] = i.text
             self.identifiers.append(d)
 
-        val = record.find(util.nspath_eval('dc:type', namespaces))
+        val = record.find(_nspath('dc:type'))
         self.type = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:title', namespaces))
+        val = record.find(_nspath('dc:title'))
         self.title = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:alternative', namespaces))
+        val = record.find(_nspath('dct:alternative'))
         self.alternative = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:isPartOf', namespaces))
+        val = record.find(_nspath('dct:isPartOf'))
         self.ispartof = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:abstract', namespaces))
+        val = record.find(_nspath('dct:abstract'))
         self.abstract = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:date', namespaces))
+        val = record.find(_nspath('dc:date'))
         self.date = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:created', namespaces))
+        val = record.find(_nspath('dct:created'))
         self.created = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:issued', namespaces))
+        val = record.find(_nspath('dct:issued'))
         self.issued = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:relation', namespaces))
+        val = record.find(_nspath('dc:relation'))
         self.relation = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:temporal', namespaces))
+        val = record.find(_nspath('dct:temporal'))
         self.temporal = util.testXMLValue(val)
 
         self.uris = []  # list of dicts
-        for i in record.findall(util.nspath_eval('dc:URI', namespaces)):
+        for i in record.findall(_nspath('dc:URI')):
             uri = {}
             uri['protocol'] = util.testXMLValue(i.attrib.get('protocol'), True)
             uri['name'] = util.testXMLValue(i.attrib.get('name'), True)
@@ -700,64 +855,64 @@ class Csw30Record(object):
             self.uris.append(uri)
 
         self.references = []  # list of dicts
-        for i in record.findall(util.nspath_eval('dct:references', namespaces)):
+        for i in record.findall(_nspath('dct:references')):
             ref = {}
             ref['scheme'] = util.testXMLValue(i.attrib.get('scheme'), True)
             ref['url'] = util.testXMLValue(i)
 
             self.references.append(ref)
 
-        val = record.find(util.nspath_eval('dct:modified', namespaces))
+        val = record.find(_nspath('dct:modified'))
         self.modified = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:creator', namespaces))
+        val = record.find(_nspath('dc:creator'))
         self.creator = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:publisher', namespaces))
+        val = record.find(_nspath('dc:publisher'))
         self.publisher = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:coverage', namespaces))
+        val = record.find(_nspath('dc:coverage'))
         self.coverage = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:contributor', namespaces))
+        val = record.find(_nspath('dc:contributor'))
         self.contributor = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:language', namespaces))
+        val = record.find(_nspath('dc:language'))
         self.language = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:source', namespaces))
+        val = record.find(_nspath('dc:source'))
         self.source = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:rightsHolder', namespaces))
+        val = record.find(_nspath('dct:rightsHolder'))
         self.rightsholder = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:accessRights', namespaces))
+        val = record.find(_nspath('dct:accessRights'))
         self.accessrights = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dct:license', namespaces))
+        val = record.find(_nspath('dct:license'))
         self.license = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('dc:format', namespaces))
+        val = record.find(_nspath('dc:format'))
         self.format = util.testXMLValue(val)
 
         self.subjects = []
-        for i in record.findall(util.nspath_eval('dc:subject', namespaces)):
+        for i in record.findall(_nspath('dc:subject')):
             self.subjects.append(util.testXMLValue(i))
 
         self.rights = []
-        for i in record.findall(util.nspath_eval('dc:rights', namespaces)):
+        for i in record.findall(_nspath('dc:rights')):
             self.rights.append(util.testXMLValue(i))
 
-        val = record.find(util.nspath_eval('dct:spatial', namespaces))
+        val = record.find(_nspath('dct:spatial'))
         self.spatial = util.testXMLValue(val)
 
-        val = record.find(util.nspath_eval('ows200:BoundingBox', namespaces))
+        val = record.find(_nspath('ows200:BoundingBox'))
         if val is not None:
             self.bbox = ows.BoundingBox(val, namespaces['ows'])
         else:
             self.bbox = None
 
-        val = record.find(util.nspath_eval('dct:spatial', namespaces))
+        val = record.find(_nspath('dct:spatial'))
         self.spatial = None
         if val is not None:
             val = util.testXMLValue(val)
@@ -771,7 +926,7 @@ class Csw30Record(object):
             else:
                 self.spatial = val
 
-        val = record.find(util.nspath_eval('ows200:WGS84BoundingBox', namespaces))
+        val = record.find(_nspath('ows200:WGS84BoundingBox'))
         if val is not None:
             self.bbox_wgs84 = ows.WGS84BoundingBox(val, namespaces['ows'])
         else:
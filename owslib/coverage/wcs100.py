@@ -39,14 +39,15 @@ class WebCoverageService_1_0_0(WCSBase):
         else:
             raise KeyError("No content named %s" % name)
 
-    def __init__(self, url, xml, cookies, auth=None, timeout=30, headers=None):
-        super(WebCoverageService_1_0_0, self).__init__(auth=auth, timeout=timeout, headers=headers)
+    def __init__(self, url, xml, cookies, auth=None, timeout=30, headers=None, session=None):
+        super(WebCoverageService_1_0_0, self).__init__(auth=auth, timeout=timeout, headers=headers, session=session)
         self.version = '1.0.0'
         self.url = url
         self.cookies = cookies
         self.timeout = timeout
         # initialize from saved capability document or access the server
-        reader = WCSCapabilitiesReader(self.version, self.cookies, self.auth, headers=self.headers)
+        reader = WCSCapabilitiesReader(self.version, self.cookies, self.auth, headers=self.headers,
+                                       session=self.session)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
@@ -154,7 +155,8 @@ class WebCoverageService_1_0_0(WCSBase):
         data = urlencode(request)
         LOGGER.debug('WCS 1.0.0 DEBUG: Second part of URL: %s' % data)
 
-        u = openURL(base_url, data, method, self.cookies, auth=self.auth, timeout=timeout, headers=self.headers)
+        u = openURL(base_url, data, method, self.cookies, auth=self.auth, timeout=timeout, headers=self.headers,
+                    session=self.session)
         return u
 
     def getOperationByName(self, name):
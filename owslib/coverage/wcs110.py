@@ -52,14 +52,15 @@ class WebCoverageService_1_1_0(WCSBase):
         else:
             raise KeyError("No content named %s" % name)
 
-    def __init__(self, url, xml, cookies, auth=None, timeout=30, headers=None):
-        super(WebCoverageService_1_1_0, self).__init__(auth=auth, timeout=timeout, headers=headers)
+    def __init__(self, url, xml, cookies, auth=None, timeout=30, headers=None, session=None):
+        super(WebCoverageService_1_1_0, self).__init__(auth=auth, timeout=timeout, headers=headers, session=session)
 
         self.url = url
         self.cookies = cookies
         self.timeout = timeout
         # initialize from saved capability document or access the server
-        reader = WCSCapabilitiesReader(self.version, self.cookies, self.auth, headers=self.headers)
+        reader = WCSCapabilitiesReader(self.version, self.cookies, self.auth, headers=self.headers,
+                                       session=self.session)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
@@ -205,7 +206,8 @@ class WebCoverageService_1_1_0(WCSBase):
         # encode and request
         data = urlencode(request)
 
-        u = openURL(base_url, data, method, self.cookies, auth=self.auth, timeout=timeout, headers=self.headers)
+        u = openURL(base_url, data, method, self.cookies, auth=self.auth, timeout=timeout, headers=self.headers,
+                    session=self.session)
         return u
 
     def getOperationByName(self, name):
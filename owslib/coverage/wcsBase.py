@@ -10,6 +10,7 @@
 # =============================================================================
 
 from urllib.parse import urlencode, parse_qsl
+from owslib.cache import get_default_cache
 from owslib.etree import etree
 from owslib.util import Authentication, openURL, getXMLTree
 
@@ -33,7 +34,7 @@ class ServiceException(Exception):
 class WCSBase(object):
     """Base class to be subclassed by version dependent WCS classes. Provides 'high-level'
     version independent methods"""
-    def __new__(self, url, xml, cookies, auth=None, timeout=30, headers=None):
+    def __new__(self, url, xml, cookies, auth=None, timeout=30, headers=None, session=None):
         """ overridden __new__ method
 
         @type url: string
@@ -43,26 +44,28 @@ class WCSBase(object):
         @param auth: instance of owslib.util.Authentication
         @param timeout: HTTP timeout, in seconds
         @param headers: dict for geoserver's request's headers
+        @param session: instance of owslib.util.HTTPSession
         @return: inititalised WCSBase object
         """
         obj = object.__new__(self)
-        obj.__init__(url, xml, cookies, timeout=timeout, auth=auth, headers=headers)
+        obj.__init__(url, xml, cookies, timeout=timeout, auth=auth, headers=headers, session=session)
         self.cookies = cookies
         self.headers = headers
         self.timeout = timeout
         self._describeCoverage = {}  # cache for DescribeCoverage responses
         return obj
 
-    def __init__(self, auth=None, timeout=30, headers=None):
+    def __init__(self, auth=None, timeout=30, headers=None, session=None):
         self.auth = auth or Authentication()
         self.headers = headers
+        self.session = session
         self.timeout = timeout
 
     def getDescribeCoverage(self, identifier):
         ''' returns a describe coverage document - checks the internal cache to see if it has been fetched before '''
         if identifier not in list(self._describeCoverage.keys()):
             reader = DescribeCoverageReader(
-                self.version, identifier, self.cookies, self.auth, self.timeout, self.headers)
+                self.version, identifier, self.cookies, self.auth, self.timeout, self.headers, self.session)
             self._describeCoverage[identifier] = reader.read(self.url)
         return self._describeCoverage[identifier]
 
@@ -71,10 +74,12 @@ class WCSCapabilitiesReader(object):
     """Read and parses WCS capabilities document into a lxml.etree infoset
     """
 
-    def __init__(self, version=None, cookies=None, auth=None, timeout=30, headers=None):
+    def __init__(self, version=None, cookies=None, auth=None, timeout=30, headers=None, session=None, cache=None):
         """Initialize
         @type version: string
         @param version: WCS Version parameter e.g '1.0.0'
+        @type cache: owslib.cache.CapabilitiesCache
+        @param cache: capabilities cache (default is the default cache, if any)
         """
         self.version = version
         self._infoset = None
@@ -82,6 +87,8 @@ class WCSCapabilitiesReader(object):
         self.headers = headers
         self.timeout = timeout
         self.auth = auth or Authentication()
+        self.session = session
+        self.cache = cache
 
     def capabilities_url(self, service_url):
         """Return a capabilities url
@@ -117,7 +124,13 @@ class WCSCapabilitiesReader(object):
         @return: An elementtree tree representation of the capabilities document
         """
         request = self.capabilities_url(service_url)
-        u = openURL(request, timeout=timeout, cookies=self.cookies, auth=self.auth, headers=self.headers)
+        cache = self.cache or get_default_cache()
+        if cache is not None:
+            u = cache.open(request, version=self.version, timeout=timeout, cookies=self.cookies, auth=self.auth,
+                           headers=self.headers, session=self.session)
+        else:
+            u = openURL(request, timeout=timeout, cookies=self.cookies, auth=self.auth, headers=self.headers,
+                        session=self.session)
         return getXMLTree(u)
 
     def readString(self, st):
@@ -132,7 +145,7 @@ class DescribeCoverageReader(object):
     """Read and parses WCS DescribeCoverage document into a lxml.etree infoset
     """
 
-    def __init__(self, version, identifier, cookies, auth=None, timeout=30, headers=None):
+    def __init__(self, version, identifier, cookies, auth=None, timeout=30, headers=None, session=None):
         """Initialize
         @type version: string
         @param version: WCS Version parameter e.g '1.0.0'
@@ -144,6 +157,7 @@ class DescribeCoverageReader(object):
         self.headers = headers
         self.timeout = timeout
         self.auth = auth or Authentication()
+        self.session = session
 
     def descCov_url(self, service_url):
         """Return a describe coverage url
@@ -196,5 +210,6 @@ class DescribeCoverageReader(object):
         """
 
         request = self.descCov_url(service_url)
-        u = openURL(request, cookies=self.cookies, timeout=timeout, auth=self.auth, headers=self.headers)
+        u = openURL(request, cookies=self.cookies, timeout=timeout, auth=self.auth, headers=self.headers,
+                    session=self.session)
         return etree.fromstring(u.read())
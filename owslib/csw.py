@@ -18,7 +18,7 @@ from .util import clean_ows_url, Authentication
 
 
 def CatalogueServiceWeb(url, lang='en-US', version='2.0.2', timeout=10, skip_caps=False,
-                        username=None, password=None, auth=None, headers=None):
+                        username=None, password=None, auth=None, headers=None, session=None, parse_processes=0):
     """
     CSW factory function, returns a version specific CatalogueServiceWeb object
 
@@ -41,6 +41,12 @@ def CatalogueServiceWeb(url, lang='en-US', version='2.0.2', timeout=10, skip_cap
     @param auth: instance of owslib.util.Authentication
     @type headers: dict
     @param headers: HTTP headers to send with requests
+    @type session: owslib.util.HTTPSession
+    @param session: HTTP session to send requests with (default is the shared session)
+    @type parse_processes: int
+    @param parse_processes: number of processes parsing ISO 19139 records,
+                            None for the number of CPUs (default is 0,
+                            records are parsed in this process)
 
     @return: initialized CatalogueServiceWeb object
     """
@@ -59,12 +65,12 @@ def CatalogueServiceWeb(url, lang='en-US', version='2.0.2', timeout=10, skip_cap
         return csw2.CatalogueServiceWeb(
             clean_url, lang=lang, version=version, timeout=timeout,
             skip_caps=skip_caps, username=username, password=password,
-            auth=auth, headers=headers)
+            auth=auth, headers=headers, session=session, parse_processes=parse_processes)
     if version == '3.0.0':
         return csw3.CatalogueServiceWeb(
             clean_url, lang=lang, version=version, timeout=timeout,
             skip_caps=skip_caps, username=username, password=password,
-            auth=auth, headers=headers)
+            auth=auth, headers=headers, session=session, parse_processes=parse_processes)
 
     raise NotImplementedError('The CSW version ({}) you requested is'
                               ' not implemented. Please use 2.0.2 or'
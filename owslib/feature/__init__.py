@@ -8,6 +8,7 @@
 import logging
 
 from urllib.parse import urlencode
+from owslib import snapshot
 from owslib.crs import Crs
 from owslib.util import Authentication, build_get_url
 from owslib.feature.schema import get_schema
@@ -19,8 +20,9 @@ LOGGER = logging.getLogger(__name__)
 class WebFeatureService_(object):
     """Base class for WebFeatureService implementations"""
 
-    def __init__(self, auth=None):
+    def __init__(self, auth=None, session=None):
         self.auth = auth or Authentication()
+        self.session = session
 
     def getBBOXKVP(self, bbox, typename):
         """Formate bounding box for KVP request type (HTTP GET)
@@ -388,4 +390,29 @@ class WebFeatureService_(object):
         """
         Get layer schema compatible with :class:`fiona` schema object
         """
-        return get_schema(self.url, typename, self.version, auth=self.auth)
+        return get_schema(self.url, typename, self.version, auth=self.auth, session=self.session)
+
+    def to_snapshot(self):
+        """Return a compact snapshot of the service metadata
+
+        The snapshot is restored with `from_snapshot`, see
+        :mod:`owslib.snapshot`.
+
+        @returns: snapshot, as bytes
+        """
+        return snapshot.dumps(self)
+
+    @classmethod
+    def from_snapshot(cls, data, headers=None, auth=None, session=None):
+        """Restore a service from its snapshot, without requesting or parsing
+        its capabilities document
+
+        @param data: snapshot returned by `to_snapshot`
+        @param headers: HTTP headers to send with requests
+        @param auth: instance of owslib.util.Authentication
+        @param session: instance of owslib.util.HTTPSession
+        @returns: service instance
+        @raises owslib.snapshot.SnapshotError: if the snapshot is invalid or
+            was taken by another version of OWSLib
+        """
+        return snapshot.loads(data, cls, headers=headers, auth=auth or Authentication(), session=session)
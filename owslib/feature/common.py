@@ -1,3 +1,4 @@
+from owslib.cache import get_default_cache
 from owslib.etree import etree
 from owslib.util import Authentication, openURL, getXMLTree
 
@@ -12,7 +13,8 @@ class WFSCapabilitiesReader(object):
     """Read and parse capabilities document into a lxml.etree infoset
     """
 
-    def __init__(self, version="1.0", username=None, password=None, headers=None, auth=None):
+    def __init__(self, version="1.0", username=None, password=None, headers=None, auth=None, session=None,
+                 cache=None):
         """Initialize"""
         self.headers = headers
         if auth:
@@ -21,6 +23,8 @@ class WFSCapabilitiesReader(object):
             if password:
                 auth.password = password
         self.auth = auth or Authentication(username, password)
+        self.session = session
+        self.cache = cache
         self.version = version
         self._infoset = None
 
@@ -55,7 +59,12 @@ class WFSCapabilitiesReader(object):
             A timeout value (in seconds) for the request.
         """
         request = self.capabilities_url(url)
-        u = openURL(request, timeout=timeout, headers=self.headers, auth=self.auth)
+        cache = self.cache or get_default_cache()
+        if cache is not None:
+            u = cache.open(request, version=self.version, timeout=timeout, headers=self.headers, auth=self.auth,
+                           session=self.session)
+        else:
+            u = openURL(request, timeout=timeout, headers=self.headers, auth=self.auth, session=self.session)
         return getXMLTree(u)
 
     def readString(self, st):
@@ -72,9 +81,10 @@ class WFSCapabilitiesReader(object):
 
 
 class AbstractContentMetadata(object):
-    def __init__(self, headers=None, auth=None):
+    def __init__(self, headers=None, auth=None, session=None):
         self.auth = auth or Authentication()
         self.headers = headers
+        self.session = session
 
     def get_metadata(self):
         return [
@@ -0,0 +1,247 @@
+"""
+Incremental reader for GML feature collections, as returned by WFS
+GetFeature requests
+
+Features are parsed one at a time with :func:`lxml.etree.iterparse` and
+discarded from the document tree once they have been yielded, so memory use
+does not grow with the size of the response::
+
+    schema = wfs.get_schema('dijken:dijklijnenkaart_rce')
+    response = wfs.getfeature(typename='dijken:dijklijnenkaart_rce', stream=True)
+    for feature in iter_features(response, schema=schema, as_geojson=True):
+        print(feature['id'], feature['properties'])
+"""
+
+from dateutil import parser
+
+from owslib.etree import etree
+from owslib.namespaces import Namespaces
+
+MYNS = Namespaces()
+GML_NAMESPACES = (
+    MYNS.get_namespace("gml"),
+    MYNS.get_namespace("gml32"),
+)
+WFS20_NAMESPACE = MYNS.get_namespace("wfs20")
+XSI_NAMESPACE = MYNS.get_namespace("xsi")
+
+MEMBER_TAGS = frozenset(
+    ["{%s}%s" % (ns, tag) for ns in GML_NAMESPACES for tag in ("featureMember", "featureMembers")]
+).union(["{%s}member" % WFS20_NAMESPACE])
+# members which are not features themselves, their features are read instead
+CONTAINER_TAGS = frozenset(
+    ["{%s}%s" % (WFS20_NAMESPACE, tag) for tag in ("FeatureCollection", "additionalObjects", "Tuple")]
+)
+
+ID_ATTRIBUTES = ["{%s}id" % ns for ns in GML_NAMESPACES] + ["fid"]
+
+INTEGER_TYPES = frozenset([
+    "int", "integer", "long", "short", "byte", "nonNegativeInteger", "positiveInteger",
+    "negativeInteger", "nonPositiveInteger", "unsignedInt", "unsignedLong", "unsignedShort",
+    "unsignedByte",
+])
+FLOAT_TYPES = frozenset(["double", "float", "decimal"])
+
+
+def iter_features(source, schema=None, as_geojson=False):
+    """Iterate over the features of a GML feature collection
+
+    Properties are returned as strings, unless their type is known from
+    `schema`. Geometries are returned as GeoJSON-like geometry objects, with
+    coordinates in the axis order of the document.
+
+    :param source: file-like object (e.g. the result of
+                   ``WebFeatureService.getfeature``) or file name
+    :param dict schema: layer schema, as returned by
+                        :func:`owslib.feature.schema.get_schema`
+    :param bool as_geojson: whether to return GeoJSON-like features instead
+                            of flat dictionaries of the feature's properties
+                            (geometry included), with its id as ``gml_id``
+    :return: generator of features
+    """
+    types = {}
+    geometry_column = None
+    if schema:
+        types = schema.get("properties", {})
+        geometry_column = schema.get("geometry_column")
+
+    context = etree.iterparse(source, events=("end",), remove_comments=True)
+    for _, element in context:
+        member = element.getparent()
+        if member is None or member.tag not in MEMBER_TAGS or element.tag in CONTAINER_TAGS:
+            continue
+
+        yield _to_feature(element, types, geometry_column, as_geojson)
+
+        # discard the feature, and the members already processed
+        element.clear()
+        while element.getprevious() is not None:
+            del member[0]
+        if not member.tag.endswith("featureMembers"):
+            collection = member.getparent()
+            while member.getprevious() is not None:
+                del collection[0]
+    del context
+
+
+def _to_feature(element, types, geometry_column, as_geojson):
+    """Convert a feature element into a feature
+
+    :param element: feature element
+    :param dict types: data types of the properties by name
+    :param str geometry_column: name of the geometry property, if known
+    :param bool as_geojson: whether to return a GeoJSON-like feature
+    :return dict: feature
+    """
+    fid = None
+    for attribute in ID_ATTRIBUTES:
+        fid = element.get(attribute)
+        if fid is not None:
+            break
+
+    properties = {}
+    geometry = None
+    geometry_name = None
+    for child in element.iterchildren(tag=etree.Element):
+        qname = etree.QName(child)
+        if qname.namespace in GML_NAMESPACES:  # boundedBy, name, description...
+            continue
+
+        name = qname.localname
+        value = child.find("*")
+        if value is not None and (name == geometry_column or etree.QName(value).namespace in GML_NAMESPACES):
+            if geometry_name is None:
+                geometry_name = name
+                geometry = _to_geometry(value)
+                continue
+            properties[name] = _to_geometry(value)
+        elif child.get("{%s}nil" % XSI_NAMESPACE) == "true":
+            properties[name] = None
+        else:
+            properties[name] = _to_value(child.text, types.get(name))
+
+    if as_geojson:
+        return {
+            "type": "Feature",
+            "id": fid,
+            "geometry": geometry,
+            "properties": properties,
+        }
+
+    feature = {"gml_id": fid}
+    if geometry_name is not None:
+        feature[geometry_name] = geometry
+    feature.update(properties)
+    return feature
+
+
+def _to_value(text, data_type):
+    """Convert the text of a property into its data type
+
+    :param str text: text of the property element
+    :param str data_type: XML schema data type of the property
+    :return: typed value (the text itself if it cannot be converted)
+    """
+    if text is None:
+        return None
+    if data_type is None or data_type == "string":
+        return text
+
+    text = text.strip()
+    try:
+        if data_type in INTEGER_TYPES:
+            return int(text)
+        if data_type in FLOAT_TYPES:
+            return float(text)
+        if data_type == "boolean":
+            return text in ("true", "1")
+        if data_type == "date":
+            return parser.parse(text).date()
+        if data_type == "dateTime":
+            return parser.parse(text)
+    except (ValueError, OverflowError):
+        pass
+    return text
+
+
+def _to_geometry(element):
+    """Convert a GML geometry into a GeoJSON-like geometry object
+
+    :param element: GML geometry element
+    :return dict: geometry, or ``None`` if the geometry type is not supported
+    """
+    name = etree.QName(element).localname
+
+    if name == "Point":
+        return {"type": "Point", "coordinates": _coordinates(element)[0]}
+    if name in ("LineString", "Curve", "LinearRing"):
+        return {"type": "LineString", "coordinates": _coordinates(element)}
+    if name in ("Polygon", "Surface", "PolygonPatch"):
+        return {"type": "Polygon", "coordinates": _rings(element)}
+
+    # geometries of the (pointMember, curveMembers, ...) member properties
+    members = [
+        _to_geometry(geometry)
+        for member in element.iterchildren(tag=etree.Element)
+        for geometry in member.iterchildren(tag=etree.Element)
+    ]
+    members = [m for m in members if m is not None]
+    if name == "MultiPoint":
+        return {"type": "MultiPoint", "coordinates": [m["coordinates"] for m in members]}
+    if name in ("MultiLineString", "MultiCurve"):
+        return {"type": "MultiLineString", "coordinates": [m["coordinates"] for m in members]}
+    if name in ("MultiPolygon", "MultiSurface"):
+        return {"type": "MultiPolygon", "coordinates": [m["coordinates"] for m in members]}
+    if name in ("MultiGeometry", "CompositeCurve", "CompositeSurface"):
+        return {"type": "GeometryCollection", "geometries": members}
+
+    return None
+
+
+def _rings(element):
+    """Return the exterior and interior rings of a polygon, exterior first"""
+    rings = []
+    for ring in element.iter(
+        *["{%s}%s" % (ns, tag) for ns in GML_NAMESPACES
+          for tag in ("exterior", "outerBoundaryIs", "interior", "innerBoundaryIs")]
+    ):
+        coordinates = _coordinates(ring)
+        if ring.tag.endswith(("exterior", "outerBoundaryIs")):
+            rings.insert(0, coordinates)
+        else:
+            rings.append(coordinates)
+    return rings
+
+
+def _coordinates(element):
+    """Return the coordinates of a geometry as a list of positions
+
+    Supports ``gml:pos``, ``gml:posList``, ``gml:coordinates`` and ``gml:coord``.
+    """
+    positions = []
+    for node in element.iter(etree.Element):
+        name = etree.QName(node).localname
+        if name == "pos":
+            positions.append([float(v) for v in node.text.split()])
+        elif name == "posList":
+            dimension = int(node.get("srsDimension") or _srs_dimension(node) or 2)
+            values = [float(v) for v in node.text.split()]
+            positions.extend(values[i:i + dimension] for i in range(0, len(values), dimension))
+        elif name == "coordinates":
+            decimal = node.get("decimal", ".")
+            separator = node.get("cs", ",")
+            ts = node.get("ts", " ")
+            tuples = node.text.split() if not ts.strip() else node.text.strip().split(ts)
+            for tuple_ in tuples:
+                positions.append([float(v.replace(decimal, ".")) for v in tuple_.split(separator)])
+        elif name == "coord":
+            positions.append([float(v.text) for v in node.iterchildren(tag=etree.Element)])
+    return positions
+
+
+def _srs_dimension(element):
+    """Return the srsDimension declared on the closest enclosing geometry"""
+    for ancestor in element.iterancestors():
+        if ancestor.get("srsDimension"):
+            return ancestor.get("srsDimension")
+    return None
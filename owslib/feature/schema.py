@@ -25,7 +25,8 @@ GML_NAMESPACES = (
 
 
 def get_schema(
-    url, typename, version="1.0.0", timeout=30, headers=None, username=None, password=None, auth=None
+    url, typename, version="1.0.0", timeout=30, headers=None, username=None, password=None, auth=None,
+    session=None
 ):
     """Parses DescribeFeatureType response and creates schema compatible
     with :class:`fiona`
@@ -37,6 +38,7 @@ def get_schema(
     :param str username: service authentication username
     :param str password: service authentication password
     :param Authentication auth: instance of owslib.util.Authentication
+    :param HTTPSession session: instance of owslib.util.HTTPSession
     """
     if auth:
         if username:
@@ -47,7 +49,7 @@ def get_schema(
         auth = Authentication(username, password)
     url = _get_describefeaturetype_url(url, version, typename)
     root = _get_remote_describefeaturetype(url, timeout=timeout,
-                                           headers=headers, auth=auth)
+                                           headers=headers, auth=auth, session=session)
 
     if ":" in typename:
         typename = typename.split(":")[1]
@@ -204,14 +206,15 @@ def _get_describefeaturetype_url(url, version, typename):
     return url.split("?")[0] + "?" + urlqs
 
 
-def _get_remote_describefeaturetype(url, timeout, headers, auth):
+def _get_remote_describefeaturetype(url, timeout, headers, auth, session=None):
     """Gets the DescribeFeatureType response from the remote server.
 
     :param str url: url of the service
     :param int timeout: request timeout
     :param Authentication auth: instance of owslib.util.Authentication
+    :param HTTPSession session: instance of owslib.util.HTTPSession
 
     :return etree.Element with the root of the DescribeFeatureType response
     """
-    res = openURL(url, timeout=timeout, headers=headers, auth=auth)
+    res = openURL(url, timeout=timeout, headers=headers, auth=auth, session=session)
     return etree.fromstring(res.read())
@@ -20,10 +20,8 @@ from owslib.util import (
     Authentication,
     openURL
 )
+from owslib import remotemetadata
 from owslib.etree import etree
-from owslib.fgdc import Metadata
-from owslib.iso import MD_Metadata
-from owslib.iso3 import MD_Metadata as MD_Metadata3  # ISO 19115 Part 3 XML
 from owslib.crs import Crs
 from owslib.namespaces import Namespaces
 from owslib.feature.schema import get_schema
@@ -92,6 +90,7 @@ class WebFeatureService_1_0_0(object):
         username=None,
         password=None,
         auth=None,
+        session=None,
     ):
         """Initialize."""
         if auth:
@@ -104,8 +103,9 @@ class WebFeatureService_1_0_0(object):
         self.timeout = timeout
         self.headers = headers
         self.auth = auth or Authentication(username, password)
+        self.session = session
         self._capabilities = None
-        reader = WFSCapabilitiesReader(self.version, headers=self.headers, auth=self.auth)
+        reader = WFSCapabilitiesReader(self.version, headers=self.headers, auth=self.auth, session=self.session)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
@@ -142,11 +142,13 @@ class WebFeatureService_1_0_0(object):
         featuretypelist = self._capabilities.find(nspath("FeatureTypeList"))
         features = self._capabilities.findall(nspath("FeatureTypeList/FeatureType"))
         for feature in features:
-            cm = ContentMetadata(
-                feature, featuretypelist, parse_remote_metadata, auth=self.auth
-            )
+            cm = ContentMetadata(feature, featuretypelist, auth=self.auth, session=self.session)
             self.contents[cm.id] = cm
 
+        if parse_remote_metadata:
+            # resolved at once for all feature types
+            remotemetadata.parse_remote_metadata(self.contents.values(), self.timeout)
+
         # exceptions
         self.exceptions = [
             f.text for f in self._capabilities.findall("Capability/Exception/Format")
@@ -159,7 +161,7 @@ class WebFeatureService_1_0_0(object):
         reader = WFSCapabilitiesReader(self.version, auth=self.auth)
         return openURL(
             reader.capabilities_url(self.url), timeout=self.timeout,
-            headers=self.headers, auth=self.auth
+            headers=self.headers, auth=self.auth, session=self.session
         )
 
     def items(self):
@@ -182,6 +184,7 @@ class WebFeatureService_1_0_0(object):
         outputFormat=None,
         method="{http://www.opengis.net/wfs}Get",
         startindex=None,
+        stream=False,
     ):
         """Request and return feature data as a file-like object.
 
@@ -209,6 +212,11 @@ class WebFeatureService_1_0_0(object):
             Requested response format of the request.
         startindex: int (optional)
             Start position to return feature set (paging in combination with maxfeatures)
+        stream : bool (optional)
+            Whether to return a file-like object reading the response from
+            the live connection (`owslib.util.StreamingResponse`), rather
+            than reading it into memory. Service exceptions are detected by
+            peeking at the first bytes of the response.
 
 
         There are 3 different modes of use
@@ -260,8 +268,13 @@ class WebFeatureService_1_0_0(object):
 
         data = urlencode(request)
         LOGGER.debug("Making request: %s?%s" % (base_url, data))
+
+        if stream:
+            return openURL(base_url, data, method, timeout=self.timeout, headers=self.headers,
+                           auth=self.auth, session=self.session, stream=True)
+
         u = openURL(base_url, data, method, timeout=self.timeout,
-                    headers=self.headers, auth=self.auth)
+                    headers=self.headers, auth=self.auth, session=self.session)
 
         # check for service exceptions, rewrap, and return
         # We're going to assume that anything with a content-length > 32k
@@ -306,7 +319,7 @@ class WebFeatureService_1_0_0(object):
         Get layer schema compatible with :class:`fiona` schema object
         """
 
-        return get_schema(self.url, typename, self.version, auth=self.auth)
+        return get_schema(self.url, typename, self.version, auth=self.auth, session=self.session)
 
 
 class ServiceIdentification(object):
@@ -342,10 +355,10 @@ class ContentMetadata(AbstractContentMetadata):
     """
 
     def __init__(
-        self, elem, parent, parse_remote_metadata=False, timeout=30, auth=None
+        self, elem, parent, parse_remote_metadata=False, timeout=30, auth=None, session=None
     ):
         """."""
-        super(ContentMetadata, self).__init__(auth)
+        super(ContentMetadata, self).__init__(auth=auth, session=session)
         self.id = testXMLValue(elem.find(nspath("Name")))
         self.title = testXMLValue(elem.find(nspath("Title")))
         self.abstract = testXMLValue(elem.find(nspath("Abstract")))
@@ -410,37 +423,18 @@ class ContentMetadata(AbstractContentMetadata):
 
     def parse_remote_metadata(self, timeout=30):
         """Parse remote metadata for MetadataURL of format 'XML' and add it as metadataUrl['metadata']"""
-        for metadataUrl in self.metadataUrls:
-            if (
-                metadataUrl["url"] is not None and metadataUrl["format"].lower() == "xml"
-            ):
-                try:
-                    content = openURL(
-                        metadataUrl["url"], timeout=timeout, headers=self.headers, auth=self.auth
-                    )
-                    doc = etree.fromstring(content.read())
-                    if metadataUrl["type"] == "FGDC":
-                        mdelem = doc.find(".//metadata")
-                        if mdelem is not None:
-                            metadataUrl["metadata"] = Metadata(mdelem)
-                        else:
-                            metadataUrl["metadata"] = None
-                    elif metadataUrl["type"] == "TC211":
-                        mdelem = doc.find(
-                            ".//" + nspath_eval("gmd:MD_Metadata", n.get_namespaces(["gmd"]))
-                        ) or doc.find(
-                            ".//" + nspath_eval("gmi:MI_Metadata", n.get_namespaces(["gmi"]))
-                        )
-                        if mdelem is not None:
-                            metadataUrl["metadata"] = MD_Metadata(mdelem)
-                        else:
-                            mdelem = MD_Metadata3.find_start(doc)
-                            if mdelem is not None:
-                                metadataUrl["metadata"] = MD_Metadata3(mdelem)
-                            else:
-                                metadataUrl["metadata"] = None
-                except Exception:
-                    metadataUrl["metadata"] = None
+        remotemetadata.parse_remote_metadata([self], timeout)
+
+    def _remote_metadata_parsers(self, metadataUrl):
+        if metadataUrl["url"] is not None and metadataUrl["format"].lower() == "xml":
+            if metadataUrl["type"] == "FGDC":
+                return (remotemetadata.FGDC,)
+            if metadataUrl["type"] == "TC211":
+                return (remotemetadata.ISO, remotemetadata.ISO3)
+        return None
+
+    def _read_remote_metadata(self, url, timeout):
+        return openURL(url, timeout=timeout, headers=self.headers, auth=self.auth, session=self.session).read()
 
 
 class OperationMetadata:
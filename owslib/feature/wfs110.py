@@ -17,10 +17,8 @@ from owslib.util import (
     ServiceException,
     Authentication
 )
+from owslib import remotemetadata
 from owslib.etree import etree
-from owslib.fgdc import Metadata
-from owslib.iso import MD_Metadata
-from owslib.iso3 import MD_Metadata as MD_Metadata3  # ISO 19115 Part 3 XML
 from owslib.ows import (
     OwsCommon,
     ServiceIdentification,
@@ -75,6 +73,7 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         username=None,
         password=None,
         auth=None,
+        session=None,
     ):
         """Initialize."""
         if auth:
@@ -84,14 +83,14 @@ class WebFeatureService_1_1_0(WebFeatureService_):
                 auth.password = password
         else:
             auth = Authentication(username, password)
-        super(WebFeatureService_1_1_0, self).__init__(auth)
+        super(WebFeatureService_1_1_0, self).__init__(auth, session=session)
         self.url = url
         self.version = version
         self.headers = headers
         self.timeout = timeout
         self._capabilities = None
         self.owscommon = OwsCommon("1.0.0")
-        reader = WFSCapabilitiesReader(self.version, headers=self.headers, auth=self.auth)
+        reader = WFSCapabilitiesReader(self.version, headers=self.headers, auth=self.auth, session=self.session)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
@@ -157,9 +156,13 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         )
         if features is not None:
             for feature in features:
-                cm = ContentMetadata(feature, parse_remote_metadata, headers=self.headers, auth=self.auth)
+                cm = ContentMetadata(feature, headers=self.headers, auth=self.auth, session=self.session)
                 self.contents[cm.id] = cm
 
+        if parse_remote_metadata:
+            # resolved at once for all feature types
+            remotemetadata.parse_remote_metadata(self.contents.values(), self.timeout)
+
         # exceptions
         self.exceptions = [
             f.text for f in self._capabilities.findall("Capability/Exception/Format")
@@ -172,7 +175,7 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         reader = WFSCapabilitiesReader(self.version, auth=self.auth)
         return openURL(
             reader.capabilities_url(self.url), timeout=self.timeout,
-            headers=self.headers, auth=self.auth
+            headers=self.headers, auth=self.auth, session=self.session
         )
 
     def items(self):
@@ -196,6 +199,7 @@ class WebFeatureService_1_1_0(WebFeatureService_):
         method="Get",
         startindex=None,
         sortby=None,
+        stream=False,
     ):
         """Request and return feature data as a file-like object.
 
@@ -228,6 +232,11 @@ class WebFeatureService_1_1_0(WebFeatureService_):
             List of property names whose values should be used to order
             (upon presentation) the set of feature instances that
             satify the query.
+        stream : bool (optional)
+            Whether to return a file-like object reading the response from
+            the live connection (`owslib.util.StreamingResponse`), rather
+            than reading it into memory. Service exceptions are detected by
+            peeking at the first bytes of the response.
 
         There are 3 different modes of use
 
@@ -314,8 +323,12 @@ class WebFeatureService_1_1_0(WebFeatureService_):
                 sortby=sortby,
             )
 
+        if stream:
+            return openURL(base_url, data, method, timeout=self.timeout, headers=self.headers,
+                           auth=self.auth, session=self.session, stream=True)
+
         u = openURL(base_url, data, method, timeout=self.timeout,
-                    headers=self.headers, auth=self.auth)
+                    headers=self.headers, auth=self.auth, session=self.session)
 
         # check for service exceptions, rewrap, and return
         # We're going to assume that anything with a content-length > 32k
@@ -362,9 +375,9 @@ class ContentMetadata(AbstractContentMetadata):
     Implements IMetadata.
     """
 
-    def __init__(self, elem, parse_remote_metadata=False, timeout=30, headers=None, auth=None):
+    def __init__(self, elem, parse_remote_metadata=False, timeout=30, headers=None, auth=None, session=None):
         """."""
-        super(ContentMetadata, self).__init__(headers=headers, auth=auth)
+        super(ContentMetadata, self).__init__(headers=headers, auth=auth, session=session)
         self.id = testXMLValue(elem.find(nspath_eval("wfs:Name", namespaces)))
         self.title = testXMLValue(elem.find(nspath_eval("wfs:Title", namespaces)))
         self.abstract = testXMLValue(elem.find(nspath_eval("wfs:Abstract", namespaces)))
@@ -434,35 +447,15 @@ class ContentMetadata(AbstractContentMetadata):
 
     def parse_remote_metadata(self, timeout=30):
         """Parse remote metadata for MetadataURL of format 'text/xml' and add it as metadataUrl['metadata']"""
-        for metadataUrl in self.metadataUrls:
-            if (
-                metadataUrl["url"] is not None and metadataUrl["format"].lower() == "text/xml"
-            ):
-                try:
-                    content = openURL(metadataUrl["url"], timeout=timeout, headers=self.headers, auth=self.auth)
-                    doc = etree.fromstring(content.read())
-
-                    if metadataUrl["type"] == "FGDC":
-                        mdelem = doc.find(".//metadata")
-                        if mdelem is not None:
-                            metadataUrl["metadata"] = Metadata(mdelem)
-                        else:
-                            metadataUrl["metadata"] = None
-                    elif metadataUrl["type"] in ["TC211", "19115", "19139"]:
-                        mdelem = doc.find(
-                            ".//" + nspath_eval("gmd:MD_Metadata", namespaces)
-                        )
-                        if mdelem is None:
-                            mdelem = doc.find(
-                                ".//" + nspath_eval("gmi:MI_Metadata", namespaces)
-                            )
-                        if mdelem is not None:
-                            metadataUrl["metadata"] = MD_Metadata(mdelem)
-                        else:
-                            mdelem = MD_Metadata3.find_start(doc)
-                            if mdelem is not None:
-                                metadataUrl["metadata"] = MD_Metadata3(mdelem)
-                            else:
-                                metadataUrl["metadata"] = None
-                except Exception:
-                    metadataUrl["metadata"] = None
+        remotemetadata.parse_remote_metadata([self], timeout)
+
+    def _remote_metadata_parsers(self, metadataUrl):
+        if metadataUrl["url"] is not None and metadataUrl["format"].lower() == "text/xml":
+            if metadataUrl["type"] == "FGDC":
+                return (remotemetadata.FGDC,)
+            if metadataUrl["type"] in ["TC211", "19115", "19139"]:
+                return (remotemetadata.ISO, remotemetadata.ISO3)
+        return None
+
+    def _read_remote_metadata(self, url, timeout):
+        return openURL(url, timeout=timeout, headers=self.headers, auth=self.auth, session=self.session).read()
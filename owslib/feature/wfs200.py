@@ -6,15 +6,17 @@
 # $Id: wfs.py 503 2006-02-01 17:09:12Z dokai $
 # =============================================================================
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from io import BytesIO
 import logging
+import time
 from urllib.parse import urlencode
 
+from requests.exceptions import (ChunkedEncodingError, ConnectionError, HTTPError, RequestException,
+                                 Timeout)
+
 # owslib imports:
-from owslib import util
-from owslib.fgdc import Metadata
-from owslib.iso import MD_Metadata
-from owslib.iso3 import MD_Metadata as MD_Metadata3  # ISO 19115 Part 3 XML
+from owslib import remotemetadata, util
 from owslib.ows import Constraint, ServiceIdentification, ServiceProvider, OperationsMetadata
 from owslib.etree import etree
 from owslib.util import nspath, testXMLValue, openURL, Authentication
@@ -64,6 +66,7 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         username=None,
         password=None,
         auth=None,
+        session=None,
     ):
         """Initialize."""
         if auth:
@@ -73,14 +76,14 @@ class WebFeatureService_2_0_0(WebFeatureService_):
                 auth.password = password
         else:
             auth = Authentication()
-        super(WebFeatureService_2_0_0, self).__init__(auth)
+        super(WebFeatureService_2_0_0, self).__init__(auth, session=session)
         LOGGER.debug("building WFS %s" % url)
         self.url = url
         self.version = version
         self.timeout = timeout
         self.headers = headers
         self._capabilities = None
-        reader = WFSCapabilitiesReader(self.version, headers=self.headers, auth=self.auth)
+        reader = WFSCapabilitiesReader(self.version, headers=self.headers, auth=self.auth, session=self.session)
         if xml:
             self._capabilities = reader.readString(xml)
         else:
@@ -155,11 +158,13 @@ class WebFeatureService_2_0_0(WebFeatureService_):
             nspath("FeatureTypeList/FeatureType", ns=WFS_NAMESPACE)
         )
         for feature in features:
-            cm = ContentMetadata(
-                feature, featuretypelist, parse_remote_metadata, auth=self.auth
-            )
+            cm = ContentMetadata(feature, featuretypelist, auth=self.auth, session=self.session)
             self.contents[cm.id] = cm
 
+        if parse_remote_metadata:
+            # resolved at once for all feature types
+            remotemetadata.parse_remote_metadata(self.contents.values(), self.timeout)
+
         # exceptions
         self.exceptions = [
             f.text for f in self._capabilities.findall("Capability/Exception/Format")
@@ -172,7 +177,7 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         reader = WFSCapabilitiesReader(self.version, auth=self.auth)
         return openURL(
             reader.capabilities_url(self.url), timeout=self.timeout,
-            headers=self.headers, auth=self.auth
+            headers=self.headers, auth=self.auth, session=self.session
         )
 
     def items(self):
@@ -198,6 +203,7 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         outputFormat=None,
         startindex=None,
         sortby=None,
+        stream=False,
     ):
         """Request and return feature data as a file-like object.
 
@@ -238,6 +244,11 @@ class WebFeatureService_2_0_0(WebFeatureService_):
             List of property names whose values should be used to order
             (upon presentation) the set of feature instances that
             satify the query.
+        stream : bool (optional)
+            Whether to return a file-like object reading the response from
+            the live connection (`owslib.util.StreamingResponse`), rather
+            than reading it into memory. Service exceptions are detected by
+            peeking at the first bytes of the response.
 
         There are 5 different modes of use
 
@@ -252,6 +263,7 @@ class WebFeatureService_2_0_0(WebFeatureService_):
 
         Returns:
             BytesIO -- Data returned from the service as a file-like object
+            (StreamingResponse if `stream` is set)
         """
         storedQueryParams = storedQueryParams or {}
         url = data = None
@@ -291,7 +303,12 @@ class WebFeatureService_2_0_0(WebFeatureService_):
                 startindex,
                 sortby)
 
-        u = openURL(url, data, method, timeout=self.timeout, headers=self.headers, auth=self.auth)
+        if stream:
+            return openURL(url, data, method, timeout=self.timeout, headers=self.headers, auth=self.auth,
+                           session=self.session, stream=True)
+
+        u = openURL(url, data, method, timeout=self.timeout, headers=self.headers, auth=self.auth,
+                    session=self.session)
 
         # check for service exceptions, rewrap, and return
         # We're going to assume that anything with a content-length > 32k
@@ -324,6 +341,176 @@ class WebFeatureService_2_0_0(WebFeatureService_):
                 return BytesIO(data)
             return u
 
+    def get_number_matched(
+        self,
+        typename=None,
+        filter=None,
+        bbox=None,
+        featureid=None,
+        srsname=None,
+        storedQueryID=None,
+        storedQueryParams=None,
+        method="Get",
+    ):
+        """Request the number of features matching a query (resultType=hits).
+
+        Parameters
+        ----------
+        typename, filter, bbox, featureid, srsname, storedQueryID, storedQueryParams, method
+            Query, as for `getfeature`.
+
+        Returns:
+            int -- Number of matching features, or None if unknown to the service
+        """
+        if typename and type(typename) == type(""):  # noqa: E721
+            typename = [typename]
+        if method.upper() == "GET":
+            url = self.getGETGetFeatureRequest(
+                typename=typename,
+                filter=filter,
+                bbox=bbox,
+                featureid=featureid,
+                srsname=srsname,
+                storedQueryID=storedQueryID,
+                storedQueryParams=storedQueryParams,
+                method="Get",
+            )
+            url = util.build_get_url(url, {"resultType": "hits"})
+            data = None
+        else:
+            url, data = self.getPOSTGetFeatureRequest(
+                typename=typename,
+                filter=filter,
+                bbox=bbox,
+                featureid=featureid,
+                storedQueryID=storedQueryID,
+                storedQueryParams=storedQueryParams,
+                method="Post",
+            )
+            request = etree.fromstring(data)
+            request.set("resultType", "hits")
+            data = etree.tostring(request)
+
+        u = openURL(url, data, method, timeout=self.timeout, headers=self.headers, auth=self.auth,
+                    session=self.session)
+        tree = etree.fromstring(u.read())
+        number_matched = tree.get("numberMatched")
+        if number_matched is None or number_matched == "unknown":
+            return None
+        return int(number_matched)
+
+    def iter_pages(
+        self,
+        page_size=1000,
+        max_workers=4,
+        as_completed=False,
+        retries=2,
+        backoff=1,
+        **kwargs
+    ):
+        """Request all features matching a query, page by page.
+
+        The number of matching features is requested first (see
+        `get_number_matched`), and the pages are then requested concurrently.
+        Servers should be given a `sortby` to guarantee a stable order of the
+        features across pages.
+
+        Parameters
+        ----------
+        page_size : int
+            Maximum number of features per page.
+        max_workers : int
+            Maximum number of concurrent requests.
+        as_completed : bool
+            Whether to yield the pages as they are completed, rather than
+            in order.
+        retries : int
+            Number of times a page request is repeated after a connection
+            error, timeout or server (5xx) error.
+        backoff : float
+            Delay (in seconds) before the first repetition of a failed page
+            request, doubled for each subsequent one.
+        kwargs
+            Query, as for `getfeature`. `startindex` sets the position of the
+            first feature, `maxfeatures` the maximum number of features in
+            all pages.
+
+        Raises:
+            ValueError: If the number of matching features is unknown to the
+                service, and no `maxfeatures` is given
+
+        Returns:
+            generator of (startindex, file-like object) tuples, one per page
+        """
+        startindex = kwargs.pop("startindex", None) or 0
+        maxfeatures = kwargs.pop("maxfeatures", None)
+
+        hits_query = ["typename", "filter", "bbox", "featureid", "srsname", "storedQueryID",
+                      "storedQueryParams", "method"]
+        number_matched = self.get_number_matched(**{k: v for k, v in kwargs.items() if k in hits_query})
+        if number_matched is None and maxfeatures is None:
+            raise ValueError("Number of matching features unknown, maxfeatures is required")
+        if number_matched is None:
+            end = startindex + maxfeatures
+        elif maxfeatures is None:
+            end = number_matched
+        else:
+            end = min(number_matched, startindex + maxfeatures)
+        LOGGER.debug("Requesting features %d to %d in pages of %d" % (startindex, end, page_size))
+
+        def getpage(start):
+            for attempt in range(retries + 1):
+                try:
+                    return self.getfeature(startindex=start, maxfeatures=min(page_size, end - start), **kwargs)
+                except RequestException as err:
+                    # exception reports and client errors are permanent
+                    if attempt == retries or not _is_transient(err):
+                        raise
+                    LOGGER.warning("Request of page at startindex %d failed (%s), retrying" % (start, err))
+                    time.sleep(backoff * 2 ** attempt)
+
+        starts = iter(range(startindex, end, page_size))
+        pending = []  # (startindex, future) in order of submission
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while True:
+                # keep the number of pages held in memory bounded
+                while len(pending) < 2 * max_workers:
+                    start = next(starts, None)
+                    if start is None:
+                        break
+                    pending.append((start, executor.submit(getpage, start)))
+                if not pending:
+                    break
+
+                index = 0
+                if as_completed:
+                    done, _ = wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+                    index = next(i for i, (_, future) in enumerate(pending) if future in done)
+                start, future = pending.pop(index)
+                yield start, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def getfeature_all(self, page_size=1000, max_workers=4, retries=2, **kwargs):
+        """Request all features matching a query, in concurrent pages.
+
+        Parameters
+        ----------
+        page_size, max_workers, retries
+            As for `iter_pages`.
+        kwargs
+            Query, as for `getfeature`.
+
+        Returns:
+            list -- Data returned from the service for each page, in order,
+            as file-like objects
+        """
+        return [page for _, page in self.iter_pages(
+            page_size=page_size, max_workers=max_workers, retries=retries, **kwargs)]
+
     def getpropertyvalue(
         self,
         query=None,
@@ -361,7 +548,8 @@ class WebFeatureService_2_0_0(WebFeatureService_):
             for kw in list(kwargs.keys()):
                 request[kw] = str(kwargs[kw])
         encoded_request = urlencode(request)
-        u = openURL(base_url + encoded_request, timeout=self.timeout, headers=self.headers, auth=self.auth)
+        u = openURL(base_url + encoded_request, timeout=self.timeout, headers=self.headers, auth=self.auth,
+                    session=self.session)
         return u.read()
 
     def _getStoredQueries(self):
@@ -391,7 +579,8 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         }
         encoded_request = urlencode(request)
         u = openURL(
-            base_url, data=encoded_request, timeout=self.timeout, headers=self.headers, auth=self.auth
+            base_url, data=encoded_request, timeout=self.timeout, headers=self.headers, auth=self.auth,
+            session=self.session
         )
         tree = etree.fromstring(u.read())
         tempdict = {}
@@ -423,7 +612,8 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         }
         encoded_request = urlencode(request)
         u = openURL(
-            base_url, data=encoded_request, timeout=self.timeout, headers=self.headers, auth=self.auth
+            base_url, data=encoded_request, timeout=self.timeout, headers=self.headers, auth=self.auth,
+            session=self.session
         )
         tree = etree.fromstring(u.read())
         tempdict2 = {}
@@ -462,6 +652,13 @@ class WebFeatureService_2_0_0(WebFeatureService_):
         raise KeyError("No operation named %s" % name)
 
 
+def _is_transient(err):
+    """Whether a failed request may succeed when repeated"""
+    if isinstance(err, HTTPError):
+        return err.response is not None and err.response.status_code >= 500
+    return isinstance(err, (ConnectionError, Timeout, ChunkedEncodingError))
+
+
 class StoredQuery(object):
     """' Class to describe a storedquery """
 
@@ -486,10 +683,10 @@ class ContentMetadata(AbstractContentMetadata):
     """
 
     def __init__(
-        self, elem, parent, parse_remote_metadata=False, timeout=30, headers=None, auth=None
+        self, elem, parent, parse_remote_metadata=False, timeout=30, headers=None, auth=None, session=None
     ):
         """."""
-        super(ContentMetadata, self).__init__(headers=headers, auth=auth)
+        super(ContentMetadata, self).__init__(headers=headers, auth=auth, session=session)
         self.id = elem.find(nspath("Name", ns=WFS_NAMESPACE)).text
         self.title = elem.find(nspath("Title", ns=WFS_NAMESPACE)).text
         abstract = elem.find(nspath("Abstract", ns=WFS_NAMESPACE))
@@ -561,33 +758,12 @@ class ContentMetadata(AbstractContentMetadata):
 
     def parse_remote_metadata(self, timeout=30):
         """Parse remote metadata for MetadataURL and add it as metadataUrl['metadata']"""
-        for metadataUrl in self.metadataUrls:
-            if metadataUrl["url"] is not None:
-                try:
-                    content = openURL(metadataUrl["url"], timeout=timeout, headers=self.headers, auth=self.auth)
-                    doc = etree.fromstring(content.read())
-
-                    mdelem = doc.find(".//metadata")
-                    if mdelem is not None:
-                        metadataUrl["metadata"] = Metadata(mdelem)
-                        continue
-
-                    mdelem = doc.find(
-                        ".//" + util.nspath_eval("gmd:MD_Metadata", n.get_namespaces(["gmd"]))
-                    )
-                    if mdelem is None:
-                        mdelem = doc.find(
-                            ".//" + util.nspath_eval("gmi:MI_Metadata", n.get_namespaces(["gmi"]))
-                        )
-                    if mdelem is not None:
-                        metadataUrl["metadata"] = MD_Metadata(mdelem)
-                        continue
-                    else:  # ISO 19115 Part 3 XML
-                        mdelem = MD_Metadata3.find_start(doc)
-                        if mdelem is not None:
-                            metadataUrl["metadata"] = MD_Metadata3(mdelem)
-                        else:
-                            metadataUrl["metadata"] = None
-                        continue
-                except Exception:
-                    metadataUrl["metadata"] = None
+        remotemetadata.parse_remote_metadata([self], timeout)
+
+    def _remote_metadata_parsers(self, metadataUrl):
+        if metadataUrl["url"] is not None:
+            return remotemetadata.ALL_PARSERS
+        return None
+
+    def _read_remote_metadata(self, url, timeout):
+        return openURL(url, timeout=timeout, headers=self.headers, auth=self.auth, session=self.session).read()
@@ -23,6 +23,7 @@ def get_namespaces():
 
 
 namespaces = get_namespaces()
+_nspath = util.nspath_cache(namespaces)  # etree paths of the namespaced path expressions
 
 
 class _GenericObject(object):
@@ -56,11 +57,11 @@ class PT_Group(object):
     def __init__(self, md):
         """constructor"""
 
-        self.language = util.testXMLValue(md.find(util.nspath_eval('gm03:language', namespaces)))
-        self.country = util.testXMLValue(md.find(util.nspath_eval('gm03:country', namespaces)))
-        self.character_set_code = util.testXMLValue(md.find(util.nspath_eval('gm03:characterSetCode', namespaces)))
-        self.plain_text = util.testXMLValue(md.find(util.nspath_eval('gm03:plainText', namespaces)))
-        self.plain_url = util.testXMLValue(md.find(util.nspath_eval('gm03:plainURL', namespaces)))
+        self.language = util.testXMLValue(md.find(_nspath('gm03:language')))
+        self.country = util.testXMLValue(md.find(_nspath('gm03:country')))
+        self.character_set_code = util.testXMLValue(md.find(_nspath('gm03:characterSetCode')))
+        self.plain_text = util.testXMLValue(md.find(_nspath('gm03:plainText')))
+        self.plain_url = util.testXMLValue(md.find(_nspath('gm03:plainURL')))
 
 
 class PT_FreeText(object):
@@ -69,8 +70,8 @@ class PT_FreeText(object):
         """constructor"""
 
         pt_groups = []
-        for pt_group in md.findall(util.nspath_eval(
-                'gm03:GM03_2_1Core.Core.PT_FreeText/gm03:textGroup/gm03:GM03_2_1Core.Core.PT_Group', namespaces)):
+        for pt_group in md.findall(_nspath(
+                'gm03:GM03_2_1Core.Core.PT_FreeText/gm03:textGroup/gm03:GM03_2_1Core.Core.PT_Group')):
             pt_groups.append(PT_Group(pt_group))
 
         self.pt_group = pt_groups
@@ -82,8 +83,8 @@ class PT_FreeURL(object):
         """constructor"""
 
         pt_groups = []
-        for pt_group in md.findall(util.nspath_eval(
-                'gm03:GM03_2_1Core.Core.PT_FreeURL/gm03:URLGroup/gm03:GM03_2_1Core.Core.PT_URLGroup', namespaces)):
+        for pt_group in md.findall(_nspath(
+                'gm03:GM03_2_1Core.Core.PT_FreeURL/gm03:URLGroup/gm03:GM03_2_1Core.Core.PT_URLGroup')):
             pt_groups.append(PT_Group(pt_group))
 
         self.pt_group = pt_groups
@@ -109,7 +110,7 @@ class HeaderSection(object):
         """constructor"""
 
         header = None
-        header = md.find(util.nspath_eval('gm03:HEADERSECTION', namespaces))
+        header = md.find(_nspath('gm03:HEADERSECTION'))
 
         if header is None:
             return None
@@ -118,10 +119,10 @@ class HeaderSection(object):
         self.sender = header.attrib.get('SENDER')
         self.models = []
 
-        for model in header.findall(util.nspath_eval('gm03:MODELS/gm03:MODEL', namespaces)):
-            name = util.testXMLValue(model.find(util.nspath_eval('gm03:NAME', namespaces)))
-            version = util.testXMLValue(model.find(util.nspath_eval('gm03:VERSION', namespaces)))
-            uri = util.testXMLValue(model.find(util.nspath_eval('gm03:URI', namespaces)))
+        for model in header.findall(_nspath('gm03:MODELS/gm03:MODEL')):
+            name = util.testXMLValue(model.find(_nspath('gm03:NAME')))
+            version = util.testXMLValue(model.find(_nspath('gm03:VERSION')))
+            uri = util.testXMLValue(model.find(_nspath('gm03:URI')))
             model_dict = {
                 'name': name,
                 'version': version,
@@ -129,7 +130,7 @@ class HeaderSection(object):
             }
             self.models.append(model_dict)
 
-        self.comment = util.testXMLValue(header.find(util.nspath_eval('gm03:COMMENT', namespaces)))
+        self.comment = util.testXMLValue(header.find(_nspath('gm03:COMMENT')))
 
 
 class DataSection(object):
@@ -138,16 +139,16 @@ class DataSection(object):
         """constructor"""
 
         section = None
-        section = md.find(util.nspath_eval('gm03:DATASECTION', namespaces))
+        section = md.find(_nspath('gm03:DATASECTION'))
 
         if section is None:
             return None
 
-        mdata = section.find(util.nspath_eval('gm03:GM03_2_1Core.Core', namespaces))
+        mdata = section.find(_nspath('gm03:GM03_2_1Core.Core'))
         if mdata is not None:
             self.core = Core(mdata)
         else:
-            mdata = section.find(util.nspath_eval('gm03:GM03_2_1Comprehensive.Comprehensive', namespaces))
+            mdata = section.find(_nspath('gm03:GM03_2_1Comprehensive.Comprehensive'))
             if mdata is not None:
                 self.comprehensive = Comprehensive(mdata)
 
@@ -159,176 +160,175 @@ class Core(object):
 
         self.bid = md.attrib.get('BID')
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.DQ_DataQuality', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.DQ_DataQuality'))
         if val is not None:
             self.data_quality = DQ_DataQuality(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_Authority', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_Authority'))
         if val is not None:
             self.authority = _GenericObject(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_DigitalTransferOptions', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_DigitalTransferOptions'))
         if val is not None:
             self.digital_transfer_options = MD_DigitalTransferOptions(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_Distribution', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_Distribution'))
         if val is not None:
             self.distribution = _GenericObject(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_ReferenceSystem', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_ReferenceSystem'))
         if val is not None:
             self.reference_system_identifier = MD_ReferenceSystem(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_Thesaurus', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_Thesaurus'))
         if val is not None:
             self.thesaurus = MD_Thesaurus(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.SC_VerticalDatum', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.SC_VerticalDatum'))
         if val is not None:
             self.vertical_datum = SC_VerticalDatum(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.CI_Address', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.CI_Address'))
         if val is not None:
             self.address = CI_Address(val)
 
         self.date = []
-        for cid in md.findall(util.nspath_eval('gm03:GM03_2_1Core.Core.CI_Date', namespaces)):
+        for cid in md.findall(_nspath('gm03:GM03_2_1Core.Core.CI_Date')):
             self.date.append(CI_Date(cid))
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.CI_Telephone', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.CI_Telephone'))
         if val is not None:
             self.telephone = CI_Telephone(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.DQ_Scope', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.DQ_Scope'))
         if val is not None:
             self.scope = DQ_Scope(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.EX_VerticalExtent', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.EX_VerticalExtent'))
         if val is not None:
             self.vertical_extent = EX_VerticalExtent(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_Format', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_Format'))
         if val is not None:
             self.format = MD_Format(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_Metadata', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_Metadata'))
         if val is not None:
             self.metadata = MD_Metadata(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_RepresentativeFraction', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_RepresentativeFraction'))
         if val is not None:
             self.representative_fraction = MD_RepresentativeFraction(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_Resolution', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_Resolution'))
         if val is not None:
             self.resolution = MD_Resolution(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.EX_BoundingPolygon', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.EX_BoundingPolygon'))
         if val is not None:
             self.bounding_polygon = EX_BoundingPolygon(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.EX_GeographicBoundingBox', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.EX_GeographicBoundingBox'))
         if val is not None:
             self.geographic_bounding_box = EX_GeographicBoundingBox(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.EX_GeographicDescription', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.EX_GeographicDescription'))
         if val is not None:
             self.geographic_description = EX_GeographicDescription(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.EX_TemporalExtent', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.EX_TemporalExtent'))
         if val is not None:
             self.temporal_extent = EX_TemporalExtent(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_DistributiondistributionFormat', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_DistributiondistributionFormat'))
         if val is not None:
             self.distribution_distribution_format = MD_DistributiondistributionFormat(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.referenceSystemInfoMD_Metadata', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.referenceSystemInfoMD_Metadata'))
         if val is not None:
             self.reference_system_metadata = referenceSystemInfoMD_Metadata(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.CI_Citation', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.CI_Citation'))
         if val is None:
-            val = md.find(util.nspath_eval('gm03:GM03_2_1Comprehensive.Comprehensive.CI_Citation', namespaces))
+            val = md.find(_nspath('gm03:GM03_2_1Comprehensive.Comprehensive.CI_Citation'))
             if val is not None:
                 self.citation = CI_Citation(val)
         else:
             self.citation = CI_Citation(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.CI_Contact', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.CI_Contact'))
         if val is not None:
             self.contact = CI_Contact(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.CI_OnlineResource', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.CI_OnlineResource'))
         if val is not None:
             self.online_resource = CI_OnlineResource(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.CI_ResponsibleParty', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.CI_ResponsibleParty'))
         if val is not None:
             self.responsible_party = CI_ResponsibleParty(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.EX_Extent', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.EX_Extent'))
         if val is not None:
             self.extent = EX_Extent(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.EX_SpatialTemporalExtent', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.EX_SpatialTemporalExtent'))
         if val is not None:
             self.spatial_temporal_extent = EX_Extent(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.LI_Lineage', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.LI_Lineage'))
         if val is not None:
             self.lineage = LI_Lineage(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_Identifier', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_Identifier'))
         if val is not None:
             self.identifier = MD_Identifier(val)
 
         self.keywords = []
-        for kw in md.findall(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_Keywords', namespaces)):
+        for kw in md.findall(_nspath('gm03:GM03_2_1Core.Core.MD_Keywords')):
             self.keywords.append(MD_Keywords(kw))
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_DataIdentification', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_DataIdentification'))
         if val is None:
-            val = md.find(util.nspath_eval(
-                'gm03:GM03_2_1Comprehensive.Comprehensive.MD_DataIdentification', namespaces))
+            val = md.find(_nspath('gm03:GM03_2_1Comprehensive.Comprehensive.MD_DataIdentification'))
             if val is not None:
                 self.data_identification = MD_DataIdentification(val)
         else:
             self.data_identification = MD_DataIdentification(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.RS_Identifier', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.RS_Identifier'))
         if val is not None:
             self.rs_identifier = RS_Identifier(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.CI_ResponsiblePartyparentinfo', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.CI_ResponsiblePartyparentinfo'))
         if val is not None:
             self.responsible_party_parent_info = CI_ResponsiblePartyparentinfo(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.descriptiveKeywordsMD_Identification', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.descriptiveKeywordsMD_Identification'))
         if val is not None:
             self.descriptive_keywords_identification = descriptiveKeywordsMD_Identification(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.EX_ExtentgeographicElement', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.EX_ExtentgeographicElement'))
         if val is not None:
             self.extent_geographic_element = EX_ExtentgeographicElement(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.EX_ExtenttemporalElement', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.EX_ExtenttemporalElement'))
         if val is not None:
             self.extent_temporal_element = EX_ExtenttemporalElement(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.EX_ExtentverticalElement', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.EX_ExtentverticalElement'))
         if val is not None:
             self.extent_vertical_element = EX_ExtenttemporalElement(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_IdentificationpointOfContact', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_IdentificationpointOfContact'))
         if val is not None:
             self.identification_point_of_contact = MD_IdentificationpointOfContact(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_Metadatacontact', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.MD_Metadatacontact'))
         if val is not None:
             self.metadata_point_of_contact = MD_Metadatacontact(val)
 
-        val = md.find(util.nspath_eval('gm03:GM03_2_1Core.Core.spatialExtentEX_SpatialTemporalExtent', namespaces))
+        val = md.find(_nspath('gm03:GM03_2_1Core.Core.spatialExtentEX_SpatialTemporalExtent'))
         if val is not None:
             self.self.spatial_temporal_extent = spatialExtentEX_SpatialTemporalExtent(val)
 
@@ -357,7 +357,7 @@ class DQ_DataQuality(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:MD_Metadata', namespaces))
+        val = md.find(_nspath('gm03:MD_Metadata'))
         self.metadata = _GenericObjectProperty(val)
 
 
@@ -376,7 +376,7 @@ class MD_ReferenceSystem(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:referenceSystemIdentifier', namespaces))
+        val = md.find(_nspath('gm03:referenceSystemIdentifier'))
         self.reference_system_identifier = _GenericObjectProperty(val)
 
 
@@ -387,7 +387,7 @@ class MD_DigitalTransferOptions(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:MD_Distribution', namespaces))
+        val = md.find(_nspath('gm03:MD_Distribution'))
         self.distribution = _GenericObjectProperty(val)
 
 
@@ -398,7 +398,7 @@ class MD_Thesaurus(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:citation', namespaces))
+        val = md.find(_nspath('gm03:citation'))
         self.citation = _GenericObjectProperty(val)
 
 
@@ -409,7 +409,7 @@ class SC_VerticalDatum(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:datumID', namespaces))
+        val = md.find(_nspath('gm03:datumID'))
         self.datum_id = _GenericObjectProperty(val)
 
 
@@ -420,14 +420,14 @@ class CI_Address(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.street_name = util.testXMLValue(md.find(util.nspath_eval('gm03:streetName', namespaces)))
-        self.street_number = util.testXMLValue(md.find(util.nspath_eval('gm03:streetNumber', namespaces)))
-        self.address_line = util.testXMLValue(md.find(util.nspath_eval('gm03:addressLine', namespaces)))
-        self.post_box = util.testXMLValue(md.find(util.nspath_eval('gm03:postBox', namespaces)))
-        self.postal_code = util.testXMLValue(md.find(util.nspath_eval('gm03:postalCode', namespaces)))
-        self.city = util.testXMLValue(md.find(util.nspath_eval('gm03:city', namespaces)))
-        self.administrative_area = util.testXMLValue(md.find(util.nspath_eval('gm03:administrativeArea', namespaces)))
-        self.country = util.testXMLValue(md.find(util.nspath_eval('gm03:country', namespaces)))
+        self.street_name = util.testXMLValue(md.find(_nspath('gm03:streetName')))
+        self.street_number = util.testXMLValue(md.find(_nspath('gm03:streetNumber')))
+        self.address_line = util.testXMLValue(md.find(_nspath('gm03:addressLine')))
+        self.post_box = util.testXMLValue(md.find(_nspath('gm03:postBox')))
+        self.postal_code = util.testXMLValue(md.find(_nspath('gm03:postalCode')))
+        self.city = util.testXMLValue(md.find(_nspath('gm03:city')))
+        self.administrative_area = util.testXMLValue(md.find(_nspath('gm03:administrativeArea')))
+        self.country = util.testXMLValue(md.find(_nspath('gm03:country')))
 
 
 class CI_Date(_GenericObject):
@@ -437,10 +437,10 @@ class CI_Date(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.date = util.testXMLValue(md.find(util.nspath_eval('gm03:date', namespaces)))
-        self.date_type = util.testXMLValue(md.find(util.nspath_eval('gm03:dateType', namespaces)))
+        self.date = util.testXMLValue(md.find(_nspath('gm03:date')))
+        self.date_type = util.testXMLValue(md.find(_nspath('gm03:dateType')))
 
-        val = md.find(util.nspath_eval('gm03:CI_Citation', namespaces))
+        val = md.find(_nspath('gm03:CI_Citation'))
         self.citation = _GenericObjectProperty(val)
 
 
@@ -451,10 +451,10 @@ class CI_Telephone(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.number = util.testXMLValue(md.find(util.nspath_eval('gm03:number', namespaces)))
-        self.number_type = util.testXMLValue(md.find(util.nspath_eval('gm03:numberType', namespaces)))
+        self.number = util.testXMLValue(md.find(_nspath('gm03:number')))
+        self.number_type = util.testXMLValue(md.find(_nspath('gm03:numberType')))
 
-        val = md.find(util.nspath_eval('gm03:CI_ResponsibleParty', namespaces))
+        val = md.find(_nspath('gm03:CI_ResponsibleParty'))
         self.responsible_party = _GenericObjectProperty(val)
 
 
@@ -465,9 +465,9 @@ class DQ_Scope(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.level = util.testXMLValue(md.find(util.nspath_eval('gm03:level', namespaces)))
+        self.level = util.testXMLValue(md.find(_nspath('gm03:level')))
 
-        val = md.find(util.nspath_eval('gm03:DQ_DataQuality', namespaces))
+        val = md.find(_nspath('gm03:DQ_DataQuality'))
         self.data_quality = _GenericObjectProperty(val)
 
 
@@ -478,11 +478,11 @@ class EX_VerticalExtent(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.minimum_value = util.testXMLValue(md.find(util.nspath_eval('gm03:minimumValue', namespaces)))
-        self.maximum_value = util.testXMLValue(md.find(util.nspath_eval('gm03:maximumValue', namespaces)))
-        self.unit_of_measure = util.testXMLValue(md.find(util.nspath_eval('gm03:unitOfMeasure', namespaces)))
+        self.minimum_value = util.testXMLValue(md.find(_nspath('gm03:minimumValue')))
+        self.maximum_value = util.testXMLValue(md.find(_nspath('gm03:maximumValue')))
+        self.unit_of_measure = util.testXMLValue(md.find(_nspath('gm03:unitOfMeasure')))
 
-        val = md.find(util.nspath_eval('gm03:verticalDatum', namespaces))
+        val = md.find(_nspath('gm03:verticalDatum'))
         self.vertical_datum = _GenericObjectProperty(val)
 
 
@@ -493,8 +493,8 @@ class MD_Format(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.name = util.testXMLValue(md.find(util.nspath_eval('gm03:name', namespaces)))
-        self.version = util.testXMLValue(md.find(util.nspath_eval('gm03:version', namespaces)))
+        self.name = util.testXMLValue(md.find(_nspath('gm03:name')))
+        self.version = util.testXMLValue(md.find(_nspath('gm03:version')))
 
 
 class MD_Metadata(_GenericObject):
@@ -504,35 +504,32 @@ class MD_Metadata(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.file_identifier = util.testXMLValue(md.find(util.nspath_eval('gm03:fileIdentifier', namespaces)))
-        self.language = util.testXMLValue(md.find(util.nspath_eval('gm03:language', namespaces)))
-        self.character_set = util.testXMLValue(md.find(util.nspath_eval('gm03:characterSet', namespaces)))
-        self.date_stamp = util.testXMLValue(md.find(util.nspath_eval('gm03:dateStamp', namespaces)))
-        self.metadata_standard_name = util.testXMLValue(md.find(util.nspath_eval(
-            'gm03:metadataStandardName', namespaces)))
-        self.metadata_standard_version = util.testXMLValue(md.find(util.nspath_eval(
-            'gm03:metadataStandardVersion', namespaces)))
-        self.dataset_uri = util.testXMLValue(md.find(util.nspath_eval('gm03:dataSetURI', namespaces)))
-
-        val = md.find(util.nspath_eval('gm03:hierarchyLevel', namespaces))
+        self.file_identifier = util.testXMLValue(md.find(_nspath('gm03:fileIdentifier')))
+        self.language = util.testXMLValue(md.find(_nspath('gm03:language')))
+        self.character_set = util.testXMLValue(md.find(_nspath('gm03:characterSet')))
+        self.date_stamp = util.testXMLValue(md.find(_nspath('gm03:dateStamp')))
+        self.metadata_standard_name = util.testXMLValue(md.find(_nspath('gm03:metadataStandardName')))
+        self.metadata_standard_version = util.testXMLValue(md.find(_nspath('gm03:metadataStandardVersion')))
+        self.dataset_uri = util.testXMLValue(md.find(_nspath('gm03:dataSetURI')))
+
+        val = md.find(_nspath('gm03:hierarchyLevel'))
         if val is not None:
             values = []
-            for value in val.findall(util.nspath_eval('gm03:GM03_2_1Core.Core.MD_ScopeCode_/gm03:value', namespaces)):
+            for value in val.findall(_nspath('gm03:GM03_2_1Core.Core.MD_ScopeCode_/gm03:value')):
                 values.append(util.testXMLValue(value))
             self.hierarchy_level = values
 
-        val = md.find(util.nspath_eval('gm03:hierarchyLevelName', namespaces))
+        val = md.find(_nspath('gm03:hierarchyLevelName'))
         if val is not None:
             values = []
-            for value in val.findall(util.nspath_eval(
-                    'gm03:GM03_2_1Core.Core.CharacterString_/gm03:value', namespaces)):
+            for value in val.findall(_nspath('gm03:GM03_2_1Core.Core.CharacterString_/gm03:value')):
                 values.append(util.testXMLValue(value))
             self.hierarchy_level_name = values
 
-        val = md.find(util.nspath_eval('gm03:distributionInfo', namespaces))
+        val = md.find(_nspath('gm03:distributionInfo'))
         self.distribution_info = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:parentIdentifier', namespaces))
+        val = md.find(_nspath('gm03:parentIdentifier'))
         self.parent_identifier = _GenericObjectProperty(val)
 
 
@@ -543,7 +540,7 @@ class MD_RepresentativeFraction(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.denominator = util.testXMLValue(md.find(util.nspath_eval('gm03:denominator', namespaces)))
+        self.denominator = util.testXMLValue(md.find(_nspath('gm03:denominator')))
 
 
 class MD_Resolution(_GenericObject):
@@ -553,12 +550,12 @@ class MD_Resolution(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.distance = util.testXMLValue(md.find(util.nspath_eval('gm03:distance', namespaces)))
+        self.distance = util.testXMLValue(md.find(_nspath('gm03:distance')))
 
-        val = md.find(util.nspath_eval('gm03:MD_DataIdentification', namespaces))
+        val = md.find(_nspath('gm03:MD_DataIdentification'))
         self.data_identification = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:equivalentScale', namespaces))
+        val = md.find(_nspath('gm03:equivalentScale'))
         self.equivalent_scale = _GenericObjectProperty(val)
 
 
@@ -569,14 +566,14 @@ class MD_ScopeDescription(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.attributes = util.testXMLValue(md.find(util.nspath_eval('gm03:attributes', namespaces)))
-        self.features = util.testXMLValue(md.find(util.nspath_eval('gm03:features', namespaces)))
-        self.feature_instances = util.testXMLValue(md.find(util.nspath_eval('gm03:featureInstances', namespaces)))
-        self.attribute_instances = util.testXMLValue(md.find(util.nspath_eval('gm03:attributeInstances', namespaces)))
-        self.dataset = util.testXMLValue(md.find(util.nspath_eval('gm03:dataset', namespaces)))
-        self.other = util.testXMLValue(md.find(util.nspath_eval('gm03:other', namespaces)))
+        self.attributes = util.testXMLValue(md.find(_nspath('gm03:attributes')))
+        self.features = util.testXMLValue(md.find(_nspath('gm03:features')))
+        self.feature_instances = util.testXMLValue(md.find(_nspath('gm03:featureInstances')))
+        self.attribute_instances = util.testXMLValue(md.find(_nspath('gm03:attributeInstances')))
+        self.dataset = util.testXMLValue(md.find(_nspath('gm03:dataset')))
+        self.other = util.testXMLValue(md.find(_nspath('gm03:other')))
 
-        val = md.find(util.nspath_eval('gm03:DQ_Scope', namespaces))
+        val = md.find(_nspath('gm03:DQ_Scope'))
         self.scope = _GenericObjectProperty(val)
 
 
@@ -587,28 +584,28 @@ class EX_BoundingPolygon(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.extent_type_code = util.testXMLValue(md.find(util.nspath_eval('gm03:extentTypeCode', namespaces)))
+        self.extent_type_code = util.testXMLValue(md.find(_nspath('gm03:extentTypeCode')))
 
         boundaries = []
 
-        for boundary in md.findall(util.nspath_eval('gm03:SURFACE/gm03:BOUNDARY', namespaces)):
+        for boundary in md.findall(_nspath('gm03:SURFACE/gm03:BOUNDARY')):
             polylines = []
-            for polyline in boundary.findall(util.nspath_eval('gm03:POLYLINE', namespaces)):
+            for polyline in boundary.findall(_nspath('gm03:POLYLINE')):
                 coords = []
                 arcs = []
-                for coord in polyline.findall(util.nspath_eval('gm03:COORD', namespaces)):
-                    c1 = util.testXMLValue(coord.find(util.nspath_eval('gm03:C1', namespaces)))
-                    c2 = util.testXMLValue(coord.find(util.nspath_eval('gm03:C2', namespaces)))
-                    c3 = util.testXMLValue(coord.find(util.nspath_eval('gm03:C3', namespaces)))
+                for coord in polyline.findall(_nspath('gm03:COORD')):
+                    c1 = util.testXMLValue(coord.find(_nspath('gm03:C1')))
+                    c2 = util.testXMLValue(coord.find(_nspath('gm03:C2')))
+                    c3 = util.testXMLValue(coord.find(_nspath('gm03:C3')))
                     coordvalue = {'c1': c1, 'c2': c2, 'c3': c3}
                     coords.append(coordvalue)
-                for arc in polyline.findall(util.nspath_eval('gm03:ARC', namespaces)):
-                    c1 = util.testXMLValue(coord.find(util.nspath_eval('gm03:C1', namespaces)))
-                    c2 = util.testXMLValue(coord.find(util.nspath_eval('gm03:C2', namespaces)))
-                    c3 = util.testXMLValue(coord.find(util.nspath_eval('gm03:C3', namespaces)))
-                    a1 = util.testXMLValue(coord.find(util.nspath_eval('gm03:A1', namespaces)))
-                    a2 = util.testXMLValue(coord.find(util.nspath_eval('gm03:A2', namespaces)))
-                    r = util.testXMLValue(coord.find(util.nspath_eval('gm03:R', namespaces)))
+                for arc in polyline.findall(_nspath('gm03:ARC')):
+                    c1 = util.testXMLValue(coord.find(_nspath('gm03:C1')))
+                    c2 = util.testXMLValue(coord.find(_nspath('gm03:C2')))
+                    c3 = util.testXMLValue(coord.find(_nspath('gm03:C3')))
+                    a1 = util.testXMLValue(coord.find(_nspath('gm03:A1')))
+                    a2 = util.testXMLValue(coord.find(_nspath('gm03:A2')))
+                    r = util.testXMLValue(coord.find(_nspath('gm03:R')))
                     arcpoint = {'c1': c1, 'c2': c2, 'c3': c3, 'a1': a1, 'a2': a2, 'r': r}
                     arcs.append(arcpoint)
                 polylines.append(coords)
@@ -624,11 +621,11 @@ class EX_GeographicBoundingBox(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.extent_type_code = util.testXMLValue(md.find(util.nspath_eval('gm03:extentTypeCode', namespaces)))
-        self.north_bound_latitude = util.testXMLValue(md.find(util.nspath_eval('gm03:northBoundLatitude', namespaces)))
-        self.south_bound_latitude = util.testXMLValue(md.find(util.nspath_eval('gm03:southBoundLatitude', namespaces)))
-        self.east_bound_longitude = util.testXMLValue(md.find(util.nspath_eval('gm03:eastBoundLongitude', namespaces)))
-        self.west_bound_longitude = util.testXMLValue(md.find(util.nspath_eval('gm03:westBoundLongitude', namespaces)))
+        self.extent_type_code = util.testXMLValue(md.find(_nspath('gm03:extentTypeCode')))
+        self.north_bound_latitude = util.testXMLValue(md.find(_nspath('gm03:northBoundLatitude')))
+        self.south_bound_latitude = util.testXMLValue(md.find(_nspath('gm03:southBoundLatitude')))
+        self.east_bound_longitude = util.testXMLValue(md.find(_nspath('gm03:eastBoundLongitude')))
+        self.west_bound_longitude = util.testXMLValue(md.find(_nspath('gm03:westBoundLongitude')))
 
 
 class EX_GeographicDescription(_GenericObject):
@@ -638,9 +635,9 @@ class EX_GeographicDescription(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.extent_type_code = util.testXMLValue(md.find(util.nspath_eval('gm03:extentTypeCode', namespaces)))
+        self.extent_type_code = util.testXMLValue(md.find(_nspath('gm03:extentTypeCode')))
 
-        val = md.find(util.nspath_eval('gm03:geographicIdentifier', namespaces))
+        val = md.find(_nspath('gm03:geographicIdentifier'))
         self.geographic_identifier = _GenericObjectProperty(val)
 
 
@@ -651,10 +648,8 @@ class EX_TemporalExtent(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        begin = util.testXMLValue(md.find(util.nspath_eval(
-            'gm03:extent/gm03:GM03_2_1Core.Core.TM_Primitive/begin', namespaces)))
-        end = util.testXMLValue(md.find(util.nspath_eval(
-            'gm03:extent/gm03:GM03_2_1Core.Core.TM_Primitive/end', namespaces)))
+        begin = util.testXMLValue(md.find(_nspath('gm03:extent/gm03:GM03_2_1Core.Core.TM_Primitive/begin')))
+        end = util.testXMLValue(md.find(_nspath('gm03:extent/gm03:GM03_2_1Core.Core.TM_Primitive/end')))
 
         self.extent = {'begin': begin, 'end': end}
 
@@ -664,10 +659,10 @@ class MD_DistributiondistributionFormat(object):
     def __init__(self, md):
         """constructor"""
 
-        val = md.find(util.nspath_eval('gm03:MD_Distribution', namespaces))
+        val = md.find(_nspath('gm03:MD_Distribution'))
         self.distribution = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:distributionFormat', namespaces))
+        val = md.find(_nspath('gm03:distributionFormat'))
         self.distribution_format = _GenericObjectProperty(val)
 
 
@@ -676,10 +671,10 @@ class referenceSystemInfoMD_Metadata(object):
     def __init__(self, md):
         """constructor"""
 
-        val = md.find(util.nspath_eval('gm03:referenceSystemInfo', namespaces))
+        val = md.find(_nspath('gm03:referenceSystemInfo'))
         self.reference_system_info = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:MD_Metadata', namespaces))
+        val = md.find(_nspath('gm03:MD_Metadata'))
         self.metadata = _GenericObjectProperty(val)
 
 
@@ -690,11 +685,11 @@ class CI_Citation(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:title', namespaces))
+        val = md.find(_nspath('gm03:title'))
         if val is not None:
             self.title = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:MD_Authority', namespaces))
+        val = md.find(_nspath('gm03:MD_Authority'))
         self.authority = _GenericObjectProperty(val)
 
 
@@ -705,9 +700,9 @@ class CI_Contact(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.hours_of_service = util.testXMLValue(md.find(util.nspath_eval('gm03:hoursOfService', namespaces)))
+        self.hours_of_service = util.testXMLValue(md.find(_nspath('gm03:hoursOfService')))
 
-        val = md.find(util.nspath_eval('gm03:contactInstructions', namespaces))
+        val = md.find(_nspath('gm03:contactInstructions'))
         if val is not None:
             self.contact_instructions = PT_FreeText(val)
 
@@ -719,23 +714,23 @@ class CI_OnlineResource(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.protocol = util.testXMLValue(md.find(util.nspath_eval('gm03:protocol', namespaces)))
-        self.application_profile = util.testXMLValue(md.find(util.nspath_eval('gm03:applicationProfile', namespaces)))
-        self.function = util.testXMLValue(md.find(util.nspath_eval('gm03:function', namespaces)))
+        self.protocol = util.testXMLValue(md.find(_nspath('gm03:protocol')))
+        self.application_profile = util.testXMLValue(md.find(_nspath('gm03:applicationProfile')))
+        self.function = util.testXMLValue(md.find(_nspath('gm03:function')))
 
-        val = md.find(util.nspath_eval('gm03:description', namespaces))
+        val = md.find(_nspath('gm03:description'))
         if val is not None:
             self.description = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:name', namespaces))
+        val = md.find(_nspath('gm03:name'))
         if val is not None:
             self.name = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:linkage', namespaces))
+        val = md.find(_nspath('gm03:linkage'))
         if val is not None:
             self.linkage = PT_FreeURL(val)
 
-        val = md.find(util.nspath_eval('gm03:MD_DigitalTransferOptions', namespaces))
+        val = md.find(_nspath('gm03:MD_DigitalTransferOptions'))
         self.digital_transfer_options = _GenericObjectProperty(val)
 
 
@@ -746,36 +741,34 @@ class CI_ResponsibleParty(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.individual_first_name = util.testXMLValue(md.find(util.nspath_eval(
-            'gm03:individualFirstName', namespaces)))
-        self.individual_last_name = util.testXMLValue(md.find(util.nspath_eval(
-            'gm03:individualLastName', namespaces)))
+        self.individual_first_name = util.testXMLValue(md.find(_nspath('gm03:individualFirstName')))
+        self.individual_last_name = util.testXMLValue(md.find(_nspath('gm03:individualLastName')))
 
-        val = md.find(util.nspath_eval('gm03:electronicalMailAddress', namespaces))
+        val = md.find(_nspath('gm03:electronicalMailAddress'))
         if val is not None:
-            self.electronical_mail_address = util.testXMLValue(val.find(util.nspath_eval(
-                'gm03:GM03_2_1Core.Core.URL_/gm03:value', namespaces)))
+            self.electronical_mail_address = util.testXMLValue(val.find(_nspath(
+                'gm03:GM03_2_1Core.Core.URL_/gm03:value')))
 
-        val = md.find(util.nspath_eval('gm03:organisationName', namespaces))
+        val = md.find(_nspath('gm03:organisationName'))
         if val is not None:
             self.organisation_name = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:positionName', namespaces))
+        val = md.find(_nspath('gm03:positionName'))
         if val is not None:
             self.position_name = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:organisationAcronym', namespaces))
+        val = md.find(_nspath('gm03:organisationAcronym'))
         if val is not None:
             self.organisation_acronym = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:linkage', namespaces))
+        val = md.find(_nspath('gm03:linkage'))
         if val is not None:
             self.linkage = PT_FreeURL(val)
 
-        val = md.find(util.nspath_eval('gm03:address', namespaces))
+        val = md.find(_nspath('gm03:address'))
         self.address = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:contactInfo', namespaces))
+        val = md.find(_nspath('gm03:contactInfo'))
         self.contact_info = _GenericObjectProperty(val)
 
 
@@ -786,11 +779,11 @@ class EX_Extent(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:description', namespaces))
+        val = md.find(_nspath('gm03:description'))
         if val is not None:
             self.description = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:MD_DataIdentification', namespaces))
+        val = md.find(_nspath('gm03:MD_DataIdentification'))
         self.data_identification = _GenericObjectProperty(val)
 
 
@@ -809,11 +802,11 @@ class LI_Lineage(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:statement', namespaces))
+        val = md.find(_nspath('gm03:statement'))
         if val is not None:
             self.statement = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:DQ_DataQuality', namespaces))
+        val = md.find(_nspath('gm03:DQ_DataQuality'))
         self.data_quality = _GenericObjectProperty(val)
 
 
@@ -824,11 +817,11 @@ class MD_Identifier(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:code', namespaces))
+        val = md.find(_nspath('gm03:code'))
         if val is not None:
             self.code = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:MD_Authority', namespaces))
+        val = md.find(_nspath('gm03:MD_Authority'))
         self.authority = _GenericObjectProperty(val)
 
 
@@ -839,13 +832,13 @@ class MD_Keywords(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        self.type = util.testXMLValue(md.find(util.nspath_eval('gm03:type', namespaces)))
+        self.type = util.testXMLValue(md.find(_nspath('gm03:type')))
 
-        val = md.find(util.nspath_eval('gm03:keyword', namespaces))
+        val = md.find(_nspath('gm03:keyword'))
         if val is not None:
             self.keyword = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:thesaurus', namespaces))
+        val = md.find(_nspath('gm03:thesaurus'))
         self.thesaurus = _GenericObjectProperty(val)
 
 
@@ -856,44 +849,42 @@ class MD_DataIdentification(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:status', namespaces))
+        val = md.find(_nspath('gm03:status'))
         if val is not None:
-            self.status = util.testXMLValue(val.find(util.nspath_eval(
-                'gm03:GM03_2_1Core.Core.MD_ProgressCode_/gm03:value', namespaces)))
+            self.status = util.testXMLValue(val.find(_nspath('gm03:GM03_2_1Core.Core.MD_ProgressCode_/gm03:value')))
 
-        val = md.find(util.nspath_eval('gm03:abstract', namespaces))
+        val = md.find(_nspath('gm03:abstract'))
         if val is not None:
             self.abstract = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:purpose', namespaces))
+        val = md.find(_nspath('gm03:purpose'))
         if val is not None:
             self.purpose = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:MD_Metadata', namespaces))
+        val = md.find(_nspath('gm03:MD_Metadata'))
         self.metadata = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:citation', namespaces))
+        val = md.find(_nspath('gm03:citation'))
         self.citation = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:spatialRepresentationType', namespaces))
+        val = md.find(_nspath('gm03:spatialRepresentationType'))
         if val is not None:
-            self.spatial_representation_type = util.testXMLValue(val.find(util.nspath_eval(
-                'gm03:GM03_2_1Core.Core.MD_SpatialRepresentationTypeCode_/gm03:value', namespaces)))
+            self.spatial_representation_type = util.testXMLValue(val.find(_nspath(
+                'gm03:GM03_2_1Core.Core.MD_SpatialRepresentationTypeCode_/gm03:value')))
 
-        val = md.find(util.nspath_eval('gm03:language', namespaces))
+        val = md.find(_nspath('gm03:language'))
         if val is not None:
-            self.language = util.testXMLValue(val.find(util.nspath_eval(
-                'gm03:CodeISO.LanguageCodeISO_/gm03:value', namespaces)))
+            self.language = util.testXMLValue(val.find(_nspath('gm03:CodeISO.LanguageCodeISO_/gm03:value')))
 
-        val = md.find(util.nspath_eval('gm03:characterSet', namespaces))
+        val = md.find(_nspath('gm03:characterSet'))
         if val is not None:
-            self.character_set = util.testXMLValue(val.find(util.nspath_eval(
-                'gm03:GM03_2_1Core.Core.MD_CharacterSetCode_/gm03:value', namespaces)))
+            self.character_set = util.testXMLValue(val.find(_nspath(
+                'gm03:GM03_2_1Core.Core.MD_CharacterSetCode_/gm03:value')))
 
-        val = md.find(util.nspath_eval('gm03:topicCategory', namespaces))
+        val = md.find(_nspath('gm03:topicCategory'))
         if val is not None:
-            self.topic_category = util.testXMLValue(val.find(util.nspath_eval(
-                'gm03:GM03_2_1Core.Core.MD_TopicCategoryCode_/gm03:value', namespaces)))
+            self.topic_category = util.testXMLValue(val.find(_nspath(
+                'gm03:GM03_2_1Core.Core.MD_TopicCategoryCode_/gm03:value')))
 
 
 class RS_Identifier(_GenericObject):
@@ -903,11 +894,11 @@ class RS_Identifier(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:code', namespaces))
+        val = md.find(_nspath('gm03:code'))
         if val is not None:
             self.code = PT_FreeText(val)
 
-        val = md.find(util.nspath_eval('gm03:MD_Authority', namespaces))
+        val = md.find(_nspath('gm03:MD_Authority'))
         self.authority = _GenericObjectProperty(val)
 
 
@@ -918,10 +909,10 @@ class CI_ResponsiblePartyparentinfo(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:parentResponsibleParty', namespaces))
+        val = md.find(_nspath('gm03:parentResponsibleParty'))
         self.parent_responsible_party = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:CI_ResponsibleParty', namespaces))
+        val = md.find(_nspath('gm03:CI_ResponsibleParty'))
         self.responsible_party = _GenericObjectProperty(val)
 
 
@@ -932,10 +923,10 @@ class descriptiveKeywordsMD_Identification(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:descriptiveKeywords', namespaces))
+        val = md.find(_nspath('gm03:descriptiveKeywords'))
         self.descriptive_keywords = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:MD_Identification', namespaces))
+        val = md.find(_nspath('gm03:MD_Identification'))
         self.identification = _GenericObjectProperty(val)
 
 
@@ -946,10 +937,10 @@ class EX_ExtenttemporalElement(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:EX_Extent', namespaces))
+        val = md.find(_nspath('gm03:EX_Extent'))
         self.extent = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:temporalElement', namespaces))
+        val = md.find(_nspath('gm03:temporalElement'))
         self.temporal_element = _GenericObjectProperty(val)
 
 
@@ -960,10 +951,10 @@ class EX_ExtentverticalElement(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:EX_Extent', namespaces))
+        val = md.find(_nspath('gm03:EX_Extent'))
         self.extent = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:verticalElement', namespaces))
+        val = md.find(_nspath('gm03:verticalElement'))
         self.vertical_element = _GenericObjectProperty(val)
 
 
@@ -974,10 +965,10 @@ class EX_ExtentgeographicElement(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:EX_Extent', namespaces))
+        val = md.find(_nspath('gm03:EX_Extent'))
         self.extent = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:geographicElement', namespaces))
+        val = md.find(_nspath('gm03:geographicElement'))
         self.geographic_element = _GenericObjectProperty(val)
 
 
@@ -988,16 +979,15 @@ class MD_IdentificationpointOfContact(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:pointOfContact', namespaces))
+        val = md.find(_nspath('gm03:pointOfContact'))
         self.point_of_contact = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:MD_Identification', namespaces))
+        val = md.find(_nspath('gm03:MD_Identification'))
         self.identification = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:role', namespaces))
+        val = md.find(_nspath('gm03:role'))
         if val is not None:
-            self.role = util.testXMLValue(val.find(util.nspath_eval(
-                'gm03:GM03_2_1Core.Core.CI_RoleCode_/gm03:value', namespaces)))
+            self.role = util.testXMLValue(val.find(_nspath('gm03:GM03_2_1Core.Core.CI_RoleCode_/gm03:value')))
 
 
 class MD_Metadatacontact(_GenericObject):
@@ -1007,16 +997,15 @@ class MD_Metadatacontact(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:contact', namespaces))
+        val = md.find(_nspath('gm03:contact'))
         self.contact = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:MD_Metadata', namespaces))
+        val = md.find(_nspath('gm03:MD_Metadata'))
         self.metadata = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:role', namespaces))
+        val = md.find(_nspath('gm03:role'))
         if val is not None:
-            self.role = util.testXMLValue(val.find(util.nspath_eval(
-                'gm03:GM03_2_1Core.Core.CI_RoleCode_/gm03:value', namespaces)))
+            self.role = util.testXMLValue(val.find(_nspath('gm03:GM03_2_1Core.Core.CI_RoleCode_/gm03:value')))
 
 
 class spatialExtentEX_SpatialTemporalExtent(_GenericObject):
@@ -1026,10 +1015,10 @@ class spatialExtentEX_SpatialTemporalExtent(_GenericObject):
 
         _GenericObject.__init__(self, md)
 
-        val = md.find(util.nspath_eval('gm03:spatialExtent', namespaces))
+        val = md.find(_nspath('gm03:spatialExtent'))
         self.spatial_extent = _GenericObjectProperty(val)
 
-        val = md.find(util.nspath_eval('gm03:EX_SpatialTemporalExtent', namespaces))
+        val = md.find(_nspath('gm03:EX_SpatialTemporalExtent'))
         self.spatial_temporal_extent = _GenericObjectProperty(val)
 
 
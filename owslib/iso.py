@@ -26,17 +26,18 @@ def get_namespaces():
 
 
 namespaces = get_namespaces()
+_nspath = util.nspath_cache(namespaces)  # etree paths of the namespaced path expressions
 
 def testFirstCharOrAnchor(md,xpath):
     """ function which checks if the first matching element is either charstring or anchor, if anchor, returns {name, url}, else {name} """
     r = {'name': '', 'url': ''}
-    val = md.find(util.nspath_eval(xpath+'/gco:CharacterString', namespaces))
+    val = md.find(_nspath(xpath+'/gco:CharacterString'))
     r['name'] = util.testXMLValue(val)
     if r['name'] in [None,'']:    
-        val = md.find(util.nspath_eval(xpath+'/gmx:Anchor', namespaces))
+        val = md.find(_nspath(xpath+'/gmx:Anchor'))
         if val is not None:
             r['name'] = util.testXMLValue(val)
-            r['url'] = val.attrib.get(util.nspath_eval('xlink:href', namespaces))
+            r['url'] = val.attrib.get(_nspath('xlink:href'))
     return r
 
 def testAllCharOrAnchor(md,xpath,aslist=True):
@@ -45,15 +46,15 @@ def testAllCharOrAnchor(md,xpath,aslist=True):
     the aslist parameter indicates to return 2 lists or single list of objects
     """
     ro = []
-    for i in md.findall(util.nspath_eval(xpath+'/gco:CharacterString', namespaces)):
+    for i in md.findall(_nspath(xpath+'/gco:CharacterString')):
         r = {'name': '', 'url': ''}
         r['name'] = util.testXMLValue(i)
         ro.append(r)
-    for i in md.findall(util.nspath_eval(xpath+'/gmx:Anchor', namespaces)):
+    for i in md.findall(_nspath(xpath+'/gmx:Anchor')):
         r = {'name': '', 'url': ''}
         if i is not None:
             r['name'] = util.testXMLValue(i)
-            r['url'] = i.attrib.get(util.nspath_eval('xlink:href', namespaces)) 
+            r['url'] = i.attrib.get(_nspath('xlink:href')) 
             ro.append(r)
     if aslist:
         return ro
@@ -97,53 +98,53 @@ class MD_Metadata(object):
             else:  # part of a larger document
                 self.xml = etree.tostring(md)
 
-            val = md.find(util.nspath_eval('gmd:fileIdentifier/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:fileIdentifier/gco:CharacterString'))
             self.identifier = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:parentIdentifier/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:parentIdentifier/gco:CharacterString'))
             self.parentidentifier = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:language/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:language/gco:CharacterString'))
             self.language = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:dataSetURI/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:dataSetURI/gco:CharacterString'))
             self.dataseturi = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:language/gmd:LanguageCode', namespaces))
+            val = md.find(_nspath('gmd:language/gmd:LanguageCode'))
             self.languagecode = util.testXMLAttribute(val, 'codeListValue')
 
-            val = md.find(util.nspath_eval('gmd:dateStamp/gco:Date', namespaces))
+            val = md.find(_nspath('gmd:dateStamp/gco:Date'))
             self.datestamp = util.testXMLValue(val)
 
             if not self.datestamp:
-                val = md.find(util.nspath_eval('gmd:dateStamp/gco:DateTime', namespaces))
+                val = md.find(_nspath('gmd:dateStamp/gco:DateTime'))
                 self.datestamp = util.testXMLValue(val)
 
             self.charset = _testCodeListValue(md.find(
-                util.nspath_eval('gmd:characterSet/gmd:MD_CharacterSetCode', namespaces)))
+                _nspath('gmd:characterSet/gmd:MD_CharacterSetCode')))
 
             self.hierarchy = _testCodeListValue(md.find(
-                util.nspath_eval('gmd:hierarchyLevel/gmd:MD_ScopeCode', namespaces)))
+                _nspath('gmd:hierarchyLevel/gmd:MD_ScopeCode')))
 
             self.contact = []
-            for i in md.findall(util.nspath_eval('gmd:contact/gmd:CI_ResponsibleParty', namespaces)):
+            for i in md.findall(_nspath('gmd:contact/gmd:CI_ResponsibleParty')):
                 o = CI_ResponsibleParty(i)
                 self.contact.append(o)
 
-            val = md.find(util.nspath_eval('gmd:dateStamp/gco:DateTime', namespaces))
+            val = md.find(_nspath('gmd:dateStamp/gco:DateTime'))
             self.datetimestamp = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:metadataStandardName/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:metadataStandardName/gco:CharacterString'))
             self.stdname = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:metadataStandardVersion/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:metadataStandardVersion/gco:CharacterString'))
             self.stdver = util.testXMLValue(val)
 
             self.locales = []
-            for i in md.findall(util.nspath_eval('gmd:locale/gmd:PT_Locale', namespaces)):
+            for i in md.findall(_nspath('gmd:locale/gmd:PT_Locale')):
                 self.locales.append(PT_Locale(i))
 
-            val = md.find(util.nspath_eval('gmd:referenceSystemInfo/gmd:MD_ReferenceSystem', namespaces))
+            val = md.find(_nspath('gmd:referenceSystemInfo/gmd:MD_ReferenceSystem'))
             if val is not None:
                 self.referencesystem = MD_ReferenceSystem(val)
             else:
@@ -151,7 +152,7 @@ class MD_Metadata(object):
 
             self.identification = []
 
-            for idinfo in md.findall(util.nspath_eval('gmd:identificationInfo', namespaces)):
+            for idinfo in md.findall(_nspath('gmd:identificationInfo')):
                 if len(idinfo) > 0:
                     val = list(idinfo)[0]
                     tagval = util.xmltag_split(val.tag)
@@ -164,26 +165,26 @@ class MD_Metadata(object):
 
             self.contentinfo = []
             for contentinfo in md.findall(
-                    util.nspath_eval('gmd:contentInfo/gmd:MD_FeatureCatalogueDescription', namespaces)):
+                    _nspath('gmd:contentInfo/gmd:MD_FeatureCatalogueDescription')):
                 self.contentinfo.append(MD_FeatureCatalogueDescription(contentinfo))
             for contentinfo in md.findall(
-                    util.nspath_eval('gmd:contentInfo/gmd:MD_ImageDescription', namespaces)):
+                    _nspath('gmd:contentInfo/gmd:MD_ImageDescription')):
                 self.contentinfo.append(MD_ImageDescription(contentinfo))
 
-            val = md.find(util.nspath_eval('gmd:distributionInfo/gmd:MD_Distribution', namespaces))
+            val = md.find(_nspath('gmd:distributionInfo/gmd:MD_Distribution'))
 
             if val is not None:
                 self.distribution = MD_Distribution(val)
             else:
                 self.distribution = None
 
-            val = md.find(util.nspath_eval('gmd:dataQualityInfo/gmd:DQ_DataQuality', namespaces))
+            val = md.find(_nspath('gmd:dataQualityInfo/gmd:DQ_DataQuality'))
             if val is not None:
                 self.dataquality = DQ_DataQuality(val)
             else:
                 self.dataquality = None
 
-            val = md.find(util.nspath_eval('gmi:acquisitionInformation/gmi:MI_AcquisitionInformation', namespaces))
+            val = md.find(_nspath('gmi:acquisitionInformation/gmi:MI_AcquisitionInformation'))
             if val is not None:
                 self.acquisition = MI_AcquisitionInformation(val)
             else:
@@ -226,11 +227,11 @@ class PT_Locale(object):
         else:
             self.id = md.attrib.get('id')
             self.languagecode = None
-            languagecode = md.find(util.nspath_eval('gmd:languageCode/gmd:LanguageCode', namespaces))
+            languagecode = md.find(_nspath('gmd:languageCode/gmd:LanguageCode'))
             if languagecode is not None:
                 self.languagecode = languagecode.attrib.get('codeListValue')
             self.charset = None
-            charset = md.find(util.nspath_eval('gmd:characterEncoding/gmd:MD_CharacterSetCode', namespaces))
+            charset = md.find(_nspath('gmd:characterEncoding/gmd:MD_CharacterSetCode'))
             if charset is not None:
                 self.charset = charset.attrib.get('codeListValue')
 
@@ -242,17 +243,17 @@ class CI_Date(object):
             self.date = None
             self.type = None
         else:
-            val = md.find(util.nspath_eval('gmd:date/gco:Date', namespaces))
+            val = md.find(_nspath('gmd:date/gco:Date'))
             if val is not None:
                 self.date = util.testXMLValue(val)
             else:
-                val = md.find(util.nspath_eval('gmd:date/gco:DateTime', namespaces))
+                val = md.find(_nspath('gmd:date/gco:DateTime'))
                 if val is not None:
                     self.date = util.testXMLValue(val)
                 else:
                     self.date = None
 
-            val = md.find(util.nspath_eval('gmd:dateType/gmd:CI_DateTypeCode', namespaces))
+            val = md.find(_nspath('gmd:dateType/gmd:CI_DateTypeCode'))
             self.type = _testCodeListValue(val)
 
 
@@ -286,56 +287,49 @@ class CI_ResponsibleParty(object):
             self.organization = frm['name']
             self.organization_url = frm['url']
 
-            val = md.find(util.nspath_eval('gmd:positionName/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:positionName/gco:CharacterString'))
             self.position = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
-                'gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:voice/gco:CharacterString', namespaces))
+            val = md.find(_nspath(
+                'gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:voice/gco:CharacterString'))
 
             self.phone = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
-                'gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:facsimile/gco:CharacterString',
-                namespaces))
+            val = md.find(_nspath(
+                'gmd:contactInfo/gmd:CI_Contact/gmd:phone/gmd:CI_Telephone/gmd:facsimile/gco:CharacterString'))
             self.fax = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
-                'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:deliveryPoint/gco:CharacterString',
-                namespaces))
+            val = md.find(_nspath(
+                'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:deliveryPoint/gco:CharacterString'))
             self.address = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
-                'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:city/gco:CharacterString', namespaces))
+            val = md.find(_nspath(
+                'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:city/gco:CharacterString'))
             self.city = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
-                'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:administrativeArea/gco:CharacterString',
-                namespaces))
+            val = md.find(_nspath(
+                'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:administrativeArea/gco:CharacterString'))
             self.region = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
-                'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:postalCode/gco:CharacterString',
-                namespaces))
+            val = md.find(_nspath(
+                'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:postalCode/gco:CharacterString'))
             self.postcode = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
-                'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:country/gco:CharacterString',
-                namespaces))
+            val = md.find(_nspath(
+                'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:country/gco:CharacterString'))
             self.country = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
-                'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress/gco:CharacterString',
-                namespaces))
+            val = md.find(_nspath(
+                'gmd:contactInfo/gmd:CI_Contact/gmd:address/gmd:CI_Address/gmd:electronicMailAddress/gco:CharacterString'))
             self.email = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
-                'gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource', namespaces))
+            val = md.find(_nspath('gmd:contactInfo/gmd:CI_Contact/gmd:onlineResource/gmd:CI_OnlineResource'))
             if val is not None:
                 self.onlineresource = CI_OnlineResource(val)
             else:
                 self.onlineresource = None
 
-            self.role = _testCodeListValue(md.find(util.nspath_eval('gmd:role/gmd:CI_RoleCode', namespaces)))
+            self.role = _testCodeListValue(md.find(_nspath('gmd:role/gmd:CI_RoleCode')))
 
 
 class Keyword(object):
@@ -348,7 +342,7 @@ class Keyword(object):
             self.url = None
         else:
             self.name = util.testXMLValue(kw)
-            self.url = kw.attrib.get(util.nspath_eval('xlink:href', namespaces))
+            self.url = kw.attrib.get(_nspath('xlink:href'))
 
 
 class MD_Keywords(object):
@@ -363,35 +357,35 @@ class MD_Keywords(object):
             self.kwdtype_codeList = 'http://standards.iso.org/ittf/PubliclyAvailableStandards/ISO_19139_Schemas/resources/codelist/gmxCodelists.xml#MD_KeywordTypeCode'
         else:
             self.keywords = []
-            val = md.findall(util.nspath_eval('gmd:keyword/gco:CharacterString', namespaces))
+            val = md.findall(_nspath('gmd:keyword/gco:CharacterString'))
             if len(val) == 0:
-                val = md.findall(util.nspath_eval('gmd:keyword/gmx:Anchor', namespaces))
+                val = md.findall(_nspath('gmd:keyword/gmx:Anchor'))
             for word in val:
                 self.keywords.append(Keyword(word))
             self.type = None
-            val = md.find(util.nspath_eval('gmd:type/gmd:MD_KeywordTypeCode', namespaces))
+            val = md.find(_nspath('gmd:type/gmd:MD_KeywordTypeCode'))
             self.type = util.testXMLAttribute(val, 'codeListValue')
 
             self.thesaurus = None
-            val = md.find(util.nspath_eval('gmd:thesaurusName/gmd:CI_Citation', namespaces))
+            val = md.find(_nspath('gmd:thesaurusName/gmd:CI_Citation'))
             if val is not None:
                 self.thesaurus = {}
 
-                title = val.find(util.nspath_eval('gmd:title/gco:CharacterString', namespaces))
+                title = val.find(_nspath('gmd:title/gco:CharacterString'))
                 self.thesaurus['title'] = util.testXMLValue(title)
                 self.thesaurus['url'] = None
 
                 if self.thesaurus['title'] is None:  # try gmx:Anchor
-                    t = val.find(util.nspath_eval('gmd:title/gmx:Anchor', namespaces))
+                    t = val.find(_nspath('gmd:title/gmx:Anchor'))
                     if t is not None:
                         self.thesaurus['title'] = util.testXMLValue(t)
-                        self.thesaurus['url'] = t.attrib.get(util.nspath_eval('xlink:href', namespaces))
+                        self.thesaurus['url'] = t.attrib.get(_nspath('xlink:href'))
 
-                date_ = val.find(util.nspath_eval('gmd:date/gmd:CI_Date/gmd:date/gco:Date', namespaces))
+                date_ = val.find(_nspath('gmd:date/gmd:CI_Date/gmd:date/gco:Date'))
                 self.thesaurus['date'] = util.testXMLValue(date_)
 
                 datetype = val.find(
-                    util.nspath_eval('gmd:date/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode', namespaces))
+                    _nspath('gmd:date/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode'))
                 self.thesaurus['datetype'] = util.testXMLAttribute(datetype, 'codeListValue')
 
 
@@ -439,37 +433,32 @@ class MD_DataIdentification(object):
             self.spatialrepresentationtype = []
         else:
             self.identtype = identtype
-            val = md.find(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:title/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:citation/gmd:CI_Citation/gmd:title/gco:CharacterString'))
             self.title = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
-                'gmd:citation/gmd:CI_Citation/gmd:alternateTitle/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:citation/gmd:CI_Citation/gmd:alternateTitle/gco:CharacterString'))
             self.alternatetitle = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:aggregationInfo', namespaces))
+            val = md.find(_nspath('gmd:aggregationInfo'))
             self.aggregationinfo = util.testXMLValue(val)
 
             self.uricode = []
-            _values = md.findall(util.nspath_eval(
-                'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:MD_Identifier/gmd:code/gco:CharacterString',
-                namespaces))
-            _values += md.findall(util.nspath_eval(
-                'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:code/gco:CharacterString',
-                namespaces))
+            _values = md.findall(_nspath(
+                'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:MD_Identifier/gmd:code/gco:CharacterString'))
+            _values += md.findall(_nspath(
+                'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:code/gco:CharacterString'))
             for i in _values:
                 val = util.testXMLValue(i)
                 if val not in [None,'']:
                     self.uricode.append(val)
             
-            _values = md.findall(util.nspath_eval(
-                'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:MD_Identifier/gmd:code/gmx:Anchor',
-                namespaces))
-            _values += md.findall(util.nspath_eval(
-                'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:code/gmx:Anchor',
-                namespaces))
+            _values = md.findall(_nspath(
+                'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:MD_Identifier/gmd:code/gmx:Anchor'))
+            _values += md.findall(_nspath(
+                'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:code/gmx:Anchor'))
             for i in _values:
                 val = util.testXMLValue(i)
-                val1 = i.attrib.get(util.nspath_eval('xlink:href', namespaces))
+                val1 = i.attrib.get(_nspath('xlink:href'))
                 if val1 not in [None,'']:
                     self.uricode.append(val1)
                 elif val not in [None,'']:
@@ -477,17 +466,15 @@ class MD_DataIdentification(object):
                     
 
             self.uricodespace = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:codeSpace/gco:CharacterString',
-                    namespaces)):
+            for i in md.findall(_nspath(
+                    'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:codeSpace/gco:CharacterString')):
                 val = util.testXMLValue(i)
                 if val not in [None,'']:
                     self.uricodespace.append(val)
-            for i in md.findall(util.nspath_eval(
-                    'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:codeSpace/gmx:Anchor',
-                    namespaces)):
+            for i in md.findall(_nspath(
+                    'gmd:citation/gmd:CI_Citation/gmd:identifier/gmd:RS_Identifier/gmd:codeSpace/gmx:Anchor')):
                 val = util.testXMLValue(i)
-                val1 = i.attrib.get(util.nspath_eval('xlink:href', namespaces))
+                val1 = i.attrib.get(_nspath('xlink:href'))
                 if val1 not in [None,'']:
                     self.uricode.append(val1)
                 elif val not in [None,'']:
@@ -497,44 +484,41 @@ class MD_DataIdentification(object):
             self.date = []
             self.datetype = []
 
-            for i in md.findall(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:date/gmd:CI_Date', namespaces)):
+            for i in md.findall(_nspath('gmd:citation/gmd:CI_Citation/gmd:date/gmd:CI_Date')):
                 self.date.append(CI_Date(i))
 
             self.uselimitation = []
             self.uselimitation_url = []
-            _values = md.findall(util.nspath_eval(
-                'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useLimitation/gco:CharacterString', namespaces))
-            _values += md.findall(util.nspath_eval(
-                'gmd:resourceConstraints/gmd:MD_Constraints/gmd:useLimitation/gco:CharacterString', namespaces))
+            _values = md.findall(_nspath(
+                'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useLimitation/gco:CharacterString'))
+            _values += md.findall(_nspath(
+                'gmd:resourceConstraints/gmd:MD_Constraints/gmd:useLimitation/gco:CharacterString'))
             for i in _values:
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.uselimitation.append(val)
 
-            _values = md.findall(util.nspath_eval(
-                'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useLimitation/gmx:Anchor', namespaces))
-            _values += md.findall(util.nspath_eval(
-                'gmd:resourceConstraints/gmd:MD_Constraints/gmd:useLimitation/gmx:Anchor', namespaces))
+            _values = md.findall(_nspath(
+                'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useLimitation/gmx:Anchor'))
+            _values += md.findall(_nspath('gmd:resourceConstraints/gmd:MD_Constraints/gmd:useLimitation/gmx:Anchor'))
             for i in _values:
                 val = util.testXMLValue(i)
-                val1 = i.attrib.get(util.nspath_eval('xlink:href', namespaces))
+                val1 = i.attrib.get(_nspath('xlink:href'))
 
                 if val is not None:
                     self.uselimitation.append(val)
                     self.uselimitation_url.append(val1)
 
             self.accessconstraints = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_RestrictionCode',
-                    namespaces)):
+            for i in md.findall(_nspath(
+                    'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_RestrictionCode')):
                 val = _testCodeListValue(i)
                 if val is not None:
                     self.accessconstraints.append(val)
 
             self.classification = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_ClassificationCode',
-                    namespaces)):
+            for i in md.findall(_nspath(
+                    'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:accessConstraints/gmd:MD_ClassificationCode')):
                 val = _testCodeListValue(i)
                 if val is not None:
                     self.classification.append(val)
@@ -544,46 +528,42 @@ class MD_DataIdentification(object):
             self.otherconstraints_url = ocs['url']
 
             self.securityconstraints = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:resourceConstraints/gmd:MD_SecurityConstraints/gmd:classification/gmd:MD_ClassificationCode',
-                    namespaces)):
+            for i in md.findall(_nspath(
+                    'gmd:resourceConstraints/gmd:MD_SecurityConstraints/gmd:classification/gmd:MD_ClassificationCode')):
                 val = _testCodeListValue(i)
                 if val is not None:
                     self.securityconstraints.append(val)
 
             self.useconstraints = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useConstraints/gmd:MD_RestrictionCode',
-                    namespaces)):
+            for i in md.findall(_nspath(
+                    'gmd:resourceConstraints/gmd:MD_LegalConstraints/gmd:useConstraints/gmd:MD_RestrictionCode')):
                 val = _testCodeListValue(i)
                 if val is not None:
                     self.useconstraints.append(val)
 
             self.denominators = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:spatialResolution/gmd:MD_Resolution/gmd:equivalentScale/gmd:MD_RepresentativeFraction/gmd:denominator/gco:Integer',
-                    namespaces)):
+            for i in md.findall(_nspath(
+                    'gmd:spatialResolution/gmd:MD_Resolution/gmd:equivalentScale/gmd:MD_RepresentativeFraction/gmd:denominator/gco:Integer')):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.denominators.append(val)
 
             self.distance = []
             self.uom = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:spatialResolution/gmd:MD_Resolution/gmd:distance/gco:Distance', namespaces)):
+            for i in md.findall(_nspath('gmd:spatialResolution/gmd:MD_Resolution/gmd:distance/gco:Distance')):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.distance.append(val)
                 self.uom.append(i.get("uom"))
 
             self.resourcelanguagecode = []
-            for i in md.findall(util.nspath_eval('gmd:language/gmd:LanguageCode', namespaces)):
+            for i in md.findall(_nspath('gmd:language/gmd:LanguageCode')):
                 val = _testCodeListValue(i)
                 if val is not None:
                     self.resourcelanguagecode.append(val)
 
             self.resourcelanguage = []
-            for i in md.findall(util.nspath_eval('gmd:language/gco:CharacterString', namespaces)):
+            for i in md.findall(_nspath('gmd:language/gco:CharacterString')):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.resourcelanguage.append(val)
@@ -591,8 +571,8 @@ class MD_DataIdentification(object):
             self.creator = []
             self.publisher = []
             self.contributor = []
-            for val in md.findall(util.nspath_eval('gmd:pointOfContact/gmd:CI_ResponsibleParty', namespaces)):
-                role = val.find(util.nspath_eval('gmd:role/gmd:CI_RoleCode', namespaces))
+            for val in md.findall(_nspath('gmd:pointOfContact/gmd:CI_ResponsibleParty')):
+                role = val.find(_nspath('gmd:role/gmd:CI_RoleCode'))
                 if role is not None:
                     clv = _testCodeListValue(role)
                     rp = CI_ResponsibleParty(val)
@@ -603,55 +583,53 @@ class MD_DataIdentification(object):
                     elif clv == 'author':
                         self.contributor.append(rp)
 
-            val = md.find(util.nspath_eval('gmd:citation/gmd:CI_Citation/gmd:edition/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:citation/gmd:CI_Citation/gmd:edition/gco:CharacterString'))
             self.edition = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:abstract/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:abstract/gco:CharacterString'))
             self.abstract = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('gmd:abstract/gmx:Anchor', namespaces))
+            val = md.find(_nspath('gmd:abstract/gmx:Anchor'))
 
             self.abstract_url = None
             if val is not None:
                 self.abstract = util.testXMLValue(val)
-                self.abstract_url = val.attrib.get(util.nspath_eval('xlink:href', namespaces))
+                self.abstract_url = val.attrib.get(_nspath('xlink:href'))
 
-            val = md.find(util.nspath_eval('gmd:purpose/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:purpose/gco:CharacterString'))
             self.purpose = util.testXMLValue(val)
 
-            self.status = _testCodeListValue(md.find(util.nspath_eval('gmd:status/gmd:MD_ProgressCode', namespaces)))
+            self.status = _testCodeListValue(md.find(_nspath('gmd:status/gmd:MD_ProgressCode')))
 
             self.graphicoverview = []
-            for val in md.findall(util.nspath_eval(
-                    'gmd:graphicOverview/gmd:MD_BrowseGraphic/gmd:fileName/gco:CharacterString', namespaces)):
+            for val in md.findall(_nspath('gmd:graphicOverview/gmd:MD_BrowseGraphic/gmd:fileName/gco:CharacterString')):
                 if val is not None:
                     val2 = util.testXMLValue(val)
                     if val2 is not None:
                         self.graphicoverview.append(val2)
 
             self.contact = []
-            for i in md.findall(util.nspath_eval('gmd:pointOfContact/gmd:CI_ResponsibleParty', namespaces)):
+            for i in md.findall(_nspath('gmd:pointOfContact/gmd:CI_ResponsibleParty')):
                 o = CI_ResponsibleParty(i)
                 self.contact.append(o)
 
             self.spatialrepresentationtype = []
-            for val in md.findall(util.nspath_eval(
-                    'gmd:spatialRepresentationType/gmd:MD_SpatialRepresentationTypeCode', namespaces)):
+            for val in md.findall(_nspath('gmd:spatialRepresentationType/gmd:MD_SpatialRepresentationTypeCode')):
                 val = util.testXMLAttribute(val, 'codeListValue')
                 if val:
                     self.spatialrepresentationtype.append(val)
 
             self.keywords = []
-            for mdkw in md.findall(util.nspath_eval('gmd:descriptiveKeywords/gmd:MD_Keywords', namespaces)):
+            for mdkw in md.findall(_nspath('gmd:descriptiveKeywords/gmd:MD_Keywords')):
                 self.keywords.append(MD_Keywords(mdkw))
 
             self.topiccategory = []
-            for i in md.findall(util.nspath_eval('gmd:topicCategory/gmd:MD_TopicCategoryCode', namespaces)):
+            for i in md.findall(_nspath('gmd:topicCategory/gmd:MD_TopicCategoryCode')):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.topiccategory.append(val)
 
-            val = md.find(util.nspath_eval('gmd:supplementalInformation/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:supplementalInformation/gco:CharacterString'))
             self.supplementalinformation = util.testXMLValue(val)
 
             # There may be multiple geographicElement, create an extent
@@ -660,36 +638,32 @@ class MD_DataIdentification(object):
             val = None
             val2 = None
             val3 = None
-            extents = md.findall(util.nspath_eval('gmd:extent', namespaces))
-            extents.extend(md.findall(util.nspath_eval('srv:extent', namespaces)))
+            extents = md.findall(_nspath('gmd:extent'))
+            extents.extend(md.findall(_nspath('srv:extent')))
             for extent in extents:
                 if val is None:
-                    for e in extent.findall(util.nspath_eval('gmd:EX_Extent/gmd:geographicElement', namespaces)):
-                        if e.find(util.nspath_eval('gmd:EX_GeographicBoundingBox', namespaces)) is not None or \
-                                e.find(util.nspath_eval('gmd:EX_BoundingPolygon', namespaces)) is not None:
+                    for e in extent.findall(_nspath('gmd:EX_Extent/gmd:geographicElement')):
+                        if e.find(_nspath('gmd:EX_GeographicBoundingBox')) is not None or \
+                                e.find(_nspath('gmd:EX_BoundingPolygon')) is not None:
                             val = e
                             break
                     self.extent = EX_Extent(val)
                     self.bbox = self.extent.boundingBox  # for backwards compatibility
 
                 if val2 is None:
-                    val2 = extent.find(util.nspath_eval(
-                        'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:beginPosition',
-                        namespaces))
+                    val2 = extent.find(_nspath(
+                        'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:beginPosition'))
                     if val2 is None:
-                        val2 = extent.find(util.nspath_eval(
-                            'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:beginPosition',
-                            namespaces))
+                        val2 = extent.find(_nspath(
+                            'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:beginPosition'))
                     self.temporalextent_start = util.testXMLValue(val2)
 
                 if val3 is None:
-                    val3 = extent.find(util.nspath_eval(
-                        'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:endPosition',
-                        namespaces))
+                    val3 = extent.find(_nspath(
+                        'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml:TimePeriod/gml:endPosition'))
                     if val3 is None:
-                        val3 = extent.find(util.nspath_eval(
-                            'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:endPosition',
-                            namespaces))
+                        val3 = extent.find(_nspath(
+                            'gmd:EX_Extent/gmd:temporalElement/gmd:EX_TemporalExtent/gmd:extent/gml32:TimePeriod/gml32:endPosition'))
                     self.temporalextent_end = util.testXMLValue(val3)
 
 
@@ -701,16 +675,14 @@ class MD_Distributor(object):
             self.online = []
         else:
             self.contact = None
-            val = md.find(util.nspath_eval(
-                'gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty', namespaces))
+            val = md.find(_nspath('gmd:MD_Distributor/gmd:distributorContact/gmd:CI_ResponsibleParty'))
             if val is not None:
                 self.contact = CI_ResponsibleParty(val)
 
             self.online = []
 
-            for ol in md.findall(util.nspath_eval(
-                    'gmd:MD_Distributor/gmd:distributorTransferOptions/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource',
-                    namespaces)):
+            for ol in md.findall(_nspath(
+                    'gmd:MD_Distributor/gmd:distributorTransferOptions/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource')):
                 self.online.append(CI_OnlineResource(ol))
 
 
@@ -741,13 +713,12 @@ class MD_Distribution(object):
             self.specification_url = spc['url']
 
             self.distributor = []
-            for dist in md.findall(util.nspath_eval('gmd:distributor', namespaces)):
+            for dist in md.findall(_nspath('gmd:distributor')):
                 self.distributor.append(MD_Distributor(dist))
 
             self.online = []
-            for ol in md.findall(util.nspath_eval(
-                    'gmd:transferOptions/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource',
-                    namespaces)):
+            for ol in md.findall(_nspath(
+                    'gmd:transferOptions/gmd:MD_DigitalTransferOptions/gmd:onLine/gmd:CI_OnlineResource')):
                 self.online.append(CI_OnlineResource(ol))
 
 
@@ -770,25 +741,22 @@ class DQ_DataQuality(object):
             self.conformancetitle_url = cts['url']
 
             self.conformancedate = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:date/gco:Date',
-                    namespaces)):
+            for i in md.findall(_nspath(
+                    'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:date/gco:Date')):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.conformancedate.append(val)
 
             self.conformancedatetype = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode',
-                    namespaces)):
+            for i in md.findall(_nspath(
+                    'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:date/gmd:CI_Date/gmd:dateType/gmd:CI_DateTypeCode')):
                 val = _testCodeListValue(i)
                 if val is not None:
                     self.conformancedatetype.append(val)
 
             self.conformancedegree = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:pass/gco:Boolean',
-                    namespaces)):
+            for i in md.findall(_nspath(
+                    'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:pass/gco:Boolean')):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.conformancedegree.append(val)
@@ -797,15 +765,13 @@ class DQ_DataQuality(object):
             self.lineage = lng['name']
             self.lineage_url = lng['url']
 
-            val = md.find(util.nspath_eval(
-                'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:title/gco:CharacterString',
-                namespaces))
+            val = md.find(_nspath(
+                'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:title/gco:CharacterString'))
             self.specificationtitle = util.testXMLValue(val)
 
             self.specificationdate = []
-            for i in md.findall(util.nspath_eval(
-                    'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:date/gmd:CI_Date',
-                    namespaces)):
+            for i in md.findall(_nspath(
+                    'gmd:report/gmd:DQ_DomainConsistency/gmd:result/gmd:DQ_ConformanceResult/gmd:specification/gmd:CI_Citation/gmd:date/gmd:CI_Date')):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.specificationdate.append(val)
@@ -825,45 +791,42 @@ class SV_ServiceIdentification(MD_DataIdentification):
             self.operations = []
             self.operateson = []
         else:
-            val = md.find(util.nspath_eval('srv:serviceType/gco:LocalName', namespaces))
+            val = md.find(_nspath('srv:serviceType/gco:LocalName'))
             self.type = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('srv:serviceTypeVersion/gco:CharacterString', namespaces))
+            val = md.find(_nspath('srv:serviceTypeVersion/gco:CharacterString'))
             self.version = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
-                'srv:accessProperties/gmd:MD_StandardOrderProcess/gmd:fees/gco:CharacterString', namespaces))
+            val = md.find(_nspath('srv:accessProperties/gmd:MD_StandardOrderProcess/gmd:fees/gco:CharacterString'))
             self.fees = util.testXMLValue(val)
 
-            self.couplingtype = _testCodeListValue(md.find(util.nspath_eval(
-                'gmd:couplingType/gmd:SV_CouplingType', namespaces)))
+            self.couplingtype = _testCodeListValue(md.find(_nspath('gmd:couplingType/gmd:SV_CouplingType')))
 
             self.operations = []
 
-            for i in md.findall(util.nspath_eval('srv:containsOperations', namespaces)):
+            for i in md.findall(_nspath('srv:containsOperations')):
                 tmp = {}
-                val = i.find(util.nspath_eval(
-                    'srv:SV_OperationMetadata/srv:operationName/gco:CharacterString', namespaces))
+                val = i.find(_nspath('srv:SV_OperationMetadata/srv:operationName/gco:CharacterString'))
                 tmp['name'] = util.testXMLValue(val)
                 tmp['dcplist'] = []
-                for d in i.findall(util.nspath_eval('srv:SV_OperationMetadata/srv:DCP', namespaces)):
-                    tmp2 = _testCodeListValue(d.find(util.nspath_eval('srv:DCPList', namespaces)))
+                for d in i.findall(_nspath('srv:SV_OperationMetadata/srv:DCP')):
+                    tmp2 = _testCodeListValue(d.find(_nspath('srv:DCPList')))
                     tmp['dcplist'].append(tmp2)
 
                 tmp['connectpoint'] = []
 
-                for d in i.findall(util.nspath_eval('srv:SV_OperationMetadata/srv:connectPoint', namespaces)):
-                    tmp3 = d.find(util.nspath_eval('gmd:CI_OnlineResource', namespaces))
+                for d in i.findall(_nspath('srv:SV_OperationMetadata/srv:connectPoint')):
+                    tmp3 = d.find(_nspath('gmd:CI_OnlineResource'))
                     tmp['connectpoint'].append(CI_OnlineResource(tmp3))
                 self.operations.append(tmp)
 
             self.operateson = []
 
-            for i in md.findall(util.nspath_eval('srv:operatesOn', namespaces)):
+            for i in md.findall(_nspath('srv:operatesOn')):
                 tmp = {}
                 tmp['uuidref'] = i.attrib.get('uuidref')
-                tmp['href'] = i.attrib.get(util.nspath_eval('xlink:href', namespaces))
-                tmp['title'] = i.attrib.get(util.nspath_eval('xlink:title', namespaces))
+                tmp['href'] = i.attrib.get(_nspath('xlink:href'))
+                tmp['title'] = i.attrib.get(_nspath('xlink:title'))
                 self.operateson.append(tmp)
 
 
@@ -882,7 +845,7 @@ class CI_OnlineResource(object):
             self.applicationprofile = None
             self.applicationprofile_url = None
         else:
-            val = md.find(util.nspath_eval('gmd:linkage/gmd:URL', namespaces))
+            val = md.find(_nspath('gmd:linkage/gmd:URL'))
             self.url = util.testXMLValue(val)
 
             val = testFirstCharOrAnchor(md,'gmd:protocol')
@@ -901,11 +864,10 @@ class CI_OnlineResource(object):
             self.applicationprofile = val['name']
             self.applicationprofile_url = val['url']
 
-            val = md.find(util.nspath_eval('gmd:description/gco:CharacterString', namespaces))
+            val = md.find(_nspath('gmd:description/gco:CharacterString'))
             self.description = util.testXMLValue(val)
 
-            self.function = _testCodeListValue(md.find(util.nspath_eval(
-                'gmd:function/gmd:CI_OnLineFunctionCode', namespaces)))
+            self.function = _testCodeListValue(md.find(_nspath('gmd:function/gmd:CI_OnLineFunctionCode')))
 
 
 class EX_GeographicBoundingBox(object):
@@ -916,13 +878,13 @@ class EX_GeographicBoundingBox(object):
             self.miny = None
             self.maxy = None
         else:
-            val = md.find(util.nspath_eval('gmd:westBoundLongitude/gco:Decimal', namespaces))
+            val = md.find(_nspath('gmd:westBoundLongitude/gco:Decimal'))
             self.minx = util.testXMLValue(val)
-            val = md.find(util.nspath_eval('gmd:eastBoundLongitude/gco:Decimal', namespaces))
+            val = md.find(_nspath('gmd:eastBoundLongitude/gco:Decimal'))
             self.maxx = util.testXMLValue(val)
-            val = md.find(util.nspath_eval('gmd:southBoundLatitude/gco:Decimal', namespaces))
+            val = md.find(_nspath('gmd:southBoundLatitude/gco:Decimal'))
             self.miny = util.testXMLValue(val)
-            val = md.find(util.nspath_eval('gmd:northBoundLatitude/gco:Decimal', namespaces))
+            val = md.find(_nspath('gmd:northBoundLatitude/gco:Decimal'))
             self.maxy = util.testXMLValue(val)
 
 
@@ -932,19 +894,19 @@ class EX_Polygon(object):
             self.exterior_ring = None
             self.interior_rings = []
         else:
-            linear_ring = md.find(util.nspath_eval('gml32:Polygon/gml32:exterior/gml32:LinearRing', namespaces))
+            linear_ring = md.find(_nspath('gml32:Polygon/gml32:exterior/gml32:LinearRing'))
             if linear_ring is not None:
                 self.exterior_ring = self._coordinates_for_ring(linear_ring)
 
-            interior_ring_elements = md.findall(util.nspath_eval('gml32:Polygon/gml32:interior', namespaces))
+            interior_ring_elements = md.findall(_nspath('gml32:Polygon/gml32:interior'))
             self.interior_rings = []
             for iring_element in interior_ring_elements:
-                linear_ring = iring_element.find(util.nspath_eval('gml32:LinearRing', namespaces))
+                linear_ring = iring_element.find(_nspath('gml32:LinearRing'))
                 self.interior_rings.append(self._coordinates_for_ring(linear_ring))
 
     def _coordinates_for_ring(self, linear_ring):
         coordinates = []
-        positions = linear_ring.findall(util.nspath_eval('gml32:pos', namespaces))
+        positions = linear_ring.findall(_nspath('gml32:pos'))
         for pos in positions:
             tokens = pos.text.split()
             coords = tuple([float(t) for t in tokens])
@@ -958,10 +920,10 @@ class EX_GeographicBoundingPolygon(object):
             self.is_extent = None
             self.polygons = []
         else:
-            val = md.find(util.nspath_eval('gmd:extentTypeCode', namespaces))
+            val = md.find(_nspath('gmd:extentTypeCode'))
             self.is_extent = util.testXMLValue(val)
 
-            md_polygons = md.findall(util.nspath_eval('gmd:polygon', namespaces))
+            md_polygons = md.findall(_nspath('gmd:polygon'))
 
             self.polygons = []
             for val in md_polygons:
@@ -980,17 +942,16 @@ class EX_Extent(object):
             self.boundingPolygon = None
 
             if md is not None:
-                bboxElement = md.find(util.nspath_eval('gmd:EX_GeographicBoundingBox', namespaces))
+                bboxElement = md.find(_nspath('gmd:EX_GeographicBoundingBox'))
                 if bboxElement is not None:
                     self.boundingBox = EX_GeographicBoundingBox(bboxElement)
 
-                polygonElement = md.find(util.nspath_eval('gmd:EX_BoundingPolygon', namespaces))
+                polygonElement = md.find(_nspath('gmd:EX_BoundingPolygon'))
                 if polygonElement is not None:
                     self.boundingPolygon = EX_GeographicBoundingPolygon(polygonElement)
 
-                val = md.find(util.nspath_eval(
-                    'gmd:EX_GeographicDescription/gmd:geographicIdentifier/gmd:MD_Identifier/gmd:code/gco:CharacterString',
-                    namespaces))
+                val = md.find(_nspath(
+                    'gmd:EX_GeographicDescription/gmd:geographicIdentifier/gmd:MD_Identifier/gmd:code/gco:CharacterString'))
                 self.description_code = util.testXMLValue(val)
 
 
@@ -1032,39 +993,39 @@ def _testCodeListValue(elpath):
 class CodelistCatalogue(object):
     """ process CT_CodelistCatalogue """
     def __init__(self, ct):
-        val = ct.find(util.nspath_eval('gmx:name/gco:CharacterString', namespaces))
+        val = ct.find(_nspath('gmx:name/gco:CharacterString'))
         self.name = util.testXMLValue(val)
-        val = ct.find(util.nspath_eval('gmx:scope/gco:CharacterString', namespaces))
+        val = ct.find(_nspath('gmx:scope/gco:CharacterString'))
         self.scope = util.testXMLValue(val)
-        val = ct.find(util.nspath_eval('gmx:fieldOfApplication/gco:CharacterString', namespaces))
+        val = ct.find(_nspath('gmx:fieldOfApplication/gco:CharacterString'))
         self.fieldapp = util.testXMLValue(val)
-        val = ct.find(util.nspath_eval('gmx:versionNumber/gco:CharacterString', namespaces))
+        val = ct.find(_nspath('gmx:versionNumber/gco:CharacterString'))
         self.version = util.testXMLValue(val)
-        val = ct.find(util.nspath_eval('gmx:versionDate/gco:Date', namespaces))
+        val = ct.find(_nspath('gmx:versionDate/gco:Date'))
         self.date = util.testXMLValue(val)
 
         self.dictionaries = {}
 
-        for i in ct.findall(util.nspath_eval('gmx:codelistItem/gmx:CodeListDictionary', namespaces)):
-            id = i.attrib.get(util.nspath_eval('gml32:id', namespaces))
+        for i in ct.findall(_nspath('gmx:codelistItem/gmx:CodeListDictionary')):
+            id = i.attrib.get(_nspath('gml32:id'))
             self.dictionaries[id] = {}
-            val = i.find(util.nspath_eval('gml32:description', namespaces))
+            val = i.find(_nspath('gml32:description'))
             self.dictionaries[id]['description'] = util.testXMLValue(val)
-            val = i.find(util.nspath_eval('gml32:identifier', namespaces))
+            val = i.find(_nspath('gml32:identifier'))
             self.dictionaries[id]['identifier'] = util.testXMLValue(val)
             self.dictionaries[id]['entries'] = {}
 
-            for j in i.findall(util.nspath_eval('gmx:codeEntry', namespaces)):
-                id2 = j.find(util.nspath_eval('gmx:CodeDefinition', namespaces)).attrib.get(
-                    util.nspath_eval('gml32:id', namespaces))
+            for j in i.findall(_nspath('gmx:codeEntry')):
+                id2 = j.find(_nspath('gmx:CodeDefinition')).attrib.get(
+                    _nspath('gml32:id'))
                 self.dictionaries[id]['entries'][id2] = {}
-                val = j.find(util.nspath_eval('gmx:CodeDefinition/gml32:description', namespaces))
+                val = j.find(_nspath('gmx:CodeDefinition/gml32:description'))
                 self.dictionaries[id]['entries'][id2]['description'] = util.testXMLValue(val)
 
-                val = j.find(util.nspath_eval('gmx:CodeDefinition/gml32:identifier', namespaces))
+                val = j.find(_nspath('gmx:CodeDefinition/gml32:identifier'))
                 self.dictionaries[id]['entries'][id2]['identifier'] = util.testXMLValue(val)
 
-                val = j.find(util.nspath_eval('gmx:CodeDefinition', namespaces)).attrib.get('codeSpace')
+                val = j.find(_nspath('gmx:CodeDefinition')).attrib.get('codeSpace')
                 self.dictionaries[id]['entries'][id2]['codespace'] = util.testXMLValue(val, True)
 
     def getcodelistdictionaries(self):
@@ -1097,35 +1058,35 @@ class MD_FeatureCatalogueDescription(object):
                 self.xml = etree.tostring(fcd)
 
             self.compliancecode = None
-            val = fcd.find(util.nspath_eval('gmd:complianceCode/gco:Boolean', namespaces))
+            val = fcd.find(_nspath('gmd:complianceCode/gco:Boolean'))
             val = util.testXMLValue(val)
             if val is not None:
                 self.compliancecode = util.getTypedValue('boolean', val)
 
             self.language = []
-            for i in fcd.findall(util.nspath_eval('gmd:language/gco:CharacterString', namespaces)):
+            for i in fcd.findall(_nspath('gmd:language/gco:CharacterString')):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.language.append(val)
 
             self.includedwithdataset = None
-            val = fcd.find(util.nspath_eval('gmd:includedWithDataset/gco:Boolean', namespaces))
+            val = fcd.find(_nspath('gmd:includedWithDataset/gco:Boolean'))
             val = util.testXMLValue(val)
             if val is not None:
                 self.includedwithdataset = util.getTypedValue('boolean', val)
 
             self.featuretypenames = []
-            for i in fcd.findall(util.nspath_eval('gmd:featureTypes/gco:LocalName', namespaces)):
+            for i in fcd.findall(_nspath('gmd:featureTypes/gco:LocalName')):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.featuretypenames.append(val)
-            for i in fcd.findall(util.nspath_eval('gmd:featureTypes/gco:ScopedName', namespaces)):
+            for i in fcd.findall(_nspath('gmd:featureTypes/gco:ScopedName')):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.featuretypenames.append(val)
 
             self.featurecatalogues = []
-            for i in fcd.findall(util.nspath_eval('gmd:featureCatalogueCitation', namespaces)):
+            for i in fcd.findall(_nspath('gmd:featureCatalogueCitation')):
                 val = i.attrib.get('uuidref')
                 val = util.testXMLValue(val, attrib=True)
                 if val is not None:
@@ -1151,23 +1112,23 @@ class FC_FeatureCatalogue(object):
             val = fc.attrib['uuid']
             self.identifier = util.testXMLValue(val, attrib=True)
 
-            val = fc.find(util.nspath_eval('gmx:name/gco:CharacterString', namespaces))
+            val = fc.find(_nspath('gmx:name/gco:CharacterString'))
             self.name = util.testXMLValue(val)
 
-            val = fc.find(util.nspath_eval('gmx:versionDate/gco:Date', namespaces))
+            val = fc.find(_nspath('gmx:versionDate/gco:Date'))
             self.versiondate = util.testXMLValue(val)
 
             if not self.versiondate:
-                val = fc.find(util.nspath_eval('gmx:versionDate/gco:DateTime', namespaces))
+                val = fc.find(_nspath('gmx:versionDate/gco:DateTime'))
                 self.versiondate = util.testXMLValue(val)
 
             self.producer = None
-            prod = fc.find(util.nspath_eval('gfc:producer/gmd:CI_ResponsibleParty', namespaces))
+            prod = fc.find(_nspath('gfc:producer/gmd:CI_ResponsibleParty'))
             if prod is not None:
                 self.producer = CI_ResponsibleParty(prod)
 
             self.featuretypes = []
-            for i in fc.findall(util.nspath_eval('gfc:featureType/gfc:FC_FeatureType', namespaces)):
+            for i in fc.findall(_nspath('gfc:featureType/gfc:FC_FeatureType')):
                 self.featuretypes.append(FC_FeatureType(i))
 
 
@@ -1191,24 +1152,24 @@ class FC_FeatureType(object):
             val = ft.attrib['uuid']
             self.identifier = util.testXMLValue(val, attrib=True)
 
-            val = ft.find(util.nspath_eval('gfc:typeName/gco:LocalName', namespaces))
+            val = ft.find(_nspath('gfc:typeName/gco:LocalName'))
             self.typename = util.testXMLValue(val)
 
-            val = ft.find(util.nspath_eval('gfc:definition/gco:CharacterString', namespaces))
+            val = ft.find(_nspath('gfc:definition/gco:CharacterString'))
             self.definition = util.testXMLValue(val)
 
             self.isabstract = None
-            val = ft.find(util.nspath_eval('gfc:isAbstract/gco:Boolean', namespaces))
+            val = ft.find(_nspath('gfc:isAbstract/gco:Boolean'))
             val = util.testXMLValue(val)
             if val is not None:
                 self.isabstract = util.getTypedValue('boolean', val)
 
             self.aliases = []
-            for i in ft.findall(util.nspath_eval('gfc:aliases/gco:LocalName', namespaces)):
+            for i in ft.findall(_nspath('gfc:aliases/gco:LocalName')):
                 self.aliases.append(util.testXMLValue(i))
 
             self.attributes = []
-            for i in ft.findall(util.nspath_eval('gfc:carrierOfCharacteristics/gfc:FC_FeatureAttribute', namespaces)):
+            for i in ft.findall(_nspath('gfc:carrierOfCharacteristics/gfc:FC_FeatureAttribute')):
                 self.attributes.append(FC_FeatureAttribute(i))
 
 
@@ -1228,20 +1189,20 @@ class FC_FeatureAttribute(object):
             else:  # part of a larger document
                 self.xml = etree.tostring(fa)
 
-            val = fa.find(util.nspath_eval('gfc:memberName/gco:LocalName', namespaces))
+            val = fa.find(_nspath('gfc:memberName/gco:LocalName'))
             self.membername = util.testXMLValue(val)
 
-            val = fa.find(util.nspath_eval('gfc:definition/gco:CharacterString', namespaces))
+            val = fa.find(_nspath('gfc:definition/gco:CharacterString'))
             self.definition = util.testXMLValue(val)
 
-            val = fa.find(util.nspath_eval('gfc:code/gco:CharacterString', namespaces))
+            val = fa.find(_nspath('gfc:code/gco:CharacterString'))
             self.code = util.testXMLValue(val)
 
-            val = fa.find(util.nspath_eval('gfc:valueType/gco:TypeName/gco:aName/gco:CharacterString', namespaces))
+            val = fa.find(_nspath('gfc:valueType/gco:TypeName/gco:aName/gco:CharacterString'))
             self.valuetype = util.testXMLValue(val)
 
             self.listedvalues = []
-            for i in fa.findall(util.nspath_eval('gfc:listedValue/gfc:FC_ListedValue', namespaces)):
+            for i in fa.findall(_nspath('gfc:listedValue/gfc:FC_ListedValue')):
                 self.listedvalues.append(FC_ListedValue(i))
 
 
@@ -1259,13 +1220,13 @@ class FC_ListedValue(object):
             else:  # part of a larger document
                 self.xml = etree.tostring(lv)
 
-            val = lv.find(util.nspath_eval('gfc:label/gco:CharacterString', namespaces))
+            val = lv.find(_nspath('gfc:label/gco:CharacterString'))
             self.label = util.testXMLValue(val)
 
-            val = lv.find(util.nspath_eval('gfc:code/gco:CharacterString', namespaces))
+            val = lv.find(_nspath('gfc:code/gco:CharacterString'))
             self.code = util.testXMLValue(val)
 
-            val = lv.find(util.nspath_eval('gfc:definition/gco:CharacterString', namespaces))
+            val = lv.find(_nspath('gfc:definition/gco:CharacterString'))
             self.definition = util.testXMLValue(val)
 
 
@@ -1282,26 +1243,25 @@ class MD_ImageDescription(object):
             self.illumination_elevation_angle = None
             self.illumination_azimuth_angle = None
         else:
-            val = img_desc.find(util.nspath_eval('gmd:attributeDescription/gco:RecordType', namespaces))
+            val = img_desc.find(_nspath('gmd:attributeDescription/gco:RecordType'))
             self.attribute_description = util.testXMLValue(val)
 
-            val = img_desc.find(util.nspath_eval('gmd:contentType/gmd:MD_CoverageContentTypeCode', namespaces))
+            val = img_desc.find(_nspath('gmd:contentType/gmd:MD_CoverageContentTypeCode'))
             self.type = util.testXMLAttribute(val, 'codeListValue')
 
-            val = img_desc.find(util.nspath_eval('gmd:cloudCoverPercentage/gco:Real', namespaces))
+            val = img_desc.find(_nspath('gmd:cloudCoverPercentage/gco:Real'))
             self.cloud_cover = util.testXMLValue(val)
 
-            val = img_desc.find(util.nspath_eval('gmd:illuminationElevationAngle/gco:Real', namespaces))
+            val = img_desc.find(_nspath('gmd:illuminationElevationAngle/gco:Real'))
             self.illumination_elevation_angle = util.testXMLValue(val)
 
-            val = img_desc.find(util.nspath_eval('gmd:illuminationAzimuthAngle/gco:Real', namespaces))
+            val = img_desc.find(_nspath('gmd:illuminationAzimuthAngle/gco:Real'))
             self.illumination_azimuth_angle = util.testXMLValue(val)
 
-            val = img_desc.find(util.nspath_eval(
-                'gmd:processingLevelCode/gmd:RS_Identifier/gmd:code/gco:CharacterString', namespaces))
+            val = img_desc.find(_nspath('gmd:processingLevelCode/gmd:RS_Identifier/gmd:code/gco:CharacterString'))
             self.processing_level = util.testXMLValue(val)
 
-            for i in img_desc.findall(util.nspath_eval('gmd:dimension/gmd:MD_Band', namespaces)):
+            for i in img_desc.findall(_nspath('gmd:dimension/gmd:MD_Band')):
                 bid = util.testXMLAttribute(i, 'id')
                 self.bands.append(MD_Band(i, bid))
 
@@ -1317,13 +1277,13 @@ class MD_Band(object):
         else:
             self.id = band_id
 
-            val = band.find(util.nspath_eval('gmd:units/gml:UnitDefinition/gml:identifier', namespaces))
+            val = band.find(_nspath('gmd:units/gml:UnitDefinition/gml:identifier'))
             self.units = util.testXMLValue(val)
 
-            val = band.find(util.nspath_eval('gmd:minValue/gco:Real', namespaces))
+            val = band.find(_nspath('gmd:minValue/gco:Real'))
             self.min = util.testXMLValue(val)
 
-            val = band.find(util.nspath_eval('gmd:maxValue/gco:Real', namespaces))
+            val = band.find(_nspath('gmd:maxValue/gco:Real'))
             self.max = util.testXMLValue(val)
 
 
@@ -1333,7 +1293,7 @@ class MI_AcquisitionInformation(object):
     def __init__(self, acq=None):
         self.platforms = []
 
-        for i in acq.findall(util.nspath_eval('gmi:platform/gmi:MI_Platform', namespaces)):
+        for i in acq.findall(_nspath('gmi:platform/gmi:MI_Platform')):
             self.platforms.append(MI_Platform(i))
 
 
@@ -1347,13 +1307,13 @@ class MI_Platform(object):
             self.identifier = None
             self.description = None
         else:
-            val = plt.find(util.nspath_eval('gmi:identifier', namespaces))
+            val = plt.find(_nspath('gmi:identifier'))
             self.identifier = util.testXMLValue(val)
 
-            val = plt.find(util.nspath_eval('gmi:description', namespaces))
+            val = plt.find(_nspath('gmi:description'))
             self.description = util.testXMLValue(val)
 
-            for i in plt.findall(util.nspath_eval('gmi:instrument/gmi:MI_Instrument', namespaces)):
+            for i in plt.findall(_nspath('gmi:instrument/gmi:MI_Instrument')):
                 self.instruments.append(MI_Instrument(i))
 
 
@@ -1365,8 +1325,8 @@ class MI_Instrument(object):
             self.identifier = None
             self.type = None
         else:
-            val = inst.find(util.nspath_eval('gmi:identifier', namespaces))
+            val = inst.find(_nspath('gmi:identifier'))
             self.identifier = util.testXMLValue(val)
 
-            val = inst.find(util.nspath_eval('gmi:type', namespaces))
+            val = inst.find(_nspath('gmi:type'))
             self.type = util.testXMLValue(val)
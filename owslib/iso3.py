@@ -90,6 +90,18 @@ NAMESPACES_V1 =  {
         "xlink":"http://www.w3.org/1999/xlink"
 }
 
+# etree paths of the namespaced path expressions, for both versions
+_NSPATHS = {id(NAMESPACES_V2): util.nspath_cache(NAMESPACES_V2), id(NAMESPACES_V1): util.nspath_cache(NAMESPACES_V1)}
+
+
+def _nspath_eval(xpath, namespaces):
+    """ Return the etree path of a path expression, cached for the ISO 19115 Part 3 namespaces """
+    nspath = _NSPATHS.get(id(namespaces))
+    if nspath is None:
+        return util.nspath_eval(xpath, namespaces)
+    return nspath(xpath)
+
+
 class printable():
     """ A super class used to roughly pretty print class members
 
@@ -164,54 +176,54 @@ class MD_Metadata(printable):
                 self.xml = etree.tostring(md)
 
            # Test mdb version
-            if md.find(util.nspath_eval('mdb:metadataIdentifier', NAMESPACES_V2)) is None and \
-                    md.find(util.nspath_eval('mdb:metadataIdentifier', NAMESPACES_V1)) is not None:
+            if md.find(_nspath_eval('mdb:metadataIdentifier', NAMESPACES_V2)) is None and \
+                    md.find(_nspath_eval('mdb:metadataIdentifier', NAMESPACES_V1)) is not None:
                 self.namespaces = NAMESPACES_V1
 
-            val = md.find(util.nspath_eval('mdb:metadataIdentifier/mcc:MD_Identifier/mcc:code/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('mdb:metadataIdentifier/mcc:MD_Identifier/mcc:code/gco:CharacterString', self.namespaces))
             self.identifier = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('mdb:parentMetadata/cit:CI_Citation/cit:identifier/mcc:MD_Identifier/mcc:code/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('mdb:parentMetadata/cit:CI_Citation/cit:identifier/mcc:MD_Identifier/mcc:code/gco:CharacterString', self.namespaces))
             self.parentidentifier = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('lan:language/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('lan:language/gco:CharacterString', self.namespaces))
             self.language = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('mdb:identificationInfo/mri:MD_DataIdentification/mri:citation/cit:CI_Citation/cit:identifier/mcc:MD_Identifier/mcc:code/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('mdb:identificationInfo/mri:MD_DataIdentification/mri:citation/cit:CI_Citation/cit:identifier/mcc:MD_Identifier/mcc:code/gco:CharacterString', self.namespaces))
             self.dataseturi = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('mdb:defaultLocale/lan:PT_Locale/lan:language/lan:LanguageCode', self.namespaces))
+            val = md.find(_nspath_eval('mdb:defaultLocale/lan:PT_Locale/lan:language/lan:LanguageCode', self.namespaces))
             self.languagecode = util.testXMLAttribute(val, 'codeListValue')
 
-            val = md.find(util.nspath_eval('mdb:dateInfo/cit:CI_Date/cit:date/gco:DateTime', self.namespaces))
+            val = md.find(_nspath_eval('mdb:dateInfo/cit:CI_Date/cit:date/gco:DateTime', self.namespaces))
             self.datestamp = util.testXMLValue(val)
 
             val = md.find(
-                util.nspath_eval('mdb:defaultLocale/lan:PT_Locale/lan:characterEncoding/lan:MD_CharacterSetCode', self.namespaces))
+                _nspath_eval('mdb:defaultLocale/lan:PT_Locale/lan:characterEncoding/lan:MD_CharacterSetCode', self.namespaces))
             self.charset = util.testXMLAttribute(val, 'codeListValue')
 
             val = md.find(
-                util.nspath_eval('mdb:metadataScope/mdb:MD_MetadataScope/mdb:resourceScope/mcc:MD_ScopeCode', self.namespaces))
+                _nspath_eval('mdb:metadataScope/mdb:MD_MetadataScope/mdb:resourceScope/mcc:MD_ScopeCode', self.namespaces))
             self.hierarchy = util.testXMLAttribute(val, 'codeListValue')
 
             self.contact = []
-            for i in md.findall(util.nspath_eval('mdb:contact/cit:CI_Responsibility', self.namespaces)):
+            for i in md.findall(_nspath_eval('mdb:contact/cit:CI_Responsibility', self.namespaces)):
                 o = CI_Responsibility(self.namespaces, i)
                 self.contact.append(o)
 
             self.datetimestamp = self.datestamp
 
-            val = md.find(util.nspath_eval('mdb:metadataStandard/cit:CI_Citation/cit:title/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('mdb:metadataStandard/cit:CI_Citation/cit:title/gco:CharacterString', self.namespaces))
             self.stdname = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('mdb:metadataStandard/cit:CI_Citation/cit:edition/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('mdb:metadataStandard/cit:CI_Citation/cit:edition/gco:CharacterString', self.namespaces))
             self.stdver = util.testXMLValue(val)
 
             self.locales = []
-            for i in md.findall(util.nspath_eval('mdb:defaultLocale/lan:PT_Locale', self.namespaces)):
+            for i in md.findall(_nspath_eval('mdb:defaultLocale/lan:PT_Locale', self.namespaces)):
                 self.locales.append(PT_Locale(self.namespaces, i))
 
-            val = md.find(util.nspath_eval('mdb:referenceSystemInfo/mrs:MD_ReferenceSystem', self.namespaces))
+            val = md.find(_nspath_eval('mdb:referenceSystemInfo/mrs:MD_ReferenceSystem', self.namespaces))
             if val is not None:
                 self.referencesystem = MD_ReferenceSystem(self.namespaces, val)
             else:
@@ -219,7 +231,7 @@ class MD_Metadata(printable):
 
             self.identification = []
 
-            for idinfo in md.findall(util.nspath_eval('mdb:identificationInfo', self.namespaces)):
+            for idinfo in md.findall(_nspath_eval('mdb:identificationInfo', self.namespaces)):
                 if len(idinfo) > 0:
                     val = list(idinfo)[0]
                     tagval = util.xmltag_split(val.tag)
@@ -232,24 +244,24 @@ class MD_Metadata(printable):
 
             self.contentinfo = []
             for contentinfo in md.findall(
-                    util.nspath_eval('mdb:contentInfo/mrc:MD_FeatureCatalogueDescription', self.namespaces)):
+                    _nspath_eval('mdb:contentInfo/mrc:MD_FeatureCatalogueDescription', self.namespaces)):
                 self.contentinfo.append(MD_FeatureCatalogueDescription(self.namespaces, contentinfo))
             for contentinfo in md.findall(
-                    util.nspath_eval('mdb:contentInfo/mrc:MD_ImageDescription', self.namespaces)):
+                    _nspath_eval('mdb:contentInfo/mrc:MD_ImageDescription', self.namespaces)):
                 self.contentinfo.append(MD_ImageDescription(self.namespaces, contentinfo))
             for contentinfo in md.findall(
-                    util.nspath_eval('mdb:contentInfo/mrc:MD_FeatureCatalogue/mrc:featureCatalogue/gfc:FC_FeatureCatalogue',
+                    _nspath_eval('mdb:contentInfo/mrc:MD_FeatureCatalogue/mrc:featureCatalogue/gfc:FC_FeatureCatalogue',
                                      self.namespaces)):
                 self.contentinfo.append(FC_FeatureCatalogue(self.namespaces, contentinfo))
 
-            val = md.find(util.nspath_eval('mdb:distributionInfo/mrd:MD_Distribution', self.namespaces))
+            val = md.find(_nspath_eval('mdb:distributionInfo/mrd:MD_Distribution', self.namespaces))
 
             if val is not None:
                 self.distribution = MD_Distribution(self.namespaces, val)
             else:
                 self.distribution = None
 
-            val = md.find(util.nspath_eval('mdb:dataQualityInfo/mdq:DQ_DataQuality', self.namespaces))
+            val = md.find(_nspath_eval('mdb:dataQualityInfo/mdq:DQ_DataQuality', self.namespaces))
             if val is not None:
                 self.dataquality = DQ_DataQuality(self.namespaces, val)
             else:
@@ -288,11 +300,11 @@ class MD_Metadata(printable):
         :returns: a list of tuples (id string, 'mdb:MD_Metadata' lxml.Element)
         """
         for ns in [NAMESPACES_V2, NAMESPACES_V1]:
-            elems = elemtree.findall('.//' + util.nspath_eval('mdb:MD_Metadata', ns))
+            elems = elemtree.findall('.//' + _nspath_eval('mdb:MD_Metadata', ns))
             if len(elems) > 0:
                 ret_list = []
                 for i in elems:
-                    val = i.find(util.nspath_eval('mdb:metadataIdentifier/mcc:MD_Identifier/mcc:code/gco:CharacterString', NAMESPACES_V2))
+                    val = i.find(_nspath_eval('mdb:metadataIdentifier/mcc:MD_Identifier/mcc:code/gco:CharacterString', NAMESPACES_V2))
                     ret_list.append((i, util.testXMLValue(val)))
                 return ret_list
         return []
@@ -351,13 +363,13 @@ class PT_Locale(printable):
 
             try:
                 self.languagecode = md.find(
-                    util.nspath_eval('lan:language/lan:LanguageCode', self.namespaces)).attrib.get('codeListValue')
+                    _nspath_eval('lan:language/lan:LanguageCode', self.namespaces)).attrib.get('codeListValue')
             except AttributeError:
                 pass
 
             try:
                 self.charset = md.find(
-                    util.nspath_eval('lan:characterEncoding/lan:MD_CharacterSetCode', self.namespaces)).attrib.get(
+                    _nspath_eval('lan:characterEncoding/lan:MD_CharacterSetCode', self.namespaces)).attrib.get(
                     'codeListValue')
             except AttributeError:
                 pass
@@ -378,17 +390,17 @@ class CI_Date(printable):
             self.date = None
             self.type = None
         else:
-            val = md.find(util.nspath_eval('cit:date/gco:Date', self.namespaces))
+            val = md.find(_nspath_eval('cit:date/gco:Date', self.namespaces))
             if val is not None:
                 self.date = util.testXMLValue(val)
             else:
-                val = md.find(util.nspath_eval('cit:date/gco:DateTime', self.namespaces))
+                val = md.find(_nspath_eval('cit:date/gco:DateTime', self.namespaces))
                 if val is not None:
                     self.date = util.testXMLValue(val)
                 else:
                     self.date = None
 
-            val = md.find(util.nspath_eval('cit:dateType/cit:CI_DateTypeCode', self.namespaces))
+            val = md.find(_nspath_eval('cit:dateType/cit:CI_DateTypeCode', self.namespaces))
             self.type = _testCodeListValue(val)
 
 
@@ -419,20 +431,20 @@ class CI_Responsibility(printable):
             self.role = None
         else:
             # Individual name
-            val = md.find(util.nspath_eval('cit:party/cit:CI_Individual/cit:name/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('cit:party/cit:CI_Individual/cit:name/gco:CharacterString', self.namespaces))
             self.name = util.testXMLValue(val)
 
             # Individual within organisation name
             if self.name is None:
-                val = md.find(util.nspath_eval('cit:party/cit:CI_Organisation/cit:individual/cit:CI_Individual/cit:name/gco:CharacterString', self.namespaces))
+                val = md.find(_nspath_eval('cit:party/cit:CI_Organisation/cit:individual/cit:CI_Individual/cit:name/gco:CharacterString', self.namespaces))
                 self.name = util.testXMLValue(val)
 
             # Organisation name
-            val = md.find(util.nspath_eval('cit:party/cit:CI_Organisation/cit:name/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('cit:party/cit:CI_Organisation/cit:name/gco:CharacterString', self.namespaces))
             self.organization = util.testXMLValue(val)
 
             # Individual within organisation position
-            val = md.find(util.nspath_eval('cit:party/cit:CI_Organisation/cit:individual/cit:CI_Individual/cit:positionName/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('cit:party/cit:CI_Organisation/cit:individual/cit:CI_Individual/cit:positionName/gco:CharacterString', self.namespaces))
             self.position = util.testXMLValue(val)
 
             # Organisation telephone
@@ -446,44 +458,44 @@ class CI_Responsibility(printable):
                 self.fax = util.testXMLValue(val_list[0])
 
             # Organisation address
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'cit:party/cit:CI_Organisation/cit:contactInfo/cit:CI_Contact/cit:address/cit:CI_Address/cit:deliveryPoint/gco:CharacterString',
                 self.namespaces))
             self.address = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'cit:party/cit:CI_Organisation/cit:contactInfo/cit:CI_Contact/cit:address/cit:CI_Address/cit:city/gco:CharacterString', self.namespaces))
             self.city = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'cit:party/cit:CI_Organisation/cit:contactInfo/cit:CI_Contact/cit:address/cit:CI_Address/cit:administrativeArea/gco:CharacterString',
                 self.namespaces))
             self.region = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'cit:party/cit:CI_Organisation/cit:contactInfo/cit:CI_Contact/cit:address/cit:CI_Address/cit:postalCode/gco:CharacterString',
                 self.namespaces))
             self.postcode = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'cit:party/cit:CI_Organisation/cit:contactInfo/cit:CI_Contact/cit:address/cit:CI_Address/cit:country/gco:CharacterString',
                 self.namespaces))
             self.country = util.testXMLValue(val)
 
             # Organisation email
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'cit:party/cit:CI_Organisation/cit:contactInfo/cit:CI_Contact/cit:address/cit:CI_Address/cit:electronicMailAddress/gco:CharacterString',
                 self.namespaces))
             self.email = util.testXMLValue(val)
 
             # Organisation online resources
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'cit:party/cit:CI_Organisation/cit:contactInfo/cit:CI_Contact/cit:onlineResource/cit:CI_OnlineResource', self.namespaces))
             if val is not None:
                 self.onlineresource = CI_OnlineResource(self.namespaces, val)
             else:
                 self.onlineresource = None
-            val = md.find(util.nspath_eval('cit:role/cit:CI_RoleCode', self.namespaces))
+            val = md.find(_nspath_eval('cit:role/cit:CI_RoleCode', self.namespaces))
             self.role = _testCodeListValue(val)
 
 
@@ -503,7 +515,7 @@ class Keyword(printable):
             self.url = None
         else:
             self.name = util.testXMLValue(kw)
-            self.url = kw.attrib.get(util.nspath_eval('xlink:href', self.namespaces))
+            self.url = kw.attrib.get(_nspath_eval('xlink:href', self.namespaces))
 
 
 class MD_Keywords(printable):
@@ -524,34 +536,34 @@ class MD_Keywords(printable):
         self.kwdtype_codeList = 'http://standards.iso.org/iso/19115/-3/resources/Codelist/gmxCodelists.xml#MD_KeywordTypeCode'
 
         if md is not None:
-            val = md.findall(util.nspath_eval('mri:keyword/gco:CharacterString', self.namespaces))
+            val = md.findall(_nspath_eval('mri:keyword/gco:CharacterString', self.namespaces))
             if len(val) == 0:
-                val = md.findall(util.nspath_eval('mri:keyword/gcx:Anchor', self.namespaces))
+                val = md.findall(_nspath_eval('mri:keyword/gcx:Anchor', self.namespaces))
             for word in val:
                 self.keywords.append(Keyword(self.namespaces, word))
 
-            val = md.find(util.nspath_eval('mri:type/mri:MD_KeywordTypeCode', self.namespaces))
+            val = md.find(_nspath_eval('mri:type/mri:MD_KeywordTypeCode', self.namespaces))
             self.type = util.testXMLAttribute(val, 'codeListValue')
 
-            cit = md.find(util.nspath_eval('mri:thesaurusName/cit:CI_Citation', self.namespaces))
+            cit = md.find(_nspath_eval('mri:thesaurusName/cit:CI_Citation', self.namespaces))
             if cit is not None:
                 self.thesaurus = {}
 
-                title = cit.find(util.nspath_eval('cit:title/gco:CharacterString', self.namespaces))
+                title = cit.find(_nspath_eval('cit:title/gco:CharacterString', self.namespaces))
                 self.thesaurus['title'] = util.testXMLValue(title)
                 self.thesaurus['url'] = None
 
                 if self.thesaurus['title'] is None:  # try gmx:Anchor
-                    t = cit.find(util.nspath_eval('cit:title/gcx:Anchor', self.namespaces))
+                    t = cit.find(_nspath_eval('cit:title/gcx:Anchor', self.namespaces))
                     if t is not None:
                         self.thesaurus['title'] = util.testXMLValue(t)
-                        self.thesaurus['url'] = t.attrib.get(util.nspath_eval('xlink:href', self.namespaces))
+                        self.thesaurus['url'] = t.attrib.get(_nspath_eval('xlink:href', self.namespaces))
 
-                date_ = cit.find(util.nspath_eval('cit:date/cit:CI_Date/cit:date/gco:Date', self.namespaces))
+                date_ = cit.find(_nspath_eval('cit:date/cit:CI_Date/cit:date/gco:Date', self.namespaces))
                 self.thesaurus['date'] = util.testXMLValue(date_)
 
                 datetype = cit.find(
-                    util.nspath_eval('cit:date/cit:CI_Date/cit:dateType/cit:CI_DateTypeCode', self.namespaces))
+                    _nspath_eval('cit:date/cit:CI_Date/cit:dateType/cit:CI_DateTypeCode', self.namespaces))
                 self.thesaurus['datetype'] = util.testXMLAttribute(datetype, 'codeListValue')
 
 class MD_DataIdentification(printable):
@@ -610,18 +622,17 @@ class MD_DataIdentification(printable):
         else:
             # Title
             self.identtype = identtype
-            val = md.find(util.nspath_eval(
-                'mri:citation/cit:CI_Citation/cit:title/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('mri:citation/cit:CI_Citation/cit:title/gco:CharacterString', self.namespaces))
             self.title = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'mri:citation/cit:CI_Citation/cit:alternateTitle/gco:CharacterString', self.namespaces))
             self.alternatetitle = util.testXMLValue(val)
 
             # Identifier
             self.uricode = []
             for end_tag in ['gco:CharacterString', 'gcx:Anchor']:
-                _values = md.findall(util.nspath_eval(
+                _values = md.findall(_nspath_eval(
                     f"mri:citation/cit:CI_Citation/cit:identifier/mcc:MD_Identifier/mcc:code/{end_tag}",
                     self.namespaces))
                 for i in _values:
@@ -630,7 +641,7 @@ class MD_DataIdentification(printable):
                         self.uricode.append(val)
 
             self.uricodespace = []
-            for i in md.findall(util.nspath_eval(
+            for i in md.findall(_nspath_eval(
                     'mri:citation/cit:CI_Citation/cit:identifier/mcc:MD_Identifier/mcc:codeSpace/gco:CharacterString',
                     self.namespaces)):
                 val = util.testXMLValue(i)
@@ -641,13 +652,13 @@ class MD_DataIdentification(printable):
             self.date = []
             self.datetype = []
 
-            for i in md.findall(util.nspath_eval('mri:citation/cit:CI_Citation/cit:date/cit:CI_Date', self.namespaces)):
+            for i in md.findall(_nspath_eval('mri:citation/cit:CI_Citation/cit:date/cit:CI_Date', self.namespaces)):
                 self.date.append(CI_Date(self.namespaces, i))
 
             # Use Limitation
             self.uselimitation = []
             self.uselimitation_url = []
-            uselimit_values = md.findall(util.nspath_eval(
+            uselimit_values = md.findall(_nspath_eval(
                 'mri:resourceConstraints/mco:MD_LegalConstraints/mco:useLimitation/gco:CharacterString', self.namespaces))
             for i in uselimit_values:
                 val = util.testXMLValue(i)
@@ -656,7 +667,7 @@ class MD_DataIdentification(printable):
 
             # Access constraints
             self.accessconstraints = []
-            for i in md.findall(util.nspath_eval(
+            for i in md.findall(_nspath_eval(
                     'mri:resourceConstraints/mco:MD_LegalConstraints/mco:accessConstraints/mco:MD_RestrictionCode',
                     self.namespaces)):
                 val = _testCodeListValue(i)
@@ -669,7 +680,7 @@ class MD_DataIdentification(printable):
             # Other constraints
             self.otherconstraints = []
             for end_tag in ['gco:CharacterString', 'gcx:Anchor']:
-                for i in md.findall(util.nspath_eval(
+                for i in md.findall(_nspath_eval(
                         f"mri:resourceConstraints/mco:MD_LegalConstraints/mco:otherConstraints/{end_tag}",
                         self.namespaces)):
                     val = util.testXMLValue(i)
@@ -678,7 +689,7 @@ class MD_DataIdentification(printable):
 
             # Security constraints
             self.securityconstraints = []
-            for i in md.findall(util.nspath_eval(
+            for i in md.findall(_nspath_eval(
                     'mri:resourceConstraints/mco:MD_SecurityConstraints/mco:classification/mco:MD_ClassificationCode',
                     self.namespaces)):
                 val = _testCodeListValue(i)
@@ -687,7 +698,7 @@ class MD_DataIdentification(printable):
 
             # Use constraints
             self.useconstraints = []
-            for i in md.findall(util.nspath_eval(
+            for i in md.findall(_nspath_eval(
                     'mri:resourceConstraints/mco:MD_LegalConstraints/mco:useConstraints/mco:MD_RestrictionCode',
                     self.namespaces)):
                 val = _testCodeListValue(i)
@@ -696,7 +707,7 @@ class MD_DataIdentification(printable):
 
             # Spatial resolution denominators
             self.denominators = []
-            for i in md.findall(util.nspath_eval(
+            for i in md.findall(_nspath_eval(
                     'mri:spatialResolution/mri:MD_Resolution/mri:equivalentScale/mri:MD_RepresentativeFraction/mri:denominator/gco:Integer',
                     self.namespaces)):
                 val = util.testXMLValue(i)
@@ -706,7 +717,7 @@ class MD_DataIdentification(printable):
             # Spatial resolution distance and units of measure
             self.distance = []
             self.uom = []
-            for i in md.findall(util.nspath_eval(
+            for i in md.findall(_nspath_eval(
                     'mri:spatialResolution/mri:MD_Resolution/mri:distance/gco:Distance', self.namespaces)):
                 val = util.testXMLValue(i)
                 if val is not None:
@@ -715,14 +726,14 @@ class MD_DataIdentification(printable):
 
             # Language code
             self.resourcelanguagecode = []
-            for i in md.findall(util.nspath_eval('mri:defaultLocale/lan:PT_Locale/lan:language/lan:LanguageCode', self.namespaces)):
+            for i in md.findall(_nspath_eval('mri:defaultLocale/lan:PT_Locale/lan:language/lan:LanguageCode', self.namespaces)):
                 val = _testCodeListValue(i)
                 if val is not None:
                     self.resourcelanguagecode.append(val)
 
             # Language
             self.resourcelanguage = []
-            for i in md.findall(util.nspath_eval('mri:defaultLocale/lan:PT_Locale/lan:language/gco:CharacterString', self.namespaces)):
+            for i in md.findall(_nspath_eval('mri:defaultLocale/lan:PT_Locale/lan:language/gco:CharacterString', self.namespaces)):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.resourcelanguage.append(val)
@@ -732,8 +743,8 @@ class MD_DataIdentification(printable):
             self.contributor = []
             self.funder = []
             # Extract roles from point of contact for resource
-            for val in md.findall(util.nspath_eval('mri:pointOfContact/cit:CI_Responsibility', self.namespaces)):
-                role = val.find(util.nspath_eval('cit:role/cit:CI_RoleCode', self.namespaces))
+            for val in md.findall(_nspath_eval('mri:pointOfContact/cit:CI_Responsibility', self.namespaces)):
+                role = val.find(_nspath_eval('cit:role/cit:CI_RoleCode', self.namespaces))
                 if role is not None:
                     clv = _testCodeListValue(role)
                     rp = CI_Responsibility(self.namespaces, val)
@@ -748,12 +759,12 @@ class MD_DataIdentification(printable):
                         self.contributor.append(rp)
 
             # Edition
-            val = md.find(util.nspath_eval('cit:CI_Citation/cit:edition/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('cit:CI_Citation/cit:edition/gco:CharacterString', self.namespaces))
             self.edition = util.testXMLValue(val)
 
             # Extract roles from responsible party for resource
-            for val in md.findall(util.nspath_eval('mri:citation/cit:CI_Citation/cit:citedResponsibleParty/cit:CI_Responsibility', self.namespaces)):
-                role = val.find(util.nspath_eval('cit:role/cit:CI_RoleCode', self.namespaces))
+            for val in md.findall(_nspath_eval('mri:citation/cit:CI_Citation/cit:citedResponsibleParty/cit:CI_Responsibility', self.namespaces)):
+                role = val.find(_nspath_eval('cit:role/cit:CI_RoleCode', self.namespaces))
                 if role is not None:
                     clv = _testCodeListValue(role)
                     rp = CI_Responsibility(self.namespaces, val)
@@ -771,26 +782,26 @@ class MD_DataIdentification(printable):
                         self.funder.append(rp)
 
             # Abstract
-            val = md.find(util.nspath_eval('mri:abstract/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('mri:abstract/gco:CharacterString', self.namespaces))
             self.abstract = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('mri:abstract/gcx:Anchor', self.namespaces))
+            val = md.find(_nspath_eval('mri:abstract/gcx:Anchor', self.namespaces))
 
             self.abstract_url = None
             if val is not None:
                 self.abstract = util.testXMLValue(val)
-                self.abstract_url = val.attrib.get(util.nspath_eval('xlink:href', self.namespaces))
+                self.abstract_url = val.attrib.get(_nspath_eval('xlink:href', self.namespaces))
 
             # Purpose
-            val = md.find(util.nspath_eval('mri:purpose/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('mri:purpose/gco:CharacterString', self.namespaces))
             self.purpose = util.testXMLValue(val)
 
             # Status
-            self.status = _testCodeListValue(md.find(util.nspath_eval('mri:status/mri:MD_ProgressCode', self.namespaces)))
+            self.status = _testCodeListValue(md.find(_nspath_eval('mri:status/mri:MD_ProgressCode', self.namespaces)))
 
             # Graphic overview
             self.graphicoverview = []
-            for val in md.findall(util.nspath_eval(
+            for val in md.findall(_nspath_eval(
                     'mri:graphicOverview/mcc:MD_BrowseGraphic/mcc:fileName/gco:CharacterString', self.namespaces)):
                 if val is not None:
                     val2 = util.testXMLValue(val)
@@ -799,13 +810,13 @@ class MD_DataIdentification(printable):
 
             # Point of Contact
             self.contact = []
-            for i in md.findall(util.nspath_eval('mri:pointOfContact/cit:CI_Responsibility', self.namespaces)):
+            for i in md.findall(_nspath_eval('mri:pointOfContact/cit:CI_Responsibility', self.namespaces)):
                 o = CI_Responsibility(self.namespaces, i)
                 self.contact.append(o)
 
             # Spatial repreentation type
             self.spatialrepresentationtype = []
-            for val in md.findall(util.nspath_eval(
+            for val in md.findall(_nspath_eval(
                     'mri:spatialRepresentationType/mcc:MD_SpatialRepresentationTypeCode', self.namespaces)):
                 val = util.testXMLAttribute(val, 'codeListValue')
                 if val:
@@ -813,18 +824,18 @@ class MD_DataIdentification(printable):
 
             # Keywords
             self.keywords = []
-            for mdkw in md.findall(util.nspath_eval('mri:descriptiveKeywords/mri:MD_Keywords', self.namespaces)):
+            for mdkw in md.findall(_nspath_eval('mri:descriptiveKeywords/mri:MD_Keywords', self.namespaces)):
                 self.keywords.append(MD_Keywords(self.namespaces, mdkw))
 
             # Topic category
             self.topiccategory = []
-            for i in md.findall(util.nspath_eval('mri:topicCategory/mri:MD_TopicCategoryCode', self.namespaces)):
+            for i in md.findall(_nspath_eval('mri:topicCategory/mri:MD_TopicCategoryCode', self.namespaces)):
                 val = util.testXMLValue(i)
                 if val is not None:
                     self.topiccategory.append(val)
 
             # Supplamental information
-            val = md.find(util.nspath_eval('mri:supplementalInformation/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('mri:supplementalInformation/gco:CharacterString', self.namespaces))
             self.supplementalinformation = util.testXMLValue(val)
 
             # There may be multiple geographicElement, create an extent
@@ -833,29 +844,29 @@ class MD_DataIdentification(printable):
             val = None
             val2 = None
             val3 = None
-            extents = md.findall(util.nspath_eval('mri:extent', self.namespaces))
+            extents = md.findall(_nspath_eval('mri:extent', self.namespaces))
             for extent in extents:
                 # Parse bounding box and vertical extents
                 if val is None:
-                    for e in extent.findall(util.nspath_eval('gex:EX_Extent/gex:geographicElement', self.namespaces)):
-                        if e.find(util.nspath_eval('gex:EX_GeographicBoundingBox', self.namespaces)) is not None or \
-                                e.find(util.nspath_eval('gex:EX_BoundingPolygon', self.namespaces)) is not None:
+                    for e in extent.findall(_nspath_eval('gex:EX_Extent/gex:geographicElement', self.namespaces)):
+                        if e.find(_nspath_eval('gex:EX_GeographicBoundingBox', self.namespaces)) is not None or \
+                                e.find(_nspath_eval('gex:EX_BoundingPolygon', self.namespaces)) is not None:
                             val = e
                             break
-                    vert_elem = extent.find(util.nspath_eval('gex:EX_Extent/gex:verticalElement', self.namespaces))
+                    vert_elem = extent.find(_nspath_eval('gex:EX_Extent/gex:verticalElement', self.namespaces))
                     self.extent = EX_Extent(self.namespaces, val, vert_elem)
                     self.bbox = self.extent.boundingBox  # for backwards compatibility
 
                 # Parse temporal extent begin
                 if val2 is None:
-                    val2 = extent.find(util.nspath_eval(
+                    val2 = extent.find(_nspath_eval(
                         'gex:EX_Extent/gex:temporalElement/gex:EX_TemporalExtent/gex:extent/gml:TimePeriod/gml:beginPosition',
                         self.namespaces))
                     self.temporalextent_start = util.testXMLValue(val2)
 
                 # Parse temporal extent end
                 if val3 is None:
-                    val3 = extent.find(util.nspath_eval(
+                    val3 = extent.find(_nspath_eval(
                         'gex:EX_Extent/gex:temporalElement/gex:EX_TemporalExtent/gex:extent/gml:TimePeriod/gml:endPosition',
                         self.namespaces))
                     self.temporalextent_end = util.testXMLValue(val3)
@@ -877,14 +888,14 @@ class MD_Distributor(printable):
             self.online = []
         else:
             self.contact = None
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'mrd:MD_Distributor/mrd:distributorContact/cit:CI_Responsibility', self.namespaces))
             if val is not None:
                 self.contact = CI_Responsibility(self.namespaces, val)
 
             self.online = []
 
-            for ol in md.findall(util.nspath_eval(
+            for ol in md.findall(_nspath_eval(
                     'mrd:MD_Distributor/mrd:distributorTransferOptions/mrd:MD_DigitalTransferOptions/mrd:onLine/cit:CI_OnlineResource',
                     self.namespaces)):
                 self.online.append(CI_OnlineResource(self.namespaces, ol))
@@ -907,21 +918,21 @@ class MD_Distribution(printable):
             self.distributor = []
             self.online = []
         else:
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'mrd:distributionFormat/mrd:MD_Format/mrd:formatSpecificationCitation/cit:CI_Citation/cit:title/gco:CharacterString', self.namespaces))
             self.format = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'mrd:distributionFormat/mrd:MD_Format/mrd:formatSpecificationCitation/cit:CI_Citation/cit:edition/gco:CharacterString', self.namespaces))
             self.version = util.testXMLValue(val)
 
             self.distributor = []
-            for dist in md.findall(util.nspath_eval('mrd:distributor', self.namespaces)):
+            for dist in md.findall(_nspath_eval('mrd:distributor', self.namespaces)):
                 self.distributor.append(MD_Distributor(self.namespaces, dist))
 
             self.online = []
 
-            for ol in md.findall(util.nspath_eval(
+            for ol in md.findall(_nspath_eval(
                     'mrd:transferOptions/mrd:MD_DigitalTransferOptions/mrd:onLine/cit:CI_OnlineResource',
                     self.namespaces)):
                 self.online.append(CI_OnlineResource(self.namespaces, ol))
@@ -973,15 +984,15 @@ class DQ_DataQuality(printable):
                 namespaces=self.namespaces)
             if len(lins) > 0:
                 self.lineage = util.testXMLValue(lins[0])
-                self.lineage_url = lins[0].attrib.get(util.nspath_eval('xlink:href', self.namespaces))
+                self.lineage_url = lins[0].attrib.get(_nspath_eval('xlink:href', self.namespaces))
 
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'mdq:report/mdq:DQ_DomainConsistency/mdq:result/mdq:DQ_ConformanceResult/mdq:specification/cit:CI_Citation/cit:title/gco:CharacterString',
                 self.namespaces))
             self.specificationtitle = util.testXMLValue(val)
 
             self.specificationdate = []
-            for i in md.findall(util.nspath_eval(
+            for i in md.findall(_nspath_eval(
                     'mdq:report/mdq:DQ_DomainConsistency/mdq:result/mdq:DQ_ConformanceResult/mdq:specification/cit:CI_Citation/cit:date/cit:CI_Date/cit:date/gco:DateTime',
                     self.namespaces)):
                 val = util.testXMLValue(i)
@@ -1014,42 +1025,42 @@ class SV_ServiceIdentification(MD_DataIdentification, printable):
             if len(val) > 0:
                 self.type = util.testXMLValue(val[0])
 
-            val = md.find(util.nspath_eval('srv:serviceTypeVersion/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('srv:serviceTypeVersion/gco:CharacterString', self.namespaces))
             self.version = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'srv:accessProperties/mrd:MD_StandardOrderProcess/mrd:fees/gco:CharacterString', self.namespaces))
             self.fees = util.testXMLValue(val)
 
-            self.couplingtype = _testCodeListValue(md.find(util.nspath_eval(
+            self.couplingtype = _testCodeListValue(md.find(_nspath_eval(
                 'srv:couplingType/srv:SV_CouplingType', self.namespaces)))
 
             self.operations = []
 
-            for i in md.findall(util.nspath_eval('srv:containsOperations', self.namespaces)):
+            for i in md.findall(_nspath_eval('srv:containsOperations', self.namespaces)):
                 tmp = {}
-                val = i.find(util.nspath_eval(
+                val = i.find(_nspath_eval(
                     'srv:SV_OperationMetadata/srv:operationName/gco:CharacterString', self.namespaces))
                 tmp['name'] = util.testXMLValue(val)
                 tmp['dcplist'] = []
-                for d in i.findall(util.nspath_eval('srv:SV_OperationMetadata/srv:distributedComputingPlatform', self.namespaces)):
-                    tmp2 = _testCodeListValue(d.find(util.nspath_eval('srv:DCPList', self.namespaces)))
+                for d in i.findall(_nspath_eval('srv:SV_OperationMetadata/srv:distributedComputingPlatform', self.namespaces)):
+                    tmp2 = _testCodeListValue(d.find(_nspath_eval('srv:DCPList', self.namespaces)))
                     tmp['dcplist'].append(tmp2)
 
                 tmp['connectpoint'] = []
 
-                for d in i.findall(util.nspath_eval('srv:SV_OperationMetadata/srv:connectPoint', self.namespaces)):
-                    tmp3 = d.find(util.nspath_eval('cit:CI_OnlineResource', self.namespaces))
+                for d in i.findall(_nspath_eval('srv:SV_OperationMetadata/srv:connectPoint', self.namespaces)):
+                    tmp3 = d.find(_nspath_eval('cit:CI_OnlineResource', self.namespaces))
                     tmp['connectpoint'].append(CI_OnlineResource(self.namespaces, tmp3))
                 self.operations.append(tmp)
 
             self.operateson = []
 
-            for i in md.findall(util.nspath_eval('srv:operatesOn', self.namespaces)):
+            for i in md.findall(_nspath_eval('srv:operatesOn', self.namespaces)):
                 tmp = {}
                 tmp['uuidref'] = i.attrib.get('uuidref')
-                tmp['href'] = i.attrib.get(util.nspath_eval('xlink:href', self.namespaces))
-                tmp['title'] = i.attrib.get(util.nspath_eval('xlink:title', self.namespaces))
+                tmp['href'] = i.attrib.get(_nspath_eval('xlink:href', self.namespaces))
+                tmp['title'] = i.attrib.get(_nspath_eval('xlink:title', self.namespaces))
                 self.operateson.append(tmp)
 
 
@@ -1071,19 +1082,19 @@ class CI_OnlineResource(printable):
             self.description = None
             self.function = None
         else:
-            val = md.find(util.nspath_eval('cit:linkage/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('cit:linkage/gco:CharacterString', self.namespaces))
             self.url = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('cit:protocol/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('cit:protocol/gco:CharacterString', self.namespaces))
             self.protocol = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('cit:name/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('cit:name/gco:CharacterString', self.namespaces))
             self.name = util.testXMLValue(val)
 
-            val = md.find(util.nspath_eval('cit:description/gco:CharacterString', self.namespaces))
+            val = md.find(_nspath_eval('cit:description/gco:CharacterString', self.namespaces))
             self.description = util.testXMLValue(val)
 
-            self.function = _testCodeListValue(md.find(util.nspath_eval(
+            self.function = _testCodeListValue(md.find(_nspath_eval(
                 'cit:function/cit:CI_OnLineFunctionCode', self.namespaces)))
 
 
@@ -1104,13 +1115,13 @@ class EX_GeographicBoundingBox(printable):
             self.miny = None
             self.maxy = None
         else:
-            val = md.find(util.nspath_eval('gex:westBoundLongitude/gco:Decimal', self.namespaces))
+            val = md.find(_nspath_eval('gex:westBoundLongitude/gco:Decimal', self.namespaces))
             self.minx = util.testXMLValue(val)
-            val = md.find(util.nspath_eval('gex:eastBoundLongitude/gco:Decimal', self.namespaces))
+            val = md.find(_nspath_eval('gex:eastBoundLongitude/gco:Decimal', self.namespaces))
             self.maxx = util.testXMLValue(val)
-            val = md.find(util.nspath_eval('gex:southBoundLatitude/gco:Decimal', self.namespaces))
+            val = md.find(_nspath_eval('gex:southBoundLatitude/gco:Decimal', self.namespaces))
             self.miny = util.testXMLValue(val)
-            val = md.find(util.nspath_eval('gex:northBoundLatitude/gco:Decimal', self.namespaces))
+            val = md.find(_nspath_eval('gex:northBoundLatitude/gco:Decimal', self.namespaces))
             self.maxy = util.testXMLValue(val)
 
 
@@ -1131,19 +1142,19 @@ class EX_Polygon(printable):
 
         if md is not None:
             try:
-                linear_ring = md.find(util.nspath_eval('gml32:Polygon/gml32:exterior/gml32:LinearRing', self.namespaces))
+                linear_ring = md.find(_nspath_eval('gml32:Polygon/gml32:exterior/gml32:LinearRing', self.namespaces))
                 if linear_ring is not None:
                     self.exterior_ring = self._coordinates_for_ring(linear_ring)
             except KeyError:
                 pass
 
             try:
-                interior_ring_elements = md.findall(util.nspath_eval('gml32:Polygon/gml32:interior', self.namespaces))
+                interior_ring_elements = md.findall(_nspath_eval('gml32:Polygon/gml32:interior', self.namespaces))
                 self.interior_rings = []
                 if interior_ring_elements is not None:
                     for iring_element in interior_ring_elements:
                         try:
-                            linear_ring = iring_element.find(util.nspath_eval('gml32:LinearRing', self.namespaces))
+                            linear_ring = iring_element.find(_nspath_eval('gml32:LinearRing', self.namespaces))
                             self.interior_rings.append(self._coordinates_for_ring(linear_ring))
                         except KeyError:
                             pass
@@ -1158,7 +1169,7 @@ class EX_Polygon(printable):
         :returns: coordinate list of float tuples
         """
         coordinates = []
-        positions = linear_ring.findall(util.nspath_eval('gml32:pos', self.namespaces))
+        positions = linear_ring.findall(_nspath_eval('gml32:pos', self.namespaces))
         for pos in positions:
             tokens = pos.text.split()
             coords = tuple([float(t) for t in tokens])
@@ -1181,10 +1192,10 @@ class EX_BoundingPolygon(printable):
             self.is_extent = None
             self.polygons = []
         else:
-            val = md.find(util.nspath_eval('gex:extentTypeCode', self.namespaces))
+            val = md.find(_nspath_eval('gex:extentTypeCode', self.namespaces))
             self.is_extent = util.testXMLValue(val)
 
-            md_polygons = md.findall(util.nspath_eval('gex:polygon', self.namespaces))
+            md_polygons = md.findall(_nspath_eval('gex:polygon', self.namespaces))
 
             self.polygons = []
             for val in md_polygons:
@@ -1210,15 +1221,15 @@ class EX_Extent(printable):
         self.vertExtMax = None
         if md is not None:
             # Parse bounding box
-            bboxElement = md.find(util.nspath_eval('gex:EX_GeographicBoundingBox', self.namespaces))
+            bboxElement = md.find(_nspath_eval('gex:EX_GeographicBoundingBox', self.namespaces))
             if bboxElement is not None:
                 self.boundingBox = EX_GeographicBoundingBox(self.namespaces, bboxElement)
 
-            polygonElement = md.find(util.nspath_eval('gex:EX_BoundingPolygon', self.namespaces))
+            polygonElement = md.find(_nspath_eval('gex:EX_BoundingPolygon', self.namespaces))
             if polygonElement is not None:
                 self.boundingPolygon = EX_BoundingPolygon(self.namespaces, polygonElement)
 
-            code = md.find(util.nspath_eval(
+            code = md.find(_nspath_eval(
                 'gex:EX_GeographicDescription/gex:geographicIdentifier/mcc:MD_Identifier/mcc:code/gco:CharacterString',
                 self.namespaces))
             self.description_code = util.testXMLValue(code)
@@ -1226,13 +1237,13 @@ class EX_Extent(printable):
         # Parse vertical extent
         if vert_elem is not None:
             # Get vertical extent max
-            vertext_max = vert_elem.find(util.nspath_eval(
+            vertext_max = vert_elem.find(_nspath_eval(
                 'gex:EX_VerticalExtent/gex:maximumValue/gco:Real',
                 self.namespaces))
             self.vertExtMax = util.testXMLValue(vertext_max)
 
             # Get vertical extent min
-            vertext_min = vert_elem.find(util.nspath_eval(
+            vertext_min = vert_elem.find(_nspath_eval(
                 'gex:EX_VerticalExtent/gex:minimumValue/gco:Real',
                 self.namespaces))
             self.vertExtMin = util.testXMLValue(vertext_min)
@@ -1254,26 +1265,26 @@ class MD_ReferenceSystem(printable):
             self.codeSpace = None
             self.version = None
         else:
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'mrs:referenceSystemIdentifier/mcc:MD_Identifier/mcc:code/gco:CharacterString', self.namespaces))
             if val is not None:
                 self.code = util.testXMLValue(val)
             else:
-                val = md.find(util.nspath_eval(
+                val = md.find(_nspath_eval(
                 'mrs:referenceSystemIdentifier/mcc:MD_Identifier/mcc:code/gcx:Anchor', self.namespaces))
                 if val is not None:
                     self.code = util.testXMLValue(val)
                 else:
                     self.code = None
 
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'mrs:referenceSystemIdentifier/mcc:MD_Identifier/mcc:codeSpace/gco:CharacterString', self.namespaces))
             if val is not None:
                 self.codeSpace = util.testXMLValue(val)
             else:
                 self.codeSpace = None
 
-            val = md.find(util.nspath_eval(
+            val = md.find(_nspath_eval(
                 'mrs:referenceSystemIdentifier/mcc:MD_Identifier/mcc:version/gco:CharacterString', self.namespaces))
             if val is not None:
                 self.version = util.testXMLValue(val)
@@ -1325,19 +1336,19 @@ class MD_FeatureCatalogueDescription(printable):
                 self.xml = etree.tostring(fcd)
 
             self.compliancecode = None
-            comp = fcd.find(util.nspath_eval('mrc:complianceCode/gco:Boolean', self.namespaces))
+            comp = fcd.find(_nspath_eval('mrc:complianceCode/gco:Boolean', self.namespaces))
             val = util.testXMLValue(comp)
             if val is not None:
                 self.compliancecode = util.getTypedValue('boolean', val)
 
             self.language = []
-            for i in fcd.findall(util.nspath_eval('mrc:locale/lan:PT_Locale/lan:language/lan:LanguageCode', self.namespaces)):
+            for i in fcd.findall(_nspath_eval('mrc:locale/lan:PT_Locale/lan:language/lan:LanguageCode', self.namespaces)):
                 val = _testCodeListValue(i)
                 if val is not None:
                     self.language.append(val)
 
             self.includedwithdataset = None
-            comp = fcd.find(util.nspath_eval('mrc:includedWithDataset/gco:Boolean', self.namespaces))
+            comp = fcd.find(_nspath_eval('mrc:includedWithDataset/gco:Boolean', self.namespaces))
             val = util.testXMLValue(comp)
             if val is not None:
                 self.includedwithdataset = util.getTypedValue('boolean', val)
@@ -1351,7 +1362,7 @@ class MD_FeatureCatalogueDescription(printable):
 
             # Gather feature catalogue titles
             self.featurecatalogues = []
-            for cit in fcd.findall(util.nspath_eval(
+            for cit in fcd.findall(_nspath_eval(
                     'mrc:featureCatalogueCitation/cit:CI_Citation/cit:title/gco:CharacterString', self.namespaces)):
                 val = util.testXMLValue(cit)
                 if val is not None:
@@ -1377,23 +1388,23 @@ class FC_FeatureCatalogue(object):
             val = fc.attrib['uuid']
             self.identifier = util.testXMLValue(val, attrib=True)
 
-            val = fc.find(util.nspath_eval('cat:name/gco:CharacterString', self.namespaces))
+            val = fc.find(_nspath_eval('cat:name/gco:CharacterString', self.namespaces))
             self.name = util.testXMLValue(val)
 
-            val = fc.find(util.nspath_eval('cat:versionDate/gco:Date', self.namespaces))
+            val = fc.find(_nspath_eval('cat:versionDate/gco:Date', self.namespaces))
             self.versiondate = util.testXMLValue(val)
 
             if not self.versiondate:
-                val = fc.find(util.nspath_eval('cat:versionDate/gco:DateTime', self.namespaces))
+                val = fc.find(_nspath_eval('cat:versionDate/gco:DateTime', self.namespaces))
                 self.versiondate = util.testXMLValue(val)
 
             self.producer = None
-            prod = fc.find(util.nspath_eval('gfc:producer/cit:CI_Responsiblility', self.namespaces))
+            prod = fc.find(_nspath_eval('gfc:producer/cit:CI_Responsiblility', self.namespaces))
             if prod is not None:
                 self.producer = CI_Responsibility(prod)
 
             self.featuretypes = []
-            for i in fc.findall(util.nspath_eval('gfc:featureType/gfc:FC_FeatureType', self.namespaces)):
+            for i in fc.findall(_nspath_eval('gfc:featureType/gfc:FC_FeatureType', self.namespaces)):
                 self.featuretypes.append(FC_FeatureType(i))
 
 class FC_FeatureType(object):
@@ -1416,24 +1427,24 @@ class FC_FeatureType(object):
             val = ft.attrib['uuid']
             self.identifier = util.testXMLValue(val, attrib=True)
 
-            val = ft.find(util.nspath_eval('gfc:typeName/gco:LocalName', self.namespaces))
+            val = ft.find(_nspath_eval('gfc:typeName/gco:LocalName', self.namespaces))
             self.typename = util.testXMLValue(val)
 
-            val = ft.find(util.nspath_eval('gfc:definition/gco:CharacterString', self.namespaces))
+            val = ft.find(_nspath_eval('gfc:definition/gco:CharacterString', self.namespaces))
             self.definition = util.testXMLValue(val)
 
             self.isabstract = None
-            val = ft.find(util.nspath_eval('gfc:isAbstract/gco:Boolean', self.namespaces))
+            val = ft.find(_nspath_eval('gfc:isAbstract/gco:Boolean', self.namespaces))
             val = util.testXMLValue(val)
             if val is not None:
                 self.isabstract = util.getTypedValue('boolean', val)
 
             self.aliases = []
-            for i in ft.findall(util.nspath_eval('gfc:aliases/gco:LocalName', self.namespaces)):
+            for i in ft.findall(_nspath_eval('gfc:aliases/gco:LocalName', self.namespaces)):
                 self.aliases.append(util.testXMLValue(i))
 
             self.attributes = []
-            for i in ft.findall(util.nspath_eval('gfc:carrierOfCharacteristics/gfc:FC_FeatureAttribute', namespaces)):
+            for i in ft.findall(_nspath_eval('gfc:carrierOfCharacteristics/gfc:FC_FeatureAttribute', namespaces)):
                 self.attributes.append(FC_FeatureAttribute(i))
 
 class FC_FeatureAttribute(object):
@@ -1452,20 +1463,20 @@ class FC_FeatureAttribute(object):
             else:  # part of a larger document
                 self.xml = etree.tostring(fa)
 
-            val = fa.find(util.nspath_eval('gfc:memberName/gco:ScopedName', self.namespaces))
+            val = fa.find(_nspath_eval('gfc:memberName/gco:ScopedName', self.namespaces))
             self.membername = util.testXMLValue(val)
 
-            val = fa.find(util.nspath_eval('gfc:definition/gco:CharacterString', self.namespaces))
+            val = fa.find(_nspath_eval('gfc:definition/gco:CharacterString', self.namespaces))
             self.definition = util.testXMLValue(val)
 
-            val = fa.find(util.nspath_eval('gfc:code/gco:CharacterString', self.namespaces))
+            val = fa.find(_nspath_eval('gfc:code/gco:CharacterString', self.namespaces))
             self.code = util.testXMLValue(val)
 
-            val = fa.find(util.nspath_eval('gfc:valueType/gco:TypeName/gco:aName/gco:CharacterString', self.namespaces))
+            val = fa.find(_nspath_eval('gfc:valueType/gco:TypeName/gco:aName/gco:CharacterString', self.namespaces))
             self.valuetype = util.testXMLValue(val)
 
             self.listedvalues = []
-            for i in fa.findall(util.nspath_eval('gfc:listedValue/gfc:FC_ListedValue', self.namespaces)):
+            for i in fa.findall(_nspath_eval('gfc:listedValue/gfc:FC_ListedValue', self.namespaces)):
                 self.listedvalues.append(FC_ListedValue(i))
 
 class FC_ListedValue(object):
@@ -1482,13 +1493,13 @@ class FC_ListedValue(object):
             else:  # part of a larger document
                 self.xml = etree.tostring(lv)
 
-            val = lv.find(util.nspath_eval('gfc:label/gco:CharacterString', self.namespaces))
+            val = lv.find(_nspath_eval('gfc:label/gco:CharacterString', self.namespaces))
             self.label = util.testXMLValue(val)
 
-            val = lv.find(util.nspath_eval('gfc:code/gco:CharacterString', self.namespaces))
+            val = lv.find(_nspath_eval('gfc:code/gco:CharacterString', self.namespaces))
             self.code = util.testXMLValue(val)
 
-            val = lv.find(util.nspath_eval('gfc:definition/gco:CharacterString', self.namespaces))
+            val = lv.find(_nspath_eval('gfc:definition/gco:CharacterString', self.namespaces))
             self.definition = util.testXMLValue(val)
 
 class MD_ImageDescription(printable):
@@ -1512,26 +1523,26 @@ class MD_ImageDescription(printable):
             self.illumination_elevation_angle = None
             self.illumination_azimuth_angle = None
         else:
-            attdesc = img_desc.find(util.nspath_eval('mrc:attributeDescription/gco:RecordType', self.namespaces))
+            attdesc = img_desc.find(_nspath_eval('mrc:attributeDescription/gco:RecordType', self.namespaces))
             self.attributedescription = util.testXMLValue(attdesc)
 
-            ctype = img_desc.find(util.nspath_eval('mrc:attributeGroup/mrc:MD_AttributeGroup/mrc:contentType/mrc:MD_CoverageContentTypeCode', self.namespaces))
+            ctype = img_desc.find(_nspath_eval('mrc:attributeGroup/mrc:MD_AttributeGroup/mrc:contentType/mrc:MD_CoverageContentTypeCode', self.namespaces))
             self.type = util.testXMLAttribute(ctype, 'codeListValue')
 
-            cloudcov = img_desc.find(util.nspath_eval('mrc:cloudCoverPercentage/gco:Real', self.namespaces))
+            cloudcov = img_desc.find(_nspath_eval('mrc:cloudCoverPercentage/gco:Real', self.namespaces))
             self.cloudcover = util.testXMLValue(cloudcov)
 
-            iea = img_desc.find(util.nspath_eval('mrc:illuminationElevationAngle/gco:Real', self.namespaces))
+            iea = img_desc.find(_nspath_eval('mrc:illuminationElevationAngle/gco:Real', self.namespaces))
             self.illumination_elevation_angle = util.testXMLValue(iea)
 
-            iaa = img_desc.find(util.nspath_eval('mrc:illuminationAzimuthAngle/gco:Real', self.namespaces))
+            iaa = img_desc.find(_nspath_eval('mrc:illuminationAzimuthAngle/gco:Real', self.namespaces))
             self.illumination_azimuth_angle = util.testXMLValue(iaa)
 
-            proclvl = img_desc.find(util.nspath_eval(
+            proclvl = img_desc.find(_nspath_eval(
                 'mrc:processingLevelCode/mcc:MD_Identifier/mcc:code/gco:CharacterString', self.namespaces))
             self.processinglevel = util.testXMLValue(proclvl)
 
-            for i in img_desc.findall(util.nspath_eval('mrc:attributeGroup/mrc:MD_AttributeGroup/mrc:attribute/mrc:MD_Band', self.namespaces)):
+            for i in img_desc.findall(_nspath_eval('mrc:attributeGroup/mrc:MD_AttributeGroup/mrc:attribute/mrc:MD_Band', self.namespaces)):
                 self.bands.append(MD_Band(self.namespaces, i))
 
 
@@ -1552,14 +1563,14 @@ class MD_Band(printable):
             self.min = None
             self.max = None
         else:
-            seq_id = band.find(util.nspath_eval('mrc:sequenceIdentifier/gco:MemberName/gco:aName/gco:CharacterString', self.namespaces))
+            seq_id = band.find(_nspath_eval('mrc:sequenceIdentifier/gco:MemberName/gco:aName/gco:CharacterString', self.namespaces))
             self.id = util.testXMLValue(seq_id)
 
-            units = band.find(util.nspath_eval('mrc:units/gml:UnitDefinition/gml:identifier', self.namespaces))
+            units = band.find(_nspath_eval('mrc:units/gml:UnitDefinition/gml:identifier', self.namespaces))
             self.units = util.testXMLValue(units)
 
-            bmin = band.find(util.nspath_eval('mrc:minValue/gco:Real', self.namespaces))
+            bmin = band.find(_nspath_eval('mrc:minValue/gco:Real', self.namespaces))
             self.min = util.testXMLValue(bmin)
 
-            bmax = band.find(util.nspath_eval('mrc:maxValue/gco:Real', self.namespaces))
+            bmax = band.find(_nspath_eval('mrc:maxValue/gco:Real', self.namespaces))
             self.max = util.testXMLValue(bmax)
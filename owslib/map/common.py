@@ -1,14 +1,19 @@
+from collections.abc import Mapping
 from urllib.parse import urlencode, parse_qsl
+import sys
+import warnings
 
+from owslib.cache import get_default_cache
 from owslib.etree import etree
-from owslib.util import strip_bom, Authentication, openURL, getXMLTree
+from owslib.util import strip_bom, Authentication, openURL, getXMLTree, testXMLValue
 
 
 class WMSCapabilitiesReader(object):
     """Read and parse capabilities document into a lxml.etree infoset
     """
 
-    def __init__(self, version='1.1.1', url=None, un=None, pw=None, headers=None, auth=None):
+    def __init__(self, version='1.1.1', url=None, un=None, pw=None, headers=None, auth=None, session=None,
+                 cache=None):
         """Initialize"""
         self.version = version
         self._infoset = None
@@ -21,6 +26,8 @@ class WMSCapabilitiesReader(object):
         self.headers = headers
         self.request = None
         self.auth = auth or Authentication(un, pw)
+        self.session = session
+        self.cache = cache
 
         # if self.username and self.password:
         #     # Provide login information in order to use the WMS server
@@ -62,8 +69,13 @@ class WMSCapabilitiesReader(object):
 
         # now split it up again to use the generic openURL function...
         spliturl = self.request.split('?')
-        u = openURL(spliturl[0], spliturl[1], method='Get',
-                    timeout=timeout, headers=self.headers, auth=self.auth)
+        cache = self.cache or get_default_cache()
+        if cache is not None:
+            u = cache.open(spliturl[0], spliturl[1], version=self.version,
+                           timeout=timeout, headers=self.headers, auth=self.auth, session=self.session)
+        else:
+            u = openURL(spliturl[0], spliturl[1], method='Get',
+                        timeout=timeout, headers=self.headers, auth=self.auth, session=self.session)
         return getXMLTree(u)
 
     def readString(self, st):
@@ -77,10 +89,138 @@ class WMSCapabilitiesReader(object):
         return etree.fromstring(raw_text)
 
 
+class LazyContents(Mapping):
+    """Mapping of layer names to content metadata built on first access
+
+    The layer elements of the capabilities document are indexed by name in a
+    single pass, and the content metadata of a layer (and of its parent
+    layers, whose properties it inherits) is only built when the layer is
+    accessed.
+    """
+
+    def __init__(self, caps, factory, layer_tag='Layer', name_tag='Name'):
+        """
+        :param caps: ``Capability`` element of the capabilities document
+        :param factory: callable building the content metadata of a layer
+                        element, given its parent's content metadata and its
+                        index in its parent
+        :param layer_tag: tag of the layer elements
+        :param name_tag: tag of the layer name elements
+        """
+        self._factory = factory
+        self._elements = {}
+        self._parents = {}
+        self._built = {}
+
+        # depth first, so that the layers are indexed in document order
+        stack = [caps]
+        while stack:
+            parent = stack.pop()
+            children = parent.findall(layer_tag)
+            for index, elem in enumerate(children):
+                self._parents[elem] = (parent if parent is not caps else None, index + 1)
+                name = testXMLValue(elem.find(name_tag))
+                if name:
+                    if name in self._elements:
+                        warnings.warn('Content metadata for layer "%s" already exists. Using child layer' % name)
+                    self._elements[name] = elem
+            stack.extend(reversed(children))
+
+    def __getitem__(self, name):
+        return self.build(self._elements[name])
+
+    def __iter__(self):
+        return iter(self._elements)
+
+    def __len__(self):
+        return len(self._elements)
+
+    def __contains__(self, name):
+        return name in self._elements
+
+    def build(self, elem):
+        """Return the content metadata of a (named or unnamed) layer element, built once"""
+        cm = self._built.get(elem)
+        if cm is None:
+            parent, index = self._parents[elem]
+            cm = self._factory(elem, self.build(parent) if parent is not None else None, index)
+            self._built[elem] = cm
+        return cm
+
+    def __repr__(self):
+        return '<%s of %d layers, %d built>' % (self.__class__.__name__, len(self), len(self._built))
+
+
+_NO_CRS = frozenset()
+_NO_STYLES = {}
+
+
 class AbstractContentMetadata(object):
+    """
+    Base class of WMS layer metadata
 
-    def __init__(self, auth=None):
+    The CRS options and styles of a layer are inherited from its parent
+    layer.  Layers share the (frozen) set of CRS and the styles of their
+    parent unless they add their own, and copies of them are only made when
+    the ``crsOptions`` and ``styles`` of a layer are accessed.
+    """
+
+    def __init__(self, auth=None, session=None, headers=None):
         self.auth = auth or Authentication()
+        self.session = session
+        self.headers = headers
+
+    def _inherit(self, crs, styles):
+        """
+        Set the CRS options and styles of the layer
+
+        :param crs: CRS codes of the layer element
+        :param styles: dictionary of the styles of the layer element
+        """
+        parent = self.parent
+        inherited = parent._crs if parent is not None else _NO_CRS
+        own = frozenset(sys.intern(code) for code in crs)
+        if own <= inherited:
+            self._crs = inherited
+        else:
+            # layers adding the same CRS to those of their parent share the union
+            if parent is not None:
+                unions = parent.__dict__.setdefault('_crs_unions', {})
+            else:
+                unions = {}
+            self._crs = unions.setdefault(own, inherited | own)
+        self._crs_list = None
+
+        inherited = parent._styles if parent is not None else _NO_STYLES
+        self._styles = {**inherited, **styles} if styles else inherited
+        self._styles_dict = None
+
+    @property
+    def crsOptions(self):
+        if self._crs_list is None:
+            self._crs_list = list(self._crs)
+        return self._crs_list
+
+    @crsOptions.setter
+    def crsOptions(self, value):
+        self._crs_list = value
+        self._crs = frozenset(value or ())
+
+    @property
+    def styles(self):
+        if self._styles_dict is None:
+            self._styles_dict = dict(self._styles)
+        return self._styles_dict
+
+    @styles.setter
+    def styles(self, value):
+        self._styles_dict = value
+        self._styles = value
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop('_crs_unions', None)
+        return state
 
     def get_metadata(self):
         return [m['metadata'] for m in self.metadataUrls if m.get('metadata', None) is not None]
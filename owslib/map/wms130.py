@@ -19,16 +19,14 @@ from urllib.parse import urlencode
 
 import warnings
 from math import sqrt
+from owslib import remotemetadata, snapshot
 from owslib.etree import etree
 from owslib.util import (openURL, ServiceException, testXMLValue,
                          extract_xml_list, xmltag_split, OrderedDict, nspath,
                          nspath_eval, bind_url, Authentication, str2bool)
-from owslib.fgdc import Metadata
-from owslib.iso import MD_Metadata
-from owslib.iso3 import MD_Metadata as MD_Metadata3  # ISO 19115 Part 3 XML
 from owslib.crs import Crs
 from owslib.namespaces import Namespaces
-from owslib.map.common import WMSCapabilitiesReader, AbstractContentMetadata
+from owslib.map.common import WMSCapabilitiesReader, AbstractContentMetadata, LazyContents
 
 n = Namespaces()
 WMS_NAMESPACE = n.get_namespace("wms")
@@ -53,7 +51,7 @@ class WebMapService_1_3_0(object):
 
     def __init__(self, url, version='1.3.0', xml=None, username=None,
                  password=None, parse_remote_metadata=False, timeout=30,
-                 headers=None, auth=None):
+                 headers=None, auth=None, session=None, lazy=False):
         """initialize"""
         if auth:
             if username:
@@ -66,10 +64,11 @@ class WebMapService_1_3_0(object):
         self.headers = headers
         self._capabilities = None
         self.auth = auth or Authentication(username, password)
+        self.session = session
 
         # Authentication handled by Reader
         reader = WMSCapabilitiesReader(
-            self.version, url=self.url, headers=headers, auth=self.auth)
+            self.version, url=self.url, headers=headers, auth=self.auth, session=self.session)
         if xml is not None:  # read from stored xml
             self._capabilities = reader.readString(xml)
         else:  # read from server
@@ -85,9 +84,9 @@ class WebMapService_1_3_0(object):
             raise ServiceException(err_message)
 
         # build metadata objects
-        self._buildMetadata(parse_remote_metadata)
+        self._buildMetadata(parse_remote_metadata, lazy)
 
-    def _buildMetadata(self, parse_remote_metadata=False):
+    def _buildMetadata(self, parse_remote_metadata=False, lazy=False):
         '''set up capabilities metadata objects:'''
 
         self.updateSequence = self._capabilities.attrib.get('updateSequence')
@@ -108,16 +107,27 @@ class WebMapService_1_3_0(object):
 
         # serviceContents metadata: our assumption is that services use a top-level
         # layer as a metadata organizer, nothing more.
-        self.contents = OrderedDict()
         caps = self._capabilities.find(nspath('Capability', WMS_NAMESPACE))
 
+        if lazy:
+            # index the named layers, their metadata is built on first access
+            def build_layer(elem, parent_metadata, index):
+                return ContentMetadata(elem, parent=parent_metadata, index=index,
+                                       parse_remote_metadata=parse_remote_metadata, timeout=self.timeout,
+                                       session=self.session, headers=self.headers,
+                                       lazy=self.contents.build)
+            self.contents = LazyContents(caps, build_layer, nspath('Layer', WMS_NAMESPACE),
+                                         nspath('Name', WMS_NAMESPACE))
+        else:
+            self.contents = OrderedDict()
+
         # recursively gather content metadata for all layer elements.
         # To the WebMapService.contents store only metadata of named layers.
         def gather_layers(parent_elem, parent_metadata):
             layers = []
             for index, elem in enumerate(parent_elem.findall(nspath('Layer', WMS_NAMESPACE))):
                 cm = ContentMetadata(elem, parent=parent_metadata, index=index + 1,
-                                     parse_remote_metadata=parse_remote_metadata)
+                                     session=self.session, headers=self.headers)
                 if cm.id:
                     if cm.id in self.contents:
                         warnings.warn('Content metadata for layer "%s" already exists. Using child layer' % cm.id)
@@ -125,7 +135,11 @@ class WebMapService_1_3_0(object):
                     self.contents[cm.id] = cm
                 cm.children = gather_layers(elem, cm)
             return layers
-        gather_layers(caps, None)
+        if not lazy:
+            gather_layers(caps, None)
+            if parse_remote_metadata:
+                # resolved at once for all layers
+                remotemetadata.parse_remote_metadata(self.contents.values(), self.timeout)
 
         # exceptions
         self.exceptions = [f.text for f
@@ -145,6 +159,21 @@ class WebMapService_1_3_0(object):
             xml = etree.tostring(self._capabilities)
         return xml
 
+    def to_snapshot(self):
+        """Return a compact snapshot of the service metadata (layers, styles,
+        operations...), to be restored with `from_snapshot`.
+        See :mod:`owslib.snapshot`."""
+        return snapshot.dumps(self)
+
+    @classmethod
+    def from_snapshot(cls, data, headers=None, auth=None, session=None):
+        """Restore a service from a snapshot returned by `to_snapshot`,
+        without requesting or parsing its capabilities document.
+
+        Raises `owslib.snapshot.SnapshotError` if the snapshot is invalid or
+        was taken by another version of OWSLib."""
+        return snapshot.loads(data, cls, headers=headers, auth=auth or Authentication(), session=session)
+
     def getOperationByName(self, name):
         """Return a named content item."""
         for item in self.operations:
@@ -308,7 +337,8 @@ class WebMapService_1_3_0(object):
 
         self.request = bind_url(base_url) + data
 
-        u = openURL(base_url, data, method, timeout=timeout or self.timeout, auth=self.auth, headers=self.headers)
+        u = openURL(base_url, data, method, timeout=timeout or self.timeout, auth=self.auth, headers=self.headers,
+                    session=self.session)
 
         # need to handle casing in the header keys
         headers = {}
@@ -383,7 +413,8 @@ class WebMapService_1_3_0(object):
 
         self.request = bind_url(base_url) + data
 
-        u = openURL(base_url, data, method, timeout=timeout or self.timeout, auth=self.auth, headers=self.headers)
+        u = openURL(base_url, data, method, timeout=timeout or self.timeout, auth=self.auth, headers=self.headers,
+                    session=self.session)
 
         # check for service exceptions, and return
         if u.info()['Content-Type'] == 'XML':
@@ -431,8 +462,8 @@ class ServiceProvider(object):
 class ContentMetadata(AbstractContentMetadata):
 
     def __init__(self, elem, parent=None, children=None, index=0, parse_remote_metadata=False,
-                 timeout=30, auth=None):
-        super(ContentMetadata, self).__init__(auth)
+                 timeout=30, auth=None, session=None, lazy=False, headers=None):
+        super(ContentMetadata, self).__init__(auth, session=session, headers=headers)
 
         if xmltag_split(elem.tag) != 'Layer':
             raise ValueError('%s should be a Layer' % (elem,))
@@ -542,45 +573,19 @@ class ContentMetadata(AbstractContentMetadata):
                     nspath('OnlineResource', WMS_NAMESPACE)).attrib['{http://www.w3.org/1999/xlink}href']
 
         # TODO: get this from the bbox attributes instead (deal with parents)
-        # SRS options
-        self.crsOptions = []
-
-        # Copy any parent SRS options (they are inheritable properties)
-        if self.parent:
-            self.crsOptions = list(self.parent.crsOptions)
-
-        # Look for SRS option attached to this layer
-        if elem.find(nspath('CRS', WMS_NAMESPACE)) is not None:
-            # some servers found in the wild use a single SRS
-            # tag containing a whitespace separated list of SRIDs
-            # instead of several SRS tags. hence the inner loop
-            for srslist in [x.text for x in elem.findall(nspath('CRS', WMS_NAMESPACE))]:
-                if srslist:
-                    for srs in srslist.split():
-                        self.crsOptions.append(srs)
-
-        # Get rid of duplicate entries
-        self.crsOptions = list(set(self.crsOptions))
-
-        # Set self.crsOptions to None if the layer (and parents) had no SRS options
-        if len(self.crsOptions) == 0:
-            # raise ValueError('%s no SRS available!?' % (elem,))
-            # Comment by D Lowe.
-            # Do not raise ValueError as it is possible that a layer is purely a parent layer and
-            # does not have SRS specified. Instead set crsOptions to None
-            # Comment by Jachym:
-            # Do not set it to None, but to [], which will make the code
-            # work further. Fixed by anthonybaxter
-            self.crsOptions = []
+        # SRS options, the SRS options and styles of the parent are
+        # inheritable properties, see AbstractContentMetadata._inherit
+        crs = []
+        # some servers found in the wild use a single SRS
+        # tag containing a whitespace separated list of SRIDs
+        # instead of several SRS tags. hence the inner loop
+        for srslist in [x.text for x in elem.findall(nspath('CRS', WMS_NAMESPACE))]:
+            if srslist:
+                crs.extend(srslist.split())
 
         # Styles
-        self.styles = {}
-
-        # Copy any parent styles (they are inheritable properties)
-        if self.parent:
-            self.styles = self.parent.styles.copy()
-
         # Get the styles for this layer (items with the same name are replaced)
+        styles = {}
         for s in elem.findall(nspath('Style', WMS_NAMESPACE)):
             name = s.find(nspath('Name', WMS_NAMESPACE))
             title = s.find(nspath('Title', WMS_NAMESPACE))
@@ -604,7 +609,9 @@ class ContentMetadata(AbstractContentMetadata):
                 lgd_format = lgd.find(nspath('Format', WMS_NAMESPACE))
                 if lgd_format is not None:
                     style['legend_format'] = lgd_format.text.strip()
-            self.styles[name_] = style
+            styles[name_] = style
+
+        self._inherit(crs, styles)
 
         # keywords
         self.keywords = [f.text for f in elem.findall(nspath('KeywordList/Keyword', WMS_NAMESPACE))]
@@ -684,47 +691,51 @@ class ContentMetadata(AbstractContentMetadata):
             }
             self.featureListUrls.append(featureUrl)
 
-        self.layers = []
-        for child in elem.findall(nspath('Layer', WMS_NAMESPACE)):
-            self.layers.append(ContentMetadata(child, self))
+        # with lazy, the child layers are built on first access, by lazy
+        # itself if it is callable (the builder of the service's contents)
+        self._lazy = lazy
+        self._elem = None
+        self._layers = None
+        if lazy:
+            self._elem = elem
+        else:
+            self._layers = [ContentMetadata(child, self, session=self.session, headers=self.headers)
+                            for child in elem.findall(nspath('Layer', WMS_NAMESPACE))]
 
     def parse_remote_metadata(self, timeout=30):
         """Parse remote metadata for MetadataURL and add it as metadataUrl['metadata']"""
-        for metadataUrl in self.metadataUrls:
-            if metadataUrl['url'] is not None \
-                    and metadataUrl['format'].lower() in ['application/xml', 'text/xml']:  # download URL
-                try:
-                    content = openURL(
-                        metadataUrl['url'], timeout=timeout, auth=self.auth)
-                    doc = etree.fromstring(content.read())
-
-                    mdelem = doc.find('.//metadata')
-                    if mdelem is not None:
-                        metadataUrl['metadata'] = Metadata(mdelem)
-                        continue
-
-                    mdelem = doc.find(
-                        './/' + nspath_eval('gmd:MD_Metadata', n.get_namespaces(['gmd']))
-                    )
-                    if mdelem is None:
-                        doc.find(
-                            './/' + nspath_eval('gmi:MI_Metadata', n.get_namespaces(['gmi']))
-                        )
-
-                    if mdelem is not None:
-                        metadataUrl['metadata'] = MD_Metadata(mdelem)
-                        continue
-                    else:
-                        mdelem = MD_Metadata3.find_start(doc)
-                        if mdelem is not None:
-                            metadataUrl["metadata"] = MD_Metadata3(mdelem)
-                        else:
-                            metadataUrl["metadata"] = None
-                except Exception:
-                    metadataUrl['metadata'] = None
+        remotemetadata.parse_remote_metadata([self], timeout)
+
+    def _remote_metadata_parsers(self, metadataUrl):
+        if metadataUrl['url'] is not None \
+                and metadataUrl['format'].lower() in ['application/xml', 'text/xml']:  # download URL
+            return remotemetadata.ALL_PARSERS
+        return None
+
+    def _read_remote_metadata(self, url, timeout):
+        return openURL(url, timeout=timeout, headers=self.headers, auth=self.auth, session=self.session).read()
+
+    @property
+    def layers(self):
+        if self._layers is None:
+            if callable(self._lazy):
+                self._layers = [self._lazy(child) for child in self._elem.findall(nspath('Layer', WMS_NAMESPACE))]
+            else:
+                self._layers = [ContentMetadata(child, self, index=index + 1, session=self.session,
+                                                headers=self.headers, lazy=True)
+                                for index, child in enumerate(self._elem.findall(nspath('Layer', WMS_NAMESPACE)))]
+            self._elem = None
+        return self._layers
+
+    @layers.setter
+    def layers(self, value):
+        self._layers = value
+        self._elem = None
 
     @property
     def children(self):
+        if self._children is None and self._lazy:
+            self._children = [layer for layer in self.layers if layer.id]
         return self._children
 
     @children.setter
@@ -734,6 +745,13 @@ class ContentMetadata(AbstractContentMetadata):
         else:
             self._children.extend(value)
 
+    def __getstate__(self):
+        # build the child layers, the state must not refer to the document
+        self.children
+        state = super(ContentMetadata, self).__getstate__()
+        state['_lazy'] = bool(self._lazy)
+        return state
+
     def __str__(self):
         return 'Layer Name: %s Title: %s' % (self.name, self.title)
 
@@ -15,8 +15,8 @@ import requests
 import yaml
 
 from owslib import __version__
-from owslib.util import (Authentication, http_delete, http_get, http_post,
-                         http_put)
+from owslib.util import (Authentication, HTTPSession, http_delete, http_get,
+                         http_post, http_put)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -29,7 +29,8 @@ class API:
     """Abstraction for OGC API - Common version 1.0"""
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30,
-                 headers: dict = None, auth: Authentication = None):
+                 headers: dict = None, auth: Authentication = None,
+                 session: HTTPSession = None):
         """
         Initializer; implements /
 
@@ -42,6 +43,8 @@ class API:
         @param username: service authentication username
         @param password: service authentication password
         @param auth: instance of owslib.util.Authentication
+        @param session: instance of owslib.util.HTTPSession (default is the
+                        shared session)
 
         @returns: `owslib.ogcapi.API`
         """
@@ -60,12 +63,14 @@ class API:
         if headers:
             self.headers.update(headers)
         self.auth = auth
+        self.session = session
 
         if json_ is not None:  # static JSON string
             self.links = json.loads(json_).get('links', [])
             self.response = json_
         else:
-            response = http_get(self.url, headers=self.headers, auth=self.auth).json()
+            response = http_get(self.url, headers=self.headers, auth=self.auth,
+                                session=self.session).json()
             self.links = response.get('links', [])
             self.response = response
 
@@ -98,7 +103,8 @@ class API:
 
         if url is not None:
             LOGGER.debug(f'Request: {url}')
-            response = http_get(url, headers=REQUEST_HEADERS, auth=self.auth)
+            response = http_get(url, headers=REQUEST_HEADERS, auth=self.auth,
+                                session=self.session)
             if openapi_format == openapi_json_mimetype:
                 content = response.json()
             elif openapi_format == openapi_yaml_mimetype:
@@ -180,14 +186,30 @@ class API:
 
         if method == 'GET':
             response = http_get(url, headers=self.headers, auth=self.auth,
-                                params=kwargs)
+                                params=kwargs, session=self.session)
         elif method == 'POST':
             response = http_post(url, headers=self.headers, request=data,
-                                 auth=self.auth)
+                                 auth=self.auth, session=self.session)
         elif method == 'PUT':
-            response = http_put(url, headers=self.headers, data=data, auth=self.auth)
+            response = http_put(url, headers=self.headers, data=data, auth=self.auth,
+                                session=self.session)
         elif method == 'DELETE':
-            response = http_delete(url, headers=self.headers, auth=self.auth)
+            response = http_delete(url, headers=self.headers, auth=self.auth,
+                                   session=self.session)
+
+        return self._parse_response(response, as_dict)
+
+    def _parse_response(self, response, as_dict: bool = True) -> dict:
+        """
+        helper function to check and decode an OGC API response
+
+        @type response: `requests.Response`
+        @param response: HTTP response
+        @type as_dict: bool
+        @param as_dict: whether to return JSON dict (default ``True``)
+
+        @returns: response as JSON ``dict``
+        """
 
         LOGGER.debug(f'URL: {response.url}')
         LOGGER.debug(f'Response status code: {response.status_code}')
@@ -210,9 +232,10 @@ class API:
 
 class Collections(API):
     def __init__(self, url: str, json_: str = None, timeout: int = 30,
-                 headers: dict = None, auth: Authentication = None):
+                 headers: dict = None, auth: Authentication = None,
+                 session: HTTPSession = None):
         __doc__ = API.__doc__  # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def collections(self) -> dict:
         """
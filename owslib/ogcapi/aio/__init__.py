@@ -0,0 +1,408 @@
+"""
+asyncio variants of the OGC API clients
+
+Each class mirrors its blocking counterpart in ``owslib.ogcapi`` (URL
+building and keyword argument handling are inherited from it), but every
+request method is a coroutine.  All instances share one pooled
+``aiohttp`` connector per event loop unless given an explicit
+``AsyncHTTPSession``::
+
+    async with AsyncHTTPSession(limit=200) as session:
+        w = Features('https://demo.pygeoapi.io/master', session=session)
+        results = await asyncio.gather(*[
+            w.collection_items(c, limit=10) for c in await w.feature_collections()
+        ])
+
+Requires the ``aiohttp`` package.
+"""
+
+import asyncio
+import json
+import logging
+import ssl
+import weakref
+
+import aiohttp
+from multidict import CIMultiDict
+import yaml
+
+from owslib import ogcapi
+from owslib.ogcapi import REQUEST_HEADERS
+from owslib.util import Authentication
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _check_auth(auth):
+    """Raise a ValueError if an authentication is not supported"""
+    if auth is not None and auth.auth_delegate is not None:
+        raise ValueError('auth_delegate is not supported by the asyncio OGC API clients')
+
+
+class AsyncResponse:
+    """
+    Fully read response of an asynchronous request
+
+    Provides the parts of the ``requests.Response`` interface used by the
+    OGC API clients, so that response handling is shared with them.
+    """
+
+    def __init__(self, url: str, status_code: int, headers: dict,
+                 content: bytes, encoding: str = None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def __repr__(self):
+        return f'<AsyncResponse [{self.status_code}]>'
+
+
+class AsyncHTTPSession:
+    """
+    Pooled asynchronous HTTP transport shared by the asyncio OGC API clients
+
+    Connections are pooled per event loop, so a single instance can be used
+    from successive ``asyncio.run()`` calls.  The connections of a loop are
+    closed by ``aclose()``, or once the loop shuts down its asynchronous
+    generators (as ``asyncio.run()`` does before closing it).
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 0):
+        """
+        @type limit: int
+        @param limit: maximum number of simultaneous connections
+        @type limit_per_host: int
+        @param limit_per_host: maximum number of simultaneous connections to
+                               a single host (``0`` for no limit)
+        """
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._sessions = weakref.WeakKeyDictionary()
+        self._finalizers = weakref.WeakKeyDictionary()
+        self._ssl_contexts = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The ``aiohttp.ClientSession`` bound to the running event loop"""
+
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host)
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[loop] = session
+            self._finalizers.pop(loop, None)
+        return session
+
+    async def _loop_session(self) -> aiohttp.ClientSession:
+        """The session of the running event loop, closed when the loop shuts down"""
+
+        session = self.session
+        loop = asyncio.get_running_loop()
+        if loop not in self._finalizers:
+            # the loop closes its asynchronous generators before shutting down
+            finalizer = _close_on_shutdown(session)
+            await finalizer.__anext__()
+            self._finalizers[loop] = finalizer
+        return session
+
+    def _ssl(self, auth: Authentication):
+        if auth is None or (auth.verify is True and auth.cert is None):
+            return True
+        if auth.verify is False and auth.cert is None:
+            return False
+
+        cert = tuple(auth.cert) if isinstance(auth.cert, list) else auth.cert
+        key = (auth.verify, cert)
+        if key not in self._ssl_contexts:
+            if isinstance(auth.verify, str):
+                context = ssl.create_default_context(cafile=auth.verify)
+            else:
+                context = ssl.create_default_context()
+                if auth.verify is False:
+                    context.check_hostname = False
+                    context.verify_mode = ssl.CERT_NONE
+            if isinstance(auth.cert, (list, tuple)):
+                context.load_cert_chain(*auth.cert)
+            elif auth.cert is not None:
+                context.load_cert_chain(auth.cert)
+            self._ssl_contexts[key] = context
+        return self._ssl_contexts[key]
+
+    async def request(self, method: str, url: str, params: dict = None,
+                      data=None, json_: dict = None, headers: dict = None,
+                      auth: Authentication = None,
+                      timeout: int = None) -> AsyncResponse:
+        """
+        Send an HTTP request through the pooled connections
+
+        @type method: string
+        @param method: HTTP method
+        @type url: string
+        @param url: URL of the request
+        @type params: dict
+        @param params: query parameters (``None`` values are skipped)
+        @param data: request payload
+        @type json_: dict
+        @param json_: request payload to be sent as JSON
+        @type headers: dict
+        @param headers: HTTP headers to send with the request
+        @param auth: instance of owslib.util.Authentication
+        @type timeout: int
+        @param timeout: time (in seconds) after which the request should timeout
+
+        @returns: `AsyncResponse`
+        """
+
+        _check_auth(auth)
+        basic_auth = None
+        if auth is not None:
+            if auth.username and auth.password:
+                basic_auth = aiohttp.BasicAuth(auth.username, auth.password)
+
+        query = None
+        if params:
+            query = []
+            for key, value in params.items():
+                if value is None:
+                    continue
+                if isinstance(value, (list, tuple)):
+                    query.extend((key, str(v)) for v in value)
+                else:
+                    query.append((key, str(value)))
+
+        session = await self._loop_session()
+        async with session.request(
+                method, url, params=query, data=data, json=json_,
+                headers=headers, auth=basic_auth, ssl=self._ssl(auth),
+                timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            content = await response.read()
+            return AsyncResponse(str(response.url), response.status,
+                                 response.headers, content, response.charset)
+
+    async def aclose(self):
+        """Close the pooled connections of the running event loop"""
+
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(loop, None)
+        finalizer = self._finalizers.pop(loop, None)
+        if finalizer is not None:
+            await finalizer.aclose()
+        if session is not None:
+            await session.close()
+
+    close = aclose
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} limit={self.limit} limit_per_host={self.limit_per_host}>'
+
+
+async def _close_on_shutdown(session: aiohttp.ClientSession):
+    """Asynchronous generator closing a session when it is finalized"""
+
+    try:
+        yield
+    finally:
+        await session.close()
+
+
+_default_session = AsyncHTTPSession()
+
+
+def get_default_session() -> AsyncHTTPSession:
+    """
+    Return the asynchronous HTTP session used when no session is given
+
+    @returns: `AsyncHTTPSession`
+    """
+
+    return _default_session
+
+
+def set_default_session(session: AsyncHTTPSession):
+    """
+    Set the asynchronous HTTP session used when no session is given
+
+    @type session: `AsyncHTTPSession`
+    @param session: session, or ``None`` to restore a new default session
+    """
+
+    global _default_session
+    _default_session = session or AsyncHTTPSession()
+
+
+class API(ogcapi.API):
+    """Abstraction for OGC API - Common version 1.0 (asyncio)"""
+
+    def __init__(self, url: str, json_: str = None, timeout: int = 30,
+                 headers: dict = None, auth: Authentication = None,
+                 session: AsyncHTTPSession = None):
+        """
+        Initializer.  No request is made until the landing page is needed,
+        or the object is opened with ``await api.open()`` or ``async with``
+
+        @type url: string
+        @param url: url of OGC API landing page document
+        @type json_: string
+        @param json_: json object
+        @param headers: HTTP headers to send with requests
+        @param timeout: time (in seconds) after which requests should timeout
+        @param auth: instance of owslib.util.Authentication (without
+                     auth_delegate, which is not supported)
+        @param session: instance of owslib.ogcapi.aio.AsyncHTTPSession
+                        (default is the shared session)
+
+        @returns: `owslib.ogcapi.aio.API`
+        """
+
+        _check_auth(auth)
+
+        if '?' in url:
+            self.url, self.url_query_string = url.split('?')
+        else:
+            self.url = url.rstrip('/') + '/'
+            self.url_query_string = None
+
+        self.json_ = json_
+        self.timeout = timeout
+        self.headers = dict(REQUEST_HEADERS)
+        self.response_headers = None
+
+        if headers:
+            self.headers.update(headers)
+        self.auth = auth
+        self.session = session
+
+        self.links = []
+        self.response = None
+
+        if json_ is not None:  # static JSON string
+            self.links = json.loads(json_).get('links', [])
+            self.response = json_
+
+    async def open(self):
+        """
+        fetch the landing page, if not done already
+
+        @returns: `owslib.ogcapi.aio.API`
+        """
+
+        if self.response is None:
+            response = await self._http('GET', self.url)
+            response = response.json()
+            self.links = response.get('links', [])
+            self.response = response
+        return self
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def api(self) -> dict:
+        """
+        implements /api
+
+        @returns: `dict` of OpenAPI definition object
+        """
+
+        await self.open()
+
+        openapi_json_mimetype = 'application/vnd.oai.openapi+json;version=3.0'
+        openapi_yaml_mimetype = 'application/vnd.oai.openapi;version=3.0'
+
+        for mimetype in [openapi_json_mimetype, openapi_yaml_mimetype]:
+            for link in self.links:
+                if link['rel'] == 'service-desc' and link['type'] == mimetype:
+                    LOGGER.debug(f"Request: {link['href']}")
+                    response = await self._http('GET', link['href'])
+                    if mimetype == openapi_json_mimetype:
+                        return response.json()
+                    return yaml.safe_load(response.text)
+
+        msg = 'Did not find service-desc link'
+        LOGGER.error(msg)
+        raise RuntimeError(msg)
+
+    async def _http(self, method: str, url: str, **kwargs) -> AsyncResponse:
+        session = self.session or get_default_session()
+        return await session.request(method, url, headers=kwargs.pop('headers', self.headers),
+                                     auth=self.auth, timeout=self.timeout, **kwargs)
+
+    async def _request(self, method: str = 'GET', path: str = None,
+                       data: str = None, as_dict: bool = True,
+                       kwargs: dict = {}) -> dict:
+        """
+        helper coroutine for request/response patterns against OGC API endpoints
+
+        @type path: string
+        @param path: path of request
+        @type method: string
+        @param method: HTTP method (default ``GET``)
+        @type data: string
+        @param data: request data payload
+        @type as_dict: bool
+        @param as_dict: whether to return JSON dict (default ``True``)
+        @type kwargs: string
+        @param kwargs: ``dict`` of keyword value pair request parameters
+
+        @returns: response as JSON ``dict``
+        """
+
+        url = self._build_url(path)
+        self.request = url
+
+        LOGGER.debug(f'Method: {method}')
+        LOGGER.debug(f'Request: {url}')
+        LOGGER.debug(f'Data: {data}')
+        LOGGER.debug(f'Params: {kwargs}')
+
+        if method == 'GET':
+            response = await self._http('GET', url, params=kwargs)
+        elif method == 'POST':
+            headers = CIMultiDict({
+                'Content-Type': 'application/json' if isinstance(data, dict) else 'text/xml'
+            })
+            headers.update(self.headers)
+            if isinstance(data, dict):
+                response = await self._http('POST', url, json_=data, headers=headers)
+            else:
+                response = await self._http('POST', url, data=data, headers=headers)
+        elif method == 'PUT':
+            if isinstance(data, dict):
+                response = await self._http('PUT', url, json_=data)
+            else:
+                response = await self._http('PUT', url, data=data)
+        elif method == 'DELETE':
+            response = await self._http('DELETE', url)
+
+        return self._parse_response(response, as_dict)
+
+
+class Collections(API, ogcapi.Collections):
+    """Abstraction for OGC API collections (asyncio)"""
@@ -0,0 +1,152 @@
+import logging
+
+from owslib.ogcapi import connectedsystems
+from owslib.ogcapi.aio import AsyncHTTPSession, Collections
+from owslib.util import Authentication
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ConnectedSystems(Collections, connectedsystems.ConnectedSystems):
+    """Abstraction for OGC API - Connected Systems (asyncio)"""
+
+
+class Systems(ConnectedSystems, connectedsystems.Systems):
+    """Abstraction for OGC API - Connected Systems - Systems (asyncio)"""
+
+    async def system_collections(self) -> list:
+        """
+        implements /collections filtered on systems
+
+        @returns: `list` of filtered collections object
+        """
+
+        collections_ = await self.collections()
+
+        return [c_['id'] for c_ in collections_['collections']
+                if c_.get('itemType', '').lower() == 'system']
+
+
+class Procedures(ConnectedSystems, connectedsystems.Procedures):
+    pass
+
+
+class Deployments(ConnectedSystems, connectedsystems.Deployments):
+
+    async def deployment_create(self, data: str) -> bool:
+        """ implements /deployments
+        @type data: dict
+        @param data: JSON object
+        @returns: ``bool`` of creation result
+        """
+        _ = await self._request(path='deployments', data=data, method='POST')
+
+        return True
+
+    async def deployment_update(self, deployment_id: str, data: str) -> bool:
+        """ implements /deployments/{deploymentId}
+        @type deployment_id: string
+        @param deployment_id: id of deployment
+        @type data: dict
+        @param data: JSON object
+        @returns: ``bool`` of update result
+        """
+        path = f'deployments/{deployment_id}'
+        _ = await self._request(path=path, data=data, method='PUT')
+
+        return True
+
+    async def deployment_delete(self, deployment_id: str) -> bool:
+        """ implements /deployments/{deploymentId}
+        @type deployment_id: string
+        @param deployment_id: id of deployment
+        @returns: ``bool`` of deletion result
+        """
+        path = f'deployments/{deployment_id}'
+        _ = await self._request(path=path, method='DELETE')
+
+        return True
+
+    async def deployment_add_systems_to_deployment(self, deployment_id: str, data: str,
+                                                   use_member_endpoint=False) -> bool:
+        """ implements /deployments/{deploymentId}/systems
+        @type deployment_id: string
+        @param deployment_id: id of deployment
+        @type data: dict
+        @param data: JSON object
+        @param use_member_endpoint: whether to use the /members endpoint
+        @returns: ``bool`` of creation result
+        """
+        if use_member_endpoint:
+            path = f'deployments/{deployment_id}/members'
+        else:
+            path = f'deployments/{deployment_id}/systems'
+        _ = await self._request(path=path, data=data, method='POST')
+
+        return True
+
+    async def deployment_update_system_in_deployment(self, deployment_id: str, system_id: str,
+                                                     data: str) -> bool:
+        """ implements /deployments/{deploymentId}/systems/{systemId}
+        @type deployment_id: string
+        @param deployment_id: id of deployment
+        @type system_id: string
+        @param system_id: id of system
+        @type data: dict
+        @param data: JSON object
+        @returns: ``bool`` of update result
+        """
+        path = f'deployments/{deployment_id}/systems/{system_id}'
+        _ = await self._request(path=path, data=data, method='PUT')
+
+        return True
+
+    async def deployment_delete_system_in_deployment(self, deployment_id: str, system_id: str) -> bool:
+        """ implements /deployments/{deploymentId}/systems/{systemId}
+        @type deployment_id: string
+        @param deployment_id: id of deployment
+        @type system_id: string
+        @param system_id: id of system
+        @returns: ``bool`` of deletion result
+        """
+        path = f'deployments/{deployment_id}/systems/{system_id}'
+        _ = await self._request(path=path, method='DELETE')
+
+        return True
+
+
+class SamplingFeatures(ConnectedSystems, connectedsystems.SamplingFeatures):
+
+    def __init__(self, url: str, json_: str = None, timeout: int = 30, headers: dict = None,
+                 auth: Authentication = None, alternate_sampling_feature_url: str = None,
+                 session: AsyncHTTPSession = None):
+        self.alternate_sampling_feature_url = alternate_sampling_feature_url
+        super().__init__(url, json_, timeout, headers, auth, session=session)
+
+
+class Properties(ConnectedSystems, connectedsystems.Properties):
+    pass
+
+
+class Datastreams(ConnectedSystems, connectedsystems.Datastreams):
+    pass
+
+
+class Observations(ConnectedSystems, connectedsystems.Observations):
+    pass
+
+
+class ControlStreams(ConnectedSystems, connectedsystems.ControlStreams):
+    pass
+
+
+class Commands(ConnectedSystems, connectedsystems.Commands):
+    pass
+
+
+class SystemEvents(ConnectedSystems, connectedsystems.SystemEvents):
+    pass
+
+
+class SystemHistory(ConnectedSystems, connectedsystems.SystemHistory):
+    pass
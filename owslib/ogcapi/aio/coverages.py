@@ -0,0 +1,39 @@
+from io import BytesIO
+import logging
+from typing import BinaryIO
+
+from owslib.ogcapi import coverages
+from owslib.ogcapi.aio import Collections
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Coverages(Collections, coverages.Coverages):
+    """Abstraction for OGC API - Coverages (asyncio)"""
+
+    async def coverages(self) -> list:
+        """
+        implements /collections filtered on coverages
+
+        @returns: `list` of filtered collections object
+        """
+
+        collections_ = await self.collections()
+
+        return [c_['id'] for c_ in collections_['collections']
+                if any('coverage' in l_['rel'] for l_ in c_['links'])]
+
+    async def coverage(self, collection_id: str, **kwargs: dict) -> BinaryIO:
+        """
+        implements /collection/{collectionId}/coverage/
+
+        Keyword arguments are those of
+        `owslib.ogcapi.coverages.Coverages.coverage`
+
+        @returns: coverage data
+        """
+
+        path = f'collections/{collection_id}/coverage'
+
+        return BytesIO(await self._request(path=path, as_dict=False,
+                                           kwargs=self._coverage_kwargs(**kwargs)))
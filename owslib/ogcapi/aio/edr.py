@@ -0,0 +1,22 @@
+import logging
+
+from owslib.ogcapi import edr
+from owslib.ogcapi.aio.features import Features
+
+LOGGER = logging.getLogger(__name__)
+
+
+class EnvironmentalDataRetrieval(Features, edr.EnvironmentalDataRetrieval):
+    """Abstraction for OGC API - Environmental Data Retrieval (asyncio)"""
+
+    async def data(self) -> list:
+        """
+        implements /collections filtered on EDR data resources
+
+        @returns: `list` of filtered collections object
+        """
+
+        collections_ = await self.collections()
+
+        return [c_['id'] for c_ in collections_['collections']
+                if any('data' in l_['rel'] for l_ in c_['links'])]
@@ -0,0 +1,196 @@
+import asyncio
+import logging
+from typing import AsyncIterator
+
+from owslib.ogcapi import features
+from owslib.ogcapi.aio import Collections
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Features(Collections, features.Features):
+    """Abstraction for OGC API - Features (asyncio)"""
+
+    async def feature_collections(self) -> list:
+        """
+        implements /collections filtered on features
+
+        @returns: `list` of filtered collections object
+        """
+
+        collections_ = await self.collections()
+
+        return [c_['id'] for c_ in collections_['collections']
+                if c_.get('itemType', '').lower() == 'feature']
+
+    async def iter_collection_items(self, collection_id: str, page_size: int = 100,
+                                    prefetch: bool = False,
+                                    **kwargs: dict) -> AsyncIterator[dict]:
+        """
+        implements /collection/{collectionId}/items as a lazy asynchronous
+        iterator over all matching features
+
+        @type collection_id: string
+        @param collection_id: id of collection
+        @type page_size: int
+        @param page_size: number of features requested per page
+        @type prefetch: bool
+        @param prefetch: whether to fetch the next page in a concurrent task
+                         while the current page is consumed
+        @param kwargs: query parameters, as for `collection_items`
+                       (``offset`` sets the start position of results)
+
+        @returns: asynchronous generator of features
+        """
+
+        offset = int(kwargs.pop('offset', 0) or 0)
+        kwargs.pop('limit', None)
+        follow_links = 'cql' not in kwargs  # next links cannot carry a POST payload
+
+        async def fetch(href, offset_):
+            # the page URL is returned, self.request is shared with the caller
+            if href is not None:
+                LOGGER.debug(f'Following next link: {href}')
+                response = await self._http('GET', href)
+                return self._parse_response(response), href
+            params = dict(kwargs, limit=page_size)
+            if offset_:
+                params['offset'] = offset_
+            url, page = self._collection_items(collection_id, params)
+            return await page, url
+
+        task = None
+        fetched = set()  # URLs of the pages, not to follow next links back to them
+        try:
+            page, url = await fetch(None, offset)
+            while True:
+                fetched.add(url)
+                features_ = page.get('features', [])
+                offset += len(features_)
+                next_page = self._next_page(page, url, offset, page_size, follow_links, fetched)
+                page = None
+
+                if next_page is not None and prefetch:
+                    task = asyncio.ensure_future(fetch(*next_page))
+
+                for feature in features_:
+                    yield feature
+
+                if next_page is None:
+                    break
+                page, url = await task if task is not None else await fetch(*next_page)
+                task = None
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def collection_create(self, data: str) -> bool:
+        """
+        implements POST /collections
+
+        @type data: string
+        @param data: collection data
+
+        @returns: single collection result
+        """
+
+        self.headers['Content-Type'] = 'application/json'
+
+        _ = await self._request(method='POST', path='collections', data=data)
+
+        return True
+
+    async def collection_update(self, collection_id: str, data: str) -> bool:
+        """
+        implements PUT /collections/{collectionId}
+
+        @type collection_id: string
+        @param collection_id: id of collection
+        @type data: string
+        @param data: collection data
+
+        @returns: ``bool`` of update result
+        """
+
+        path = f'collections/{collection_id}'
+        _ = await self._request(method='PUT', path=path, data=data)
+
+        return True
+
+    async def collection_delete(self, collection_id: str) -> bool:
+        """
+        implements DELETE /collections/{collectionId}
+
+        @type collection_id: string
+        @param collection_id: id of collection
+
+        @returns: ``bool`` of deletion result
+        """
+
+        path = f'collections/{collection_id}'
+        _ = await self._request(method='DELETE', path=path)
+
+        return True
+
+    async def collection_item_create(self, collection_id: str, data: str) -> bool:
+        """
+        implements POST /collections/{collectionId}/items
+
+        @type collection_id: string
+        @param collection_id: id of collection
+        @type data: string
+        @param data: raw representation of data
+
+        @returns: single feature result
+        """
+
+        path = f'collections/{collection_id}/items'
+
+        if isinstance(data, dict):  # JSON
+            LOGGER.debug('Detected JSON payload')
+            self.headers['Content-Type'] = 'application/geo+json'
+        elif data.startswith('<'):  # XML
+            data = data.strip()
+            LOGGER.debug('Detected XML payload')
+            self.headers['Content-Type'] = 'application/xml'
+
+        _ = await self._request(method='POST', path=path, data=data)
+
+        return True
+
+    async def collection_item_update(self, collection_id: str, identifier: str,
+                                     data: str) -> bool:
+        """
+        implements PUT /collections/{collectionId}/items/{featureId}
+
+        @type collection_id: string
+        @param collection_id: id of collection
+        @type identifier: string
+        @param identifier: feature identifier
+        @type data: string
+        @param data: raw representation of data
+
+        @returns: ``bool`` of update result
+        """
+
+        path = f'collections/{collection_id}/items/{identifier}'
+        _ = await self._request(method='PUT', path=path, data=data)
+
+        return True
+
+    async def collection_item_delete(self, collection_id: str, identifier: str) -> bool:
+        """
+        implements DELETE /collections/{collectionId}/items/{featureId}
+
+        @type collection_id: string
+        @param collection_id: id of collection
+        @type identifier: string
+        @param identifier: feature identifier
+
+        @returns: ``bool`` of deletion result
+        """
+
+        path = f'collections/{collection_id}/items/{identifier}'
+        _ = await self._request(method='DELETE', path=path)
+
+        return True
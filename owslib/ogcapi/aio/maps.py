@@ -0,0 +1,41 @@
+from io import BytesIO
+import logging
+from typing import BinaryIO
+
+from owslib.ogcapi import maps
+from owslib.ogcapi.aio import Collections
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Maps(Collections, maps.Maps):
+    """Abstraction for OGC API - Maps (asyncio)"""
+
+    async def maps(self) -> list:
+        """
+        implements /collections filtered on maps
+
+        @returns: `list` of filtered collections object
+        """
+
+        collections_ = await self.collections()
+
+        return [c_['id'] for c_ in collections_['collections']
+                if any('map' in l_['rel'] for l_ in c_['links'])]
+
+    async def map(self, collection_id: str, **kwargs: dict) -> BinaryIO:
+        """
+        implements /collection/{collectionId}/map
+
+        Keyword arguments are those of `owslib.ogcapi.maps.Maps.map`
+
+        @returns: map image
+        """
+
+        if 'style' in kwargs:
+            path = f'collections/{collection_id}/styles/{kwargs["style"]}/map'
+        else:
+            path = f'collections/{collection_id}/map'
+
+        return BytesIO(await self._request(path=path, as_dict=False,
+                                           kwargs=self._map_kwargs(**kwargs)))
@@ -0,0 +1,20 @@
+import logging
+
+from owslib.ogcapi import processes
+from owslib.ogcapi.aio import Collections
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Processes(Collections, processes.Processes):
+    """Abstraction for OGC API - Processes (asyncio)"""
+
+    async def processes(self) -> list:
+        """
+        implements /processes
+
+        @returns: `list` of available processes
+        """
+
+        response = await self._request(path='processes')
+        return response['processes']
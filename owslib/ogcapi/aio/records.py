@@ -0,0 +1,22 @@
+import logging
+
+from owslib.ogcapi import records
+from owslib.ogcapi.aio.features import Features
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Records(Features, records.Records):
+    """Abstraction for OGC API - Records (asyncio)"""
+
+    async def records(self) -> list:
+        """
+        implements /collections filtered on records
+
+        @returns: `list` of filtered collections object
+        """
+
+        collections_ = await self.collections()
+
+        return [c_['id'] for c_ in collections_['collections']
+                if c_.get('itemType', '').lower() == 'record']
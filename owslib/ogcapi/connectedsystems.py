@@ -8,16 +8,16 @@
 import logging
 
 from owslib.ogcapi import API, Collections
-from owslib.util import (Authentication)
+from owslib.util import Authentication, HTTPSession
 
 LOGGER = logging.getLogger(__name__)
 
 
 class ConnectedSystems(Collections):
     def __init__(self, url: str, json_: str = None, timeout: int = 30, headers: dict = None,
-                 auth: Authentication = None):
+                 auth: Authentication = None, session: HTTPSession = None):
         __doc__ = API.__doc__  # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def _request(self, method: str = 'GET', path: str = None,
                  data: str = None, as_dict: bool = True, kwargs: dict = {}) -> dict:
@@ -29,9 +29,10 @@ class Systems(ConnectedSystems):
     """Abstraction for OGC API - Connected Systems - Systems"""
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30,
-                 headers: dict = None, auth: Authentication = None):
+                 headers: dict = None, auth: Authentication = None,
+                 session: HTTPSession = None):
         __doc__ = Collections.__doc__  # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def system_collections(self) -> list:
         """
@@ -238,9 +239,9 @@ class Systems(ConnectedSystems):
 
 class Procedures(ConnectedSystems):
     def __init__(self, url: str, json_: str = None, timeout: int = 30, headers: dict = None,
-                 auth: Authentication = None):
+                 auth: Authentication = None, session: HTTPSession = None):
         __doc__ = API.__doc__  # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def procedures(self, **kwargs) -> dict:
         """
@@ -305,9 +306,9 @@ class Procedures(ConnectedSystems):
 class Deployments(ConnectedSystems):
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30, headers: dict = None,
-                 auth: Authentication = None):
+                 auth: Authentication = None, session: HTTPSession = None):
         __doc__ = API.__doc__   # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def deployments(self, **kwargs) -> dict:
         """ implements /deployments
@@ -451,10 +452,11 @@ class SamplingFeatures(ConnectedSystems):
     alternate_sampling_feature_url = None
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30, headers: dict = None,
-                 auth: Authentication = None, alternate_sampling_feature_url: str = None):
+                 auth: Authentication = None, alternate_sampling_feature_url: str = None,
+                 session: HTTPSession = None):
         self.alternate_sampling_feature_url = alternate_sampling_feature_url
         __doc__ = API.__doc__   # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def sampling_features(self, use_fois=False, **kwargs) -> dict:
         """
@@ -555,9 +557,9 @@ class SamplingFeatures(ConnectedSystems):
 class Properties(ConnectedSystems):
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30, headers: dict = None,
-                 auth: Authentication = None):
+                 auth: Authentication = None, session: HTTPSession = None):
         __doc__ = API.__doc__   # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def properties(self, **kwargs) -> dict:
         """
@@ -623,9 +625,9 @@ class Properties(ConnectedSystems):
 class Datastreams(ConnectedSystems):
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30, headers: dict = None,
-                 auth: Authentication = None):
+                 auth: Authentication = None, session: HTTPSession = None):
         __doc__ = Collections.__doc__   # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def datastreams(self, **kwargs) -> dict:
         """
@@ -737,9 +739,9 @@ class Datastreams(ConnectedSystems):
 class Observations(ConnectedSystems):
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30, headers: dict = None,
-                 auth: Authentication = None):
+                 auth: Authentication = None, session: HTTPSession = None):
         __doc__ = Collections.__doc__   # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def observations(self, **kwargs) -> dict:
         """
@@ -816,9 +818,9 @@ class Observations(ConnectedSystems):
 class ControlStreams(ConnectedSystems):
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30, headers: dict = None,
-                 auth: Authentication = None):
+                 auth: Authentication = None, session: HTTPSession = None):
         __doc__ = Collections.__doc__   # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def controlstreams(self, **kwargs) -> dict:
         """
@@ -922,9 +924,9 @@ class ControlStreams(ConnectedSystems):
 class Commands(ConnectedSystems):
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30, headers: dict = None,
-                 auth: Authentication = None):
+                 auth: Authentication = None, session: HTTPSession = None):
         __doc__ = Collections.__doc__   # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def commands(self, **kwargs) -> dict:
         """
@@ -1045,9 +1047,9 @@ class Commands(ConnectedSystems):
 class SystemEvents(ConnectedSystems):
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30, headers: dict = None,
-                 auth: Authentication = None):
+                 auth: Authentication = None, session: HTTPSession = None):
         __doc__ = Collections.__doc__   # noqa
-        super().__init__(url, json_, timeout, headers, auth=auth)
+        super().__init__(url, json_, timeout, headers, auth=auth, session=session)
 
     def system_events(self, **kwargs) -> dict:
         """
@@ -1131,9 +1133,9 @@ class SystemEvents(ConnectedSystems):
 class SystemHistory(ConnectedSystems):
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30, headers: dict = None,
-                 auth: Authentication = None):
+                 auth: Authentication = None, session: HTTPSession = None):
         __doc__ = Collections.__doc__   # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def system_history(self, system_id: str, **kwargs) -> dict:
         """
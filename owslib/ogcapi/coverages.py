@@ -11,7 +11,7 @@ import logging
 from typing import BinaryIO
 
 from owslib.ogcapi import Collections
-from owslib.util import Authentication
+from owslib.util import Authentication, HTTPSession
 
 LOGGER = logging.getLogger(__name__)
 
@@ -20,9 +20,10 @@ class Coverages(Collections):
     """Abstraction for OGC API - Coverages"""
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30,
-                 headers: dict = None, auth: Authentication = None):
+                 headers: dict = None, auth: Authentication = None,
+                 session: HTTPSession = None):
         __doc__ = Collections.__doc__  # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def coverages(self) -> list:
         """
@@ -70,6 +71,18 @@ class Coverages(Collections):
         @returns: coverage data
         """
 
+        path = f'collections/{collection_id}/coverage'
+
+        return BytesIO(self._request(path=path, as_dict=False, kwargs=self._coverage_kwargs(**kwargs)))
+
+    def _coverage_kwargs(self, **kwargs: dict) -> dict:
+        """
+        helper function to translate coverage keyword arguments into
+        request parameters
+
+        @returns: `dict` of request parameters
+        """
+
         kwargs_ = {}
 
         if isinstance(kwargs.get('properties'), (tuple, list)):
@@ -127,6 +140,4 @@ class Coverages(Collections):
             else:
                 kwargs_['datetime'] = str(kwargs['datetime'])
 
-        path = f'collections/{collection_id}/coverage'
-
-        return BytesIO(self._request(path=path, as_dict=False, kwargs=kwargs_))
+        return kwargs_
@@ -11,7 +11,7 @@ import logging
 from typing import BinaryIO
 
 from owslib.ogcapi.features import Features
-from owslib.util import Authentication
+from owslib.util import Authentication, HTTPSession
 
 LOGGER = logging.getLogger(__name__)
 
@@ -20,9 +20,10 @@ class EnvironmentalDataRetrieval(Features):
     """Abstraction for OGC API - Environmental Data Retrieval"""
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30,
-                 headers: dict = None, auth: Authentication = None):
+                 headers: dict = None, auth: Authentication = None,
+                 session: HTTPSession = None):
         __doc__ = Features.__doc__  # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def data(self) -> list:
         """
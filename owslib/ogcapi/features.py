@@ -6,12 +6,14 @@
 # Contact email: tomkralidis@gmail.com
 # =============================================================================
 
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 import logging
-from urllib.parse import urlencode
+from typing import Iterator
+from urllib.parse import urlencode, urljoin
 
 from owslib.ogcapi import Collections
-from owslib.util import Authentication
+from owslib.util import Authentication, HTTPSession, http_get
 
 LOGGER = logging.getLogger(__name__)
 
@@ -20,9 +22,10 @@ class Features(Collections):
     """Abstraction for OGC API - Features"""
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30,
-                 headers: dict = None, auth: Authentication = None):
+                 headers: dict = None, auth: Authentication = None,
+                 session: HTTPSession = None):
         __doc__ = Collections.__doc__  # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def feature_collections(self) -> list:
         """
@@ -130,6 +133,16 @@ class Features(Collections):
         @returns: feature results
         """
 
+        return self._collection_items(collection_id, kwargs)[1]
+
+    def _collection_items(self, collection_id: str, kwargs: dict) -> tuple:
+        """
+        helper function of `collection_items`, also returning the URL of
+        the request (for resolving the links of the results against it)
+
+        @returns: ``(url, feature results)``
+        """
+
         if 'bbox' in kwargs:
             kwargs['bbox'] = ','.join(list(map(str, kwargs['bbox'])))
         if 'datetime_' in kwargs:
@@ -150,10 +163,124 @@ class Features(Collections):
             kwargs2 = deepcopy(kwargs)
             cql = kwargs2.pop('cql')
             path = f'collections/{collection_id}/items?{urlencode(kwargs2)}'
-            return self._request(method='POST', path=path, data=cql, kwargs=kwargs2)
+            return self._build_url(path), self._request(method='POST', path=path, data=cql, kwargs=kwargs2)
         else:
             path = f'collections/{collection_id}/items'
-            return self._request(path=path, kwargs=kwargs)
+            return self._build_url(path), self._request(path=path, kwargs=kwargs)
+
+    def iter_collection_items(self, collection_id: str, page_size: int = 100,
+                              prefetch: bool = False, **kwargs: dict) -> Iterator[dict]:
+        """
+        implements /collection/{collectionId}/items as a lazy iterator over
+        all matching features
+
+        Pages are requested on demand by following ``rel=next`` links, or
+        by offset paging for servers which do not provide them, so that
+        at most one page (two when prefetching) is held in memory.
+
+        @type collection_id: string
+        @param collection_id: id of collection
+        @type page_size: int
+        @param page_size: number of features requested per page
+        @type prefetch: bool
+        @param prefetch: whether to fetch the next page in a background
+                         thread while the current page is consumed
+        @param kwargs: query parameters, as for `collection_items`
+                       (``offset`` sets the start position of results)
+
+        @returns: generator of features
+        """
+
+        offset = int(kwargs.pop('offset', 0) or 0)
+        kwargs.pop('limit', None)
+        follow_links = 'cql' not in kwargs  # next links cannot carry a POST payload
+
+        def fetch(href, offset_):
+            # the page URL is returned, self.request is shared with the caller
+            if href is not None:
+                LOGGER.debug(f'Following next link: {href}')
+                response = http_get(href, headers=self.headers, auth=self.auth,
+                                    session=self.session)
+                return self._parse_response(response), href
+            params = dict(kwargs, limit=page_size)
+            if offset_:
+                params['offset'] = offset_
+            url, page = self._collection_items(collection_id, params)
+            return page, url
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        fetched = set()  # URLs of the pages, not to follow next links back to them
+        try:
+            page, url = fetch(None, offset)
+            while True:
+                fetched.add(url)
+                features = page.get('features', [])
+                offset += len(features)
+                next_page = self._next_page(page, url, offset, page_size, follow_links, fetched)
+                page = None
+
+                future = None
+                if next_page is not None and executor is not None:
+                    future = executor.submit(fetch, *next_page)
+
+                yield from features
+
+                if next_page is None:
+                    break
+                page, url = future.result() if future is not None else fetch(*next_page)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def _next_page(self, page: dict, url: str, offset: int, page_size: int,
+                   follow_links: bool = True, fetched: set = None) -> tuple:
+        """
+        helper function to determine how to request the page following
+        a page of items
+
+        @type page: dict
+        @param page: items response
+        @type url: string
+        @param url: URL the page was requested from
+        @type offset: int
+        @param offset: start position of the following page
+        @type page_size: int
+        @param page_size: number of features requested per page
+        @type follow_links: bool
+        @param follow_links: whether to follow ``rel=next`` links
+        @type fetched: set
+        @param fetched: URLs of the pages already fetched, whose next links
+                        are not followed again
+
+        @returns: ``(href, None)`` of the next link, ``(None, offset)``
+                  for offset paging, or ``None`` for the last page
+        """
+
+        features = page.get('features', [])
+        if not features:
+            return None
+
+        links = page.get('links', [])
+        if follow_links:
+            next_links = [link for link in links if link.get('rel') == 'next']
+            if next_links:
+                # prefer a (Geo)JSON representation
+                next_links.sort(key=lambda link: 'json' not in link.get('type', 'json'))
+                href = urljoin(url, next_links[0]['href'])
+                if fetched is not None and href in fetched:
+                    LOGGER.debug(f'Next link to a fetched page: {href}')
+                    return None
+                return href, None
+
+        number_matched = page.get('numberMatched')
+        if number_matched is not None:
+            return (None, offset) if offset < int(number_matched) else None
+        if links and follow_links:  # no next link: last page
+            return None
+        if len(features) < page_size:
+            return None
+
+        return None, offset
 
     def collection_item(self, collection_id: str, identifier: str) -> dict:
         """
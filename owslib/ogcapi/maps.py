@@ -11,7 +11,7 @@ import logging
 from typing import BinaryIO
 
 from owslib.ogcapi import Collections
-from owslib.util import Authentication
+from owslib.util import Authentication, HTTPSession
 
 LOGGER = logging.getLogger(__name__)
 
@@ -20,9 +20,10 @@ class Maps(Collections):
     """Abstraction for OGC API - Maps"""
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30,
-                 headers: dict = None, auth: Authentication = None):
+                 headers: dict = None, auth: Authentication = None,
+                 session: HTTPSession = None):
         __doc__ = Collections.__doc__  # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def maps(self) -> list:
         """
@@ -67,6 +68,21 @@ class Maps(Collections):
         @returns: map image
         """
 
+        if 'style' in kwargs:
+            path = f'collections/{collection_id}/styles/{kwargs["style"]}/map'
+        else:
+            path = f'collections/{collection_id}/map'
+
+        return BytesIO(self._request(path=path, as_dict=False, kwargs=self._map_kwargs(**kwargs)))
+
+    def _map_kwargs(self, **kwargs: dict) -> dict:
+        """
+        helper function to translate map keyword arguments into
+        request parameters
+
+        @returns: `dict` of request parameters
+        """
+
         kwargs_ = {}
 
         if 'bbox' in kwargs:
@@ -81,9 +97,4 @@ class Maps(Collections):
 
         kwargs_['transparent'] = str(kwargs.get('transparent', True)).lower()
 
-        if 'style' in kwargs:
-            path = f'collections/{collection_id}/styles/{kwargs["style"]}/map'
-        else:
-            path = f'collections/{collection_id}/map'
-
-        return BytesIO(self._request(path=path, as_dict=False, kwargs=kwargs_))
+        return kwargs_
@@ -9,7 +9,7 @@
 import logging
 
 from owslib.ogcapi import Collections
-from owslib.util import Authentication
+from owslib.util import Authentication, HTTPSession
 
 LOGGER = logging.getLogger(__name__)
 
@@ -18,9 +18,10 @@ class Processes(Collections):
     """Abstraction for OGC API - Processes"""
 
     def __init__(self, url: str, json_: str = None, timeout: int = 30,
-                 headers: dict = None, auth: Authentication = None):
+                 headers: dict = None, auth: Authentication = None,
+                 session: HTTPSession = None):
         __doc__ = Collections.__doc__  # noqa
-        super().__init__(url, json_, timeout, headers, auth)
+        super().__init__(url, json_, timeout, headers, auth, session=session)
 
     def processes(self) -> list:
         """
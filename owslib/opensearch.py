@@ -34,7 +34,7 @@ namespaces = {
 class OpenSearch(object):
     """ OpenSearch request class """
     def __init__(self, url, lang='en-US', version='1.1', timeout=10, xml=None,
-                 username=None, password=None, auth=None, headers=None):
+                 username=None, password=None, auth=None, headers=None, session=None):
         """
 
         Initialize an OpenSearch client
@@ -51,6 +51,7 @@ class OpenSearch(object):
         - password: password for HTTP basic authentication
         - auth: instance of owslib.util.Authentication
         - headers: HTTP headers to send with requests
+        - session: instance of owslib.util.HTTPSession (default is the shared session)
         """
 
         if auth:
@@ -65,6 +66,7 @@ class OpenSearch(object):
         self.timeout = timeout
         self.auth = auth or Authentication(username, password)
         self.headers = headers
+        self.session = session
 
         if xml is not None:
             LOGGER.debug('Loading from XML stream')
@@ -72,7 +74,7 @@ class OpenSearch(object):
         else:
             LOGGER.debug('Loading from URL')
             self.request = self.url
-            response = http_get(self.request, timeout=self.timeout)
+            response = http_get(self.request, timeout=self.timeout, session=self.session)
             self._exml = etree.fromstring(response.content)
 
         self.description = Description(self._exml)
@@ -127,7 +129,7 @@ class OpenSearch(object):
                     key.replace('_', ':'),
                     value)
 
-        response = http_get(prune_url(template), timeout=self.timeout)
+        response = http_get(prune_url(template), timeout=self.timeout, session=self.session)
 
         if 'json' in type_:
             LOGGER.debug('Returning dict of JSON response')
@@ -0,0 +1,153 @@
+"""
+Batched resolution of the remote metadata of layers
+
+The metadata documents referenced by the MetadataURLs of the layers of a
+service (WMS layers, WFS feature types) are resolved in a single stage:
+identical URLs are requested once, documents are requested concurrently,
+and large documents are parsed in a pool of processes.  The parsed metadata
+is set as ``metadataUrl['metadata']``, as by the ``parse_remote_metadata``
+method of the layers.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import logging
+import multiprocessing
+
+from owslib.etree import etree
+from owslib.fgdc import Metadata
+from owslib.iso import MD_Metadata
+from owslib.iso3 import MD_Metadata as MD_Metadata3
+from owslib.namespaces import Namespaces
+from owslib.util import nspath_eval
+
+LOGGER = logging.getLogger(__name__)
+
+_NAMESPACES = Namespaces().get_namespaces(['gmd', 'gmi'])
+_GMD_MD_METADATA = './/' + nspath_eval('gmd:MD_Metadata', _NAMESPACES)
+_GMI_MI_METADATA = './/' + nspath_eval('gmi:MI_Metadata', _NAMESPACES)
+
+# metadata document parsers, in order of preference
+FGDC = 'fgdc'
+ISO = 'iso'
+ISO3 = 'iso3'
+ALL_PARSERS = (FGDC, ISO, ISO3)
+
+# size (in bytes) from which documents are parsed in a process pool
+PROCESS_THRESHOLD = 1024 * 1024
+
+
+def _find_metadata(doc, parsers):
+    """ Return the metadata class and element of the first of the parsers matching a document """
+    for parser in parsers:
+        if parser == FGDC:
+            mdelem = doc if doc.tag == 'metadata' else doc.find('.//metadata')
+            if mdelem is not None:
+                return Metadata, mdelem
+        elif parser == ISO:
+            mdelem = doc.find(_GMD_MD_METADATA)
+            if mdelem is None:
+                mdelem = doc.find(_GMI_MI_METADATA)
+            if mdelem is not None:
+                return MD_Metadata, mdelem
+        elif parser == ISO3:
+            mdelem = MD_Metadata3.find_start(doc)
+            if mdelem is not None:
+                return MD_Metadata3, mdelem
+    return None, None
+
+
+def parse_metadata(content, parsers=ALL_PARSERS):
+    """
+    Parse a metadata document
+
+    :param content: metadata document, as bytes
+    :param parsers: document types tried in order (`FGDC`, `ISO`, `ISO3`)
+    :returns: `owslib.fgdc.Metadata`, `owslib.iso.MD_Metadata` or
+              `owslib.iso3.MD_Metadata`, or None if the document is not of
+              any of the types
+    """
+    cls, mdelem = _find_metadata(etree.fromstring(content), parsers)
+    return None if cls is None else cls(mdelem)
+
+
+def _parse_detached(content, parsers):
+    """ Parse a metadata document, without its element """
+    metadata = parse_metadata(content, parsers)
+    if metadata is not None and hasattr(metadata, 'md'):
+        metadata.md = None  # elements cannot be pickled
+    return metadata
+
+
+def _attach(metadata, content, parsers):
+    """ Attach its element to metadata parsed by `_parse_detached` """
+    if metadata is not None and hasattr(metadata, 'md'):
+        metadata.md = _find_metadata(etree.fromstring(content), parsers)[1]
+    return metadata
+
+
+def parse_remote_metadata(layers, timeout=30, max_workers=8, max_processes=None,
+                          process_threshold=PROCESS_THRESHOLD):
+    """
+    Resolve the remote metadata of layers
+
+    Each layer provides the parsers of its MetadataURLs
+    (``_remote_metadata_parsers(metadataUrl)``, None for MetadataURLs which
+    are not resolved) and reads their documents
+    (``_read_remote_metadata(url, timeout)``).  Layers sharing a metadata
+    document share its parsed metadata.
+
+    :param layers: iterable of layers (content metadata objects)
+    :param timeout: timeout (in seconds) of the requests
+    :param max_workers: maximum number of concurrent requests
+    :param max_processes: maximum number of processes parsing large
+                          documents (default is the number of CPUs), 0 to
+                          parse all documents in this process
+    :param process_threshold: size (in bytes) from which documents are
+                              parsed in the process pool
+    """
+    requests = {}  # (url, parsers): [metadataUrl, ...]
+    readers = {}  # url: layer reading the document
+    for layer in layers:
+        for metadataUrl in layer.metadataUrls:
+            parsers = layer._remote_metadata_parsers(metadataUrl)
+            if parsers is None:
+                continue
+            requests.setdefault((metadataUrl['url'], parsers), []).append(metadataUrl)
+            readers.setdefault(metadataUrl['url'], layer)
+    if not requests:
+        return
+
+    def read(url):
+        try:
+            return readers[url]._read_remote_metadata(url, timeout)
+        except Exception as err:
+            LOGGER.debug('Reading remote metadata %s failed: %s' % (url, err))
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(readers))) as executor:
+        documents = dict(zip(readers, executor.map(read, readers)))
+
+    large = [key for key in requests
+             if documents[key[0]] is not None and len(documents[key[0]]) >= process_threshold]
+    results = {}
+    if large and max_processes != 0:
+        # spawned, as forking would copy the threads of this process
+        with ProcessPoolExecutor(max_workers=max_processes,
+                                 mp_context=multiprocessing.get_context('spawn')) as executor:
+            futures = {key: executor.submit(_parse_detached, documents[key[0]], key[1]) for key in large}
+        for key, future in futures.items():
+            try:
+                results[key] = _attach(future.result(), documents[key[0]], key[1])
+            except Exception as err:
+                LOGGER.debug('Parsing remote metadata %s failed: %s' % (key[0], err))
+                results[key] = None
+
+    for key, metadataUrls in requests.items():
+        if key not in results:
+            try:
+                results[key] = None if documents[key[0]] is None else parse_metadata(documents[key[0]], key[1])
+            except Exception as err:
+                LOGGER.debug('Parsing remote metadata %s failed: %s' % (key[0], err))
+                results[key] = None
+        for metadataUrl in metadataUrls:
+            metadataUrl['metadata'] = results[key]
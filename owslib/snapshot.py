@@ -0,0 +1,262 @@
+"""
+Compact snapshots of parsed service metadata
+
+A snapshot holds the metadata objects built from a capabilities document
+(layers, styles, CRS options, bounding boxes, tile matrix sets,
+operations...) so that a service can be restored without fetching or
+traversing the document again::
+
+    wms = WebMapService('http://example.org/wms', version='1.3.0')
+    with open('wms.snapshot', 'wb') as f:
+        f.write(wms.to_snapshot())
+    ...
+    with open('wms.snapshot', 'rb') as f:
+        wms = WebMapService_1_3_0.from_snapshot(f.read())
+
+Snapshots are zlib compressed JSON documents describing the object graph,
+not pickles: only OWSLib classes are instantiated when loading them, and
+none of their code is run.  The capabilities document itself is not
+included, nor are the runtime attributes of the objects (authentication,
+HTTP session, headers, cookies and tile cache), which are given to
+``from_snapshot``.
+
+Every snapshot is stamped with the snapshot format and OWSLib versions, and
+a `SnapshotError` is raised when loading a snapshot stamped with other
+versions, as the parsed objects may have changed in between.
+"""
+
+import base64
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import date, datetime
+import importlib
+import json
+import zlib
+
+import owslib
+from owslib.etree import etree
+
+SNAPSHOT_VERSION = 7
+
+MAGIC = b'owslib-snapshot'
+
+# attributes which are given when the snapshot is loaded, instead of stored
+RUNTIME_ATTRIBUTES = ('auth', 'session', 'headers', 'cookies', 'tile_cache')
+# attributes which are not stored and are restored as None
+SKIPPED_ATTRIBUTES = ('_capabilities',)
+
+
+class SnapshotError(ValueError):
+    """Invalid or stale snapshot"""
+    pass
+
+
+def dumps(obj):
+    """
+    Return the snapshot of a service (or any other metadata object)
+
+    :param obj: object to take a snapshot of
+    :returns: snapshot, as bytes
+    """
+    encoder = _Encoder()
+    root = encoder.encode(obj)
+    document = json.dumps({
+        'classes': encoder.classes,
+        'objects': encoder.objects,
+        'sets': encoder.sets,
+        'root': root,
+    }, separators=(',', ':'), ensure_ascii=False)
+    return _header() + zlib.compress(document.encode('utf-8'))
+
+
+def loads(data, cls=None, **runtime):
+    """
+    Restore an object from its snapshot
+
+    :param data: snapshot, as returned by `dumps`
+    :param cls: expected class of the object (checked if given)
+    :param runtime: values of the runtime attributes (``auth``, ``session``,
+                    ``headers``, ``cookies``, ``tile_cache``) of the restored
+                    objects
+    :returns: restored object
+    """
+    header, _, body = data.partition(b'\n')
+    if not header.startswith(MAGIC + b' '):
+        raise SnapshotError('Not an OWSLib snapshot')
+    if header + b'\n' != _header():
+        raise SnapshotError('Stale snapshot (%s), expected %s' % (
+            header.decode('utf-8', 'replace'), _header().strip().decode('utf-8')))
+
+    try:
+        document = json.loads(zlib.decompress(body))
+    except (zlib.error, ValueError) as err:
+        raise SnapshotError('Corrupted snapshot: %s' % err)
+
+    decoder = _Decoder(document, runtime)
+    obj = decoder.decode(document['root'])
+    if cls is not None and not isinstance(obj, cls):
+        raise SnapshotError('Snapshot of %s, not %s' % (type(obj).__name__, cls.__name__))
+    return obj
+
+
+def _header():
+    return b'%s %d %s\n' % (MAGIC, SNAPSHOT_VERSION, str(owslib.__version__).encode('utf-8'))
+
+
+def _class_name(cls):
+    return '%s:%s' % (cls.__module__, cls.__qualname__)
+
+
+class _Encoder(object):
+    """
+    Encodes an object graph in JSON types
+
+    Scalars are kept as is, and other values are encoded as lists tagged
+    with their type.  Objects are stored once in a table and referenced by
+    their index, so that shared objects (e.g. the parents of layers) are
+    preserved.  Sets are stored once in their own table too, as the CRS
+    options of layers are shared by all the layers inheriting them.
+    """
+
+    def __init__(self):
+        self.classes = []
+        self.objects = []
+        self.sets = []
+        self._class_indexes = {}
+        self._object_indexes = {}
+        self._set_indexes = {}
+        self._encoded_sets = []  # kept alive, so that their ids are not reused
+
+    def encode(self, value):
+        if value is None or isinstance(value, (str, bool, int, float)):
+            return value
+        if isinstance(value, list):
+            return ['l'] + [self.encode(v) for v in value]
+        if isinstance(value, tuple):
+            return ['t'] + [self.encode(v) for v in value]
+        if isinstance(value, Mapping):
+            # other mappings (e.g. lazily built contents) are restored as ordered dicts
+            encoded = ['d' if isinstance(value, dict) and not isinstance(value, OrderedDict) else 'o']
+            for k, v in value.items():
+                encoded.append(self.encode(k))
+                encoded.append(self.encode(v))
+            return encoded
+        if isinstance(value, (set, frozenset)):
+            return ['f' if isinstance(value, frozenset) else 's', self._encode_set(value)]
+        if isinstance(value, bytes):
+            return ['b', base64.b64encode(value).decode('ascii')]
+        if isinstance(value, datetime):
+            return ['D', value.isoformat()]
+        if isinstance(value, date):
+            return ['a', value.isoformat()]
+        if etree.iselement(value):
+            return ['x', etree.tostring(value, encoding='unicode', with_tail=False)]
+        if type(value).__module__.split('.')[0] == 'owslib' and hasattr(value, '__dict__'):
+            return ['r', self._encode_object(value)]
+        raise TypeError('Cannot take a snapshot of %r' % (value,))
+
+    def _encode_set(self, value):
+        index = self._set_indexes.get(id(value))
+        if index is None:
+            index = len(self.sets)
+            self._set_indexes[id(value)] = index
+            self._encoded_sets.append(value)
+            self.sets.append(None)
+            self.sets[index] = [self.encode(v) for v in value]
+        return index
+
+    def _encode_object(self, obj):
+        index = self._object_indexes.get(id(obj))
+        if index is not None:
+            return index
+
+        cls = type(obj)
+        if cls not in self._class_indexes:
+            self._class_indexes[cls] = len(self.classes)
+            self.classes.append(_class_name(cls))
+
+        index = len(self.objects)
+        self._object_indexes[id(obj)] = index
+        entry = [self._class_indexes[cls], None]
+        self.objects.append(entry)
+
+        if '__getstate__' in vars(cls):
+            state = obj.__getstate__()
+        else:
+            state = vars(obj)
+        attributes = {}
+        for name, value in state.items():
+            if name in RUNTIME_ATTRIBUTES:
+                attributes[name] = ['R']
+            elif name in SKIPPED_ATTRIBUTES:
+                attributes[name] = None
+            else:
+                attributes[name] = self.encode(value)
+        entry[1] = attributes
+        return index
+
+
+class _Decoder(object):
+    """Decodes the object graph encoded by `_Encoder`"""
+
+    def __init__(self, document, runtime):
+        self.runtime = runtime
+        self._sets = document['sets']
+        self._decoded_sets = {}
+        self.classes = [_resolve_class(name) for name in document['classes']]
+        # objects are created first, so that references can be resolved in
+        # any order
+        self.objects = [self.classes[c].__new__(self.classes[c]) for c, _ in document['objects']]
+        for obj, (_, attributes) in zip(self.objects, document['objects']):
+            for name, value in attributes.items():
+                if value == ['R']:
+                    obj.__dict__[name] = self.runtime.get(name)
+                else:
+                    obj.__dict__[name] = self.decode(value)
+
+    def decode(self, value):
+        if not isinstance(value, list):
+            return value
+        tag = value[0]
+        if tag == 'l':
+            return [self.decode(v) for v in value[1:]]
+        if tag == 't':
+            return tuple(self.decode(v) for v in value[1:])
+        if tag in ('d', 'o'):
+            items = ((self.decode(value[i]), self.decode(value[i + 1])) for i in range(1, len(value), 2))
+            return OrderedDict(items) if tag == 'o' else dict(items)
+        if tag in ('f', 's'):
+            # shared sets (e.g. inherited CRS options) are decoded once
+            decoded = self._decoded_sets.get(value[1])
+            if decoded is None:
+                items = (self.decode(v) for v in self._sets[value[1]])
+                decoded = frozenset(items) if tag == 'f' else set(items)
+                self._decoded_sets[value[1]] = decoded
+            return decoded
+        if tag == 'r':
+            return self.objects[value[1]]
+        if tag == 'b':
+            return base64.b64decode(value[1])
+        if tag == 'D':
+            return datetime.fromisoformat(value[1])
+        if tag == 'a':
+            return date.fromisoformat(value[1])
+        if tag == 'x':
+            return etree.fromstring(value[1])
+        raise SnapshotError('Unknown value type in snapshot: %r' % (tag,))
+
+
+def _resolve_class(name):
+    """Return the OWSLib class of a snapshot, by its qualified name"""
+    module_name, _, qualname = name.partition(':')
+    if module_name.split('.')[0] != 'owslib':
+        raise SnapshotError('Snapshot of a non OWSLib class: %s' % name)
+    try:
+        obj = importlib.import_module(module_name)
+        for part in qualname.split('.'):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError):
+        raise SnapshotError('Unknown class in snapshot: %s' % name)
+    if not isinstance(obj, type):
+        raise SnapshotError('Not a class in snapshot: %s' % name)
+    return obj
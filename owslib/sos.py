@@ -19,7 +19,8 @@ def SensorObservationService(url,
                              version='1.0.0',
                              xml=None,
                              username=None,
-                             password=None,):
+                             password=None,
+                             session=None):
     """
     SOS factory function
     :param url: url of capabilities document
@@ -27,6 +28,7 @@ def SensorObservationService(url,
     :param xml: elementtree object
     :param username: username allowed to handle with SOS
     :param password: password for the username
+    :param session: instance of owslib.util.HTTPSession
     :return: a version specific SensorObservationService object
     """
 
@@ -35,8 +37,8 @@ def SensorObservationService(url,
     if version in ['1.0', '1.0.0']:
         return sos100.SensorObservationService_1_0_0.__new__(
             sos100.SensorObservationService_1_0_0, clean_url, version,
-            xml, username, password)
+            xml, username, password, session=session)
     elif version in ['2.0', '2.0.0']:
         return sos200.SensorObservationService_2_0_0.__new__(
             sos200.SensorObservationService_2_0_0, clean_url, version,
-            xml, username, password)
+            xml, username, password, session=session)
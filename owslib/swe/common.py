@@ -3,11 +3,14 @@ from owslib.namespaces import Namespaces
 from owslib.util import testXMLAttribute, testXMLValue, InfiniteDateTime, NegativeInfiniteDateTime
 
 from dateutil import parser
-from datetime import timedelta
+from datetime import timedelta, timezone
 
+from owslib.arrays import datetime64_array, float64_array, require_numpy
 from owslib.etree import etree
 
+import codecs
 import inspect
+import io
 from sys import modules
 
 
@@ -429,7 +432,31 @@ class Item(NamedObject):
         super(Item, self).__init__(element)
 
 
-class DataArray(AbstractDataComponent):
+class EncodedValues(object):
+    """ Decoding of the encoded values of DataArray, Matrix and DataStream """
+    def decode_values(self, columns=False):
+        """
+        Return the values decoded by a `TextValuesDecoder`
+
+        :param columns: whether to return a dict of column arrays, rather than a structured array
+        """
+        return TextValuesDecoder(self.elementType, self.encoding).decode(self.values or '', columns)
+
+    def iter_decode_values(self, stream=None, columns=False, chunk_size=1024 * 1024):
+        """
+        Decode the values in chunks, see `TextValuesDecoder.iter_decode`
+
+        :param stream: file-like object or iterable of text or bytes chunks the values are read from, for
+                       values which are not inline (default is the inline values)
+        :param columns: whether to yield dicts of column arrays, rather than structured arrays
+        :param chunk_size: size of the chunks read from file-like objects
+        """
+        if stream is None:
+            stream = io.StringIO(self.values or '')
+        return TextValuesDecoder(self.elementType, self.encoding).iter_decode(stream, columns, chunk_size)
+
+
+class DataArray(AbstractDataComponent, EncodedValues):
     def __init__(self, element):
         super(DataArray, self).__init__(element)
         self.elementCount = element.find(nspv("swe20:elementCount/swe20:Count"))      # required
@@ -441,7 +468,7 @@ class DataArray(AbstractDataComponent):
             self.encoding = None
 
 
-class Matrix(AbstractDataComponent):
+class Matrix(AbstractDataComponent, EncodedValues):
     def __init__(self, element):
         super(Matrix, self).__init__(element)
         self.elementCount = element.find(nspv("swe20:elementCount/swe20:Count"))      # required
@@ -452,7 +479,7 @@ class Matrix(AbstractDataComponent):
         self.localFrame = testXMLAttribute(element, "localFrame")                   # anyURI, optional
 
 
-class DataStream(AbstractSWEIdentifiable):
+class DataStream(AbstractSWEIdentifiable, EncodedValues):
     def __init__(self, element):
         super(DataStream, self).__init__(element)
         self.elementCount = element.find(nspv("swe20:elementCount/swe20:Count"))      # optional
@@ -487,6 +514,155 @@ class TextEncoding(AbstractEncoding):
         self.collapseWhiteSpaces = get_boolean(testXMLAttribute(element[-1], "collapseWhiteSpaces")) or True
 
 
+# nanoseconds per time unit, of the Time values given as numbers from a reference time
+_TIME_UNITS = {'s': 1e9, 'min': 60e9, 'h': 3600e9, 'd': 86400e9}
+_TRUE = ('true', '1', 'yes')
+
+
+class TextValuesDecoder(object):
+    """
+    Decodes text encoded values into numpy arrays
+
+    Every field of the element type (a DataRecord or Vector, whose nested records and vectors are flattened with
+    their names joined by ".", or a single simple component) is decoded as a column, in one pass over the
+    tokens: Quantity values as float64 (NaN where missing), Count values as int64 (float64 if some of them are
+    not integers), Time values as datetime64[ns] (in UTC for ISO 8601 times with an offset, or numbers of
+    s/min/h/d from the reference time), Boolean values as bool, and Category and Text values as strings.
+    """
+    def __init__(self, element_type, encoding):
+        """
+        :param element_type: `ElementType` of the values
+        :param encoding: `TextEncoding` of the values
+        """
+        require_numpy('The SWE Common values decoder')
+        if not isinstance(encoding, TextEncoding):
+            raise NotImplementedError('Only text encoded values are decoded')
+        self.fields = _decoded_fields(element_type.content)
+        if len(self.fields) == 1 and self.fields[0][0] is None:
+            self.fields = [(element_type.name or 'value', self.fields[0][1])]
+        self.tokenSeparator = encoding.tokenSeparator
+        self.blockSeparator = encoding.blockSeparator
+        self.decimalSeparator = encoding.decimalSeparator
+        self.collapseWhiteSpaces = encoding.collapseWhiteSpaces
+
+    def decode(self, text, columns=False):
+        """
+        Decode values
+
+        :param text: encoded values
+        :param columns: whether to return a dict of column arrays, rather than a structured array
+        :returns: structured array with a field per column, or dict of the column arrays by name
+        """
+        return self._decode_tokens(self._tokens(text), columns)
+
+    def _decode_tokens(self, tokens, columns):
+        count = len(self.fields)
+        if len(tokens) % count:
+            raise ValueError('%d tokens are not blocks of %d fields' % (len(tokens), count))
+        decoded = {name: self._decode_column(component, tokens[i::count])
+                   for i, (name, component) in enumerate(self.fields)}
+        if columns:
+            return decoded
+        np = require_numpy('The SWE Common values decoder')
+        array = np.empty(len(tokens) // count, dtype=[(name, column.dtype) for name, column in decoded.items()])
+        for name, column in decoded.items():
+            array[name] = column
+        return array
+
+    def iter_decode(self, stream, columns=False, chunk_size=1024 * 1024):
+        """
+        Decode values read in chunks, for values which do not fit in memory
+
+        :param stream: file-like object, or iterable of text or (UTF-8) bytes chunks
+        :param columns: whether to yield dicts of column arrays, rather than structured arrays
+        :param chunk_size: size of the chunks read from file-like objects
+        :returns: generator of the decoded values of the whole blocks of every chunk, as by `decode`
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        pending = ''
+        for chunk in _read_chunks(stream, chunk_size):
+            pending += decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+            end = pending.rfind(self.blockSeparator)
+            if end < 0:
+                continue
+            text, pending = pending[:end], pending[end + len(self.blockSeparator):]
+            if self.blockSeparator == self.tokenSeparator:
+                # the separator may end a token inside a block, whose tokens are then carried to the next chunk
+                tokens = self._tokens(text)
+                partial = len(tokens) % len(self.fields)
+                if partial:
+                    pending = self.tokenSeparator.join(tokens[-partial:] + [pending])
+                    del tokens[-partial:]
+                if tokens:
+                    yield self._decode_tokens(tokens, columns)
+            elif text.strip():
+                yield self.decode(text, columns)
+        pending += decoder.decode(b'', final=True)
+        if pending.strip():
+            yield self.decode(pending, columns)
+
+    def _tokens(self, text):
+        if self.collapseWhiteSpaces:
+            text = text.strip()
+        if text.endswith(self.blockSeparator):
+            text = text[:-len(self.blockSeparator)]
+        if self.blockSeparator != self.tokenSeparator:
+            text = text.replace(self.blockSeparator, self.tokenSeparator)
+        if self.collapseWhiteSpaces and self.tokenSeparator.isspace():
+            return text.split()
+        return text.split(self.tokenSeparator) if text else []
+
+    def _decode_column(self, component, tokens):
+        np = require_numpy('The SWE Common values decoder')
+        if isinstance(component, Quantity):
+            if self.decimalSeparator != '.':
+                tokens = [t.replace(self.decimalSeparator, '.') for t in tokens]
+            return float64_array(tokens)
+        if isinstance(component, Count):
+            try:
+                return np.array(tokens, dtype=np.int64)
+            except ValueError:
+                return float64_array(tokens)
+        if self.collapseWhiteSpaces:
+            tokens = [t.strip() for t in tokens]
+        if isinstance(component, Time):
+            unit = _TIME_UNITS.get((component.uom or '').lower())
+            if unit is None:
+                return datetime64_array(tokens)
+            reference = component.referenceTime
+            if reference is not None and reference.tzinfo is not None:
+                reference = reference.astimezone(timezone.utc).replace(tzinfo=None)
+            reference = np.datetime64(reference or '1970-01-01', 'ns')
+            return reference + (float64_array(tokens) * unit).astype('timedelta64[ns]')
+        if isinstance(component, Boolean):
+            return np.array([t.lower() in _TRUE for t in tokens], dtype=bool)
+        return np.array(tokens, dtype=str)
+
+
+def _decoded_fields(component, name=None):
+    """ Return the (name, simple component) of the columns of decoded values """
+    if isinstance(component, (DataRecord, Vector)):
+        fields = []
+        for child in component.field if isinstance(component, DataRecord) else component.coordinate:
+            fields.extend(_decoded_fields(child.content, child.name if name is None else name + '.' + child.name))
+        return fields
+    if isinstance(component, (Quantity, Count, Time, Boolean, Category, Text)) and \
+            not isinstance(component, (QuantityRange, CountRange, CategoryRange)):
+        return [(name, component)]
+    raise NotImplementedError('%s values are not decoded' % type(component).__name__)
+
+
+def _read_chunks(stream, chunk_size):
+    if not hasattr(stream, 'read'):
+        yield from stream
+        return
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
 class XMLEncoding(AbstractEncoding):
     def __init__(self, element):
         raise NotImplementedError
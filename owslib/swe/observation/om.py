@@ -58,7 +58,7 @@ class OM_Observation(object):
             "om20:phenomenonTime/gml32:TimeInstant"))
 
         if instant_element is not None:
-            self.phenomenonTime = extract_time(instant_element)
+            self.phenomenonTime = extract_time(instant_element.find(nspv("gml32:timePosition")))
         else:
             start = extract_time(element.find(nspv(
                 "om20:phenomenonTime/gml32:TimePeriod/gml32:beginPosition")))
@@ -0,0 +1,227 @@
+"""
+Chunked GetObservation requests
+
+Long-range GetObservation requests often time out, or exhaust the server.
+`ObservationPlanner` splits the requested time range into windows of at
+most `step`, and the offerings and observed properties into groups of at
+most `offerings_per_request` and `properties_per_request`, and runs the
+resulting sub-requests concurrently in a pool of threads::
+
+    planner = ObservationPlanner(sos, step=timedelta(days=30), max_workers=4)
+    observations = planner.get_observations(offerings, observed_properties,
+                                            datetime(2010, 1, 1), datetime(2020, 1, 1))
+
+The observations of SOS 2.0 responses are decoded and merged in time order.
+Adjacent windows share their bounds, so the observations repeated by the
+next window are dropped, as are the points of timeseries repeated at its
+start.  SOS 1.0 responses, which are not decoded by OWSLib, are returned in
+time order by `ObservationPlanner.get_responses`.
+"""
+
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import logging
+
+from owslib.swe.observation.om import TimePeriod
+from owslib.swe.observation.sos200 import iter_observations
+from owslib.swe.observation.waterml2 import MeasurementTimeseriesObservation
+
+LOGGER = logging.getLogger(__name__)
+
+# a sub-request of a plan: offerings and observed properties, from start to end
+ObservationRequest = namedtuple('ObservationRequest', ('offerings', 'observedProperties', 'start', 'end'))
+
+_MIN_TIME = datetime.min.replace(tzinfo=timezone.utc)
+
+
+class ObservationPlanner(object):
+    """
+    Splits GetObservation requests into bounded sub-requests, run concurrently
+    """
+
+    def __init__(self, sos, step=timedelta(days=7), offerings_per_request=1, properties_per_request=None,
+                 max_workers=4, value_reference='om:phenomenonTime'):
+        """
+        :param sos: SOS 1.0 or 2.0 service (`owslib.sos.SensorObservationService`)
+        :param step: maximum time range of a sub-request, as a timedelta
+        :param offerings_per_request: maximum number of offerings of a
+                                      sub-request (None for all of them)
+        :param properties_per_request: maximum number of observed properties
+                                       of a sub-request (None for all of them)
+        :param max_workers: maximum number of concurrent sub-requests
+        :param value_reference: time property filtered by SOS 2.0 sub-requests
+        """
+        if step <= timedelta(0):
+            raise ValueError('The step of a plan must be positive')
+        self.sos = sos
+        self.step = step
+        self.offerings_per_request = offerings_per_request
+        self.properties_per_request = properties_per_request
+        self.max_workers = max_workers
+        self.value_reference = value_reference
+
+    def plan(self, offerings, observedProperties, start, end):
+        """
+        Return the sub-requests of a GetObservation request
+
+        :param offerings: list of offering identifiers
+        :param observedProperties: list of observed property identifiers
+        :param start: start of the time range, as a datetime (UTC if naive)
+        :param end: end of the time range, as a datetime (UTC if naive)
+        :returns: list of `ObservationRequest`, in time order
+        """
+        start, end = _utc(start), _utc(end)
+        if end < start:
+            raise ValueError('The time range ends before it starts')
+        windows = []
+        while True:
+            windows.append((start, min(start + self.step, end)))
+            start += self.step
+            if start >= end:
+                break
+        return [ObservationRequest(o, p, window_start, window_end)
+                for window_start, window_end in windows
+                for o in _groups(offerings, self.offerings_per_request)
+                for p in _groups(observedProperties, self.properties_per_request)]
+
+    def event_time(self, start, end):
+        """
+        Return the time filter of a sub-request, as the eventTime of SOS 1.0
+        or the temporalFilter of SOS 2.0 requests
+        """
+        period = '%s/%s' % (_format_time(start), _format_time(end))
+        if self._is_sos1():
+            return period
+        return '%s,%s' % (self.value_reference, period)
+
+    def get_responses(self, offerings, observedProperties, start, end, **kwargs):
+        """
+        Run the sub-requests of a GetObservation request
+
+        :param offerings: list of offering identifiers
+        :param observedProperties: list of observed property identifiers
+        :param start: start of the time range, as a datetime (UTC if naive)
+        :param end: end of the time range, as a datetime (UTC if naive)
+        :param kwargs: other arguments of ``get_observation`` (responseFormat...)
+        :returns: generator of the (`ObservationRequest`, response) of the
+                  sub-requests, in time order.  At most ``max_workers``
+                  sub-requests are run ahead of the consumer.
+        """
+        plan = iter(self.plan(offerings, observedProperties, start, end))
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=max(1, self.max_workers))
+        try:
+            while True:
+                # keep the number of responses held in memory bounded
+                while len(pending) < max(1, self.max_workers):
+                    request = next(plan, None)
+                    if request is None:
+                        break
+                    pending.append((request, executor.submit(self._get_observation, request, kwargs)))
+                if not pending:
+                    break
+                request, future = pending.popleft()
+                yield request, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def get_observations(self, offerings, observedProperties, start, end, **kwargs):
+        """
+        Run the sub-requests of a SOS 2.0 GetObservation request, and merge
+        their observations
+
+        The observations are decoded concurrently too, sorted by phenomenon
+        time, and those repeated by adjacent sub-requests (same procedure,
+        observed property, feature of interest, time and result) are dropped.
+        The points of a timeseries up to the last point of the previous
+        timeseries of the same procedure, observed property and feature of
+        interest are removed.
+
+        :param offerings: list of offering identifiers
+        :param observedProperties: list of observed property identifiers
+        :param start: start of the time range, as a datetime (UTC if naive)
+        :param end: end of the time range, as a datetime (UTC if naive)
+        :param kwargs: other arguments of ``get_observation`` (responseFormat...)
+        :returns: list of observations
+        """
+        if self._is_sos1():
+            raise NotImplementedError('SOS 1.0 observations are not decoded, see get_responses')
+        plan = self.plan(offerings, observedProperties, start, end)
+
+        def decode(request):
+            return list(iter_observations(self._get_observation(request, kwargs)))
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(plan)))) as executor:
+            decoded = list(executor.map(decode, plan))
+        return _merge(decoded)
+
+    def _get_observation(self, request, kwargs):
+        LOGGER.debug('GetObservation of %s' % (request,))
+        return self.sos.get_observation(offerings=list(request.offerings),
+                                        observedProperties=list(request.observedProperties),
+                                        eventTime=self.event_time(request.start, request.end), **kwargs)
+
+    def _is_sos1(self):
+        return str(self.sos.version).startswith('1')
+
+
+def _merge(decoded):
+    """ Merge the observations decoded from sub-requests, see `ObservationPlanner.get_observations` """
+    ordered = sorted(((_start_time(o), i, j, o) for i, observations in enumerate(decoded)
+                      for j, o in enumerate(observations)), key=lambda t: t[:3])
+    merged = []
+    seen = set()
+    series_ends = {}
+    for _, _, _, observation in ordered:
+        series = (observation.procedure, observation.observedProperty, observation.featureOfInterest)
+        if isinstance(observation, MeasurementTimeseriesObservation):
+            timeseries = observation.get_result()
+            last = series_ends.get(series)
+            if last is not None:
+                repeated = 0
+                while repeated < len(timeseries) and _utc(timeseries[repeated].datetime) <= last:
+                    repeated += 1
+                del timeseries[:repeated]
+            if len(timeseries) == 0:
+                continue
+            series_ends[series] = _utc(timeseries[-1].datetime)
+        else:
+            key = series + (type(observation), _time_key(observation.phenomenonTime), str(observation.get_result()))
+            if key in seen:
+                continue
+            seen.add(key)
+        merged.append(observation)
+    return merged
+
+
+def _groups(values, size):
+    values = list(values)
+    if not size:
+        return [values]
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
+
+def _utc(dt):
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _format_time(dt):
+    return _utc(dt).strftime('%Y-%m-%dT%H:%M:%S') + 'Z'
+
+
+def _start_time(observation):
+    time = observation.phenomenonTime
+    if isinstance(time, TimePeriod):
+        time = time.start
+    return _utc(time) if isinstance(time, datetime) else _MIN_TIME
+
+
+def _time_key(time):
+    if isinstance(time, TimePeriod):
+        return (_time_key(time.start), _time_key(time.end))
+    return _utc(time) if isinstance(time, datetime) else time
@@ -1,3 +1,5 @@
+from io import BytesIO
+
 from owslib.etree import etree
 from urllib.parse import urlencode, parse_qsl
 from owslib import ows
@@ -19,6 +21,10 @@ def get_namespaces():
 
 namespaces = get_namespaces()
 
+_OM_OBSERVATION = nspath_eval("om20:OM_Observation", namespaces)
+_OBSERVATION_DATA = nspath_eval("sos:observationData", namespaces)
+_EXCEPTION_REPORT = nspath_eval("ows:ExceptionReport", namespaces)
+
 
 class SensorObservationService_2_0_0(object):
     """
@@ -27,10 +33,10 @@ class SensorObservationService_2_0_0(object):
         Implements ISensorObservationService.
     """
 
-    def __new__(self, url, version, xml=None, username=None, password=None):
+    def __new__(self, url, version, xml=None, username=None, password=None, session=None):
         """overridden __new__ method"""
         obj = object.__new__(self)
-        obj.__init__(url, version, xml, username, password)
+        obj.__init__(url, version, xml, username, password, session=session)
         return obj
 
     def __getitem__(self, id):
@@ -40,17 +46,19 @@ class SensorObservationService_2_0_0(object):
         else:
             raise KeyError("No Observational Offering with id: %s" % id)
 
-    def __init__(self, url, version='2.0.0', xml=None, username=None, password=None):
+    def __init__(self, url, version='2.0.0', xml=None, username=None, password=None, session=None):
         """Initialize."""
         self.url = url
         self.username = username
         self.password = password
+        self.session = session
         self.version = version
         self._capabilities = None
 
         # Authentication handled by Reader
         reader = SosCapabilitiesReader(
-            version=self.version, url=self.url, username=self.username, password=self.password
+            version=self.version, url=self.url, username=self.username, password=self.password,
+            session=self.session
         )
         if xml is not None:  # read from stored xml
             self._capabilities = reader.read_string(xml)
@@ -142,7 +150,8 @@ class SensorObservationService_2_0_0(object):
                 request[kw] = kwargs[kw]
 
         response = openURL(base_url, request, method,
-                           username=self.username, password=self.password, **url_kwargs).read()
+                           username=self.username, password=self.password, session=self.session,
+                           **url_kwargs).read()
         tr = etree.fromstring(response)
 
         if tr.tag == nspath_eval("ows:ExceptionReport", namespaces):
@@ -157,6 +166,7 @@ class SensorObservationService_2_0_0(object):
                         eventTime=None,
                         procedure=None,
                         method=None,
+                        stream=False,
                         **kwargs):
         """
         Parameters
@@ -165,6 +175,12 @@ class SensorObservationService_2_0_0(object):
             Output format. Provide one that is available for all offerings
         method : string
             Optional. HTTP DCP method name: Get or Post.  Must
+        stream : bool
+            Optional. Whether to return a file-like object reading the
+            response from the live connection (`owslib.util.StreamingResponse`),
+            e.g. for `iter_observations`, rather than the response bytes.
+            Exception reports are detected by peeking at the first bytes of
+            the response, and raised as `owslib.util.ServiceException`.
         **kwargs : extra arguments
             anything else e.g. vendor specific parameters
         """
@@ -202,8 +218,14 @@ class SensorObservationService_2_0_0(object):
             for kw in kwargs:
                 request[kw] = kwargs[kw]
 
+        if stream:
+            return openURL(base_url, request, method,
+                           username=self.username, password=self.password, session=self.session,
+                           stream=True, **url_kwargs)
+
         response = openURL(base_url, request, method,
-                           username=self.username, password=self.password, **url_kwargs).read()
+                           username=self.username, password=self.password, session=self.session,
+                           **url_kwargs).read()
         try:
             tr = etree.fromstring(response)
             if tr.tag == nspath_eval("ows:ExceptionReport", namespaces):
@@ -294,11 +316,12 @@ class SosObservationOffering(object):
 
 
 class SosCapabilitiesReader(object):
-    def __init__(self, version="2.0.0", url=None, username=None, password=None):
+    def __init__(self, version="2.0.0", url=None, username=None, password=None, session=None):
         self.version = version
         self.url = url
         self.username = username
         self.password = password
+        self.session = session
 
     def capabilities_url(self, service_url):
         """
@@ -330,7 +353,8 @@ class SosCapabilitiesReader(object):
         """
         getcaprequest = self.capabilities_url(service_url)
         spliturl = getcaprequest.split('?')
-        u = openURL(spliturl[0], spliturl[1], method='Get', username=self.username, password=self.password)
+        u = openURL(spliturl[0], spliturl[1], method='Get', username=self.username, password=self.password,
+                    session=self.session)
         return getXMLTree(u)
 
     def read_string(self, st):
@@ -365,6 +389,42 @@ class SOSGetObservationResponse(object):
         return self.observations[index]
 
 
+def iter_observations(response_stream):
+    """ Iterate over the observations of a GetObservation response, decoded
+    one at a time by `ObservationDecoder`.
+
+    The response is parsed incrementally, and the subtree of every
+    observation is removed from the document once the next one is decoded,
+    so that memory use does not grow with the size of the response (an
+    observation holds its own subtree for as long as it is referenced).
+
+    'response_stream' is a file-like object (e.g. the result of
+    `get_observation` with stream=True), a file name, or the response bytes.
+    """
+    if isinstance(response_stream, bytes):
+        response_stream = BytesIO(response_stream)
+    decoder = ObservationDecoder()
+    context = etree.iterparse(response_stream, events=('end',), tag=(_OM_OBSERVATION, _EXCEPTION_REPORT),
+                              remove_comments=True)
+    for _, element in context:
+        parent = element.getparent()
+        if element.tag == _EXCEPTION_REPORT:
+            if parent is None:
+                raise ows.ExceptionReport(element)
+            continue
+        if parent is None or parent.tag != _OBSERVATION_DATA:
+            continue
+
+        yield decoder.decode_observation(element)
+
+        # discard the observations already decoded
+        response = parent.getparent()
+        if response is not None:
+            while parent.getprevious() is not None:
+                del response[0]
+    del context
+
+
 class ObservationDecoder(object):
     """ Class to handle decoding different Observation types.
         The decode method inspects the type of om:result element and
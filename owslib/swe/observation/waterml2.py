@@ -6,6 +6,7 @@
 #
 # Contact email: peterataylor@gmail.com
 # =============================================================================
+from owslib.arrays import datetime64_array, float64_array, require_numpy
 from owslib.util import nspath_eval
 from owslib.namespaces import Namespaces
 from owslib.util import testXMLAttribute, testXMLValue
@@ -27,6 +28,13 @@ def nspv(path):
     return nspath_eval(path, namespaces)
 
 
+_POINT = nspv("wml2:point")
+_TIME = nspv("wml2:time")
+_VALUE = nspv("wml2:value")
+_TVP_TIME = nspv("wml2:MeasurementTVP/wml2:time")
+_TVP_VALUE = nspv("wml2:MeasurementTVP/wml2:value")
+
+
 class MeasurementTimeseriesObservation(OM_Observation):
     ''' A timeseries observation that has a measurement timeseries as
     result. An implementation of the WaterML2
@@ -52,24 +60,88 @@ class Timeseries(Result):
 
 
 class MeasurementTimeseries(Timeseries):
-    ''' A WaterML2.0 timeseries of measurements, with per-value metadata. '''
+    ''' A WaterML2.0 timeseries of measurements, with per-value metadata.
+    The times and values of the points are read in a single pass into numpy
+    arrays by to_arrays, and the TimeValuePair objects of the points are only
+    created (once) when the points are first accessed. From then on, the list
+    of points is the timeseries: its changes are followed by len and
+    to_arrays. '''
     def __init__(self, element):
         super(MeasurementTimeseries, self).__init__(element)
 
         self.defaultTVPMetadata = TVPMeasurementMetadata(element.find(
             nspv("wml2:defaultPointMetadata/wml2:DefaultTVPMeasurementMetadata")))
 
-        elems = element.findall(nspv("wml2:point"))
-        self.points = []
-        for point in elems:
-            self.points.append(TimeValuePair(point))
+        self._element = element
+        self._points = element.findall(_POINT)
+        self._pairs = None
+        self._arrays = None
+        self._arrays_pairs = None  # the points of the arrays, once built
 
     def __iter__(self):
-        for point in self.points:
-            yield point
+        return iter(self.points)
 
     def __len__(self):
-        return len(self.points)
+        return len(self._points if self._pairs is None else self._pairs)
+
+    def __getitem__(self, index):
+        return self.points[index]
+
+    def __delitem__(self, index):
+        ''' Remove points from the timeseries (and its document, as long as
+        the points are not built) '''
+        if self._pairs is not None:
+            del self._pairs[index]
+            return
+        points = self._points[index] if isinstance(index, slice) else [self._points[index]]
+        for point in points:
+            self._element.remove(point)
+        del self._points[index]
+        self._arrays = None
+
+    @property
+    def points(self):
+        if self._pairs is None:
+            self._pairs = [TimeValuePair(point) for point in self._points]
+            if self._arrays is not None:
+                self._arrays_pairs = list(self._pairs)
+        return self._pairs
+
+    @points.setter
+    def points(self, points):
+        self._pairs = points
+
+    def to_arrays(self):
+        ''' Return the (times, values) arrays of the points: the times as
+        datetime64[ns] (in UTC for times with an offset), and the values as
+        float64, NaN where missing. Requires numpy. '''
+        if self._arrays is not None and (self._pairs is None or self._arrays_current()):
+            return self._arrays
+        require_numpy('The arrays of WaterML2.0 timeseries')
+        if self._pairs is None:
+            times, values = [], []
+            # a single pass over the points and their times and values
+            for elem in self._element.iter(_POINT, _TIME, _VALUE):
+                if elem.tag == _POINT:
+                    times.append(None)
+                    values.append(None)
+                elif elem.tag == _TIME:
+                    times[-1] = elem.text
+                else:
+                    values[-1] = elem.text
+        else:
+            self._arrays_pairs = list(self._pairs)
+            times = [p.datetime.isoformat() for p in self._arrays_pairs]
+            values = [p.value for p in self._arrays_pairs]
+        self._arrays = (datetime64_array(times), float64_array(values))
+        return self._arrays
+
+    def _arrays_current(self):
+        ''' Whether the arrays are those of the points '''
+        pairs = self._arrays_pairs
+        if pairs is None or len(pairs) != len(self._pairs):
+            return False
+        return all(a is b for a, b in zip(pairs, self._pairs))
 
     def _parse_metadata(self, element):
         ''' Parse metadata elements relating to timeseries:
@@ -84,15 +156,13 @@ class TimeValuePair(object):
         Currently no support for tvp metadata.
     '''
     def __init__(self, element):
-        date_str = testXMLValue(
-            element.find(nspv("wml2:MeasurementTVP/wml2:time")))
+        date_str = testXMLValue(element.find(_TVP_TIME))
         try:
             self.datetime = parser.parse(date_str)
         except Exception:
             raise ValueError("Error parsing datetime string: %s" % date_str)
 
-        value_str = testXMLValue(element.find(nspv(
-            "wml2:MeasurementTVP/wml2:value")))
+        value_str = testXMLValue(element.find(_TVP_VALUE))
         try:
             self.value = float(value_str)
         except Exception:
@@ -0,0 +1,286 @@
+"""
+Persistent cache of map tiles
+
+Tiles fetched by `WebMapTileService.gettile` and `TileMapService.gettile`
+are stored in an SQLite database, keyed by their service, layer, style,
+format, tile matrix set, tile matrix, row and column, and the values of
+dimensions and other extra parameters of the request.  Tiles are served from the database
+while they are fresh, as given by the HTTP ``Cache-Control`` and ``Expires``
+headers of their response (or the cache's time-to-live, for responses
+without them), and stale tiles are revalidated with their ``ETag`` and
+``Last-Modified`` headers.
+
+The cache is used by tile services once it has been enabled, or given to
+them::
+
+    from owslib.tilecache import TileCache, set_default_tile_cache
+
+    set_default_tile_cache(TileCache('/var/cache/owslib/tiles.sqlite', max_size=2 * 1024 ** 3))
+"""
+
+from email.utils import parsedate_to_datetime
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from owslib.cache import CachedResponse
+from owslib.util import openURL
+
+LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tiles (
+    layer TEXT NOT NULL,
+    style TEXT NOT NULL,
+    format TEXT NOT NULL,
+    tilematrixset TEXT NOT NULL,
+    tilematrix TEXT NOT NULL,
+    tile_row INTEGER NOT NULL,
+    tile_column INTEGER NOT NULL,
+    dimensions TEXT NOT NULL,
+    tile_data BLOB NOT NULL,
+    content_type TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    stored REAL NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (layer, style, format, tilematrixset, tilematrix, tile_row, tile_column, dimensions)
+);
+CREATE INDEX IF NOT EXISTS tiles_accessed ON tiles (accessed);
+CREATE INDEX IF NOT EXISTS tiles_stored ON tiles (stored);
+"""
+
+_KEY = 'layer = ? AND style = ? AND format = ? AND tilematrixset = ? AND tilematrix = ? ' \
+       'AND tile_row = ? AND tile_column = ? AND dimensions = ?'
+
+
+class TileCache(object):
+    """
+    Size and age bounded SQLite cache of map tiles
+
+    Tiles are evicted in least recently used order once their total size
+    exceeds `max_size`, and once they were stored more than `max_age`
+    seconds ago.
+    """
+
+    def __init__(self, path=None, ttl=86400, max_size=512 * 1024 * 1024, max_age=None, honor_headers=True):
+        """
+        :param path: path of the SQLite database (default is
+                     ``owslib/tiles.sqlite`` in the user's cache directory)
+        :param ttl: time (in seconds) during which tiles are used without
+                    revalidation, for responses without cache headers
+        :param max_size: maximum total size (in bytes) of the cached tiles
+        :param max_age: maximum time (in seconds) tiles are kept, whatever
+                        their cache headers, or ``None``
+        :param honor_headers: whether the HTTP cache headers of responses
+                              are honored, rather than caching all tiles for
+                              `ttl` seconds
+        """
+        if path is None:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+            path = os.path.join(base, 'owslib', 'tiles.sqlite')
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self.max_age = max_age
+        self.honor_headers = honor_headers
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.executescript(_SCHEMA)
+        self._size = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM tiles').fetchone()[0]
+
+    @staticmethod
+    def key(layer, style, format, tilematrixset, tilematrix, row, column, dimensions=None, service=None):
+        """
+        Return the cache key of a tile
+
+        :param layer: layer (or tile map) of the tile
+        :param style: style of the tile
+        :param format: format of the tile
+        :param tilematrixset: tile matrix set (or SRS) of the tile
+        :param tilematrix: tile matrix (or zoom level) of the tile
+        :param row: row index of the tile
+        :param column: column index of the tile
+        :param dimensions: values of the dimensions and other extra
+                           parameters the tile is requested with
+        :param service: URL of the service of the tile, qualifying its layer
+                        (tile caches are shared by services, which may have
+                        layers of the same name)
+        """
+        dimensions = json.dumps(sorted((dimensions or {}).items()), default=str)
+        layer = str(layer) if service is None else '%s#%s' % (service, layer)
+        return (layer, '' if style is None else str(style), '' if format is None else str(format),
+                '' if tilematrixset is None else str(tilematrixset), str(tilematrix), int(row), int(column),
+                dimensions)
+
+    def open(self, key, url, data=None, **kwargs):
+        """
+        Return a tile, from the cache if possible
+
+        :param key: cache key of the tile, see `key`
+        :param url: URL of the tile
+        :param data: (optional) query string of the request
+        :param kwargs: keyword arguments of :func:`owslib.util.openURL`
+
+        :returns: `owslib.cache.CachedResponse` or `owslib.util.ResponseWrapper`
+        """
+        now = time.time()
+        entry = self._load(key, now)
+        if entry is not None and entry['expires'] > now:
+            LOGGER.debug('Tile cache hit: %s' % (key,))
+            with self._lock:
+                self.hits += 1
+            return self._response(entry, url)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None and self.honor_headers:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        response = openURL(url, data, 'Get', headers=headers, **kwargs)
+
+        if entry is not None and response.status_code == 304:
+            LOGGER.debug('Tile cache revalidated: %s' % (key,))
+            expires = self._expires(response.info(), now)
+            with self._lock:
+                self.revalidations += 1
+                self._db.execute('UPDATE tiles SET expires = ?, accessed = ? WHERE ' + _KEY,
+                                 (now if expires is None else expires, now) + key)
+            return self._response(entry, url)
+
+        LOGGER.debug('Tile cache miss: %s' % (key,))
+        with self._lock:
+            self.misses += 1
+        info = response.info()
+        expires = self._expires(info, now)
+        if response.status_code == 200 and expires is not None and \
+                info.get('Content-Type') != 'application/vnd.ogc.se_xml':
+            self._store(key, response.read(), info, now, expires)
+        return response
+
+    def clear(self):
+        """Remove all tiles from the cache"""
+        with self._lock:
+            self._db.execute('DELETE FROM tiles')
+            self._size = 0
+
+    def close(self):
+        """Close the database of the cache"""
+        self._db.close()
+
+    def _expires(self, headers, now):
+        """Return the expiry time of a response, or None if it may not be stored"""
+        if not self.honor_headers:
+            return now + self.ttl
+        directives = {}
+        for directive in (headers.get('Cache-Control') or '').split(','):
+            name, _, value = directive.strip().partition('=')
+            directives[name.lower()] = value.strip('"')
+        if 'no-store' in directives:
+            return None
+        if 'no-cache' in directives:
+            return now
+        if directives.get('max-age', '').isdigit():
+            return now + int(directives['max-age'])
+        if headers.get('Expires'):
+            try:
+                expires = parsedate_to_datetime(headers['Expires']).timestamp()
+                if headers.get('Date'):
+                    # relative to the clock of the server
+                    expires = now + expires - parsedate_to_datetime(headers['Date']).timestamp()
+                return expires
+            except (TypeError, ValueError):
+                return now  # invalid dates mean already expired
+        return now + self.ttl
+
+    def _load(self, key, now):
+        with self._lock:
+            row = self._db.execute(
+                'SELECT tile_data, content_type, etag, last_modified, stored, expires FROM tiles WHERE ' + _KEY,
+                key).fetchone()
+            if row is None:
+                return None
+            if self.max_age is not None and row[4] < now - self.max_age:
+                return None
+            self._db.execute('UPDATE tiles SET accessed = ? WHERE ' + _KEY, (now,) + key)
+        return dict(zip(('tile_data', 'content_type', 'etag', 'last_modified', 'stored', 'expires'), row))
+
+    def _response(self, entry, url):
+        headers = {}
+        if entry['content_type']:
+            headers['Content-Type'] = entry['content_type']
+        return CachedResponse(entry['tile_data'], headers, url)
+
+    def _store(self, key, content, info, now, expires):
+        with self._lock:
+            row = self._db.execute('SELECT size FROM tiles WHERE ' + _KEY, key).fetchone()
+            if row is not None:
+                self._size -= row[0]
+            self._db.execute(
+                'INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                key + (content, info.get('Content-Type'), info.get('ETag'), info.get('Last-Modified'),
+                       now, expires, now, len(content)))
+            self._size += len(content)
+            self._evict(now)
+
+    def _evict(self, now):
+        if self.max_age is not None:
+            old = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM tiles WHERE stored < ?',
+                                   (now - self.max_age,)).fetchone()[0]
+            if old:
+                self._db.execute('DELETE FROM tiles WHERE stored < ?', (now - self.max_age,))
+                self._size -= old
+
+        if self._size <= self.max_size:
+            return
+        evicted = []
+        excess = self._size - self.max_size
+        for rowid, size in self._db.execute('SELECT rowid, size FROM tiles ORDER BY accessed'):
+            if excess <= 0:
+                break
+            evicted.append((rowid,))
+            excess -= size
+            self._size -= size
+        LOGGER.debug('Evicting %d tiles from the tile cache' % len(evicted))
+        self._db.executemany('DELETE FROM tiles WHERE rowid = ?', evicted)
+
+    def __repr__(self):
+        return '<%s path=%r ttl=%s max_size=%s max_age=%s>' % (
+            self.__class__.__name__, self.path, self.ttl, self.max_size, self.max_age)
+
+
+_default_tile_cache = None
+
+
+def get_default_tile_cache():
+    """
+    Return the tile cache used when no cache is given
+
+    :returns: `TileCache`, or ``None`` if caching is disabled
+    """
+
+    return _default_tile_cache
+
+
+def set_default_tile_cache(cache):
+    """
+    Set the tile cache used when no cache is given
+
+    :param cache: `TileCache`, or ``None`` to disable caching
+    """
+
+    global _default_tile_cache
+    _default_tile_cache = cache
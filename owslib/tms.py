@@ -15,12 +15,34 @@
 # TMS as defined in:
 # http://wiki.osgeo.org/wiki/Tile_Map_Service_Specification
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+
 from .etree import etree
+from .tilecache import get_default_tile_cache
 from .util import testXMLValue, ServiceException, Authentication, openURL
 
 
+LOGGER = logging.getLogger(__name__)
+
 FORCE900913 = False
 
+# maximum number of TileMap documents kept by _tilemaps
+TILEMAP_CACHE_SIZE = 256
+
+# TileMap documents already fetched, by URL and user name, shared by all
+# service instances, in least recently used order
+_tilemaps = OrderedDict()
+_tilemaps_lock = threading.Lock()
+
+
+def clear_tilemap_cache():
+    """Forget the TileMap documents fetched so far"""
+    with _tilemaps_lock:
+        _tilemaps.clear()
+
 
 def force900913(epsg):
     # http://osgeo-org.1560.n6.nabble.com/OSGEO-code-td3852851.html
@@ -39,8 +61,18 @@ class TileMapService(object):
     """
 
     def __init__(self, url, version='1.0.0', xml=None, username=None, password=None,
-                 parse_remote_metadata=False, timeout=30, headers=None, auth=None):
-        """Initialize."""
+                 parse_remote_metadata=False, timeout=30, headers=None, auth=None, session=None,
+                 tile_cache=None, prefetch_tilemaps=False):
+        """Initialize.
+
+        tile_cache is an optional `owslib.tilecache.TileCache` of the tiles
+        requested by gettile, defaulting to the cache returned by
+        `owslib.tilecache.get_default_tile_cache`.
+
+        If prefetch_tilemaps is true, the TileMap documents of all contents
+        are fetched concurrently (see `prefetch_tilemaps`), instead of one at
+        a time on first use.
+        """
         if auth:
             if username:
                 auth.username = username
@@ -51,6 +83,8 @@ class TileMapService(object):
         self.password = password
         self.headers = headers
         self.auth = auth or Authentication(username, password)
+        self.session = session
+        self.tile_cache = tile_cache
         self.version = version
         self.timeout = timeout
         self.services = None
@@ -59,7 +93,8 @@ class TileMapService(object):
 
         # Authentication handled by Reader
         reader = TMSCapabilitiesReader(
-            self.version, url=self.url, un=username, pw=password, headers=self.headers, auth=self.auth
+            self.version, url=self.url, un=username, pw=password, headers=self.headers, auth=self.auth,
+            session=self.session
         )
         if xml is not None:  # read from stored xml
             self._capabilities = reader.readString(xml)
@@ -68,12 +103,43 @@ class TileMapService(object):
 
         # build metadata objects
         self._buildMetadata(parse_remote_metadata)
+        if prefetch_tilemaps:
+            self.prefetch_tilemaps()
+
+    def prefetch_tilemaps(self, max_workers=8):
+        """Fetch the TileMap documents of all contents concurrently
+
+        TileMap documents are otherwise fetched one at a time, the first time
+        a property of their content (width, mimetype, boundingBox...) is
+        used.  Fetched documents are shared by all service instances (up to
+        `TILEMAP_CACHE_SIZE` of them, the least recently used are dropped).
+        Contents whose document cannot be fetched are logged and left to be
+        fetched on first use.
+
+        :param max_workers: maximum number of concurrent requests
+        :returns: number of contents whose TileMap document was loaded by
+                  this call, fetched or shared by an earlier instance
+        """
+        pending = [cm for cm in self.contents.values() if cm._tile_map is None]
+        if not pending:
+            return 0
+
+        def fetch(cm):
+            try:
+                cm._get_tilemap()
+                return 1
+            except Exception as err:
+                LOGGER.warning('Fetching TileMap %s failed: %s' % (cm.id, err))
+                return 0
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return sum(executor.map(fetch, pending))
 
     def _getcapproperty(self):
         # TODO: deprecated function. See ticket #453.
         if not self._capabilities:
             reader = TMSCapabilitiesReader(
-                self.version, url=self.url, un=self.username, pw=self.password
+                self.version, url=self.url, un=self.username, pw=self.password, session=self.session
             )
             # self._capabilities = ServiceMetadata(reader.read(self.url))
             self._capabilities = reader.read(self.url, timeout=self.timeout)
@@ -89,7 +155,7 @@ class TileMapService(object):
         tilemaps = self._capabilities.find('TileMaps')
         if tilemaps is not None:
             for tilemap in tilemaps.findall('TileMap'):
-                cm = ContentMetadata(tilemap, headers=self.headers, auth=self.auth)
+                cm = ContentMetadata(tilemap, headers=self.headers, auth=self.auth, session=self.session)
                 if cm.id:
                     if cm.id in self.contents:
                         raise KeyError('Content metadata for layer "%s" already exists' % cm.id)
@@ -121,11 +187,17 @@ class TileMapService(object):
                     items.append((item, self.contents[item]))
         return items
 
-    def _gettilefromset(self, tilesets, x, y, z, ext, timeout=None):
+    def _gettilefromset(self, tilesets, x, y, z, ext, timeout=None, tilemap=None):
         for tileset in tilesets:
             if tileset['order'] == z:
                 url = tileset['href'] + '/' + str(x) + '/' + str(y) + '.' + ext
-                u = openURL(url, '', timeout=timeout or self.timeout, headers=self.headers, auth=self.auth)
+                tile_cache = self.tile_cache or get_default_tile_cache()
+                if tile_cache is not None and tilemap is not None:
+                    key = tile_cache.key(tilemap.id, None, ext, tilemap.srs, z, y, x)
+                    return tile_cache.open(key, url, '', timeout=timeout or self.timeout, headers=self.headers,
+                                           auth=self.auth, session=self.session)
+                u = openURL(url, '', timeout=timeout or self.timeout, headers=self.headers, auth=self.auth,
+                            session=self.session)
                 return u
         else:
             raise ValueError('cannot find zoomlevel %i for TileMap' % z)
@@ -135,7 +207,8 @@ class TileMapService(object):
             raise ValueError('either id or title and srs must be specified')
         if id:
             return self._gettilefromset(self.contents[id].tilemap.tilesets,
-                                        x, y, z, self.contents[id].tilemap.extension, timeout=timeout)
+                                        x, y, z, self.contents[id].tilemap.extension, timeout=timeout,
+                                        tilemap=self.contents[id])
 
         elif title and srs:
             for tm in list(self.contents.values()):
@@ -143,12 +216,14 @@ class TileMapService(object):
                     if mimetype:
                         if tm.tilemap.mimetype == mimetype:
                             return self._gettilefromset(tm.tilemap.tilesets,
-                                                        x, y, z, tm.tilemap.extension, timeout=timeout)
+                                                        x, y, z, tm.tilemap.extension, timeout=timeout,
+                                                        tilemap=tm)
                     else:
                         # if no format is given we return the tile from the
                         # first tilemap that matches name and srs
                         return self._gettilefromset(tm.tilemap.tilesets,
-                                                    x, y, z, tm.tilemap.extension, timeout=timeout)
+                                                    x, y, z, tm.tilemap.extension, timeout=timeout,
+                                                    tilemap=tm)
             else:
                 raise ValueError('cannot find {} with projection {} for zoomlevel {}'.format(title, srs, z))
         elif title or srs:
@@ -180,7 +255,7 @@ class ContentMetadata(object):
     def __str__(self):
         return 'Layer Title: %s, URL: %s' % (self.title, self.id)
 
-    def __init__(self, elem, un=None, pw=None, headers=None, auth=None):
+    def __init__(self, elem, un=None, pw=None, headers=None, auth=None, session=None):
         if elem.tag != 'TileMap':
             raise ValueError('%s should be a TileMap' % (elem,))
         self.id = elem.attrib['href']
@@ -194,13 +269,26 @@ class ContentMetadata(object):
                 auth.password = pw
         self.auth = auth or Authentication(un, pw)
         self.headers = headers
+        self.session = session
         self._tile_map = None
         self.type = elem.attrib.get('type')
 
     def _get_tilemap(self):
         if self._tile_map is None:
-            self._tile_map = TileMap(self.id, headers=self.headers, auth=self.auth)
-            assert self._tile_map.srs == self.srs
+            key = (self.id, self.auth.username)
+            with _tilemaps_lock:
+                tile_map = _tilemaps.get(key)
+                if tile_map is not None:
+                    _tilemaps.move_to_end(key)
+            if tile_map is None:
+                tile_map = TileMap(self.id, headers=self.headers, auth=self.auth, session=self.session)
+                with _tilemaps_lock:
+                    tile_map = _tilemaps.setdefault(key, tile_map)
+                    while len(_tilemaps) > TILEMAP_CACHE_SIZE:
+                        _tilemaps.popitem(last=False)
+            if tile_map.srs != self.srs:
+                raise ValueError('TileMap %s has SRS %s, expected %s' % (self.id, tile_map.srs, self.srs))
+            self._tile_map = tile_map
         return self._tile_map
 
     @property
@@ -253,7 +341,7 @@ class TileMap(object):
     tilesets = None
     profile = None
 
-    def __init__(self, url=None, xml=None, un=None, pw=None, headers=None, auth=None):
+    def __init__(self, url=None, xml=None, un=None, pw=None, headers=None, auth=None, session=None):
         self.url = url
         if auth:
             if un:
@@ -262,6 +350,7 @@ class TileMap(object):
                 auth.password = pw
         self.auth = auth or Authentication(un, pw)
         self.headers = headers
+        self.session = session
         self.tilesets = []
         if xml and not url:
             self.readString(xml)
@@ -304,7 +393,7 @@ class TileMap(object):
                     'order': order})
 
     def read(self, url):
-        u = openURL(url, '', method='Get', headers=self.headers, auth=self.auth)
+        u = openURL(url, '', method='Get', headers=self.headers, auth=self.auth, session=self.session)
         self._parse(etree.fromstring(u.read()))
 
     def readString(self, st):
@@ -317,7 +406,7 @@ class TMSCapabilitiesReader(object):
     """Read and parse capabilities document into a lxml.etree infoset
     """
 
-    def __init__(self, version='1.0.0', url=None, un=None, pw=None, headers=None, auth=None):
+    def __init__(self, version='1.0.0', url=None, un=None, pw=None, headers=None, auth=None, session=None):
         """Initialize"""
         if auth:
             if un:
@@ -329,12 +418,14 @@ class TMSCapabilitiesReader(object):
         self.url = url
         self.headers = headers
         self.auth = auth or Authentication(un, pw)
+        self.session = session
 
     def read(self, service_url, timeout=30):
         """Get and parse a TMS capabilities document, returning an
         elementtree instance
         """
-        u = openURL(service_url, '', method='Get', timeout=timeout, headers=self.headers, auth=self.auth)
+        u = openURL(service_url, '', method='Get', timeout=timeout, headers=self.headers, auth=self.auth,
+                    session=self.session)
         return etree.fromstring(u.read())
 
     def readString(self, st):
@@ -12,17 +12,22 @@ from collections import OrderedDict
 import copy
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
 import importlib.metadata
-from io import StringIO, BytesIO
+from io import StringIO, BytesIO, BufferedReader
 import os
 import re
 import sys
+import threading
+import time
 from typing import Union
 from urllib.parse import urlsplit, urlencode, urlparse, parse_qs, urlunparse, parse_qsl
 import warnings
 
 from dateutil import parser
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
 
 from owslib.etree import etree, ParseError
@@ -135,6 +140,10 @@ class ResponseWrapper(object):
     def info(self):
         return self._response.headers
 
+    @property
+    def status_code(self):
+        return self._response.status_code
+
     def read(self):
         return self._response.content
 
@@ -144,8 +153,302 @@ class ResponseWrapper(object):
     # @TODO: __getattribute__ for poking at response
 
 
+class StreamingResponse(BufferedReader):
+    """
+    Return object type from openURL when streaming.
+
+    File-like object reading the response body from the live connection,
+    so that large responses are never held in memory as a whole.
+    Closing it releases the connection back to the pool.
+    """
+    def __init__(self, response, buffer_size=65536):
+        response.raw.decode_content = True
+        response.raw.auto_close = False  # the buffer may still hold data at the end of the body
+        super().__init__(response.raw, buffer_size)
+        self.buffer_size = buffer_size
+        self._response = response
+
+    def info(self):
+        return self._response.headers
+
+    def geturl(self):
+        return self._response.url.replace('&&', '&')
+
+    def iter_chunks(self, chunk_size=65536):
+        """
+        Iterate over the (remaining) response body
+
+        :param chunk_size: maximum size of each chunk in bytes
+        """
+        while True:
+            chunk = self.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def check_service_exception(self):
+        """
+        Raise a ServiceException if the response is an OGC exception report.
+
+        Only the first bytes of the body are peeked at, unless they start an
+        exception report, which is then read in full.
+        """
+        tag = _root_tag(self.peek(self.buffer_size))
+        if tag is None or tag.split('}')[-1] not in ('ServiceExceptionReport', 'ExceptionReport'):
+            return
+
+        content = self.read()
+        self.close()
+        try:
+            message = _service_exception_message(etree.fromstring(content))
+        except ParseError:
+            message = None
+        raise ServiceException(message or content.decode('utf-8', errors='replace'))
+
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._response.close()
+
+
+def _root_tag(head):
+    """Return the tag of the root element of the XML document starting with `head`, if any"""
+    parser = etree.XMLPullParser(events=('start',))
+    try:
+        parser.feed(head)
+        for _, element in parser.read_events():
+            return element.tag
+    except (ParseError, ValueError):
+        pass
+    return None
+
+
+def _service_exception_message(tree):
+    """Return the message of the service exception in an exception report, if any"""
+
+    # to handle the variety of namespaces and terms across services
+    # and versions, especially for "legacy" responses like WMS 1.3.0
+    possible_errors = [
+        '{http://www.opengis.net/ows}Exception',
+        '{http://www.opengis.net/ows/1.1}Exception',
+        '{http://www.opengis.net/ogc}ServiceException',
+        'ServiceException'
+    ]
+
+    for possible_error in possible_errors:
+        serviceException = tree.find(possible_error)
+        if serviceException is not None:
+            # and we need to deal with some message nesting
+            return '\n'.join([t.strip() for t in serviceException.itertext() if t.strip()])
+    return None
+
+
+def _counting_pool(pool_cls, on_connect):
+    """Return a subclass of a urllib3 connection pool class reporting new connections"""
+
+    class CountingConnectionPool(pool_cls):
+        def _new_conn(self):
+            on_connect(self.host)
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    """requests transport adapter which reports every newly opened connection"""
+
+    def __init__(self, on_connect, **kwargs):
+        self._on_connect = on_connect
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: _counting_pool(pool_cls, self._on_connect)
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+
+class HTTPSession(object):
+    """
+    Pooled, thread-safe HTTP transport shared by OWSLib requests.
+
+    TCP/TLS connections are kept alive and reused across requests (and across
+    service instances sharing the same session) instead of being set up and
+    torn down for every call.  Each thread gets its own ``requests.Session``
+    while all of them share the same connection pools.
+
+    Cookies returned by servers are not persisted between requests, so that
+    sharing a session does not change the stateless behaviour of OWSLib.
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, host_pool_maxsize=None, max_retries=0):
+        """
+        :param int pool_connections=10: number of per-host connection pools to cache
+        :param int pool_maxsize=10: maximum number of connections kept alive per host
+        :param dict host_pool_maxsize=None: ``{host: maxsize}`` overrides of ``pool_maxsize``
+            for given hosts (a host may include a ``:port``)
+        :param max_retries=0: number of retries for failed connections, or a
+            ``urllib3.util.Retry`` instance
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.host_pool_maxsize = dict(host_pool_maxsize or {})
+        self.max_retries = max_retries
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._requests = {}
+        self._connections = {}
+
+        self._adapters = {'http://': self._make_adapter(pool_maxsize),
+                          'https://': self._make_adapter(pool_maxsize)}
+        for host, maxsize in self.host_pool_maxsize.items():
+            adapter = self._make_adapter(maxsize)
+            for scheme in ('http', 'https'):
+                self._adapters['%s://%s/' % (scheme, host)] = adapter
+
+    def _make_adapter(self, maxsize):
+        return _PooledHTTPAdapter(self._connection_opened, pool_connections=self.pool_connections,
+                                  pool_maxsize=maxsize, max_retries=self.max_retries)
+
+    def _connection_opened(self, host):
+        with self._lock:
+            self._connections[host] = self._connections.get(host, 0) + 1
+
+    @property
+    def session(self):
+        """The ``requests.Session`` of the calling thread, bound to the shared pools"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            for prefix, adapter in self._adapters.items():
+                session.mount(prefix, adapter)
+            self._local.session = session
+        return session
+
+    def request(self, method, url, **kwargs):
+        """
+        Send an HTTP request through the pooled connections
+
+        :param method: HTTP method
+        :param url: URL of the request
+        :param kwargs: keyword arguments passed to ``requests.Session.request``
+
+        :returns: `requests.Response`
+        """
+        host = urlsplit(url).hostname
+        with self._lock:
+            self._requests[host] = self._requests.get(host, 0) + 1
+        return self.session.request(method, url, **kwargs)
+
+    @property
+    def stats(self):
+        """
+        Connection reuse statistics per host
+
+        :returns: `dict` of ``{host: {'requests': int, 'connections': int, 'reused': int}}``
+        """
+        with self._lock:
+            stats = {}
+            for host in set(self._requests) | set(self._connections):
+                requests_ = self._requests.get(host, 0)
+                connections = self._connections.get(host, 0)
+                stats[host] = {
+                    'requests': requests_,
+                    'connections': connections,
+                    'reused': max(requests_ - connections, 0)
+                }
+            return stats
+
+    def reset_stats(self):
+        """Reset connection reuse statistics"""
+        with self._lock:
+            self._requests.clear()
+            self._connections.clear()
+
+    def close(self):
+        """Close all pooled connections"""
+        for adapter in set(self._adapters.values()):
+            adapter.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return '<{} pool_connections={} pool_maxsize={} host_pool_maxsize={}>'.format(
+            self.__class__.__name__, self.pool_connections, self.pool_maxsize, self.host_pool_maxsize)
+
+
+_default_session = None
+_default_session_lock = threading.Lock()
+
+
+def get_default_session():
+    """
+    Return the HTTP session used when no session is given to a request
+
+    :returns: `owslib.util.HTTPSession`
+    """
+    global _default_session
+    if _default_session is None:
+        with _default_session_lock:
+            if _default_session is None:
+                _default_session = HTTPSession()
+    return _default_session
+
+
+def set_default_session(session):
+    """
+    Set the HTTP session used when no session is given to a request
+
+    :param session: instance of `owslib.util.HTTPSession`, or ``None`` to
+                    fall back to a new default session on next use
+    """
+    global _default_session
+    with _default_session_lock:
+        _default_session = session
+
+
+class RateLimiter(object):
+    """
+    Thread-safe limit on the rate of requests
+
+    Callers of `wait` are spaced out so that at most ``rate`` of them
+    proceed per second, whatever the number of threads sharing the limiter.
+    """
+
+    def __init__(self, rate):
+        """
+        :param float rate: maximum number of calls to `wait` returning per second
+        """
+        if rate <= 0:
+            raise ValueError('rate must be positive, got %r' % (rate,))
+        self.rate = rate
+        self._interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next call is allowed"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+    def __repr__(self):
+        return '<{} rate={}>'.format(self.__class__.__name__, self.rate)
+
+
 def openURL(url_base, data=None, method='Get', cookies=None, username=None, password=None, timeout=30, headers=None,
-            verify=True, cert=None, auth=None):
+            verify=True, cert=None, auth=None, session=None, stream=False):
     """
     Function to open URLs.
 
@@ -158,6 +461,9 @@ def openURL(url_base, data=None, method='Get', cookies=None, username=None, pass
     :param cert: (optional) A file with a client side certificate for SSL authentication
                  to send with the :class:`Request`.
     :param auth: Instance of owslib.util.Authentication
+    :param session: (optional) Instance of owslib.util.HTTPSession. Defaults to the shared default session.
+    :param stream: (optional) whether to return a :class:`StreamingResponse` reading the body from the
+                   live connection instead of reading it in full. Defaults to ``False``.
     """
 
     headers = headers if headers is not None else {}
@@ -206,34 +512,40 @@ def openURL(url_base, data=None, method='Get', cookies=None, username=None, pass
     if cookies is not None:
         rkwargs['cookies'] = cookies
 
-    req = requests.request(method.upper(), url_base, headers=headers, **rkwargs)
+    if stream:
+        rkwargs['stream'] = True
+
+    session = session or get_default_session()
+    req = session.request(method.upper(), url_base, headers=headers, **rkwargs)
 
     if req.status_code == 400:
-        raise ServiceException(req.text)
+        message = req.text
+        req.close()  # release the connection of streamed responses
+        raise ServiceException(message)
 
     if req.status_code in [401, 403, 404, 500, 502, 503, 504]:    # add more if needed
-        req.raise_for_status()
+        try:
+            req.raise_for_status()
+        finally:
+            req.close()
+
+    if req.status_code == 304:  # not modified, without a body
+        return ResponseWrapper(req)
+
+    if stream:
+        # check for service exceptions on the first bytes only
+        response = StreamingResponse(req)
+        response.check_service_exception()
+        return response
 
     # check for service exceptions without the http header set
     if 'Content-Type' in req.headers and \
             req.headers['Content-Type'] in ['text/xml', 'application/xml', 'application/vnd.ogc.se_xml']:
         # just in case 400 headers were not set, going to have to read the xml to see if it's an exception report.
         se_tree = etree.fromstring(req.content)
-
-        # to handle the variety of namespaces and terms across services
-        # and versions, especially for "legacy" responses like WMS 1.3.0
-        possible_errors = [
-            '{http://www.opengis.net/ows}Exception',
-            '{http://www.opengis.net/ows/1.1}Exception',
-            '{http://www.opengis.net/ogc}ServiceException',
-            'ServiceException'
-        ]
-
-        for possible_error in possible_errors:
-            serviceException = se_tree.find(possible_error)
-            if serviceException is not None:
-                # and we need to deal with some message nesting
-                raise ServiceException('\n'.join([t.strip() for t in serviceException.itertext() if t.strip()]))
+        message = _service_exception_message(se_tree)
+        if message is not None:
+            raise ServiceException(message)
 
     return ResponseWrapper(req)
 
@@ -276,6 +588,24 @@ def nspath_eval(xpath, namespaces):
     return '/'.join(out)
 
 
+def nspath_cache(namespaces):
+    """
+    Return a cached `nspath_eval` bound to a namespace mapping
+
+    Metadata parsers evaluate the same path expressions for every record: the
+    returned function computes the etree path of each expression once.  The
+    namespace mapping must not be changed afterwards.
+
+    :param namespaces: dict of namespace prefixes and URIs
+    :returns: function returning the etree path of a path expression
+    """
+
+    @lru_cache(maxsize=None)
+    def nspath(xpath):
+        return nspath_eval(xpath, namespaces)
+    return nspath
+
+
 def cleanup_namespaces(element):
     """ Remove unused namespaces from an element """
     etree.cleanup_namespaces(element)
@@ -405,7 +735,8 @@ def testXMLAttribute(element, attribute):
     return None
 
 
-def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, password=None, auth=None, headers=None):
+def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, password=None, auth=None, headers=None,
+              session=None):
     """
 
     Invoke an HTTP POST request
@@ -419,6 +750,7 @@ def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, p
     - timeout: timeout in seconds
     - auth: owslib.util.Auth instance
     - headers: HTTP headers to send with requests
+    - session: owslib.util.HTTPSession instance (default is the shared default session)
 
     """
 
@@ -459,10 +791,11 @@ def http_post(url=None, request=None, lang='en-US', timeout=10, username=None, p
     rkwargs['verify'] = auth.verify
     rkwargs['cert'] = auth.cert
 
+    session = session or get_default_session()
     if not isinstance(request, dict):
-        return requests.post(url, request, headers=headers_, **rkwargs)
+        return session.request('POST', url, data=request, headers=headers_, **rkwargs)
     else:
-        return requests.post(url, json=request, headers=headers_, **rkwargs)
+        return session.request('POST', url, json=request, headers=headers_, **rkwargs)
 
 
 def http_prepare(*args, **kwargs):
@@ -502,12 +835,14 @@ def http_prepare(*args, **kwargs):
 
 
 def http_get(*args, **kwargs):
+    session = kwargs.pop('session', None) or get_default_session()
     rkwargs = http_prepare(*args, **kwargs)
 
-    return requests.get(*args, **rkwargs)
+    return session.request('GET', *args, **rkwargs)
 
 
 def http_put(*args, **kwargs):
+    session = kwargs.pop('session', None) or get_default_session()
     rkwargs = http_prepare(*args, **kwargs)
 
     if 'data' in kwargs:
@@ -517,12 +852,13 @@ def http_put(*args, **kwargs):
         else:
             rkwargs['data'] = kwargs['data']
 
-    return requests.put(*args, **rkwargs)
+    return session.request('PUT', *args, **rkwargs)
 
 
 def http_delete(*args, **kwargs):
+    session = kwargs.pop('session', None) or get_default_session()
     rkwargs = http_prepare(*args, **kwargs)
-    return requests.delete(*args, **rkwargs)
+    return session.request('DELETE', *args, **rkwargs)
 
 
 def element_to_string(element, encoding=None, xml_declaration=False):
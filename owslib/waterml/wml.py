@@ -4,6 +4,8 @@ from owslib.util import xml_to_dict as _xml_to_dict
 from datetime import datetime
 from dateutil import parser
 
+from owslib.arrays import datetime64_array, float64_array, require_numpy
+
 namespaces = {
     'wml1.1': '{http://www.cuahsi.org/waterML/1.1/}',
     'wml1.0': '{http://www.cuahsi.org/waterML/1.0/}',
@@ -593,8 +595,9 @@ class TimeSeriesResponse(XMLParser):
         An object constructed from a dictionary parse of the response. The object has get access and can
         also iterate over each timeSeries element returned.
     """
-    def __init__(self, xml, version='wml1.1'):
+    def __init__(self, xml, version='wml1.1', columnar=False):
         super(TimeSeriesResponse, self).__init__(xml, version)
+        self.columnar = columnar
         self.parse_timeseriesresponse()
 
     """Accessor properties/methods"""
@@ -623,20 +626,22 @@ class TimeSeriesResponse(XMLParser):
         try:
             qi = self._find('queryInfo')
             self.query_info = QueryInfo(qi, self._ns)
-            self.time_series = [TimeSeries(series, self._ns) for series in self._findall('timeSeries')]
+            self.time_series = [TimeSeries(series, self._ns, self.columnar) for series in self._findall('timeSeries')]
         except Exception:
             raise
 
 
 class TimeSeries(XMLParser):
-    def __init__(self, xml, version='wml1.1'):
+    def __init__(self, xml, version='wml1.1', columnar=False):
         super(TimeSeries, self).__init__(xml, version)
+        self.columnar = columnar
         self.parse_timeseries()
 
     def parse_timeseries(self):
         try:
             self.variable = Variable(self._find('variable'), self._ns)
-            self.values = [Values(val, self._ns) for val in self._findall('values')]
+            values = ColumnarValues if self.columnar else Values
+            self.values = [values(val, self._ns) for val in self._findall('values')]
             self.source_info = SiteInfo(self._find('sourceInfo'), self._ns)
             self.name = self._root.attrib.get('name')
         except Exception:
@@ -673,7 +678,6 @@ class Values(XMLParser):
             return [(v.date_time_utc, v.value) for v in varl]
 
     def parse_values(self):
-        xml_dict = _xml_to_dict(self._root)  # noqa: F841
         # method info
         self.methods = [Method(method, self._ns) for method in self._findall('method')]
 
@@ -703,7 +707,91 @@ class Values(XMLParser):
             self.unit = Unit(unit, self._ns) if unit is not None else None
 
         # values
-        self.values = [Value(val, self._ns) for val in self._findall('value')]
+        self.parse_value_elements(self._findall('value'))
+
+    def parse_value_elements(self, elements):
+        self.values = [Value(val, self._ns) for val in elements]
+
+
+class ColumnarValues(Values):
+    """
+        Values of a time series held in numpy arrays, rather than in a `Value` object per value
+
+        The date-times of the values are held in the datetime64 arrays `date_times` and `date_times_utc`
+        (NaT where missing, and converted to UTC where they have an offset), and the values in the float64
+        array `data` (NaN where missing or not numeric).  The attributes listed in `CATEGORIES` are held as
+        integer arrays in `codes`, indexing the distinct values of the attributes in `categories` (-1 where
+        missing).  The `Value` objects of the values are only created (once) when the values are iterated.
+    """
+    # (name, attribute) of the categorical attributes of the values
+    CATEGORIES = (
+        ('method_id', 'methodID'),
+        ('source_id', 'sourceID'),
+        ('sample_id', 'sampleID'),
+        ('quality_control_level', 'qualityControlLevel'),
+        ('method_code', 'methodCode'),
+        ('source_code', 'sourceCode'),
+        ('quality_control_level_code', 'qualityControlLevelCode'),
+        ('censor_code', 'censorCode'),
+    )
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __len__(self):
+        return len(self.data)
+
+    @property
+    def values(self):
+        if self._values is None:
+            self._values = [Value(val, self._ns) for val in self._findall('value')]
+        return self._values
+
+    def mask(self, **criteria):
+        """
+            Returns the boolean array selecting the values whose categorical attributes (given by name, as in
+            `CATEGORIES`) have the given values.
+        """
+        np = require_numpy('The columnar WaterML values')
+        mask = np.ones(len(self.data), dtype=bool)
+        for name, value in criteria.items():
+            try:
+                mask &= self.codes[name] == self.categories[name].index(value)
+            except ValueError:  # not a value of the attribute
+                mask[:] = False
+        return mask
+
+    def get_date_values(self, method_id=None, source_id=None, sample_id=None, quality_level=None, utc=False):
+        """
+            Returns the (date-times, values) arrays of the values, selected as in `Values.get_date_values`.
+        """
+        criteria = {'method_id': method_id, 'source_id': source_id, 'sample_id': sample_id,
+                    'quality_control_level': quality_level}
+        mask = self.mask(**{name: value for name, value in criteria.items() if value is not None})
+        date_times = self.date_times_utc if utc else self.date_times
+        return date_times[mask], self.data[mask]
+
+    def parse_value_elements(self, elements):
+        np = require_numpy('The columnar WaterML values')
+        self._values = None
+        data, date_times, date_times_utc = [], [], []
+        indexes = [{} for _ in self.CATEGORIES]
+        codes = [[] for _ in self.CATEGORIES]
+        categories = tuple(zip(self.CATEGORIES, indexes, codes))
+        for val in elements:
+            attrib = val.attrib
+            data.append(val.text)
+            date_times.append(attrib.get('dateTime'))
+            date_times_utc.append(attrib.get('dateTimeUTC'))
+            for (_, attribute), index, code in categories:
+                value = attrib.get(attribute)
+                code.append(-1 if value is None else index.setdefault(value, len(index)))
+
+        self.data = float64_array(data)
+        self.date_times = datetime64_array(date_times)
+        self.date_times_utc = datetime64_array(date_times_utc)
+        self.categories = {name: list(index) for (name, _), index in zip(self.CATEGORIES, indexes)}
+        self.codes = {name: np.array(code, dtype=np.int32) for (name, _), code in zip(self.CATEGORIES, codes)}
 
 
 class Value(XMLParser):
@@ -733,6 +821,7 @@ class Value(XMLParser):
             self.coded_vocabulary = d.get('codedVocabulary')
             self.coded_vocabulary_term = d.get('codedVocabularyTerm')
             self.quality_control_level = d.get('qualityControlLevel')
+            self.quality_control_level_code = d.get('qualityControlLevelCode')
             self.metadata_time = d.get('metadataTime')
             self.oid = d.get('oid')
         except Exception:
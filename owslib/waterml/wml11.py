@@ -7,7 +7,7 @@ def ns(namespace):
 
 
 class WaterML_1_1(object):
-    def __init__(self, element):
+    def __init__(self, element, columnar=False):
 
         if isinstance(element, ElementType):
             self._root = element
@@ -17,6 +17,7 @@ class WaterML_1_1(object):
         if hasattr(self._root, 'getroot'):
             self._root = self._root.getroot()
 
+        self.columnar = columnar
         self._ns = 'wml1.1'
 
     @property
@@ -25,7 +26,7 @@ class WaterML_1_1(object):
             if self._root.tag == str(ns(self._ns) + 'variablesResponse'):
                 return VariablesResponse(self._root, self._ns)
             elif self._root.tag == str(ns(self._ns) + 'timeSeriesResponse'):
-                return TimeSeriesResponse(self._root, self._ns)
+                return TimeSeriesResponse(self._root, self._ns, self.columnar)
             elif self._root.tag == str(ns(self._ns) + 'sitesResponse'):
                 return SitesResponse(self._root, self._ns)
         except Exception:
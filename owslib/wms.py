@@ -20,7 +20,8 @@ from .util import clean_ows_url, Authentication
 
 
 def WebMapService(url, version='1.1.1', xml=None, username=None, password=None,
-                  parse_remote_metadata=False, timeout=30, headers=None, auth=None):
+                  parse_remote_metadata=False, timeout=30, headers=None, auth=None, session=None,
+                  lazy=False):
 
     '''wms factory function, returns a version specific WebMapService object
 
@@ -35,6 +36,9 @@ def WebMapService(url, version='1.1.1', xml=None, username=None, password=None,
     @param username: service authentication username
     @param password: service authentication password
     @param auth: instance of owslib.util.Authentication
+    @param session: instance of owslib.util.HTTPSession
+    @type lazy: boolean
+    @param lazy: whether to build the metadata of the layers only when they are accessed
     @return: initialized WebFeatureService_2_0_0 object
     '''
     if auth:
@@ -49,10 +53,10 @@ def WebMapService(url, version='1.1.1', xml=None, username=None, password=None,
     if version in ['1.1.1']:
         return wms111.WebMapService_1_1_1(
             clean_url, version=version, xml=xml, parse_remote_metadata=parse_remote_metadata,
-            timeout=timeout, headers=headers, auth=auth)
+            timeout=timeout, headers=headers, auth=auth, session=session, lazy=lazy)
     elif version in ['1.3.0']:
         return wms130.WebMapService_1_3_0(
             clean_url, version=version, xml=xml, parse_remote_metadata=parse_remote_metadata,
-            timeout=timeout, headers=headers, auth=auth)
+            timeout=timeout, headers=headers, auth=auth, session=session, lazy=lazy)
     raise NotImplementedError(
         'The WMS version ({}) you requested is not implemented. Please use 1.1.1 or 1.3.0.'.format(version))
@@ -29,16 +29,41 @@ would be appreciated.
 
 """
 
-from random import randint
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import cycle
+import logging
+import math
+from string import Formatter
+import threading
+import time
 import warnings
 from urllib.parse import (urlencode, urlparse, urlunparse, parse_qs,
-                          ParseResult)
+                          ParseResult, quote_plus)
+
+from requests.exceptions import RequestException
+
+from .arrays import require_numpy
+from .cache import get_default_cache, normalize_url
+from .crs import Crs
 from .etree import etree
-from .util import clean_ows_url, testXMLValue, getXMLInteger, Authentication, openURL, getXMLTree, nspath
+from . import snapshot
+from .tilecache import get_default_tile_cache
+from . import util
+from .util import (clean_ows_url, testXMLValue, getXMLInteger, Authentication, openURL, getXMLTree, nspath,
+                   RateLimiter)
 from .fgdc import Metadata
 from .iso import MD_Metadata
 from .ows import ServiceProvider, ServiceIdentification, OperationsMetadata
 
+LOGGER = logging.getLogger(__name__)
+
+# maximum number of tile request routings (e.g. URL templates per layer and
+# dimension values) kept by a service
+TILEROUTING_CACHE_SIZE = 1024
+
+_tilerouting_lock = threading.Lock()
 
 _OWS_NS = '{http://www.opengis.net/ows/1.1}'
 _WMTS_NS = '{http://www.opengis.net/wmts/1.0}'
@@ -100,6 +125,17 @@ _KEYWORDS_TAG = _OWS_NS + 'Keywords'
 _KEYWORD_TAG = _OWS_NS + 'Keyword'
 _HREF_TAG = _XLINK_NS + 'href'
 
+# Annex E.4, page 111: size of the standardized rendering pixel (in metres)
+_PIXEL_SIZE = 0.28e-3
+# metres per degree, on the equator of the WGS84 ellipsoid
+_METERS_PER_DEGREE = 6378137 * 2 * math.pi / 360
+# geographic CRSs (in degrees) known without pyproj
+_GEOGRAPHIC_CRS = frozenset(['CRS84', 'CRS83', 'CRS27', 4019, 4148, 4167, 4171, 4230, 4258, 4267, 4269, 4283,
+                             4289, 4312, 4314, 4326, 4490, 4612, 4617, 4618, 4674, 4759, 4883, 4937])
+# Annex H, page 126: epsilon added to avoid selecting the tiles which only
+# share an edge with a bounding box
+_EPSILON = 1e-6
+
 
 class ServiceException(Exception):
     """WMTS ServiceException
@@ -137,7 +173,7 @@ class WebMapTileService(object):
 
     def __init__(self, url, version='1.0.0', xml=None, username=None, password=None,
                  parse_remote_metadata=False, vendor_kwargs=None, headers=None, auth=None, cookies=None,
-                 timeout=30):
+                 timeout=30, session=None, tile_cache=None):
         """Initialize.
 
         Parameters
@@ -162,6 +198,13 @@ class WebMapTileService(object):
             Instance of Authentication class to hold username/password/cert/verify
         timeout : int
             number of seconds for GetTile request
+        session : owslib.util.HTTPSession
+            Optional HTTP session to send requests with. Defaults to
+            the shared session returned by owslib.util.get_default_session.
+        tile_cache : owslib.tilecache.TileCache
+            Optional cache of the tiles requested by gettile and gettiles.
+            Defaults to the cache returned by
+            owslib.tilecache.get_default_tile_cache.
 
         """
         self.url = clean_ows_url(url)
@@ -177,10 +220,13 @@ class WebMapTileService(object):
         self.cookies = cookies
         self.auth = auth or Authentication(username, password)
         self.timeout = timeout or 30
+        self.session = session
+        self.tile_cache = tile_cache
 
         # Authentication handled by Reader
         reader = WMTSCapabilitiesReader(
-            self.version, url=self.url, headers=self.headers, auth=self.auth, cookies=self.cookies)
+            self.version, url=self.url, headers=self.headers, auth=self.auth, cookies=self.cookies,
+            session=self.session)
         if xml is not None:  # read from stored xml
             self._capabilities = reader.readString(xml)
         else:  # read from server
@@ -201,7 +247,7 @@ class WebMapTileService(object):
         # TODO: deprecated function. See ticket #453.
         if not self._capabilities:
             reader = WMTSCapabilitiesReader(
-                self.version, url=self.url, headers=self.headers, auth=self.auth)
+                self.version, url=self.url, headers=self.headers, auth=self.auth, session=self.session)
             # xml = reader.read(self.url, self.vendor_kwargs)
             # self._capabilities = ServiceMetadata(xml)
             self._capabilities = reader.read(self.url, self.vendor_kwargs)
@@ -210,6 +256,10 @@ class WebMapTileService(object):
     def _buildMetadata(self, parse_remote_metadata=False):
         ''' set up capabilities metadata objects '''
 
+        # tile request routing and templates, resolved from the metadata
+        # (the least recently used are dropped, see _settilerouting)
+        self._tilerouting = OrderedDict()
+
         self.updateSequence = self._capabilities.attrib.get('updateSequence')
 
         # serviceIdentification metadata
@@ -315,19 +365,8 @@ class WebMapTileService(object):
 
         if (layer is None):
             raise ValueError("layer is mandatory (cannot be None)")
-        if style is None:
-            style = list(self[layer].styles.keys())[0]
-        if format is None:
-            format = self[layer].formats[0]
-        if tilematrixset is None:
-            tilematrixset = sorted(self[layer].tilematrixsetlinks.keys())[0]
-        if tilematrix is None:
-            msg = 'tilematrix (zoom level) is mandatory (cannot be None)'
-            raise ValueError(msg)
-        if row is None:
-            raise ValueError("row is mandatory (cannot be None)")
-        if column is None:
-            raise ValueError("column is mandatory (cannot be None)")
+        style, format, tilematrixset = self._tiledefaults(layer, style, format, tilematrixset)
+        _checktile(tilematrix, row, column)
 
         request = list()
         request.append(('SERVICE', 'WMTS'))
@@ -350,44 +389,49 @@ class WebMapTileService(object):
     def buildTileResource(self, layer=None, style=None, format=None,
                           tilematrixset=None, tilematrix=None, row=None,
                           column=None, **kwargs):
+        """Return the URL of a tile from the ResourceURL templates of its
+        layer, or None if the layer has no tile ResourceURL.
+
+        Parameters are as for `buildTileRequest`.
+        """
 
         # check the validity of the parameters and set reasonable defaults
         if layer is None:
             raise ValueError("layer is mandatory (cannot be None)")
-        if style is None:
-            style = list(self[layer].styles.keys())[0]
-        if tilematrixset is None:
-            tilematrixset = sorted(self[layer].tilematrixsetlinks.keys())[0]
-        if tilematrix is None:
-            msg = 'tilematrix (zoom level) is mandatory (cannot be None)'
-            raise ValueError(msg)
-        if row is None:
-            raise ValueError("row is mandatory (cannot be None)")
-        if column is None:
-            raise ValueError("column is mandatory (cannot be None)")
-
-        tileresourceurls = []
-        for resourceURL in self[layer].resourceURLs:
-            if resourceURL['resourceType'] == 'tile':
-                tileresourceurls.append(resourceURL)
-        numres = len(tileresourceurls)
-        if numres > 0:
-            # choose random ResourceURL if more than one available
-            resindex = randint(0, numres - 1)
-            resurl = tileresourceurls[resindex]['template']
-            return resurl.format(
-                TileMatrixSet=tilematrixset,
-                TileMatrix=tilematrix,
-                TileRow=str(row),
-                TileCol=str(column),
-                Style=style,
-                **kwargs
-            )
-
-        return None
+        _checktile(tilematrix, row, column)
+
+        template = self._tiletemplate(True, layer, style, format, tilematrixset, None, kwargs)
+        if template is None:
+            return None
+        return template.url(tilematrix, row, column)
 
     @property
     def restonly(self):
+        """Whether tiles are requested with the RESTful encoding (from
+        ResourceURL templates) rather than KVP, as declared by the GetTile
+        operation. The decision is made once for the capabilities."""
+        restonly = self._gettilerouting('restonly')
+        if restonly is None:
+            restonly = self._settilerouting('restonly', self._getrestonly())
+        return restonly
+
+    def _gettilerouting(self, key):
+        """Return a tile request routing, or None if it is not resolved"""
+        with _tilerouting_lock:
+            value = self._tilerouting.get(key)
+            if value is not None:
+                self._tilerouting.move_to_end(key)
+        return value
+
+    def _settilerouting(self, key, value):
+        """Keep a tile request routing, up to `TILEROUTING_CACHE_SIZE` of them"""
+        with _tilerouting_lock:
+            self._tilerouting[key] = value
+            while len(self._tilerouting) > TILEROUTING_CACHE_SIZE:
+                self._tilerouting.popitem(last=False)
+        return value
+
+    def _getrestonly(self):
 
         # if OperationsMetadata is missing completely --> use REST
         if len(self.operations) == 0:
@@ -414,6 +458,92 @@ class WebMapTileService(object):
 
         return restenc
 
+    def tiletemplate(self, layer, style=None, format=None, tilematrixset=None,
+                     base_url=None, **kwargs):
+        """Return the compiled URL template of the tiles of a layer.
+
+        The template is resolved once per layer, style, format, tile matrix
+        set and extra parameters, with the RESTful (ResourceURL) or KVP
+        encoding used by `gettile`, and is reused until the capabilities are
+        reloaded.
+
+        Parameters
+        ----------
+        layer : string
+            Content layer name.
+        style, format, tilematrixset : string
+            Optional, as for `buildTileRequest`.
+        base_url : string
+            Optional URL for KVP request submission. Defaults to the URL of
+            the GetTile operation as declared in the GetCapabilities
+            response.
+        **kwargs : extra arguments
+            anything else e.g. vendor specific parameters or dimensions
+
+        Returns
+        -------
+        TileURLTemplate, or None for RESTful services without a tile
+        ResourceURL for the layer.
+        """
+        if layer is None:
+            raise ValueError("layer is mandatory (cannot be None)")
+        vendor_kwargs = dict(self.vendor_kwargs or {})
+        vendor_kwargs.update(kwargs)
+        return self._tiletemplate(self.restonly, layer, style, format, tilematrixset, base_url, vendor_kwargs)
+
+    def _tiledefaults(self, layer, style, format, tilematrixset):
+        """Return the style, format and tile matrix set of tile requests,
+        defaulting to the first ones of the layer"""
+        if style is None or format is None or tilematrixset is None:
+            key = ('defaults', layer)
+            defaults = self._gettilerouting(key)
+            if defaults is None:
+                content = self[layer]
+                defaults = self._settilerouting(key, (
+                    next(iter(content.styles), None),
+                    content.formats[0] if content.formats else None,
+                    min(content.tilematrixsetlinks) if content.tilematrixsetlinks else None))
+            style = defaults[0] if style is None else style
+            format = defaults[1] if format is None else format
+            tilematrixset = defaults[2] if tilematrixset is None else tilematrixset
+        return style, format, tilematrixset
+
+    def _tiletemplate(self, rest, layer, style, format, tilematrixset, base_url, kwargs):
+        style, format, tilematrixset = self._tiledefaults(layer, style, format, tilematrixset)
+        try:
+            key = ('template', rest, layer, style, format, tilematrixset, base_url,
+                   tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:  # unhashable parameter values are not cached
+            key = None
+        template = None if key is None else self._gettilerouting(key)
+        if template is not None:
+            return template
+
+        if rest:
+            resources = [r for r in self[layer].resourceURLs if r['resourceType'] == 'tile']
+            # prefer the templates of the requested format
+            resources = [r for r in resources if r['format'] == format] or resources
+            if not resources:
+                return None
+            values = dict(kwargs, TileMatrixSet=tilematrixset, Style=style)
+            template = TileURLTemplate([_compile_resource_template(r['template'], values) for r in resources])
+        else:
+            if base_url is None:
+                base_url = self._gettile_url()
+            query = urlparse(base_url).query
+            base_url += '&' if query else '' if base_url.endswith('?') else '?'
+            head = urlencode([('SERVICE', 'WMTS'), ('REQUEST', 'GetTile'), ('VERSION', '1.0.0'),
+                              ('LAYER', layer), ('STYLE', style), ('TILEMATRIXSET', tilematrixset)], True)
+            tail = urlencode([('FORMAT', format)] + list(kwargs.items()), True)
+            kvp = '%s&TILEMATRIX={0}&TILEROW={1}&TILECOL={2}&%s' % (_escape_braces(base_url + head),
+                                                                    _escape_braces(tail))
+            template = TileURLTemplate([kvp], quote=True)
+
+        if key is not None:
+            self._settilerouting(key, template)
+        return template
+
     def gettile(self, base_url=None, layer=None, style=None, format=None,
                 tilematrixset=None, tilematrix=None, row=None, column=None,
                 **kwargs):
@@ -449,56 +579,204 @@ class WebMapTileService(object):
         **kwargs : extra arguments
             anything else e.g. vendor specific parameters
         """
-        vendor_kwargs = self.vendor_kwargs or {}
-        vendor_kwargs.update(kwargs)
-
-        # REST only WMTS
-        if self.restonly:
-            resurl = self.buildTileResource(
-                layer, style, format, tilematrixset, tilematrix,
-                row, column, **vendor_kwargs)
-            u = openURL(resurl, headers=self.headers, cookies=self.cookies, auth=self.auth, timeout=self.timeout)
-            return u
-
-        # KVP implemetation
-        data = self.buildTileRequest(layer, style, format, tilematrixset,
-                                     tilematrix, row, column, **vendor_kwargs)
-
-        if base_url is None:
-            base_url = self.url
-            try:
-                methods = self.getOperationByName('GetTile').methods
-                get_verbs = [x for x in methods
-                             if x.get('type').lower() == 'get']
-                if len(get_verbs) > 1:
-                    # Filter by constraints
-                    base_url = next(
-                        x for x in filter(
-                            list,
-                            ([pv.get('url')
-                                for const in pv.get('constraints')
-                                if 'kvp' in [x.lower() for x in const.values]]
-                             for pv in get_verbs if pv.get('constraints'))))[0]
-                elif len(get_verbs) == 1:
-                    base_url = get_verbs[0].get('url')
-            except StopIteration:
-                pass
-        u = openURL(base_url, data, headers=self.headers, cookies=self.cookies, auth=self.auth, timeout=self.timeout)
+        _checktile(tilematrix, row, column)
+        url = self._tileurlfunc(layer, style, format, tilematrixset, base_url, kwargs)(tilematrix, row, column)
+        u = self._opentile(url, layer, style, format, tilematrixset, tilematrix, row, column, kwargs)
 
         # check for service exceptions, and return
-        if u.info()['Content-Type'] == 'application/vnd.ogc.se_xml':
-            se_xml = u.read()
-            se_tree = etree.fromstring(se_xml)
-            err_message = str(se_tree.find('ServiceException').text)
-            raise ServiceException(err_message.strip(), se_xml)
+        _check_service_exception(u)
         return u
 
+    def _opentile(self, url, layer, style, format, tilematrixset, tilematrix, row, column, kwargs):
+        """Request a tile, through the tile cache if any"""
+        tile_cache = self.tile_cache or get_default_tile_cache()
+        if tile_cache is None:
+            return openURL(url, headers=self.headers, cookies=self.cookies, auth=self.auth, timeout=self.timeout,
+                           session=self.session)
+        style, format, tilematrixset = self._tiledefaults(layer, style, format, tilematrixset)
+        dimensions = dict(self.vendor_kwargs or {})
+        dimensions.update(kwargs)
+        key = tile_cache.key(layer, style, format, tilematrixset, tilematrix, row, column, dimensions,
+                             service=normalize_url(self.url) if self.url else None)
+        return tile_cache.open(key, url, headers=self.headers, cookies=self.cookies, auth=self.auth,
+                               timeout=self.timeout, session=self.session)
+
+    def _tileurlfunc(self, layer, style, format, tilematrixset, base_url, kwargs):
+        """Return the function rendering the URLs of tiles"""
+        template = self.tiletemplate(layer, style, format, tilematrixset, base_url, **kwargs)
+        if template is None:
+            raise ValueError('No tile ResourceURL for layer %s' % layer)
+        return template.url
+
+    def _gettile_url(self):
+        """Return the URL of KVP GetTile requests"""
+        base_url = self._gettilerouting('gettile_url')
+        if base_url is not None:
+            return base_url
+        base_url = self.url
+        try:
+            methods = self.getOperationByName('GetTile').methods
+            get_verbs = [x for x in methods
+                         if x.get('type').lower() == 'get']
+            if len(get_verbs) > 1:
+                # Filter by constraints
+                base_url = next(
+                    x for x in filter(
+                        list,
+                        ([pv.get('url')
+                            for const in pv.get('constraints')
+                            if 'kvp' in [x.lower() for x in const.values]]
+                         for pv in get_verbs if pv.get('constraints'))))[0]
+            elif len(get_verbs) == 1:
+                base_url = get_verbs[0].get('url')
+        except StopIteration:
+            pass
+        return self._settilerouting('gettile_url', base_url)
+
+    def gettiles(self, layer, tilematrixset, tilematrix, tiles, style=None,
+                 format=None, base_url=None, max_workers=8, retries=2,
+                 backoff=1, rate=None, **kwargs):
+        """Fetch many tiles of a tile matrix concurrently.
+
+        The tile URL template (or the GetTile endpoint and the KVP
+        parameters) is resolved once, and the tiles are then requested by a
+        bounded pool of threads sharing the HTTP session of the service.
+        For best results, the session should keep at least `max_workers`
+        connections per host alive (see owslib.util.HTTPSession).
+
+        Parameters
+        ----------
+        layer : string
+            Content layer name.
+        tilematrixset : string
+            Name of tile matrix set to use.
+        tilematrix : string
+            Name of the tile matrix to use.
+        tiles : iterable
+            (row, column) indices of the tiles to request. It is consumed
+            lazily, so may be a generator of any number of tiles.
+        style : string
+            Optional style name. Defaults to the first style defined for
+            the layer in the GetCapabilities response.
+        format : string
+            Optional output image format, such as 'image/jpeg'.
+            Defaults to the first format defined for the layer in the
+            GetCapabilities response.
+        base_url : string
+            Optional URL for KVP request submission. Defaults to the URL of
+            the GetTile operation as declared in the GetCapabilities
+            response.
+        max_workers : int
+            Maximum number of concurrent requests.
+        retries : int
+            Number of times a failed tile request is repeated.
+        backoff : float
+            Delay (in seconds) before the first repetition of a failed tile
+            request, doubled for each subsequent one.
+        rate : float
+            Optional maximum number of requests sent per second, retries
+            included.
+        **kwargs : extra arguments
+            anything else e.g. vendor specific parameters
+
+        Yields
+        ------
+        (row, column, bytes) tuples, in order of completion
+        """
+        tileurl = self._tileurlfunc(layer, style, format, tilematrixset, base_url, kwargs)
+        limiter = RateLimiter(rate) if rate else None
+
+        def gettile(row, col):
+            url = tileurl(tilematrix, row, col)
+            for attempt in range(retries + 1):
+                if limiter is not None:
+                    limiter.wait()
+                try:
+                    u = self._opentile(url, layer, style, format, tilematrixset, tilematrix, row, col, kwargs)
+                    _check_service_exception(u)
+                    return row, col, u.read()
+                except (RequestException, ServiceException, util.ServiceException) as err:
+                    if attempt == retries:
+                        raise
+                    LOGGER.warning("Request of tile %s/%s/%s failed (%s), retrying" % (tilematrix, row, col, err))
+                    time.sleep(backoff * 2 ** attempt)
+
+        tiles = iter(tiles)
+        pending = set()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            while True:
+                # keep the number of tiles held in memory bounded
+                while len(pending) < 2 * max_workers:
+                    tile = next(tiles, None)
+                    if tile is None:
+                        break
+                    pending.add(executor.submit(gettile, *tile))
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def getServiceXML(self):
         xml = None
         if self._capabilities is not None:
             xml = etree.tostring(self._capabilities)
         return xml
 
+    def to_snapshot(self):
+        """Return a compact snapshot of the service metadata
+
+        The snapshot holds the layers, styles, tile matrix sets, operations
+        and other metadata objects, see :mod:`owslib.snapshot`.
+
+        Returns
+        -------
+        bytes
+        """
+        return snapshot.dumps(self)
+
+    @classmethod
+    def from_snapshot(cls, data, headers=None, cookies=None, auth=None, session=None, tile_cache=None):
+        """Restore a service from its snapshot, without requesting or
+        parsing its capabilities document
+
+        Parameters
+        ----------
+        data : bytes
+            Snapshot returned by `to_snapshot`.
+        headers : dict
+            Optional HTTP headers to send with requests.
+        cookies : dict
+            Optional cookies to send with requests.
+        auth : owslib.util.Authentication
+            Optional instance of Authentication class to hold
+            username/password/cert/verify.
+        session : owslib.util.HTTPSession
+            Optional HTTP session to send requests with.
+        tile_cache : owslib.tilecache.TileCache
+            Optional cache of the tiles requested by gettile and gettiles.
+
+        Raises
+        ------
+        owslib.snapshot.SnapshotError
+            If the snapshot is invalid, or was taken by another version of
+            OWSLib.
+        """
+        return snapshot.loads(data, cls, headers=headers, cookies=cookies,
+                              auth=auth or Authentication(), session=session, tile_cache=tile_cache)
+
+    def __getstate__(self):
+        # compiled templates are not part of snapshots, and rebuilt on use
+        state = dict(vars(self))
+        state['_tilerouting'] = OrderedDict()
+        return state
+
     def getfeatureinfo(self):
         raise NotImplementedError
 
@@ -510,8 +788,150 @@ class WebMapTileService(object):
         raise KeyError("No operation named %s" % name)
 
 
+class TileURLTemplate(object):
+    """Compiled URL template of the tiles of a layer, see
+    `WebMapTileService.tiletemplate`.
+
+    The style, format, tile matrix set and extra parameters are substituted
+    when the template is compiled, so that rendering the URL of a tile
+    only formats the tile matrix and indices in place.
+    """
+
+    def __init__(self, templates, quote=False):
+        """
+        Parameters
+        ----------
+        templates : list
+            str.format templates of the tile URLs, with the tile matrix,
+            row and column as positional fields 0, 1 and 2. Rendered URLs
+            cycle through the templates when there are several of them
+            (e.g. mirrors of a service).
+        quote : bool
+            Whether the tile matrix is URL-encoded in rendered URLs.
+        """
+        self.templates = list(templates)
+        self.quote = quote
+        if len(self.templates) == 1:
+            self._format = self.templates[0].format
+        else:
+            self._format = None
+            self._formats = cycle([t.format for t in self.templates])
+
+    def url(self, tilematrix, row, column):
+        """Return the URL of a tile
+
+        Parameters
+        ----------
+        tilematrix : string
+            Name of the tile matrix.
+        row : integer
+            Row index of the tile.
+        column : integer
+            Column index of the tile.
+        """
+        if self.quote:
+            tilematrix = _quote(tilematrix)
+        if self._format is not None:
+            return self._format(tilematrix, row, column)
+        return next(self._formats)(tilematrix, row, column)
+
+    def __repr__(self):
+        return '<TileURLTemplate %r>' % (self.templates[0],)
+
+
+# position of the tile fields in compiled templates
+_TILE_FIELDS = {'tilematrix': '0', 'tilerow': '1', 'tilecol': '2'}
+
+
+@lru_cache(maxsize=1024)
+def _quote(value):
+    return quote_plus(str(value))
+
+
+def _escape_braces(text):
+    return text.replace('{', '{{').replace('}', '}}')
+
+
+def _compile_resource_template(template, values):
+    """Compile a ResourceURL template into a str.format template of the
+    tile matrix, row and column, given the values of the other fields.
+
+    Template variables are matched without regard to case, as servers
+    differ in the case of the variable names.
+    """
+    values = {k.lower(): v for k, v in values.items()}
+    parts = []
+    for literal, field, spec, conversion in Formatter().parse(template):
+        parts.append(_escape_braces(literal))
+        if field is None:
+            continue
+        key = field.lower()
+        if key in _TILE_FIELDS:
+            parts.append('{%s%s%s}' % (_TILE_FIELDS[key], '!' + conversion if conversion else '',
+                                       ':' + spec if spec else ''))
+        elif key in values:
+            parts.append(_escape_braces(('{0%s%s}' % ('!' + conversion if conversion else '',
+                                                      ':' + spec if spec else '')).format(values[key])))
+        else:
+            raise KeyError(field)
+    return ''.join(parts)
+
+
+def _checktile(tilematrix, row, column):
+    if tilematrix is None:
+        msg = 'tilematrix (zoom level) is mandatory (cannot be None)'
+        raise ValueError(msg)
+    if row is None:
+        raise ValueError("row is mandatory (cannot be None)")
+    if column is None:
+        raise ValueError("column is mandatory (cannot be None)")
+
+
+def _check_service_exception(u):
+    """Raise the service exception returned instead of a tile, if any"""
+    if u.info().get('Content-Type') == 'application/vnd.ogc.se_xml':
+        se_xml = u.read()
+        se_tree = etree.fromstring(se_xml)
+        err_message = str(se_tree.find('ServiceException').text)
+        raise ServiceException(err_message.strip(), se_xml)
+
+
+def _numpy():
+    """Return numpy, as required by the tile grid methods"""
+    return require_numpy('The WMTS tile grid methods')
+
+
+def _meters_per_unit(crs):
+    """Return the number of metres per unit of a CRS"""
+    try:  # pyproj is only needed to read the units of CRSs
+        import pyproj
+    except ImportError:
+        pyproj = None
+    if pyproj is not None:
+        try:
+            definition = pyproj.CRS.from_user_input(crs)
+        except pyproj.exceptions.CRSError as err:
+            LOGGER.debug('Unknown CRS %s (%s)' % (crs, err))
+        else:
+            if definition.is_geographic:
+                return _METERS_PER_DEGREE
+            if definition.axis_info and definition.axis_info[0].unit_conversion_factor:
+                return definition.axis_info[0].unit_conversion_factor
+    return _METERS_PER_DEGREE if Crs(crs).code in _GEOGRAPHIC_CRS else 1.0
+
+
 class TileMatrixSet(object):
-    '''Holds one TileMatrixSet'''
+    '''Holds one TileMatrixSet
+
+    Besides the tile matrices, it provides the tile grid methods computing,
+    for whole arrays at once, the tiles covering bounding boxes, the bounds of
+    tiles, and the transformations between map and pixel coordinates.
+    These methods require numpy.
+
+    Map coordinates are given and returned in (x, y) order, i.e. easting
+    (or longitude) first, whatever the axis order of the CRS of the tile
+    matrix set.
+    '''
     def __init__(self, elem):
         if elem.tag != _TILE_MATRIX_SET_TAG:
             raise ValueError('%s should be a TileMatrixSet' % (elem,))
@@ -519,6 +939,7 @@ class TileMatrixSet(object):
         self.crs = testXMLValue(elem.find(_SUPPORTED_CRS_TAG)).strip()
         if self.crs is None or self.identifier is None:
             raise ValueError('%s incomplete TileMatrixSet' % (elem,))
+        self._metersperunit = None
         self.tilematrix = {}
         for tilematrix in elem.findall(_TILE_MATRIX_TAG):
             tm = TileMatrix(tilematrix)
@@ -529,6 +950,197 @@ class TileMatrixSet(object):
                     warnings.warn(msg, RuntimeWarning)
                 self.tilematrix[tm.identifier] = tm
 
+    @property
+    def metersperunit(self):
+        """Number of metres per unit of the CRS of the tile matrix set
+
+        The units are read from the definition of the CRS if pyproj is
+        installed.  Otherwise, CRS84 and the most common geographic CRSs are
+        known to be in degrees, and other CRSs are assumed to be in metres:
+        it may then be set for the CRSs in other units.
+        """
+        if self._metersperunit is None:
+            self._metersperunit = _meters_per_unit(self.crs)
+        return self._metersperunit
+
+    @metersperunit.setter
+    def metersperunit(self, value):
+        self._metersperunit = value
+
+    def _grid(self, tilematrices):
+        """Return the parameters of tile matrices as arrays
+
+        Returns
+        -------
+        tuple
+            Arrays of the tile matrices' top left corner x and y, tile span
+            (in CRS units) along x and y, and matrix width and height.
+        """
+        np = _numpy()
+        tilematrices = [self.tilematrix[tm] if isinstance(tm, str) else tm for tm in tilematrices]
+        corners = np.array([tm.topleftcorner for tm in tilematrices], dtype=float).reshape(-1, 2)
+        if Crs(self.crs).axisorder == 'yx':
+            corners = corners[:, ::-1]
+        pixelspan = np.array([tm.scaledenominator for tm in tilematrices], dtype=float) * _PIXEL_SIZE
+        pixelspan /= self.metersperunit
+        return (
+            corners[:, 0],
+            corners[:, 1],
+            pixelspan * np.array([tm.tilewidth for tm in tilematrices]),
+            pixelspan * np.array([tm.tileheight for tm in tilematrices]),
+            np.array([tm.matrixwidth for tm in tilematrices], dtype=np.int64),
+            np.array([tm.matrixheight for tm in tilematrices], dtype=np.int64),
+        )
+
+    def pixelspan(self, tilematrix):
+        """Return the size of a pixel of a tile matrix, in CRS units"""
+        if isinstance(tilematrix, str):
+            tilematrix = self.tilematrix[tilematrix]
+        return tilematrix.scaledenominator * _PIXEL_SIZE / self.metersperunit
+
+    def tile_ranges(self, bbox, tilematrices=None, limits=None):
+        """Return the ranges of the tiles covering bounding boxes
+
+        The ranges are computed for all the tile matrices at once, and are
+        clipped to the tile matrices and to their limits.
+
+        Parameters
+        ----------
+        bbox : array_like
+            Bounding box ``(minx, miny, maxx, maxy)``, or array of shape
+            ``(N, 4)`` of bounding boxes.
+        tilematrices : list
+            Optional identifiers of the tile matrices (all of them by
+            default).
+        limits : TileMatrixSetLink or dict
+            Optional tile matrix set link of a layer, or its
+            ``tilematrixlimits``, to which the ranges are clipped.
+
+        Returns
+        -------
+        dict
+            Array of ``[mincol, maxcol, minrow, maxrow]`` (of shape ``(4,)``
+            or ``(N, 4)``) by tile matrix identifier. A range is empty when
+            its min is greater than its max.
+        """
+        if tilematrices is None:
+            tilematrices = list(self.tilematrix)
+        x0, y0, spanx, spany, width, height = self._grid(tilematrices)
+        np = _numpy()
+        bbox = np.asarray(bbox, dtype=float)
+        boxes = bbox.reshape(-1, 1, 4)
+
+        ranges = np.empty((boxes.shape[0], len(tilematrices), 4), dtype=np.int64)
+        ranges[..., 0] = np.floor((boxes[..., 0] - x0) / spanx + _EPSILON)
+        ranges[..., 1] = np.floor((boxes[..., 2] - x0) / spanx - _EPSILON)
+        ranges[..., 2] = np.floor((y0 - boxes[..., 3]) / spany + _EPSILON)
+        ranges[..., 3] = np.floor((y0 - boxes[..., 1]) / spany - _EPSILON)
+
+        lower = np.zeros((len(tilematrices), 4), dtype=np.int64)
+        upper = np.stack([width - 1, width - 1, height - 1, height - 1], axis=1)
+        limits = _tilematrixlimits(limits)
+        for i, tilematrix in enumerate(tilematrices):
+            tml = limits.get(tilematrix if isinstance(tilematrix, str) else tilematrix.identifier)
+            if tml is not None:
+                lower[i, 0:2] = np.maximum(lower[i, 0:2], tml.mintilecol)
+                upper[i, 0:2] = np.minimum(upper[i, 0:2], tml.maxtilecol)
+                lower[i, 2:4] = np.maximum(lower[i, 2:4], tml.mintilerow)
+                upper[i, 2:4] = np.minimum(upper[i, 2:4], tml.maxtilerow)
+        ranges[..., 0::2] = np.maximum(ranges[..., 0::2], lower[:, 0::2])
+        ranges[..., 1::2] = np.minimum(ranges[..., 1::2], upper[:, 1::2])
+
+        result = {}
+        for i, tilematrix in enumerate(tilematrices):
+            identifier = tilematrix if isinstance(tilematrix, str) else tilematrix.identifier
+            result[identifier] = ranges[:, i, :] if bbox.ndim > 1 else ranges[0, i, :]
+        return result
+
+    def tiles(self, bbox, tilematrix, limits=None):
+        """Return the tiles of a tile matrix covering a bounding box
+
+        Parameters
+        ----------
+        bbox : array_like
+            Bounding box ``(minx, miny, maxx, maxy)``.
+        tilematrix : str
+            Identifier of the tile matrix.
+        limits : TileMatrixSetLink or dict
+            Optional tile matrix set link of a layer, or its
+            ``tilematrixlimits``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(N, 2)`` of the ``(row, col)`` of the tiles,
+            row by row.
+        """
+        mincol, maxcol, minrow, maxrow = self.tile_ranges(bbox, [tilematrix], limits)[tilematrix]
+        np = _numpy()
+        rows, cols = np.mgrid[minrow:maxrow + 1, mincol:maxcol + 1]
+        return np.stack([rows.ravel(), cols.ravel()], axis=1)
+
+    def tile_bounds(self, tilematrix, rows, cols):
+        """Return the bounding boxes of tiles
+
+        Parameters
+        ----------
+        tilematrix : str
+            Identifier of the tile matrix.
+        rows, cols : array_like
+            Rows and columns of the tiles.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of ``(minx, miny, maxx, maxy)`` bounding boxes, of shape
+            ``rows.shape + (4,)``.
+        """
+        np = _numpy()
+        x0, y0, spanx, spany, _, _ = self._grid([tilematrix])
+        rows, cols = np.broadcast_arrays(np.asarray(rows, dtype=float), np.asarray(cols, dtype=float))
+        minx = x0[0] + cols * spanx[0]
+        maxy = y0[0] - rows * spany[0]
+        return np.stack([minx, maxy - spany[0], minx + spanx[0], maxy], axis=-1)
+
+    def map_to_pixel(self, tilematrix, x, y):
+        """Transform map coordinates into pixel coordinates of a tile matrix
+
+        Pixel coordinates are relative to the top left corner of the tile
+        matrix, so that the tile of a pixel is ``(py // tileheight,
+        px // tilewidth)``.
+
+        Returns
+        -------
+        tuple
+            Arrays of the pixel coordinates ``(px, py)``.
+        """
+        np = _numpy()
+        x0, y0, _, _, _, _ = self._grid([tilematrix])
+        span = self.pixelspan(tilematrix)
+        return (np.asarray(x, dtype=float) - x0[0]) / span, (y0[0] - np.asarray(y, dtype=float)) / span
+
+    def pixel_to_map(self, tilematrix, px, py):
+        """Transform pixel coordinates of a tile matrix into map coordinates
+
+        Returns
+        -------
+        tuple
+            Arrays of the map coordinates ``(x, y)``.
+        """
+        np = _numpy()
+        x0, y0, _, _, _, _ = self._grid([tilematrix])
+        span = self.pixelspan(tilematrix)
+        return x0[0] + np.asarray(px, dtype=float) * span, y0[0] - np.asarray(py, dtype=float) * span
+
+
+def _tilematrixlimits(limits):
+    """Return the tile matrix limits of a TileMatrixSetLink (or dict)"""
+    if limits is None:
+        return {}
+    if isinstance(limits, TileMatrixSetLink):
+        return limits.tilematrixlimits
+    return limits
+
 
 class TileMatrix(object):
     '''Holds one TileMatrix'''
@@ -670,6 +1282,30 @@ class TileMatrixSetLink(object):
         else:
             self.tilematrixlimits = tilematrixlimits
 
+    def contains(self, tilematrix, rows, cols):
+        """Return whether tiles are within the limits of a tile matrix
+
+        Parameters
+        ----------
+        tilematrix : str
+            Identifier of the tile matrix.
+        rows, cols : array_like
+            Rows and columns of the tiles.
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array, ``True`` for the tiles within the limits (all of
+            them if the tile matrix has no limits). Requires numpy.
+        """
+        np = _numpy()
+        rows, cols = np.broadcast_arrays(np.asarray(rows), np.asarray(cols))
+        tml = self.tilematrixlimits.get(tilematrix)
+        if tml is None:
+            return np.ones(rows.shape, dtype=bool)
+        return (rows >= tml.mintilerow) & (rows <= tml.maxtilerow) & \
+            (cols >= tml.mintilecol) & (cols <= tml.maxtilecol)
+
     def __repr__(self):
         fmt = ('<TileMatrixSetLink: {self.tilematrixset}'
                ', tilematrixlimits={{...}}>')
@@ -888,7 +1524,8 @@ class WMTSCapabilitiesReader:
     """Read and parse capabilities document into a lxml.etree infoset
     """
 
-    def __init__(self, version='1.0.0', url=None, un=None, pw=None, headers=None, auth=None, cookies=None):
+    def __init__(self, version='1.0.0', url=None, un=None, pw=None, headers=None, auth=None, cookies=None,
+                 session=None, cache=None):
         """Initialize"""
         self.version = version
         self._infoset = None
@@ -901,6 +1538,8 @@ class WMTSCapabilitiesReader:
         self.auth = auth or Authentication(un, pw)
         self.headers = headers
         self.cookies = cookies
+        self.session = session
+        self.cache = cache
 
     def capabilities_url(self, service_url, vendor_kwargs=None):
         """Return a capabilities url
@@ -935,7 +1574,13 @@ class WMTSCapabilitiesReader:
 
         # now split it up again to use the generic openURL function...
         spliturl = getcaprequest.split('?')
-        u = openURL(spliturl[0], spliturl[1], method='Get', cookies=self.cookies, headers=self.headers, auth=self.auth)
+        cache = self.cache or get_default_cache()
+        if cache is not None:
+            u = cache.open(spliturl[0], spliturl[1], version=self.version, cookies=self.cookies, headers=self.headers,
+                           auth=self.auth, session=self.session)
+        else:
+            u = openURL(spliturl[0], spliturl[1], method='Get', cookies=self.cookies, headers=self.headers,
+                        auth=self.auth, session=self.session)
         return getXMLTree(u)
 
     def readString(self, st):
@@ -108,6 +108,7 @@ Also, the directory tests/ contains several examples of well-formed "Execute" re
 
 import logging
 
+from owslib.cache import get_default_cache
 from owslib.etree import etree
 from owslib.ows import DEFAULT_OWS_NAMESPACE, XLINK_NAMESPACE
 from owslib.ows import ServiceIdentification, ServiceProvider, OperationsMetadata, BoundingBox
@@ -229,13 +230,14 @@ class WebProcessingService(object):
     """
 
     def __init__(self, url, version=WPS_DEFAULT_VERSION, username=None, password=None, skip_caps=False,
-                 headers=None, verify=None, cert=None, timeout=None, auth=None, language=None):
+                 headers=None, verify=None, cert=None, timeout=None, auth=None, language=None, session=None):
         """
         Initialization method resets the object status.
         By default it will execute a GetCapabilities invocation to the remote service,
         which can be skipped by using skip_caps=True.
 
         Parameters username, password, verify and cert are deprecated. Please use auth parameter.
+        The optional session (owslib.util.HTTPSession) defaults to the shared session.
         """
         self.auth = auth or Authentication()
         _fix_auth(self.auth, username, password, verify, cert)
@@ -246,6 +248,7 @@ class WebProcessingService(object):
         self.headers = headers
         self.timeout = timeout
         self.language = language
+        self.session = session
 
         # fields populated by method invocations
         self._capabilities = None
@@ -270,6 +273,7 @@ class WebProcessingService(object):
             auth=self.auth,
             language=self.language,
             timeout=self.timeout,
+            session=self.session,
         )
         if xml:
             # read from stored XML file
@@ -297,6 +301,7 @@ class WebProcessingService(object):
             auth=self.auth,
             language=self.language,
             timeout=self.timeout,
+            session=self.session,
         )
         if xml:
             # read from stored XML file
@@ -348,6 +353,7 @@ class WebProcessingService(object):
             timeout=self.timeout,
             auth=self.auth,
             language=self.language,
+            session=self.session,
         )
 
         # build XML request from parameters
@@ -478,18 +484,23 @@ class WPSReader(object):
     Superclass for reading a WPS document into a lxml.etree infoset.
     """
 
-    def __init__(self, version=WPS_DEFAULT_VERSION, timeout=30, auth=None, language=None):
+    def __init__(self, version=WPS_DEFAULT_VERSION, timeout=30, auth=None, language=None, session=None,
+                 cache=None):
         self.version = version
         self.timeout = timeout
         self.auth = auth or Authentication()
         self.language = language
+        self.session = session
+        self.cache = cache
 
     def _readFromUrl(self, url, data, timeout, method='Get', username=None, password=None,
-                     headers=None, verify=True, cert=None):
+                     headers=None, verify=True, cert=None, capabilities=False):
         """
         Method to get and parse a WPS document, returning an elementtree instance.
         :param str url: WPS service base url.
         :param {} data: GET: dictionary of HTTP (key, value) parameter pairs, POST: XML document to post
+        :param bool capabilities: whether the document is a capabilities document, read through the
+                                  capabilities cache
         """
         _fix_auth(self.auth, username, password, verify, cert)
         if method == 'Get':
@@ -501,15 +512,24 @@ class WPSReader(object):
 
             # split URL into base url and query string to use utility function
             spliturl = request_url.split('?')
-            u = openURL(spliturl[0], spliturl[
-                        1], method='Get', username=self.auth.username, password=self.auth.password,
-                        headers=headers, verify=self.auth.verify, cert=self.auth.cert, timeout=self.timeout)
+            cache = (self.cache or get_default_cache()) if capabilities else None
+            if cache is not None:
+                u = cache.open(spliturl[0], spliturl[1], version=self.version,
+                               username=self.auth.username, password=self.auth.password,
+                               headers=headers, verify=self.auth.verify, cert=self.auth.cert,
+                               timeout=self.timeout, session=self.session)
+            else:
+                u = openURL(spliturl[0], spliturl[
+                            1], method='Get', username=self.auth.username, password=self.auth.password,
+                            headers=headers, verify=self.auth.verify, cert=self.auth.cert, timeout=self.timeout,
+                            session=self.session)
             return etree.fromstring(u.read())
 
         elif method == 'Post':
             u = openURL(url, data, method='Post',
                         username=self.auth.username, password=self.auth.password,
-                        headers=headers, verify=self.auth.verify, cert=self.auth.cert, timeout=timeout)
+                        headers=headers, verify=self.auth.verify, cert=self.auth.cert, timeout=timeout,
+                        session=self.session)
             return etree.fromstring(u.read())
 
         else:
@@ -532,10 +552,11 @@ class WPSCapabilitiesReader(WPSReader):
     Utility class that reads and parses a WPS GetCapabilities document into a lxml.etree infoset.
     """
 
-    def __init__(self, version=WPS_DEFAULT_VERSION, timeout=None, auth=None, language=None):
+    def __init__(self, version=WPS_DEFAULT_VERSION, timeout=None, auth=None, language=None, session=None,
+                 cache=None):
         # superclass initializer
         super(WPSCapabilitiesReader, self).__init__(
-            version=version, timeout=timeout, auth=auth, language=language)
+            version=version, timeout=timeout, auth=auth, language=language, session=session, cache=cache)
 
     def readFromUrl(self, url, username=None, password=None,
                     headers=None, verify=None, cert=None):
@@ -549,7 +570,7 @@ class WPSCapabilitiesReader(WPSReader):
                                      'GetCapabilities', 'version': self.version},
                                  self.timeout,
                                  username=username, password=password,
-                                 headers=headers, verify=verify, cert=cert)
+                                 headers=headers, verify=verify, cert=cert, capabilities=True)
 
 
 class WPSDescribeProcessReader(WPSReader):
@@ -558,10 +579,10 @@ class WPSDescribeProcessReader(WPSReader):
     Class that reads and parses a WPS DescribeProcess document into a etree infoset
     """
 
-    def __init__(self, version=WPS_DEFAULT_VERSION, timeout=None, auth=None, language=None):
+    def __init__(self, version=WPS_DEFAULT_VERSION, timeout=None, auth=None, language=None, session=None):
         # superclass initializer
         super(WPSDescribeProcessReader, self).__init__(
-            version=version, timeout=timeout, auth=auth, language=language)
+            version=version, timeout=timeout, auth=auth, language=language, session=session)
 
     def readFromUrl(self, url, identifier, username=None, password=None,
                     headers=None, verify=None, cert=None):
@@ -585,9 +606,9 @@ class WPSExecuteReader(WPSReader):
     Class that reads and parses a WPS Execute response document into a etree infoset
     """
 
-    def __init__(self, timeout=None, auth=None, language=None):
+    def __init__(self, timeout=None, auth=None, language=None, session=None):
         # superclass initializer
-        super(WPSExecuteReader, self).__init__(timeout=timeout, auth=auth, language=language)
+        super(WPSExecuteReader, self).__init__(timeout=timeout, auth=auth, language=language, session=session)
 
     def readFromUrl(self, url, data={}, method='Get', username=None, password=None,
                     headers=None, verify=None, cert=None):
@@ -607,7 +628,7 @@ class WPSExecution(object):
     """
 
     def __init__(self, version=WPS_DEFAULT_VERSION, url=None, username=None, password=None,
-                 headers=None, verify=None, cert=None, timeout=None, auth=None, language=None):
+                 headers=None, verify=None, cert=None, timeout=None, auth=None, language=None, session=None):
 
         # initialize fields
         self.url = url
@@ -617,6 +638,7 @@ class WPSExecution(object):
         _fix_auth(self.auth, username, password, verify, cert)
         self.timeout = timeout
         self.language = language
+        self.session = session
 
         # request document
         self.request = None
@@ -796,7 +818,8 @@ class WPSExecution(object):
         reader = WPSExecuteReader(
             auth=self.auth,
             language=self.language,
-            timeout=self.timeout
+            timeout=self.timeout,
+            session=self.session
         )
         if response is None:
             # override status location
@@ -889,7 +912,7 @@ class WPSExecution(object):
                 if output.reference:
                     content = output.retrieveData(
                         self.auth.username, self.auth.password,
-                        headers=self.headers, verify=self.auth.verify, cert=self.auth.cert)
+                        headers=self.headers, verify=self.auth.verify, cert=self.auth.cert, session=self.session)
                     if filepath is None:
                         filepath = output.fileName
                 # ExecuteResponse contain embedded output
@@ -921,6 +944,7 @@ class WPSExecution(object):
             auth=self.auth,
             language=self.language,
             timeout=self.timeout,
+            session=self.session,
         )
         response = reader.readFromUrl(
             self.url, request, method='Post', headers=self.headers)
@@ -1425,13 +1449,14 @@ class Output(InputOutput):
                 if bbox:
                     self.data.append(bbox)
 
-    def retrieveData(self, username=None, password=None, headers=None, verify=True, cert=None):
+    def retrieveData(self, username=None, password=None, headers=None, verify=True, cert=None, session=None):
         """
         Method to retrieve data from server-side reference:
         returns "" if the reference is not known.
 
         :param username: credentials to access the remote WPS server
         :param password: credentials to access the remote WPS server
+        :param session: optional owslib.util.HTTPSession, defaults to the shared session
         """
         url = self.reference
         if url is None:
@@ -1461,16 +1486,16 @@ class Output(InputOutput):
 
             u = openURL(spliturl[0], spliturl[
                         1], method='Get', username=username, password=password,
-                        headers=headers, verify=verify, cert=cert)
+                        headers=headers, verify=verify, cert=cert, session=session)
         else:
             u = openURL(
                 url, '', method='Get', username=username, password=password,
-                headers=headers, verify=verify, cert=cert)
+                headers=headers, verify=verify, cert=cert, session=session)
 
         return u.read()
 
     def writeToDisk(self, path=None, username=None, password=None,
-                    headers=None, verify=True, cert=None):
+                    headers=None, verify=True, cert=None, session=None):
         """
         Method to write an output of a WPS process to disk:
         it either retrieves the referenced file from the server, or write out the content of response embedded output.
@@ -1479,9 +1504,10 @@ class Output(InputOutput):
                   with the name assigned by the server,
         :param username: credentials to access the remote WPS server
         :param password: credentials to access the remote WPS server
+        :param session: optional owslib.util.HTTPSession, defaults to the shared session
         """
         # Check if ExecuteResponse contains reference to server-side output
-        content = self.retrieveData(username, password, headers=headers, verify=verify, cert=cert)
+        content = self.retrieveData(username, password, headers=headers, verify=verify, cert=cert, session=session)
 
         # ExecuteResponse contain embedded output
         if content == "" and len(self.data) > 0:
@@ -0,0 +1,114 @@
+import requests
+from werkzeug import Response
+
+from owslib.cache import CapabilitiesCache, get_default_cache, normalize_url, set_default_cache
+from owslib.feature.common import WFSCapabilitiesReader
+from owslib.map.common import WMSCapabilitiesReader
+from owslib.util import openURL
+
+CAPABILITIES = b'<WMT_MS_Capabilities version="1.1.1" updateSequence="%d"><Service/></WMT_MS_Capabilities>'
+
+
+def test_normalize_url():
+    assert normalize_url('HTTP://Example.com/wms?VERSION=1.1.1&service=WMS&Request=GetCapabilities') == \
+        'http://example.com/wms?request=GetCapabilities&service=WMS&version=1.1.1'
+
+
+def test_cache_ttl_and_etag(httpserver, tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return Response(status=304)
+        return Response(CAPABILITIES % 1, content_type='application/vnd.ogc.wms_xml', headers={'ETag': '"v1"'})
+
+    httpserver.expect_request('/wms').respond_with_handler(handler)
+
+    cache = CapabilitiesCache(str(tmp_path), ttl=3600)
+    for _ in range(2):
+        tree = WMSCapabilitiesReader(cache=cache).read(httpserver.url_for('/wms'))
+        assert tree.get('updateSequence') == '1'
+    assert requests == [None]
+    assert (cache.hits, cache.misses, cache.revalidations) == (1, 1, 0)
+
+    cache.ttl = 0
+    tree = WMSCapabilitiesReader(cache=cache).read(httpserver.url_for('/wms'))
+    assert tree.get('updateSequence') == '1'
+    assert requests == [None, '"v1"']
+    assert cache.revalidations == 1
+
+    # other versions are cached apart
+    WMSCapabilitiesReader(version='1.3.0', cache=cache).read(httpserver.url_for('/wms'))
+    assert requests == [None, '"v1"', None]
+
+
+def test_cache_update_sequence(httpserver, tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request.args.get('updateSequence'))
+        if request.args.get('updateSequence') == '5':
+            return Response('<ServiceExceptionReport version="1.2.0"><ServiceException code="CurrentUpdateSequence"/>'
+                            '</ServiceExceptionReport>', status=400, content_type='application/vnd.ogc.se_xml')
+        return Response(CAPABILITIES % 5, content_type='text/xml')
+
+    httpserver.expect_request('/wfs').respond_with_handler(handler)
+
+    set_default_cache(CapabilitiesCache(str(tmp_path), ttl=0))
+    try:
+        for _ in range(2):
+            tree = WFSCapabilitiesReader().read(httpserver.url_for('/wfs'))
+            assert tree.get('updateSequence') == '5'
+        assert get_default_cache().revalidations == 1
+    finally:
+        set_default_cache(None)
+
+    assert requests == [None, '5']
+
+
+def test_cache_lru_eviction(httpserver, tmp_path):
+    httpserver.expect_request('/wms').respond_with_data(CAPABILITIES % 1, content_type='text/xml')
+
+    cache = CapabilitiesCache(str(tmp_path), max_size=2 * len(CAPABILITIES % 1))
+    for version in ['1.0.0', '1.1.0', '1.0.0', '1.1.1']:
+        WMSCapabilitiesReader(version=version, cache=cache).read(httpserver.url_for('/wms'))
+
+    assert cache.misses == 3
+    assert len(list(tmp_path.glob('*.xml'))) == 2
+
+    # 1.1.0 was the least recently used
+    WMSCapabilitiesReader(version='1.0.0', cache=cache).read(httpserver.url_for('/wms'))
+    WMSCapabilitiesReader(version='1.1.0', cache=cache).read(httpserver.url_for('/wms'))
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_cache_update_sequence_minimal_document(httpserver, tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request.args.get('updateSequence'))
+        if request.args.get('updateSequence') == '5':  # unchanged, without its sections
+            return Response(b'<WMT_MS_Capabilities version="1.1.1" updateSequence="5"/>', content_type='text/xml')
+        return Response(CAPABILITIES % 5, content_type='text/xml')
+
+    httpserver.expect_request('/wfs').respond_with_handler(handler)
+
+    cache = CapabilitiesCache(str(tmp_path), ttl=0)
+    for _ in range(3):
+        tree = WFSCapabilitiesReader(cache=cache).read(httpserver.url_for('/wfs'))
+        assert tree.find('Service') is not None
+    assert requests == [None, '5', '5']
+    assert cache.revalidations == 2
+
+
+def test_openurl_not_modified():
+    class Session(object):
+        def request(self, method, url, **kwargs):
+            response = requests.Response()
+            response.status_code = 304
+            response.headers['Content-Type'] = 'text/xml'
+            response._content = b''
+            return response
+
+    assert openURL('http://example.org/wms', session=Session()).status_code == 304
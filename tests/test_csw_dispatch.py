@@ -0,0 +1,47 @@
+from unittest import mock
+
+from werkzeug import Response
+
+from owslib.catalogue.csw2 import CatalogueServiceWeb
+
+CAPABILITIES = """<csw:Capabilities xmlns:csw="http://www.opengis.net/cat/csw/2.0.2"
+  xmlns:ows="http://www.opengis.net/ows" xmlns:ogc="http://www.opengis.net/ogc"
+  xmlns:xlink="http://www.w3.org/1999/xlink" version="2.0.2">
+<ows:OperationsMetadata>
+  <ows:Operation name="GetRecords">
+    <ows:DCP><ows:HTTP>
+      <ows:Get xlink:href="{url}/records-kvp"/><ows:Post xlink:href="{url}/records"/>
+    </ows:HTTP></ows:DCP>
+  </ows:Operation>
+  <ows:Operation name="GetRecordById">
+    <ows:DCP><ows:HTTP><ows:Get xlink:href="{url}/record"/></ows:HTTP></ows:DCP>
+  </ows:Operation>
+</ows:OperationsMetadata>
+<ogc:Filter_Capabilities/>
+</csw:Capabilities>"""
+
+RECORDS = """<csw:GetRecordsResponse xmlns:csw="http://www.opengis.net/cat/csw/2.0.2">
+<csw:SearchResults numberOfRecordsMatched="0" numberOfRecordsReturned="0" nextRecord="0"/>
+</csw:GetRecordsResponse>"""
+
+RECORD = '<csw:GetRecordByIdResponse xmlns:csw="http://www.opengis.net/cat/csw/2.0.2"/>'
+
+
+def test_operation_urls(httpserver):
+    url = httpserver.url_for('').rstrip('/')
+    httpserver.expect_request('/csw').respond_with_data(CAPABILITIES.format(url=url), content_type='application/xml')
+    httpserver.expect_request('/records', method='POST').respond_with_response(
+        Response(RECORDS, content_type='application/xml'))
+    httpserver.expect_request('/record').respond_with_data(RECORD, content_type='application/xml')
+
+    csw = CatalogueServiceWeb(url + '/csw')
+    with mock.patch('inspect.stack', side_effect=AssertionError) as stack:
+        csw.getrecords2()
+        csw.getrecords2()
+        csw.getrecordbyid(['a'])
+    assert not stack.called
+
+    paths = [request.path for request, _ in httpserver.log]
+    assert paths == ['/csw', '/records', '/records', '/record']
+    # the URLs of the operations are chosen once
+    assert csw._operation_urls == {('getrecords', False): url + '/records', ('getrecordbyid', True): url + '/record'}
@@ -12,7 +12,7 @@ def test_csw_sends_headers():
     when performing HTTP requests (in this case for GetCapabilities)
     """
 
-    with mock.patch('owslib.util.requests.request', side_effect=RuntimeError) as mock_request:
+    with mock.patch('owslib.util.HTTPSession.request', side_effect=RuntimeError) as mock_request:
         try:
             CatalogueServiceWeb(
                 'http://example.com/csw',
@@ -23,7 +23,7 @@ def test_csw_sends_headers():
             assert mock_request.called
             assert mock_request.call_args[1]['headers'] == {'User-agent': 'my-app/1.0'}
 
-    with mock.patch('owslib.util.requests.request', side_effect=RuntimeError) as mock_request:
+    with mock.patch('owslib.util.HTTPSession.request', side_effect=RuntimeError) as mock_request:
         try:
             CatalogueServiceWeb(
                 'http://example.com/csw',
@@ -0,0 +1,86 @@
+import time
+
+import pytest
+from werkzeug import Response
+
+from owslib.catalogue.csw2 import CatalogueServiceWeb as CatalogueServiceWeb202
+from owslib.catalogue.csw3 import CatalogueServiceWeb as CatalogueServiceWeb300
+from owslib.etree import etree
+from owslib.ows import ExceptionReport
+
+NAMESPACES = {
+    '2.0.2': 'http://www.opengis.net/cat/csw/2.0.2',
+    '3.0.0': 'http://www.opengis.net/cat/csw/3.0',
+}
+
+RESPONSE = """<csw:GetRecordsResponse xmlns:csw="%s" xmlns:dc="http://purl.org/dc/elements/1.1/">
+<csw:SearchResults numberOfRecordsMatched="%d" numberOfRecordsReturned="%d"%s elementSet="summary">
+%s
+</csw:SearchResults>
+</csw:GetRecordsResponse>"""
+
+RECORD = '<csw:SummaryRecord><dc:identifier>record-%d</dc:identifier><dc:title>Record %d</dc:title></csw:SummaryRecord>'
+
+EXCEPTION = """<ows:ExceptionReport xmlns:ows="http://www.opengis.net/ows" version="1.2.0">
+<ows:Exception exceptionCode="NoApplicableCode"><ows:ExceptionText>Failure</ows:ExceptionText></ows:Exception>
+</ows:ExceptionReport>"""
+
+
+def serve_records(httpserver, version, matches, next_record=True, fail_at=None):
+    """Serve GetRecords pages of `matches` summary records, and return the requested pages"""
+    requests = []
+
+    def handler(request):
+        root = etree.fromstring(request.get_data())
+        start, count = int(root.get('startPosition', 1)), int(root.get('maxRecords'))
+        requests.append((start, count))
+        if start == fail_at:
+            return Response(EXCEPTION, content_type='application/xml')
+        positions = range(start, min(start + count, matches + 1))
+        nextrecord = ''
+        if next_record:
+            nextrecord = ' nextRecord="%d"' % (positions[-1] + 1 if positions[-1] < matches else 0)
+        records = ''.join(RECORD % (i, i) for i in positions)
+        return Response(RESPONSE % (NAMESPACES[version], matches, len(positions), nextrecord, records),
+                        content_type='application/xml')
+
+    httpserver.expect_request('/csw', method='POST').respond_with_handler(handler)
+    return requests
+
+
+@pytest.mark.parametrize('version, cls', [('2.0.2', CatalogueServiceWeb202), ('3.0.0', CatalogueServiceWeb300)])
+def test_iter_records(httpserver, version, cls):
+    requests = serve_records(httpserver, version, 25)
+    csw = cls(httpserver.url_for('/csw'), skip_caps=True)
+
+    records = list(csw.iter_records(page_size=10))
+
+    assert [identifier for identifier, _ in records] == ['record-%d' % i for i in range(1, 26)]
+    assert records[-1][1].title == 'Record 25'
+    assert requests == [(1, 10), (11, 10), (21, 10)]
+    # records are not kept on the instance
+    assert not hasattr(csw, 'records')
+
+
+def test_iter_records_without_next_record(httpserver):
+    requests = serve_records(httpserver, '2.0.2', 7, next_record=False)
+    csw = CatalogueServiceWeb202(httpserver.url_for('/csw'), skip_caps=True)
+
+    assert len(list(csw.iter_records(page_size=3))) == 7
+    assert requests == [(1, 3), (4, 3), (7, 3)]
+
+
+def test_iter_records_read_ahead(httpserver):
+    requests = serve_records(httpserver, '2.0.2', 30, fail_at=21)
+    csw = CatalogueServiceWeb202(httpserver.url_for('/csw'), skip_caps=True)
+
+    records = csw.iter_records(page_size=10)
+    next(records)
+    # the second page is requested while the first one is consumed
+    deadline = time.monotonic() + 5
+    while len(requests) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert requests == [(1, 10), (11, 10)]
+
+    with pytest.raises(ExceptionReport):
+        list(records)
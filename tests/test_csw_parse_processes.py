@@ -0,0 +1,25 @@
+from owslib import snapshot
+from owslib.catalogue.csw2 import CatalogueServiceWeb
+from tests.utils import resource_file
+
+
+def test_parse_processes(httpserver):
+    with open(resource_file('inspire-getrecords-response.xml'), 'rb') as f:
+        httpserver.expect_request('/csw').respond_with_data(f.read(), content_type='application/xml')
+
+    records = []
+    for processes in (0, 2):
+        with CatalogueServiceWeb(httpserver.url_for('/csw'), skip_caps=True, parse_processes=processes) as csw:
+            csw.getrecords2(outputschema='http://www.isotc211.org/2005/gmd', esn='full', maxrecords=2)
+            records.append(csw.records)
+        assert csw._process_pool is None
+
+    serial, parallel = records
+    assert list(parallel) == list(serial) == [
+        '8dad9c98-0512-4845-a2bf-3ace1c93df6f', 'eeae2de7-0a09-4b69-b7a0-0b6b20903fd5']
+    for identifier, record in serial.items():
+        assert parallel[identifier].languagecode == record.languagecode
+        assert snapshot.dumps(parallel[identifier]) == snapshot.dumps(record)
+        # records keep the element of the response
+        root = parallel[identifier].md.getroottree().getroot()
+        assert root.tag == '{http://www.opengis.net/cat/csw/2.0.2}GetRecordsResponse'
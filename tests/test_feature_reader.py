@@ -0,0 +1,150 @@
+from datetime import date
+from io import BytesIO, RawIOBase
+import tracemalloc
+
+from owslib.feature.reader import iter_features
+
+WFS20_GML32 = b"""<?xml version="1.0" encoding="UTF-8"?>
+<wfs:FeatureCollection xmlns:wfs="http://www.opengis.net/wfs/2.0" xmlns:gml="http://www.opengis.net/gml/3.2"
+    xmlns:app="http://example.org/app" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+    numberMatched="2" numberReturned="2">
+  <wfs:member>
+    <app:lakes gml:id="lakes.1">
+      <gml:boundedBy><gml:Envelope><gml:lowerCorner>0 0</gml:lowerCorner></gml:Envelope></gml:boundedBy>
+      <app:name>Erie</app:name>
+      <app:depth>64</app:depth>
+      <app:area>25744.5</app:area>
+      <app:surveyed>2020-05-01</app:surveyed>
+      <app:remark xsi:nil="true"/>
+      <app:geom>
+        <gml:Polygon gml:id="p1" srsName="urn:ogc:def:crs:EPSG::4326">
+          <gml:exterior><gml:LinearRing><gml:posList>0 0 0 1 1 1 0 0</gml:posList></gml:LinearRing></gml:exterior>
+          <gml:interior><gml:LinearRing><gml:posList>0.1 0.1 0.1 0.2 0.2 0.2 0.1 0.1</gml:posList></gml:LinearRing>
+          </gml:interior>
+        </gml:Polygon>
+      </app:geom>
+    </app:lakes>
+  </wfs:member>
+  <wfs:member>
+    <app:lakes gml:id="lakes.2">
+      <app:name>Huron</app:name>
+      <app:depth>unknown</app:depth>
+      <app:geom><gml:Point gml:id="p2" srsDimension="3"><gml:pos>1 2 3</gml:pos></gml:Point></app:geom>
+    </app:lakes>
+  </wfs:member>
+</wfs:FeatureCollection>
+"""
+
+WFS10_GML2 = b"""<wfs:FeatureCollection xmlns:wfs="http://www.opengis.net/wfs" xmlns:gml="http://www.opengis.net/gml"
+    xmlns:app="http://example.org/app">
+  <gml:featureMember>
+    <app:rivers fid="rivers.1">
+      <app:the_geom>
+        <gml:MultiLineString>
+          <gml:lineStringMember><gml:LineString><gml:coordinates>0,0 1,1</gml:coordinates></gml:LineString>
+          </gml:lineStringMember>
+          <gml:lineStringMember><gml:LineString><gml:coordinates>2,2 3,3</gml:coordinates></gml:LineString>
+          </gml:lineStringMember>
+        </gml:MultiLineString>
+      </app:the_geom>
+      <app:name>Rhine</app:name>
+    </app:rivers>
+  </gml:featureMember>
+</wfs:FeatureCollection>
+"""
+
+SCHEMA = {
+    'properties': {'name': 'string', 'depth': 'int', 'area': 'double', 'surveyed': 'date', 'remark': 'string'},
+    'required': [],
+    'geometry': 'Polygon',
+    'geometry_column': 'geom',
+}
+
+
+def test_iter_features_geojson():
+    features = list(iter_features(BytesIO(WFS20_GML32), schema=SCHEMA, as_geojson=True))
+
+    assert len(features) == 2
+    assert features[0] == {
+        'type': 'Feature',
+        'id': 'lakes.1',
+        'geometry': {
+            'type': 'Polygon',
+            'coordinates': [
+                [[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [0.0, 0.0]],
+                [[0.1, 0.1], [0.1, 0.2], [0.2, 0.2], [0.1, 0.1]],
+            ],
+        },
+        'properties': {
+            'name': 'Erie', 'depth': 64, 'area': 25744.5, 'surveyed': date(2020, 5, 1), 'remark': None
+        },
+    }
+    # values not matching the schema are left as is
+    assert features[1]['properties'] == {'name': 'Huron', 'depth': 'unknown'}
+    assert features[1]['geometry'] == {'type': 'Point', 'coordinates': [1.0, 2.0, 3.0]}
+
+
+def test_iter_features_dict():
+    features = list(iter_features(BytesIO(WFS10_GML2)))
+
+    assert features == [{
+        'gml_id': 'rivers.1',
+        'the_geom': {'type': 'MultiLineString', 'coordinates': [[[0.0, 0.0], [1.0, 1.0]], [[2.0, 2.0], [3.0, 3.0]]]},
+        'name': 'Rhine',
+    }]
+
+
+def test_iter_features_feature_members():
+    data = b"""<wfs:FeatureCollection xmlns:wfs="http://www.opengis.net/wfs" xmlns:gml="http://www.opengis.net/gml"
+        xmlns:app="http://example.org/app"><gml:featureMembers>
+        <app:wells gml:id="wells.1"><app:id>1</app:id></app:wells>
+        <app:wells gml:id="wells.2"><app:id>2</app:id></app:wells>
+    </gml:featureMembers></wfs:FeatureCollection>"""
+
+    features = iter_features(BytesIO(data), schema={'properties': {'id': 'integer'}})
+    assert [f['id'] for f in features] == [1, 2]
+
+
+class FeatureStream(RawIOBase):
+    """Generated GML document of `count` features, without holding it in memory"""
+
+    def __init__(self, count):
+        self._chunks = self._generate(count)
+        self._buffer = b''
+
+    def _generate(self, count):
+        yield (b'<wfs:FeatureCollection xmlns:wfs="http://www.opengis.net/wfs/2.0" '
+               b'xmlns:gml="http://www.opengis.net/gml/3.2" xmlns:app="http://example.org/app">')
+        for i in range(count):
+            yield (b'<wfs:member><app:f gml:id="f.%d"><app:value>%d</app:value><app:geom><gml:Point>'
+                   b'<gml:pos>%d %d</gml:pos></gml:Point></app:geom></app:f></wfs:member>' % (i, i, i, i))
+        yield b'</wfs:FeatureCollection>'
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while len(self._buffer) < len(b):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        n = min(len(b), len(self._buffer))
+        b[:n], self._buffer = self._buffer[:n], self._buffer[n:]
+        return n
+
+
+def test_iter_features_memory():
+    count = 20000  # about 3.5 MB of GML
+
+    tracemalloc.start()
+    try:
+        total = 0
+        for feature in iter_features(FeatureStream(count)):
+            total += int(feature['value'])
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert total == sum(range(count))
+    assert peak < 1024 * 1024
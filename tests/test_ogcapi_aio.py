@@ -0,0 +1,187 @@
+import asyncio
+import gc
+import json
+import ssl
+
+import pytest
+import requests
+from werkzeug import Response
+
+pytest.importorskip('aiohttp')
+
+from owslib.ogcapi.aio import AsyncHTTPSession  # noqa: E402
+from owslib.ogcapi.aio.coverages import Coverages  # noqa: E402
+from owslib.ogcapi.aio.features import Features  # noqa: E402
+from owslib.ogcapi.aio.processes import Processes  # noqa: E402
+from owslib.util import Authentication  # noqa: E402
+
+LANDING_PAGE = {'links': [{'rel': 'self', 'type': 'application/json', 'href': '/'}]}
+
+COLLECTIONS = {
+    'collections': [
+        {'id': 'lakes', 'itemType': 'feature', 'links': []},
+        {'id': 'dem', 'links': [{'rel': 'http://www.opengis.net/def/rel/ogc/1.0/coverage'}]},
+    ]
+}
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_ogcapi_aio_features(httpserver):
+    httpserver.expect_request('/oapi/').respond_with_json(LANDING_PAGE)
+    httpserver.expect_request('/oapi/collections').respond_with_json(COLLECTIONS)
+    httpserver.expect_request(
+        '/oapi/collections/lakes/items',
+        query_string={'bbox': '-10,-10,10,10', 'datetime': '2020-01-01', 'sortby': '-name', 'limit': '5'}
+    ).respond_with_json({'type': 'FeatureCollection', 'features': [], 'numberMatched': 0})
+
+    async def main():
+        async with AsyncHTTPSession() as session:
+            async with Features(httpserver.url_for('/oapi'), session=session) as w:
+                assert w.links == LANDING_PAGE['links']
+
+                assert await w.feature_collections() == ['lakes']
+
+                items = await w.collection_items(
+                    'lakes', bbox=[-10, -10, 10, 10], datetime_='2020-01-01',
+                    sortby=('name', 'desc'), limit=5)
+                assert items['numberMatched'] == 0
+                assert w.request.startswith(httpserver.url_for('/oapi/collections/lakes/items'))
+
+    run(main())
+
+
+def test_ogcapi_aio_features_cql(httpserver):
+    cql = {'op': '=', 'args': [{'property': 'name'}, 'Erie']}
+    httpserver.expect_request(
+        '/oapi/collections/lakes/items', method='POST', query_string='limit=1', json=cql
+    ).respond_with_json({'type': 'FeatureCollection', 'features': [{'id': 1}]})
+
+    async def main():
+        async with AsyncHTTPSession() as session:
+            w = Features(httpserver.url_for('/oapi'), json_=json.dumps(LANDING_PAGE), session=session)
+            items = await w.collection_items('lakes', cql=cql, limit=1)
+            assert items['features'] == [{'id': 1}]
+
+    run(main())
+
+
+def test_ogcapi_aio_concurrent_requests(httpserver):
+    for i in range(20):
+        httpserver.expect_request(f'/oapi/collections/lakes/items/{i}').respond_with_json({'id': i})
+
+    async def main():
+        async with AsyncHTTPSession(limit=4) as session:
+            w = Features(httpserver.url_for('/oapi'), json_=json.dumps(LANDING_PAGE), session=session)
+            return await asyncio.gather(*[w.collection_item('lakes', i) for i in range(20)])
+
+    assert [f['id'] for f in run(main())] == list(range(20))
+
+
+def test_ogcapi_aio_errors_and_binary(httpserver):
+    httpserver.expect_request('/oapi/collections/missing').respond_with_data('not found', status=404)
+    httpserver.expect_request(
+        '/oapi/collections/dem/coverage', query_string={'properties': 'B04,B08'}
+    ).respond_with_data(b'\x89PNG', content_type='image/png')
+    httpserver.expect_request('/oapi/processes').respond_with_json({'processes': [{'id': 'hello-world'}]})
+
+    async def main():
+        async with AsyncHTTPSession() as session:
+            w = Coverages(httpserver.url_for('/oapi'), json_=json.dumps(LANDING_PAGE), session=session)
+            with pytest.raises(RuntimeError, match='not found'):
+                await w.collection('missing')
+
+            data = await w.coverage('dem', properties=['B04', 'B08'])
+            assert data.read() == b'\x89PNG'
+
+            p = Processes(httpserver.url_for('/oapi'), json_=json.dumps(LANDING_PAGE), session=session)
+            assert await p.processes() == [{'id': 'hello-world'}]
+
+    run(main())
+
+
+def test_ogcapi_aio_iter_collection_items(httpserver):
+    httpserver.expect_ordered_request(
+        '/oapi/collections/lakes/items', query_string={'limit': '2'}
+    ).respond_with_json({'type': 'FeatureCollection', 'features': [{'id': 1}, {'id': 2}],
+                         'links': [{'rel': 'next', 'href': 'items?limit=2&offset=2'}]})
+    httpserver.expect_ordered_request(
+        '/oapi/collections/lakes/items', query_string={'limit': '2', 'offset': '2'}
+    ).respond_with_json({'type': 'FeatureCollection', 'features': [{'id': 3}], 'links': []})
+
+    async def main():
+        async with AsyncHTTPSession() as session:
+            w = Features(httpserver.url_for('/oapi'), json_=json.dumps(LANDING_PAGE), session=session)
+            return [f['id'] async for f in w.iter_collection_items('lakes', page_size=2, prefetch=True)]
+
+    assert run(main()) == [1, 2, 3]
+
+
+def test_ogcapi_aio_iter_collection_items_next_link_loop(httpserver):
+    httpserver.expect_ordered_request(
+        '/oapi/collections/lakes/items', query_string={'limit': '2'}
+    ).respond_with_json({'type': 'FeatureCollection', 'features': [{'id': 1}, {'id': 2}],
+                         'links': [{'rel': 'next', 'href': 'items?limit=2&offset=2'}]})
+    # the next link of the last page points back to it
+    httpserver.expect_ordered_request(
+        '/oapi/collections/lakes/items', query_string={'limit': '2', 'offset': '2'}
+    ).respond_with_json({'type': 'FeatureCollection', 'features': [{'id': 3}],
+                         'links': [{'rel': 'next', 'href': 'items?limit=2&offset=2'}]})
+
+    async def main():
+        async with AsyncHTTPSession() as session:
+            w = Features(httpserver.url_for('/oapi'), json_=json.dumps(LANDING_PAGE), session=session)
+            return [f['id'] async for f in w.iter_collection_items('lakes', page_size=2)]
+
+    assert run(main()) == [1, 2, 3]
+    assert len(httpserver.log) == 2
+
+
+def test_ogcapi_aio_put_json(httpserver):
+    bodies = []
+
+    def handler(request):
+        bodies.append((request.headers['Content-Type'], request.get_data()))
+        return Response('{}', content_type='application/json')
+
+    httpserver.expect_request('/oapi/collections/lakes', method='PUT').respond_with_handler(handler)
+
+    async def main():
+        async with AsyncHTTPSession() as session:
+            w = Features(httpserver.url_for('/oapi'), json_=json.dumps(LANDING_PAGE), session=session)
+            await w._request(method='PUT', path='collections/lakes', data={'a': 1})
+
+    run(main())
+    assert bodies == [('application/json', b'{"a": 1}')]
+
+
+def test_ogcapi_aio_default_session_closed(httpserver, recwarn):
+    httpserver.expect_request('/oapi/collections').respond_with_json(COLLECTIONS)
+    session = AsyncHTTPSession()
+
+    async def main():
+        w = Features(httpserver.url_for('/oapi'), json_=json.dumps(LANDING_PAGE), session=session)
+        await w.collections()
+        return session.session
+
+    client_session = run(main())
+    # closed when asyncio.run shuts the loop down
+    assert client_session.closed
+    gc.collect()
+    assert not [w for w in recwarn if 'Unclosed' in str(w.message)]
+
+
+def test_ogcapi_aio_ssl_cert_list(tmp_path):
+    cert = tmp_path / 'cert.pem'
+    cert.write_text('not a certificate')
+    auth = Authentication(verify=False, cert=[str(cert), str(cert)])
+    with pytest.raises(ssl.SSLError):  # the key is hashable, the certificate is then loaded
+        AsyncHTTPSession()._ssl(auth)
+
+
+def test_ogcapi_aio_auth_delegate():
+    auth = Authentication(auth_delegate=requests.auth.HTTPBasicAuth('user', 'secret'))
+    with pytest.raises(ValueError):
+        Features('http://example.org/oapi', auth=auth)
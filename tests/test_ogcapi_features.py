@@ -0,0 +1,103 @@
+import json
+
+from owslib.ogcapi.features import Features
+
+LANDING_PAGE = json.dumps({'links': [{'rel': 'self', 'type': 'application/json', 'href': '/'}]})
+
+
+def feature_collection(ids, links=None, number_matched=None):
+    fc = {'type': 'FeatureCollection', 'features': [{'type': 'Feature', 'id': i} for i in ids]}
+    if links is not None:
+        fc['links'] = links
+    if number_matched is not None:
+        fc['numberMatched'] = number_matched
+    return fc
+
+
+def test_ogcapi_features_iter_items_next_links(httpserver):
+    next_ = httpserver.url_for('/oapi/collections/lakes/items?limit=2&token=b')
+    httpserver.expect_ordered_request(
+        '/oapi/collections/lakes/items', query_string={'limit': '2', 'bbox': '-10,-10,10,10'}
+    ).respond_with_json(feature_collection([1, 2], links=[
+        {'rel': 'self', 'type': 'application/geo+json', 'href': 'items'},
+        {'rel': 'next', 'type': 'text/html', 'href': 'items?f=html'},
+        {'rel': 'next', 'type': 'application/geo+json', 'href': next_},
+    ]))
+    httpserver.expect_ordered_request(
+        '/oapi/collections/lakes/items', query_string={'limit': '2', 'token': 'b'}
+    ).respond_with_json(feature_collection([3, 4], links=[
+        {'rel': 'next', 'type': 'application/geo+json', 'href': 'items?limit=2&token=c'},
+    ]))
+    httpserver.expect_ordered_request(
+        '/oapi/collections/lakes/items', query_string={'limit': '2', 'token': 'c'}
+    ).respond_with_json(feature_collection([5], links=[]))
+
+    w = Features(httpserver.url_for('/oapi'), json_=LANDING_PAGE)
+    items = w.iter_collection_items('lakes', page_size=2, bbox=[-10, -10, 10, 10])
+
+    assert next(items)['id'] == 1
+    assert len(httpserver.log) == 1  # pages are requested on demand
+    assert [f['id'] for f in items] == [2, 3, 4, 5]
+    httpserver.check_assertions()
+
+
+def test_ogcapi_features_iter_items_next_link_loop(httpserver):
+    httpserver.expect_request(
+        '/oapi/collections/lakes/items', query_string={'limit': '2'}
+    ).respond_with_json(feature_collection([1, 2], links=[{'rel': 'next', 'href': 'items?limit=2&token=b'}]))
+    # the next link of the last page points back to it
+    httpserver.expect_request(
+        '/oapi/collections/lakes/items', query_string={'limit': '2', 'token': 'b'}
+    ).respond_with_json(feature_collection([3, 4], links=[{'rel': 'next', 'href': 'items?limit=2&token=b'}]))
+
+    w = Features(httpserver.url_for('/oapi'), json_=LANDING_PAGE)
+    for prefetch in (False, True):
+        httpserver.clear_log()
+        assert [f['id'] for f in w.iter_collection_items('lakes', page_size=2, prefetch=prefetch)] == [1, 2, 3, 4]
+        assert len(httpserver.log) == 2
+
+
+def test_ogcapi_features_iter_items_offset_fallback(httpserver):
+    for offset, ids in [(None, [1, 2]), ('2', [3, 4]), ('4', [5])]:
+        query = {'limit': '2'}
+        if offset is not None:
+            query['offset'] = offset
+        httpserver.expect_ordered_request(
+            '/oapi/collections/lakes/items', query_string=query
+        ).respond_with_json(feature_collection(ids))
+
+    w = Features(httpserver.url_for('/oapi'), json_=LANDING_PAGE)
+    assert [f['id'] for f in w.iter_collection_items('lakes', page_size=2)] == [1, 2, 3, 4, 5]
+    httpserver.check_assertions()
+
+
+def test_ogcapi_features_iter_items_number_matched_prefetch(httpserver):
+    httpserver.expect_ordered_request(
+        '/oapi/collections/lakes/items', query_string={'limit': '2', 'offset': '1'}
+    ).respond_with_json(feature_collection([2, 3], links=[], number_matched=5))
+    httpserver.expect_ordered_request(
+        '/oapi/collections/lakes/items', query_string={'limit': '2', 'offset': '3'}
+    ).respond_with_json(feature_collection([4, 5], links=[], number_matched=5))
+
+    w = Features(httpserver.url_for('/oapi'), json_=LANDING_PAGE)
+    items = w.iter_collection_items('lakes', page_size=2, prefetch=True, offset=1)
+    assert [f['id'] for f in items] == [2, 3, 4, 5]
+    httpserver.check_assertions()
+
+
+def test_ogcapi_features_iter_items_relative_links(httpserver):
+    httpserver.expect_ordered_request(
+        '/oapi/collections/lakes/items', query_string={'limit': '2'}
+    ).respond_with_json(feature_collection([1, 2], links=[
+        {'rel': 'next', 'href': httpserver.url_for('/pages/2')},
+    ]))
+    # relative to the page followed last
+    httpserver.expect_ordered_request('/pages/2').respond_with_json(feature_collection([3, 4], links=[
+        {'rel': 'next', 'href': '3'},
+    ]))
+    httpserver.expect_ordered_request('/pages/3').respond_with_json(feature_collection([5], links=[]))
+
+    w = Features(httpserver.url_for('/oapi'), json_=LANDING_PAGE)
+    items = w.iter_collection_items('lakes', page_size=2, prefetch=True)
+    assert [f['id'] for f in items] == [1, 2, 3, 4, 5]
+    httpserver.check_assertions()
@@ -0,0 +1,84 @@
+import pytest
+from werkzeug import Response
+
+from owslib import fgdc, iso, remotemetadata
+from owslib.wms import WebMapService
+from tests.utils import resource_file
+
+CAPABILITIES = """<WMT_MS_Capabilities version="1.1.1" xmlns:xlink="http://www.w3.org/1999/xlink">
+<Service><Name>OGC:WMS</Name><Title>Test</Title></Service>
+<Capability>
+  <Request><GetMap><Format>image/png</Format></GetMap></Request>
+  <Layer>
+    <Title>Root</Title>
+    {layers}
+  </Layer>
+</Capability>
+</WMT_MS_Capabilities>"""
+
+LAYER = """<Layer><Name>{name}</Name><Title>{name}</Title>
+  <MetadataURL type="{type}"><Format>text/xml</Format>
+    <OnlineResource xlink:type="simple" xlink:href="{url}"/></MetadataURL>
+</Layer>"""
+
+
+@pytest.fixture
+def documents(httpserver):
+    requests = []
+
+    def handler(filename):
+        def respond(request):
+            requests.append((request.path, request.headers.get('X-Token')))
+            with open(resource_file(filename), 'rb') as f:
+                return Response(f.read(), content_type='text/xml')
+        return respond
+
+    httpserver.expect_request('/iso').respond_with_handler(handler('csw_dov_getrecordbyid.xml'))
+    httpserver.expect_request('/fgdc').respond_with_handler(handler('9250AA67-F3AC-6C12-0CB9-0662231AA181_fgdc.xml'))
+    layers = ''.join(LAYER.format(name='layer%d' % i, type='FGDC' if i == 4 else 'TC211',
+                                  url=httpserver.url_for('/fgdc' if i == 4 else '/iso'))
+                     for i in range(5))
+    return CAPABILITIES.format(layers=layers).encode(), requests
+
+
+@pytest.mark.parametrize('version', ['1.1.1', '1.3.0'])
+def test_parse_remote_metadata_batch(documents, version):
+    xml, requests = documents
+    if version == '1.3.0':
+        xml = xml.replace(b'<WMT_MS_Capabilities version="1.1.1"',
+                          b'<WMS_Capabilities version="1.3.0" xmlns="http://www.opengis.net/wms"').replace(
+            b'</WMT_MS_Capabilities>', b'</WMS_Capabilities>')
+    wms = WebMapService('http://example.org/wms', version=version, xml=xml, parse_remote_metadata=True,
+                        headers={'X-Token': 'secret'})
+
+    # each document is requested once, with the headers of the service
+    assert sorted(requests) == [('/fgdc', 'secret'), ('/iso', 'secret')]
+    metadata = [wms[name].get_metadata() for name in wms.contents]
+    assert all(type(m[0]) is iso.MD_Metadata for m in metadata[:4])
+    assert metadata[0][0] is metadata[3][0]
+    assert type(metadata[4][0]) is fgdc.Metadata
+    assert metadata[4][0].idinfo.citation.citeinfo['title'] == 'ALLSPECIES'
+
+
+def test_parse_remote_metadata_processes(documents):
+    xml, requests = documents
+    wms = WebMapService('http://example.org/wms', version='1.1.1', xml=xml)
+    assert wms['layer0'].get_metadata() == []
+
+    remotemetadata.parse_remote_metadata(wms.contents.values(), max_processes=1, process_threshold=0)
+    assert len(requests) == 2
+    md = wms['layer0'].get_metadata()[0]
+    assert type(md) is iso.MD_Metadata
+    assert md.identifier == wms['layer3'].get_metadata()[0].identifier
+    assert type(wms['layer4'].get_metadata()[0]) is fgdc.Metadata
+
+    # as parsed in this process, with its element
+    with open(resource_file('csw_dov_getrecordbyid.xml'), 'rb') as f:
+        expected = remotemetadata.parse_metadata(f.read())
+    assert md.md.tag == expected.md.tag
+    assert md.md.getparent().tag == expected.md.getparent().tag
+    assert md.xml == expected.xml
+
+    # single layers
+    wms['layer4'].parse_remote_metadata()
+    assert type(wms['layer4'].get_metadata()[0]) is fgdc.Metadata
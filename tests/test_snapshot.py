@@ -0,0 +1,126 @@
+import time
+
+import pytest
+
+from owslib import snapshot
+from owslib.etree import etree
+from owslib.feature.wfs200 import WebFeatureService_2_0_0
+from owslib.map.wms111 import WebMapService_1_1_1
+from owslib.map.wms130 import WebMapService_1_3_0
+from owslib.util import Authentication
+from owslib.wmts import WebMapTileService
+from tests.utils import resource_file
+
+RUNTIME = ('_capabilities', 'auth', 'session', 'headers', 'cookies')
+
+
+def assert_same(a, b, seen=None):
+    """Compare the object graphs of a service and its restored snapshot"""
+    seen = set() if seen is None else seen
+    assert type(a) is type(b)
+    if isinstance(a, (list, tuple)):
+        assert len(a) == len(b)
+        for x, y in zip(a, b):
+            assert_same(x, y, seen)
+    elif isinstance(a, dict):
+        assert list(a) == list(b)
+        for k in a:
+            assert_same(a[k], b[k], seen)
+    elif etree.iselement(a):
+        assert etree.tostring(a, with_tail=False) == etree.tostring(b, with_tail=False)
+    elif type(a).__module__.startswith('owslib') and hasattr(a, '__dict__'):
+        if id(a) not in seen:
+            seen.add(id(a))
+            assert_same({k: v for k, v in vars(a).items() if k not in RUNTIME},
+                        {k: v for k, v in vars(b).items() if k not in RUNTIME}, seen)
+    else:
+        assert a == b
+
+
+@pytest.mark.parametrize('cls, filename, version', [
+    (WebMapService_1_1_1, 'wms_JPLCapabilities.xml', '1.1.1'),
+    (WebMapService_1_3_0, 'wms_nccs_nasa_getcap_130.xml', '1.3.0'),
+    (WebMapTileService, 'geoserver21-wmts-cap.xml', '1.0.0'),
+    (WebFeatureService_2_0_0, 'wfs_CUZK_GetCapabilities_2_0_0.xml', '2.0.0'),
+])
+def test_snapshot_roundtrip(cls, filename, version):
+    with open(resource_file(filename), 'rb') as f:
+        xml = f.read()
+    service = cls('http://example.org/ows', version=version, xml=xml)
+
+    data = service.to_snapshot()
+    assert len(data) < len(xml)
+
+    auth = Authentication('user', 'secret')
+    restored = cls.from_snapshot(data, headers={'X-Test': '1'}, auth=auth)
+    assert_same(service, restored)
+    assert restored._capabilities is None
+    assert restored.auth is auth
+    assert restored.headers == {'X-Test': '1'}
+    assert b'secret' not in cls('http://example.org/ows', version=version, xml=xml, auth=auth).to_snapshot()
+
+
+def test_snapshot_wms_layers():
+    with open(resource_file('wms_JPLCapabilities.xml'), 'rb') as f:
+        wms = WebMapService_1_1_1('http://example.org/wms', xml=f.read())
+    restored = WebMapService_1_1_1.from_snapshot(wms.to_snapshot())
+
+    for name, layer in wms.contents.items():
+        copy = restored[name]
+        assert copy.crsOptions == layer.crsOptions
+        assert copy.styles == layer.styles
+        assert copy.boundingBoxWGS84 == layer.boundingBoxWGS84
+        # shared objects are restored once
+        if copy.parent is not None:
+            assert copy in copy.parent.children or copy in copy.parent.layers
+    assert restored.getOperationByName('GetMap').formatOptions == wms.getOperationByName('GetMap').formatOptions
+
+
+def test_snapshot_shared_crs_options():
+    # 1000+ layers inheriting thousands of CRS codes
+    with open(resource_file('wms_mass_gis-caps.xml'), 'rb') as f:
+        xml = f.read()
+    start = time.time()
+    wms = WebMapService_1_1_1('http://example.org/wms', xml=xml)
+    parsed = time.time() - start
+
+    start = time.time()
+    data = wms.to_snapshot()
+    restored = WebMapService_1_1_1.from_snapshot(data)
+    # the shared CRS options are stored once
+    assert len(data) < len(xml) / 4
+    assert time.time() - start < max(10 * parsed, 2)
+
+    layers = list(restored.contents.values())
+    assert len(layers) > 1000
+    assert layers[1]._crs is layers[2]._crs
+    assert sorted(layers[1].crsOptions) == sorted(wms[layers[1].id].crsOptions)
+
+
+def test_snapshot_wmts_tilematrixsets():
+    with open(resource_file('geoserver21-wmts-cap.xml'), 'rb') as f:
+        wmts = WebMapTileService('http://example.org/wmts', xml=f.read())
+    restored = WebMapTileService.from_snapshot(wmts.to_snapshot())
+
+    matrix = restored.tilematrixsets['EPSG:4326'].tilematrix['EPSG:4326:3']
+    assert matrix.matrixwidth == wmts.tilematrixsets['EPSG:4326'].tilematrix['EPSG:4326:3'].matrixwidth
+    layer = restored.contents['geonode:LMEs_64']
+    assert 'EPSG:4326:0' in layer.tilematrixsetlinks['EPSG:4326'].tilematrixlimits
+    request = restored.buildTileRequest(layer='geonode:LMEs_64', tilematrixset='EPSG:4326',
+                                        tilematrix='EPSG:4326:3', row=1, column=2, format='image/png')
+    assert 'TILEMATRIX=EPSG%3A4326%3A3' in request
+
+
+def test_snapshot_stale():
+    with open(resource_file('wms_JPLCapabilities.xml'), 'rb') as f:
+        data = WebMapService_1_1_1('http://example.org/wms', xml=f.read()).to_snapshot()
+
+    header, _, body = data.partition(b'\n')
+    stale = b'%s %d 0.0.0\n%s' % (snapshot.MAGIC, snapshot.SNAPSHOT_VERSION, body)
+    with pytest.raises(snapshot.SnapshotError, match='Stale'):
+        WebMapService_1_1_1.from_snapshot(stale)
+
+    with pytest.raises(snapshot.SnapshotError):
+        WebMapService_1_1_1.from_snapshot(b'not a snapshot')
+    with pytest.raises(snapshot.SnapshotError):
+        WebMapService_1_3_0.from_snapshot(data)
@@ -0,0 +1,75 @@
+import pytest
+from werkzeug import Response
+
+from tests.utils import resource_file
+
+from owslib.etree import etree
+from owslib.ows import ExceptionReport
+from owslib.swe.observation.sos200 import SensorObservationService_2_0_0, SOSGetObservationResponse, \
+    iter_observations
+from owslib.util import ServiceException, StreamingResponse
+
+CAPABILITIES = """<sos:Capabilities xmlns:sos="http://www.opengis.net/sos/2.0"
+  xmlns:ows="http://www.opengis.net/ows/1.1" xmlns:xlink="http://www.w3.org/1999/xlink" version="2.0.0">
+<ows:ServiceIdentification><ows:Title>SOS</ows:Title></ows:ServiceIdentification>
+<ows:ServiceProvider><ows:ProviderName>Provider</ows:ProviderName></ows:ServiceProvider>
+<ows:OperationsMetadata><ows:Operation name="GetObservation"><ows:DCP><ows:HTTP>
+<ows:Get xlink:href="%s"/></ows:HTTP></ows:DCP></ows:Operation></ows:OperationsMetadata>
+</sos:Capabilities>"""
+
+EXCEPTION = """<ows:ExceptionReport xmlns:ows="http://www.opengis.net/ows/1.1" version="2.0.0">
+<ows:Exception exceptionCode="InvalidParameterValue"><ows:ExceptionText>Failure</ows:ExceptionText></ows:Exception>
+</ows:ExceptionReport>"""
+
+
+def read_resource(filename):
+    with open(resource_file(filename), 'rb') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('filename', ['sos_52n_get_observation_ioos_wml2.xml',
+                                      'sos_52n_getobservation_wml2_response.xml'])
+def test_iter_observations(filename):
+    response = read_resource(filename)
+    expected = SOSGetObservationResponse(etree.fromstring(response)).observations
+
+    observations = []
+    for observation in iter_observations(resource_file(filename)):
+        observations.append(observation)
+        # the observations decoded before the previous one are no longer in the document
+        for previous in observations[:-2]:
+            assert list(previous.result._element.iterancestors())[-1].tag.endswith('observationData')
+
+    assert len(observations) == len(expected)
+    for observation, other in zip(observations, expected):
+        assert type(observation) is type(other)
+        assert observation.procedure == other.procedure
+        assert [str(p) for p in observation.get_result()] == [str(p) for p in other.get_result()]
+
+
+def test_iter_observations_exception():
+    with pytest.raises(ExceptionReport):
+        list(iter_observations(EXCEPTION.encode('utf-8')))
+
+
+def test_get_observation_stream(httpserver):
+    response = read_resource('sos_52n_getobservation_wml2_response.xml')
+    httpserver.expect_request('/sos', query_string={'service': 'SOS', 'request': 'GetCapabilities',
+                                                    'acceptversions': '2.0.0'}).respond_with_data(
+        CAPABILITIES % httpserver.url_for('/sos'), content_type='application/xml')
+    httpserver.expect_request('/sos', query_string={
+        'service': 'SOS', 'version': '2.0.0', 'request': 'GetObservation', 'offering': 'offering',
+        'observedProperty': 'property'}).respond_with_data(response, content_type='application/xml')
+    httpserver.expect_request('/sos').respond_with_handler(
+        lambda request: Response(EXCEPTION, content_type='application/xml'))
+    sos = SensorObservationService_2_0_0(httpserver.url_for('/sos'), '2.0.0')
+
+    stream = sos.get_observation(offerings=['offering'], observedProperties=['property'], stream=True)
+    assert isinstance(stream, StreamingResponse)
+    observations = list(iter_observations(stream))
+    assert len(observations) == 1
+    assert len(observations[0].get_result()) == 6
+
+    assert sos.get_observation(offerings=['offering'], observedProperties=['property']) == response
+    with pytest.raises(ServiceException):
+        sos.get_observation(offerings=['other'], observedProperties=['property'], stream=True)
@@ -0,0 +1,156 @@
+from datetime import datetime, timedelta, timezone
+import time
+from types import SimpleNamespace
+from urllib.parse import unquote
+
+import pytest
+from dateutil import parser
+from werkzeug import Response
+
+from owslib.swe.observation.om import MeasurementObservation
+from owslib.swe.observation.planner import ObservationPlanner, ObservationRequest
+from owslib.swe.observation.sos200 import SensorObservationService_2_0_0
+from owslib.swe.observation.waterml2 import MeasurementTimeseriesObservation
+
+UTC = timezone.utc
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=UTC)
+
+
+CAPABILITIES = """<sos:Capabilities xmlns:sos="http://www.opengis.net/sos/2.0"
+  xmlns:ows="http://www.opengis.net/ows/1.1" xmlns:xlink="http://www.w3.org/1999/xlink" version="2.0.0">
+<ows:ServiceIdentification><ows:Title>SOS</ows:Title></ows:ServiceIdentification>
+<ows:ServiceProvider><ows:ProviderName>Provider</ows:ProviderName></ows:ServiceProvider>
+<ows:OperationsMetadata><ows:Operation name="GetObservation"><ows:DCP><ows:HTTP>
+<ows:Get xlink:href="%s"/></ows:HTTP></ows:DCP></ows:Operation></ows:OperationsMetadata>
+</sos:Capabilities>"""
+
+RESPONSE = """<sos:GetObservationResponse xmlns:sos="http://www.opengis.net/sos/2.0"
+  xmlns:om="http://www.opengis.net/om/2.0" xmlns:gml="http://www.opengis.net/gml/3.2"
+  xmlns:xlink="http://www.w3.org/1999/xlink" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+  xmlns:wml2="http://www.opengis.net/waterml/2.0">%s</sos:GetObservationResponse>"""
+
+OBSERVATION = """<sos:observationData><om:OM_Observation gml:id="o">
+<om:phenomenonTime>%s</om:phenomenonTime>
+<om:procedure xlink:href="procedure"/><om:observedProperty xlink:href="%s"/><om:featureOfInterest xlink:href="%s"/>
+%s</om:OM_Observation></sos:observationData>"""
+
+TIMESERIES = """<om:result><wml2:MeasurementTimeseries gml:id="t">
+<wml2:defaultPointMetadata><wml2:DefaultTVPMeasurementMetadata/></wml2:defaultPointMetadata>%s
+</wml2:MeasurementTimeseries></om:result>"""
+
+POINT = """<wml2:point><wml2:MeasurementTVP><wml2:time>%s</wml2:time><wml2:value>%d</wml2:value>
+</wml2:MeasurementTVP></wml2:point>"""
+
+
+def observations(offering, observed_property, start, end):
+    """Hourly timeseries, and measurements at the bounds, from start to end (included)"""
+    times = [start + timedelta(hours=h) for h in range(int((end - start).total_seconds() // 3600) + 1)]
+    period = '<gml:TimePeriod gml:id="p"><gml:beginPosition>%s</gml:beginPosition>' \
+             '<gml:endPosition>%s</gml:endPosition></gml:TimePeriod>' % (start.isoformat(), end.isoformat())
+    points = ''.join(POINT % (t.isoformat(), t.hour) for t in times)
+    data = [OBSERVATION % (period, observed_property, offering, TIMESERIES % points)]
+    for t in (start, end):
+        instant = '<gml:TimeInstant gml:id="i"><gml:timePosition>%s</gml:timePosition></gml:TimeInstant>' % (
+            t.isoformat())
+        result = '<om:result xsi:type="gml:MeasureType" uom="m">%d</om:result>' % t.day
+        data.append(OBSERVATION % (instant, observed_property, offering, result))
+    return RESPONSE % ''.join(data)
+
+
+def test_plan():
+    planner = ObservationPlanner(SimpleNamespace(version='2.0.0'), step=timedelta(days=10), offerings_per_request=2)
+    plan = planner.plan(['a', 'b', 'c'], ['p', 'q'], datetime(2020, 1, 1), datetime(2020, 1, 25))
+
+    assert plan == [
+        ObservationRequest(['a', 'b'], ['p', 'q'], utc(2020, 1, 1), utc(2020, 1, 11)),
+        ObservationRequest(['c'], ['p', 'q'], utc(2020, 1, 1), utc(2020, 1, 11)),
+        ObservationRequest(['a', 'b'], ['p', 'q'], utc(2020, 1, 11), utc(2020, 1, 21)),
+        ObservationRequest(['c'], ['p', 'q'], utc(2020, 1, 11), utc(2020, 1, 21)),
+        ObservationRequest(['a', 'b'], ['p', 'q'], utc(2020, 1, 21), utc(2020, 1, 25)),
+        ObservationRequest(['c'], ['p', 'q'], utc(2020, 1, 21), utc(2020, 1, 25)),
+    ]
+    assert planner.event_time(datetime(2020, 1, 1, 1, tzinfo=timezone(timedelta(hours=1))), datetime(2020, 1, 2)) == \
+        'om:phenomenonTime,2020-01-01T00:00:00Z/2020-01-02T00:00:00Z'
+
+    with pytest.raises(ValueError):
+        planner.plan(['a'], ['p'], datetime(2020, 1, 2), datetime(2020, 1, 1))
+
+
+def test_get_responses_sos_100():
+    requests = []
+
+    def get_observation(**kwargs):
+        requests.append(kwargs)
+        return kwargs['eventTime'].encode('utf-8')
+
+    sos = SimpleNamespace(version='1.0.0', get_observation=get_observation)
+    planner = ObservationPlanner(sos, step=timedelta(days=1), properties_per_request=1, max_workers=3)
+    responses = list(planner.get_responses(['a'], ['p', 'q'], datetime(2020, 1, 1), datetime(2020, 1, 3),
+                                           responseFormat='text/xml'))
+
+    assert [(r.observedProperties, response) for r, response in responses] == [
+        (['p'], b'2020-01-01T00:00:00Z/2020-01-02T00:00:00Z'),
+        (['q'], b'2020-01-01T00:00:00Z/2020-01-02T00:00:00Z'),
+        (['p'], b'2020-01-02T00:00:00Z/2020-01-03T00:00:00Z'),
+        (['q'], b'2020-01-02T00:00:00Z/2020-01-03T00:00:00Z'),
+    ]
+    assert len(requests) == 4 and all(r['responseFormat'] == 'text/xml' for r in requests)
+    with pytest.raises(NotImplementedError):
+        planner.get_observations(['a'], ['p'], datetime(2020, 1, 1), datetime(2020, 1, 3))
+
+
+def test_get_responses_bounded():
+    requests = []
+
+    def get_observation(**kwargs):
+        requests.append(kwargs)
+        return b''
+
+    sos = SimpleNamespace(version='1.0.0', get_observation=get_observation)
+    planner = ObservationPlanner(sos, step=timedelta(days=1), max_workers=2)
+    responses = planner.get_responses(['a'], ['p'], datetime(2020, 1, 1), datetime(2020, 1, 21))
+    next(responses)
+    time.sleep(0.2)
+    # the consumer is idle, only the next sub-requests were run
+    assert len(requests) == 2
+    assert len(list(responses)) == 19
+    assert len(requests) == 20
+
+
+def test_get_observations(httpserver):
+    requests = []
+
+    def handler(request):
+        args = request.args
+        requests.append(args['temporalFilter'])
+        start, end = unquote(args['temporalFilter']).split(',')[1].split('/')
+        return Response(observations(args['offering'], args['observedProperty'], parser.parse(start),
+                                     parser.parse(end)), content_type='application/xml')
+
+    httpserver.expect_request('/sos', query_string={'service': 'SOS', 'request': 'GetCapabilities',
+                                                    'acceptversions': '2.0.0'}).respond_with_data(
+        CAPABILITIES % httpserver.url_for('/sos'), content_type='application/xml')
+    httpserver.expect_request('/sos').respond_with_handler(handler)
+    sos = SensorObservationService_2_0_0(httpserver.url_for('/sos'), '2.0.0')
+
+    planner = ObservationPlanner(sos, step=timedelta(hours=5), max_workers=3)
+    merged = planner.get_observations(['a', 'b'], ['p'], datetime(2020, 1, 1), datetime(2020, 1, 2))
+
+    assert len(requests) == 10
+    for offering in ('a', 'b'):
+        series = [o for o in merged if o.featureOfInterest == offering]
+        timeseries = [o for o in series if isinstance(o, MeasurementTimeseriesObservation)]
+        measurements = [o for o in series if isinstance(o, MeasurementObservation)]
+        assert len(timeseries) == 5
+        # the points are in time order, without the points repeated at the bounds of the windows
+        times = [p.datetime for o in timeseries for p in o.get_result()]
+        assert times == [utc(2020, 1, 1) + timedelta(hours=h) for h in range(25)]
+        # the measurements at the bounds of the windows are not repeated
+        assert [m.phenomenonTime for m in measurements] == \
+            [utc(2020, 1, 1) + timedelta(hours=h) for h in (0, 5, 10, 15, 20, 24)]
+    starts = [o.phenomenonTime if isinstance(o, MeasurementObservation) else o.phenomenonTime.start
+              for o in merged]
+    assert starts == sorted(starts)
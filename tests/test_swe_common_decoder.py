@@ -0,0 +1,121 @@
+import io
+
+import pytest
+
+from owslib.etree import etree
+from owslib.swe.common import DataArray, DataStream, Matrix, TextValuesDecoder
+
+np = pytest.importorskip('numpy')
+
+SWE = 'xmlns:swe="http://www.opengis.net/swe/2.0" xmlns:xlink="http://www.w3.org/1999/xlink"'
+
+RECORD = """<swe:elementType name="observation"><swe:DataRecord>
+  <swe:field name="time"><swe:Time><swe:uom xlink:href="http://www.opengis.net/def/uom/ISO-8601/0/Gregorian"/>
+  </swe:Time></swe:field>
+  <swe:field name="temperature"><swe:Quantity><swe:uom code="Cel"/></swe:Quantity></swe:field>
+  <swe:field name="count"><swe:Count/></swe:field>
+  <swe:field name="valid"><swe:Boolean/></swe:field>
+  <swe:field name="quality"><swe:Category/></swe:field>
+  <swe:field name="location"><swe:Vector>
+    <swe:coordinate name="lat"><swe:Quantity><swe:uom code="deg"/></swe:Quantity></swe:coordinate>
+    <swe:coordinate name="lon"><swe:Quantity><swe:uom code="deg"/></swe:Quantity></swe:coordinate>
+  </swe:Vector></swe:field>
+</swe:DataRecord></swe:elementType>"""
+
+VALUES = """
+  2020-01-01T00:00:00Z;12,5;3;true;good;52,1;4,9@@
+  2020-01-01T01:00:00+01:00;;4;false;bad;52,2;5,0@@
+  2020-01-01T02:00:00Z;13,25;5;1;good;52,3;5,1@@
+"""
+
+NAMES = ['time', 'temperature', 'count', 'valid', 'quality', 'location.lat', 'location.lon']
+
+
+def component(cls, tag, element_type, values, encoding='tokenSeparator=";" blockSeparator="@@" decimalSeparator=","'):
+    return cls(etree.fromstring("""<swe:%s %s>
+<swe:elementCount><swe:Count><swe:value>3</swe:value></swe:Count></swe:elementCount>%s
+<swe:encoding><swe:TextEncoding %s/></swe:encoding><swe:values>%s</swe:values></swe:%s>""" % (
+        tag, SWE, element_type, encoding, values, tag)))
+
+
+def check_values(array):
+    assert list(array['time'].astype(str)) == [
+        '2020-01-01T00:00:00.000000000', '2020-01-01T00:00:00.000000000', '2020-01-01T02:00:00.000000000']
+    np.testing.assert_array_equal(array['temperature'], [12.5, np.nan, 13.25])
+    assert array['count'].dtype == np.int64
+    assert list(array['count']) == [3, 4, 5]
+    assert list(array['valid']) == [True, False, True]
+    assert list(array['quality']) == ['good', 'bad', 'good']
+    assert list(array['location.lon']) == [4.9, 5.0, 5.1]
+
+
+@pytest.mark.parametrize('cls, tag', [(DataArray, 'DataArray'), (Matrix, 'Matrix'), (DataStream, 'DataStream')])
+def test_decode_values(cls, tag):
+    data = component(cls, tag, RECORD, VALUES)
+
+    array = data.decode_values()
+    assert array.shape == (3,)
+    assert list(array.dtype.names) == NAMES
+    check_values(array)
+
+    columns = data.decode_values(columns=True)
+    assert list(columns) == NAMES
+    check_values(columns)
+
+
+def test_decode_values_single_component():
+    data = component(DataArray, 'DataArray', """<swe:elementType name="speed"><swe:Quantity><swe:uom code="m/s"/>
+</swe:Quantity></swe:elementType>""", '1.5 2.5\n 3.5', 'tokenSeparator=" " blockSeparator=" "')
+    np.testing.assert_array_equal(data.decode_values(columns=True)['speed'], [1.5, 2.5, 3.5])
+
+    element_type = """<swe:elementType name="time">
+<swe:Time referenceTime="2020-01-01T00:00:00Z"><swe:uom code="min"/></swe:Time></swe:elementType>"""
+    data = component(DataArray, 'DataArray', element_type, '0,1.5,', 'tokenSeparator="," blockSeparator=","')
+    assert list(data.decode_values()['time'].astype(str)) == [
+        '2020-01-01T00:00:00.000000000', '2020-01-01T00:01:30.000000000']
+
+
+def test_decode_values_errors():
+    data = component(DataArray, 'DataArray', RECORD, '2020-01-01T00:00:00Z;12,5@@')
+    with pytest.raises(ValueError):
+        data.decode_values()
+
+    data = component(DataArray, 'DataArray', """<swe:elementType name="range"><swe:QuantityRange>
+<swe:uom code="m"/></swe:QuantityRange></swe:elementType>""", '1 2')
+    with pytest.raises(NotImplementedError):
+        data.decode_values()
+
+
+def test_iter_decode_values():
+    data = component(DataStream, 'DataStream', RECORD, '')
+    blocks = [block.strip() for block in VALUES.split('@@')[:3]] * 100
+
+    encoded = '@@'.join(blocks).encode('utf-8')
+    chunks = list(data.iter_decode_values(io.BytesIO(encoded), chunk_size=100))
+    assert 1 < len(chunks) < 300
+    array = np.concatenate(chunks)
+    assert len(array) == 300
+    check_values(array[:3])
+    check_values(array[-3:])
+
+    # separators split over chunks of text
+    chunks = [encoded[i:i + 7].decode('utf-8') for i in range(0, len(encoded), 7)]
+    columns = list(data.iter_decode_values(chunks, columns=True))
+    assert sum(len(c['count']) for c in columns) == 300
+
+    decoder = TextValuesDecoder(data.elementType, data.encoding)
+    assert len(np.concatenate(list(decoder.iter_decode(io.StringIO(VALUES), chunk_size=10)))) == 3
+
+
+def test_iter_decode_values_same_separators():
+    pair = """<swe:elementType name="pair"><swe:DataRecord>
+  <swe:field name="a"><swe:Count/></swe:field><swe:field name="b"><swe:Count/></swe:field>
+</swe:DataRecord></swe:elementType>"""
+    data = component(DataArray, 'DataArray', pair, '', 'tokenSeparator=" " blockSeparator=" "')
+    assert list(data.decode_values()['b']) == []
+
+    # the chunks end inside blocks
+    chunks = list(data.iter_decode_values(stream=['1 2 3', ' 4 5 6']))
+    array = np.concatenate(chunks)
+    assert list(array['a']) == [1, 3, 5]
+    assert list(array['b']) == [2, 4, 6]
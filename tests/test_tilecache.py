@@ -0,0 +1,105 @@
+import time
+
+from werkzeug import Response
+
+from owslib.tilecache import TileCache
+from owslib.tms import TileMapService, clear_tilemap_cache
+from owslib.wmts import _check_service_exception
+
+
+def test_tile_cache_headers(httpserver, tmp_path):
+    requests = []
+
+    def handler(request):
+        requests.append(request.headers.get('If-None-Match'))
+        if request.headers.get('If-None-Match') == '"v1"':
+            return Response(status=304, headers={'Cache-Control': 'max-age=60'})
+        return Response(b'tile', content_type='image/png', headers={'ETag': '"v1"', 'Cache-Control': 'no-cache'})
+
+    httpserver.expect_request('/tile').respond_with_handler(handler)
+    httpserver.expect_request('/private').respond_with_data(b'x', content_type='image/png',
+                                                            headers={'Cache-Control': 'no-store'})
+
+    cache = TileCache(str(tmp_path / 'tiles.sqlite'))
+    key = cache.key('layer', 'default', 'image/png', 'grid', '1', 2, 3, {'time': '2020'})
+    assert key != cache.key('layer', 'default', 'image/png', 'grid', '1', 2, 3, {'time': '2021'})
+
+    # no-cache: stored, but revalidated on each use
+    assert cache.open(key, httpserver.url_for('/tile')).read() == b'tile'
+    assert cache.open(key, httpserver.url_for('/tile')).read() == b'tile'
+    assert requests == [None, '"v1"']
+    # fresh for max-age seconds after the revalidation
+    response = cache.open(key, httpserver.url_for('/tile'))
+    assert response.read() == b'tile'
+    assert response.info()['Content-Type'] == 'image/png'
+    assert len(requests) == 2
+    assert (cache.hits, cache.misses, cache.revalidations) == (1, 1, 1)
+
+    other = cache.key('layer', 'default', 'image/png', 'grid', '1', 0, 0)
+    for _ in range(2):
+        assert cache.open(other, httpserver.url_for('/private')).read() == b'x'
+    assert cache.misses == 3
+
+    # the cache persists
+    cache.close()
+    cache = TileCache(str(tmp_path / 'tiles.sqlite'))
+    assert cache.open(key, httpserver.url_for('/tile')).read() == b'tile'
+    assert cache.hits == 1
+
+
+def test_tile_cache_eviction(httpserver, tmp_path):
+    httpserver.expect_request('/tile').respond_with_data(b'0123456789', content_type='image/png')
+
+    cache = TileCache(str(tmp_path / 'tiles.sqlite'), max_size=35)
+    keys = [cache.key('layer', None, 'png', 'grid', 0, 0, col) for col in range(5)]
+    for key in keys[:3]:
+        cache.open(key, httpserver.url_for('/tile'))
+    cache.open(keys[0], httpserver.url_for('/tile'))  # most recently used
+    for key in keys[3:]:
+        cache.open(key, httpserver.url_for('/tile'))
+    assert cache.misses == 5
+    assert cache._size == 30
+
+    cache.open(keys[0], httpserver.url_for('/tile'))
+    cache.open(keys[4], httpserver.url_for('/tile'))
+    assert cache.hits == 3
+    cache.open(keys[1], httpserver.url_for('/tile'))
+    assert cache.misses == 6
+
+    cache = TileCache(str(tmp_path / 'old.sqlite'), max_age=0.05)
+    cache.open(keys[0], httpserver.url_for('/tile'))
+    time.sleep(0.1)
+    cache.open(keys[0], httpserver.url_for('/tile'))
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_tms_tile_cache(httpserver, tmp_path):
+    clear_tilemap_cache()
+    url = httpserver.url_for('/tms/1.0.0')
+    httpserver.expect_request('/tms/1.0.0/world').respond_with_data(
+        """<TileMap version="1.0.0"><Title>World</Title><SRS>EPSG:4326</SRS>
+        <BoundingBox minx="-180" miny="-90" maxx="180" maxy="90"/><Origin x="-180" y="-90"/>
+        <TileFormat width="256" height="256" mime-type="image/png" extension="png"/>
+        <TileSets profile="global-geodetic"><TileSet href="%s/world/0" units-per-pixel="0.703125" order="0"/>
+        </TileSets></TileMap>""" % url, content_type='text/xml')
+    httpserver.expect_request('/tms/1.0.0/world/0/1/0.png').respond_with_data(b'tile', content_type='image/png')
+
+    cache = TileCache(str(tmp_path / 'tiles.sqlite'))
+    tms = TileMapService(url, xml="""<TileMapService version="1.0.0"><Title>Test</Title><TileMaps>
+        <TileMap title="World" srs="EPSG:4326" profile="global-geodetic" href="%s/world"/>
+        </TileMaps></TileMapService>""" % url, tile_cache=cache)
+    for _ in range(2):
+        assert tms.gettile(1, 0, 0, title='World', srs='EPSG:4326').read() == b'tile'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_tile_cache_without_content_type(tmp_path):
+    cache = TileCache(str(tmp_path / 'tiles.sqlite'))
+    key = cache.key('world', 'default', 'image/png', 'grid', '1', 0, 1)
+    now = time.time()
+    cache._store(key, b'tile', {}, now, now + 60)
+
+    u = cache.open(key, 'http://example.org/tile')
+    assert cache.hits == 1
+    _check_service_exception(u)  # no Content-Type, not an exception report
+    assert u.read() == b'tile'
@@ -19,3 +19,42 @@ def test_tms():
     out = open(scratch_file('brtachtergrondkaart.png'), 'wb')
     out.write(tile.read())
     out.close()
+
+
+TILEMAP = """<TileMap version="1.0.0"><Title>Map %d</Title><SRS>EPSG:4326</SRS>
+<BoundingBox minx="-180" miny="-90" maxx="180" maxy="90"/><Origin x="-180" y="-90"/>
+<TileFormat width="256" height="256" mime-type="image/png" extension="png"/></TileMap>"""
+
+
+def test_tms_prefetch_tilemaps(httpserver):
+    from owslib.tms import TileMapService, clear_tilemap_cache
+    clear_tilemap_cache()
+    url = httpserver.url_for('/tms/1.0.0')
+    for i in range(20):
+        httpserver.expect_request('/tms/1.0.0/map%d' % i).respond_with_data(TILEMAP % i, content_type='text/xml')
+    xml = '<TileMapService version="1.0.0"><Title>Test</Title><TileMaps>%s</TileMaps></TileMapService>' % ''.join(
+        '<TileMap title="Map %d" srs="EPSG:4326" profile="global-geodetic" href="%s/map%d"/>' % (i, url, i)
+        for i in range(20))
+
+    tms = TileMapService(url, xml=xml, prefetch_tilemaps=True)
+    assert len(httpserver.log) == 20
+    assert [cm.title for cm in tms.contents.values()] == [cm.tilemap.title for cm in tms.contents.values()]
+    assert tms.prefetch_tilemaps() == 0
+
+    # shared by other instances
+    other = TileMapService(url, xml=xml)
+    assert other.prefetch_tilemaps() == 20
+    assert other.contents[url + '/map3'].width == 256
+    assert len(httpserver.log) == 20
+
+    # at most TILEMAP_CACHE_SIZE documents are shared, the least recently used are dropped
+    from owslib import tms as tms_module
+    size = tms_module.TILEMAP_CACHE_SIZE
+    tms_module.TILEMAP_CACHE_SIZE = 5
+    try:
+        clear_tilemap_cache()
+        assert TileMapService(url, xml=xml).prefetch_tilemaps(max_workers=1) == 20
+        assert len(tms_module._tilemaps) == 5
+        assert len(httpserver.log) == 40
+    finally:
+        tms_module.TILEMAP_CACHE_SIZE = size
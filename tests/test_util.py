@@ -13,8 +13,11 @@ from datetime import datetime, timezone
 from unittest import mock
 
 import pytest
+from requests.exceptions import HTTPError
 from owslib.etree import etree
 from owslib.util import clean_ows_url, build_get_url, strip_bom, extract_time, ResponseWrapper, getXMLTree, str2bool
+from owslib.util import HTTPSession, get_default_session, set_default_session, openURL, http_get
+from owslib.util import nspath_eval, nspath_cache
 
 
 def test_strip_bom():
@@ -144,3 +147,63 @@ def test_str2bool():
     assert not str2bool('0')
     assert int(str2bool('true')) == 1
     assert int(str2bool('false')) == 0
+
+
+def test_nspath_cache():
+    namespaces = {'gmd': 'http://www.isotc211.org/2005/gmd', 'gco': 'http://www.isotc211.org/2005/gco'}
+    nspath = nspath_cache(namespaces)
+
+    xpath = 'gmd:fileIdentifier/gco:CharacterString'
+    assert nspath(xpath) == nspath_eval(xpath, namespaces)
+    assert nspath(xpath) is nspath(xpath)
+    assert nspath.cache_info().misses == 1
+
+
+def test_http_session_reuses_connections(httpserver):
+    httpserver.expect_request('/ows').respond_with_data('<ok/>', content_type='text/xml')
+    url = httpserver.url_for('/ows')
+
+    with HTTPSession() as session:
+        for _ in range(3):
+            assert openURL(url, session=session).read() == b'<ok/>'
+        assert http_get(url, session=session).content == b'<ok/>'
+
+        stats = session.stats['localhost']
+        assert stats['requests'] == 4
+        assert stats['connections'] == 1
+        assert stats['reused'] == 3
+
+        session.reset_stats()
+        assert session.stats == {}
+
+
+def test_http_session_host_pool_maxsize():
+    session = HTTPSession(pool_maxsize=4, host_pool_maxsize={'tiles.example.com': 16})
+    assert session.session.get_adapter('https://tiles.example.com/wmts')._pool_maxsize == 16
+    assert session.session.get_adapter('https://example.com/wms')._pool_maxsize == 4
+
+
+def test_default_session(httpserver):
+    httpserver.expect_request('/ows').respond_with_data('<ok/>', content_type='text/xml')
+
+    session = HTTPSession()
+    set_default_session(session)
+    try:
+        assert get_default_session() is session
+        openURL(httpserver.url_for('/ows'))
+        assert session.stats['localhost']['requests'] == 1
+    finally:
+        set_default_session(None)
+    assert get_default_session() is not session
+
+
+def test_stream_error_releases_connection(httpserver):
+    httpserver.expect_request('/missing').respond_with_data('missing', status=404)
+    httpserver.expect_request('/ows').respond_with_data('<ok/>', content_type='text/xml')
+
+    with HTTPSession() as session:
+        with pytest.raises(HTTPError):
+            openURL(httpserver.url_for('/missing'), session=session, stream=True)
+        # the connection of the failed request is reused
+        assert openURL(httpserver.url_for('/ows'), session=session).read() == b'<ok/>'
+        assert session.stats['localhost']['connections'] == 1
@@ -0,0 +1,75 @@
+from datetime import timezone
+
+import pytest
+
+from tests.utils import resource_file
+
+from owslib.etree import etree
+from owslib.swe.observation.waterml2 import MeasurementTimeseries, TimeValuePair, nspv
+
+np = pytest.importorskip('numpy')
+
+
+def timeseries(filename):
+    root = etree.parse(resource_file(filename)).getroot()
+    return [MeasurementTimeseries(e) for e in root.iter(nspv('wml2:MeasurementTimeseries'))]
+
+
+@pytest.mark.parametrize('filename', ['sos_52n_getobservation_wml2_response.xml',
+                                      'sos_52n_get_observation_ioos_wml2.xml'])
+def test_to_arrays(filename):
+    for ts in timeseries(filename):
+        times, values = ts.to_arrays()
+        points = list(ts)
+        assert len(ts) == len(points) == len(ts.points) == len(times) == len(values)
+        assert all(isinstance(p, TimeValuePair) for p in points)
+        assert times.dtype == np.dtype('datetime64[ns]')
+        assert list(times) == [np.datetime64(p.datetime.astimezone(timezone.utc).replace(tzinfo=None), 'ns')
+                               for p in points]
+        assert values.dtype == np.float64
+        np.testing.assert_array_equal(values, [p.value for p in points])
+        assert ts.to_arrays() is ts.to_arrays()
+        # the points are built once
+        assert ts.points is ts.points
+        assert ts[0] is points[0]
+
+
+def test_to_arrays_missing_values():
+    xml = b"""<wml2:MeasurementTimeseries xmlns:wml2="http://www.opengis.net/waterml/2.0">
+<wml2:defaultPointMetadata><wml2:DefaultTVPMeasurementMetadata/></wml2:defaultPointMetadata>
+<wml2:point><wml2:MeasurementTVP><wml2:time>2014-07-01T10:00:00+10:00</wml2:time><wml2:value>1.5</wml2:value>
+</wml2:MeasurementTVP></wml2:point>
+<wml2:point><wml2:MeasurementTVP><wml2:time>2014-07-01T01:00:00Z</wml2:time><wml2:value/></wml2:MeasurementTVP>
+</wml2:point>
+<wml2:point><wml2:MeasurementTVP><wml2:time>2014-07-01T02:00:00.5-01:30</wml2:time></wml2:MeasurementTVP>
+</wml2:point>
+</wml2:MeasurementTimeseries>"""
+    ts = MeasurementTimeseries(etree.fromstring(xml))
+
+    times, values = ts.to_arrays()
+    assert list(times.astype(str)) == ['2014-07-01T00:00:00.000000000', '2014-07-01T01:00:00.000000000',
+                                       '2014-07-01T03:30:00.500000000']
+    assert values[0] == 1.5
+    assert np.isnan(values[1:]).all()
+
+
+def test_points_changes():
+    ts = timeseries('sos_52n_getobservation_wml2_response.xml')[0]
+    times, values = ts.to_arrays()
+    count = len(ts)
+    first, last = ts.points[0], ts.points[-1]
+    assert ts.to_arrays()[0] is times
+
+    # the changes of the points are followed by len and to_arrays
+    del ts.points[0]
+    assert len(ts) == count - 1
+    np.testing.assert_array_equal(ts.to_arrays()[0], times[1:])
+    np.testing.assert_array_equal(ts.to_arrays()[1], values[1:])
+    del ts[-1]
+    assert len(ts) == len(ts.to_arrays()[1]) == count - 2
+
+    ts.points = [last, first]
+    assert len(ts) == 2
+    assert list(ts) == [last, first]
+    np.testing.assert_array_equal(ts.to_arrays()[0], [times[-1], times[0]])
+    assert ts.to_arrays() is ts.to_arrays()
@@ -0,0 +1,75 @@
+import pytest
+
+from tests.utils import resource_file
+
+from owslib.etree import etree
+from owslib.waterml.wml import ColumnarValues, Values
+from owslib.waterml.wml10 import WaterML_1_0
+from owslib.waterml.wml11 import WaterML_1_1
+
+np = pytest.importorskip('numpy')
+
+
+def get_values(cls, filename, columnar):
+    with open(resource_file(filename), 'rb') as f:
+        return cls(f.read(), columnar=columnar).response.time_series[0].values[0]
+
+
+@pytest.mark.parametrize('cls, filename', [
+    (WaterML_1_0, 'cuahsi_example_get_values_10.xml'),
+    (WaterML_1_1, 'cuahsi_example_get_values.xml'),
+])
+def test_columnar_values(cls, filename):
+    values = get_values(cls, filename, False)
+    columnar = get_values(cls, filename, True)
+    assert type(values) is Values
+    assert isinstance(columnar, ColumnarValues)
+
+    assert len(columnar) == len(values.values)
+    assert columnar.date_times.dtype == np.dtype('datetime64[ns]')
+    assert list(columnar.date_times) == [np.datetime64(v.date_time, 'ns') for v in values]
+    assert columnar.data.dtype == np.float64
+    assert list(columnar.data) == [float(v.value) for v in values]
+    for name, _ in ColumnarValues.CATEGORIES:
+        assert [columnar.categories[name][c] if c >= 0 else None for c in columnar.codes[name]] == \
+            [getattr(v, name) for v in values]
+
+    # value objects are created (once) when iterated
+    assert [v.value for v in columnar] == [v.value for v in values]
+    assert columnar.values is columnar.values
+    assert columnar.values[0].date_time == values.values[0].date_time
+
+
+def test_columnar_get_date_values():
+    values = get_values(WaterML_1_0, 'cuahsi_example_get_values_10.xml', False)
+    columnar = get_values(WaterML_1_0, 'cuahsi_example_get_values_10.xml', True)
+
+    date_times, data = columnar.get_date_values(method_id='27', sample_id='600')
+    assert [(d, float(v)) for d, v in values.get_date_values(method_id='27', sample_id='600')] == \
+        [(d.astype('datetime64[us]').item(), v) for d, v in zip(date_times, data)] == \
+        [(values.values[10].date_time, 0.7004)]
+
+    date_times, data = columnar.get_date_values(quality_level='Quality controlled data')
+    assert len(date_times) == len(data) == 29
+    date_times, data = columnar.get_date_values(source_id='unknown')
+    assert len(date_times) == len(data) == 0
+    assert list(columnar.mask(censor_code='nc', sample_id='590')) == [True] + [False] * 28
+
+
+def test_columnar_parse():
+    xml = b"""<values xmlns="http://www.cuahsi.org/waterML/1.1/">
+<value dateTime="2020-01-01T00:00:00Z" dateTimeUTC="2020-01-01T00:00:00">1.5</value>
+<value dateTime="2020-01-01T01:00:00+01:00" dateTimeUTC="2020-01-01T00:00:00">-9999</value>
+<value dateTime="2020-01-01T02:00:00" methodCode="1">n/a</value>
+<value dateTime="2020-01-01T03:00:00" methodCode="2"/>
+</values>"""
+    columnar = ColumnarValues(etree.fromstring(xml), 'wml1.1')
+
+    assert list(columnar.date_times.astype(str)) == [
+        '2020-01-01T00:00:00.000000000', '2020-01-01T00:00:00.000000000',
+        '2020-01-01T02:00:00.000000000', '2020-01-01T03:00:00.000000000']
+    assert list(np.isnat(columnar.date_times_utc)) == [False, False, True, True]
+    assert list(columnar.data[:2]) == [1.5, -9999.0]
+    assert np.isnan(columnar.data[2:]).all()
+    assert columnar.categories['method_code'] == ['1', '2']
+    assert list(columnar.codes['method_code']) == [-1, -1, 0, 1]
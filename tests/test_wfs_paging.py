@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+from werkzeug import Response
+
+from owslib.wfs import WebFeatureService
+
+SERVICE_URL = 'https://www.dov.vlaanderen.be:443/geoserver/gw_meetnetten/meetnetten/wfs'
+
+HITS = '<wfs:FeatureCollection xmlns:wfs="http://www.opengis.net/wfs/2.0" numberMatched="%s" numberReturned="0"/>'
+
+
+@pytest.fixture
+def wfs20(httpserver):
+    with open('tests/resources/wfs_dov_getcapabilities_200.xml', 'rb') as f:
+        xml = f.read().replace(SERVICE_URL.encode(), httpserver.url_for('/wfs').encode())
+    return WebFeatureService(httpserver.url_for('/wfs'), version='2.0.0', xml=xml)
+
+
+def serve_pages(httpserver, number_matched, fail=()):
+    """Serve hits and pages as ``startindex:count``, failing once for each startindex in `fail`"""
+    requests = []
+    lock = threading.Lock()
+
+    def handler(request):
+        args = request.args
+        if args.get('resultType') == 'hits':
+            return Response(HITS % number_matched, content_type='text/xml')
+        page = (int(args.get('startindex', 0)), int(args['count']))
+        with lock:
+            requests.append(page)
+            failed = page[0] in fail and requests.count(page) == 1
+        if failed:
+            return Response('unavailable', status=503)
+        return Response('%d:%d' % page, content_type='text/plain')
+
+    httpserver.expect_request('/wfs').respond_with_handler(handler)
+    return requests
+
+
+def test_getfeature_all(httpserver, wfs20):
+    requests = serve_pages(httpserver, 25)
+
+    pages = wfs20.getfeature_all(typename='gw_meetnetten:meetnetten', page_size=10, max_workers=3)
+
+    assert [page.read() for page in pages] == [b'0:10', b'10:10', b'20:5']
+    assert sorted(requests) == [(0, 10), (10, 10), (20, 5)]
+
+
+def test_iter_pages_window_and_retries(httpserver, wfs20):
+    requests = serve_pages(httpserver, 'unknown', fail=[15])
+
+    with pytest.raises(ValueError):
+        list(wfs20.iter_pages(typename='gw_meetnetten:meetnetten'))
+
+    pages = wfs20.iter_pages(typename='gw_meetnetten:meetnetten', page_size=10, as_completed=True,
+                             backoff=0, startindex=5, maxfeatures=23)
+    pages = dict((start, page.read()) for start, page in pages)
+
+    assert pages == {5: b'5:10', 15: b'15:10', 25: b'25:3'}
+    assert requests.count((15, 10)) == 2
+
+
+def test_iter_pages_retries_exhausted(httpserver, wfs20):
+    serve_pages(httpserver, 10, fail=[0])
+
+    with pytest.raises(Exception, match='503'):
+        list(wfs20.iter_pages(typename='gw_meetnetten:meetnetten', page_size=10, retries=0))
+
+
+def test_iter_pages_exception_report_not_retried(httpserver, wfs20):
+    requests = []
+
+    def handler(request):
+        if request.args.get('resultType') == 'hits':
+            return Response(HITS % 10, content_type='text/xml')
+        requests.append(request.args['count'])
+        return Response('<ows:ExceptionReport xmlns:ows="http://www.opengis.net/ows/1.1"><ows:Exception '
+                        'exceptionCode="InvalidParameterValue"/></ows:ExceptionReport>', status=400)
+
+    httpserver.expect_request('/wfs').respond_with_handler(handler)
+
+    with pytest.raises(Exception, match='InvalidParameterValue'):
+        list(wfs20.iter_pages(typename='gw_meetnetten:meetnetten', page_size=10, backoff=0))
+    assert len(requests) == 1
@@ -0,0 +1,59 @@
+import pytest
+
+from owslib.util import ServiceException, StreamingResponse
+from owslib.wfs import WebFeatureService
+
+SERVICE_URL = 'https://www.dov.vlaanderen.be:443/geoserver/gw_meetnetten/meetnetten/wfs'
+
+CAPABILITIES = {
+    '1.0.0': 'tests/resources/wfs_dov_getcapabilities_100_nometadata.xml',
+    '1.1.0': 'tests/resources/wfs_dov_getcapabilities_110.xml',
+    '2.0.0': 'tests/resources/wfs_dov_getcapabilities_200.xml',
+}
+
+FEATURES = b'<wfs:FeatureCollection xmlns:wfs="http://www.opengis.net/wfs/2.0">' + \
+    b'<wfs:member/>' * 20000 + b'</wfs:FeatureCollection>'
+
+
+def wfs(httpserver, version):
+    with open(CAPABILITIES[version], 'rb') as f:
+        xml = f.read().replace(SERVICE_URL.encode(), httpserver.url_for('/wfs').encode())
+    return WebFeatureService(httpserver.url_for('/wfs'), version=version, xml=xml)
+
+
+@pytest.mark.parametrize('version', ['1.0.0', '1.1.0', '2.0.0'])
+def test_getfeature_stream(httpserver, version):
+    httpserver.expect_request('/wfs').respond_with_data(FEATURES, content_type='text/xml')
+
+    with wfs(httpserver, version).getfeature(typename=['gw_meetnetten:meetnetten'], stream=True) as response:
+        assert isinstance(response, StreamingResponse)
+        assert response.peek(20).startswith(b'<wfs:FeatureCollection')
+        chunks = list(response.iter_chunks(1024))
+
+    assert httpserver.log[0][0].args['request'] == 'GetFeature'
+    assert max(len(chunk) for chunk in chunks) == 1024
+    assert b''.join(chunks) == FEATURES
+
+
+@pytest.mark.parametrize('version, report', [
+    ('1.1.0', b'<?xml version="1.0"?><!-- error --><ServiceExceptionReport xmlns="http://www.opengis.net/ogc">'
+              b'<ServiceException>Unknown typename</ServiceException></ServiceExceptionReport>'),
+    ('2.0.0', b'<ows:ExceptionReport xmlns:ows="http://www.opengis.net/ows/1.1"><ows:Exception>'
+              b'<ows:ExceptionText>Unknown typename</ows:ExceptionText></ows:Exception></ows:ExceptionReport>'),
+])
+def test_getfeature_stream_service_exception(httpserver, version, report):
+    # exception reports served as data are detected from the first bytes
+    httpserver.expect_request('/wfs').respond_with_data(report, content_type='application/octet-stream')
+
+    with pytest.raises(ServiceException, match='Unknown typename'):
+        wfs(httpserver, version).getfeature(typename=['gw_meetnetten:meetnetten'], stream=True)
+
+
+def test_getfeature_stream_json(httpserver):
+    httpserver.expect_request('/wfs').respond_with_data(
+        b'{"type": "FeatureCollection", "features": []}', content_type='application/json')
+
+    response = wfs(httpserver, '2.0.0').getfeature(
+        typename=['gw_meetnetten:meetnetten'], outputFormat='application/json', stream=True)
+    assert response.read() == b'{"type": "FeatureCollection", "features": []}'
+    response.close()
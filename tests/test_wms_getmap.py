@@ -210,7 +210,7 @@ def test_wms_sends_headers(wms_version):
     when performing HTTP requests (in this case for GetCapabilities)
     """
 
-    with mock.patch('owslib.util.requests.request', side_effect=RuntimeError) as mock_request:
+    with mock.patch('owslib.util.HTTPSession.request', side_effect=RuntimeError) as mock_request:
         try:
             WebMapService(
                 'http://example.com/wms',
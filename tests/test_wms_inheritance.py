@@ -0,0 +1,57 @@
+import pytest
+
+from owslib.wms import WebMapService
+
+CAPABILITIES_111 = b"""<WMT_MS_Capabilities version="1.1.1">
+<Service><Name>OGC:WMS</Name><Title>Test</Title></Service>
+<Capability>
+  <Request><GetMap><Format>image/png</Format></GetMap></Request>
+  <Layer>
+    <Title>Root</Title>
+    <SRS>EPSG:4326 EPSG:3857</SRS>
+    <Style><Name>default</Name><Title>Default</Title></Style>
+    <Layer><Name>a</Name><Title>A</Title></Layer>
+    <Layer><Name>b</Name><Title>B</Title><SRS>EPSG:4326</SRS></Layer>
+    <Layer><Name>c</Name><Title>C</Title><SRS>EPSG:31370</SRS>
+      <Style><Name>default</Name><Title>Other</Title></Style>
+      <Style><Name>red</Name><Title>Red</Title></Style>
+    </Layer>
+    <Layer><Name>d</Name><Title>D</Title><SRS>EPSG:31370</SRS></Layer>
+  </Layer>
+</Capability>
+</WMT_MS_Capabilities>"""
+
+CAPABILITIES_130 = CAPABILITIES_111.replace(
+    b'<WMT_MS_Capabilities version="1.1.1">',
+    b'<WMS_Capabilities version="1.3.0" xmlns="http://www.opengis.net/wms">'
+).replace(b'</WMT_MS_Capabilities>', b'</WMS_Capabilities>').replace(b'SRS>', b'CRS>')
+
+
+@pytest.mark.parametrize('version, xml', [('1.1.1', CAPABILITIES_111), ('1.3.0', CAPABILITIES_130)])
+def test_wms_inherited_crs_and_styles(version, xml):
+    wms = WebMapService('url', version=version, xml=xml)
+    a, b, c, d = wms['a'], wms['b'], wms['c'], wms['d']
+
+    assert sorted(a.crsOptions) == ['EPSG:3857', 'EPSG:4326']
+    assert sorted(c.crsOptions) == ['EPSG:31370', 'EPSG:3857', 'EPSG:4326']
+    assert a.styles == {'default': {'title': 'Default'}}
+    assert c.styles == {'default': {'title': 'Other'}, 'red': {'title': 'Red'}}
+
+    # layers which add nothing share the set of their parent, and siblings
+    # adding the same CRS share their set
+    assert a._crs is a.parent._crs
+    assert b._crs is a.parent._crs
+    assert c._crs is d._crs
+    assert a._styles is a.parent._styles
+
+    # copies are made on access, and changes do not leak to other layers
+    a.crsOptions.append('EPSG:900913')
+    a.styles['blue'] = {'title': 'Blue'}
+    assert 'EPSG:900913' in a.crsOptions
+    assert 'EPSG:900913' not in b.crsOptions
+    assert 'blue' not in a.parent.styles
+    assert 'blue' not in b.styles
+
+    c.crsOptions = ['EPSG:31370']
+    assert c.crsOptions == ['EPSG:31370']
+    assert sorted(d.crsOptions) == ['EPSG:31370', 'EPSG:3857', 'EPSG:4326']
@@ -0,0 +1,58 @@
+import pytest
+
+from owslib.map.common import LazyContents
+from owslib.wms import WebMapService
+from tests.utils import resource_file
+
+ATTRIBUTES = ('index', 'title', 'crsOptions', 'styles', 'boundingBox', 'boundingBoxWGS84',
+              'keywords', 'timepositions', 'metadataUrls')
+
+
+@pytest.mark.parametrize('filename, version', [
+    ('wms_JPLCapabilities.xml', '1.1.1'),
+    ('wms_nationalatlas_getcapabilities_130.xml', '1.3.0'),
+    ('wms_nccs_nasa_getcap_130.xml', '1.3.0'),
+])
+def test_wms_lazy_contents(filename, version):
+    with open(resource_file(filename), 'rb') as f:
+        xml = f.read()
+    wms = WebMapService('url', version=version, xml=xml)
+    lazy = WebMapService('url', version=version, xml=xml, lazy=True)
+
+    assert isinstance(lazy.contents, LazyContents)
+    assert list(lazy.contents) == list(wms.contents)
+
+    for name, layer in wms.contents.items():
+        copy = lazy[name]
+        for attribute in ATTRIBUTES:
+            assert getattr(copy, attribute) == getattr(layer, attribute)
+        assert [c.id for c in copy.children] == [c.id for c in layer.children]
+        assert [c.id for c in copy.layers] == [c.id for c in layer.layers]
+        assert [c.index for c in copy.children] == [c.index for c in layer.children]
+        # one content metadata per layer, as in eager mode
+        for child in copy.children:
+            assert lazy.contents[child.id] is child
+            assert child.parent is copy
+
+
+def test_wms_lazy_builds_on_access():
+    with open(resource_file('wms_JPLCapabilities.xml'), 'rb') as f:
+        wms = WebMapService('url', version='1.1.1', xml=f.read(), lazy=True)
+
+    assert len(wms.contents) == 15
+    assert 'modis' in wms.contents
+    assert len(wms.contents._built) == 0
+
+    layer = wms['modis']
+    # the layer and its (unnamed) parent layer, whose properties it inherits
+    assert len(wms.contents._built) == 2
+    assert layer.parent.id is None
+    assert 'EPSG:4326' in layer.crsOptions
+    assert wms['modis'] is layer
+
+    with pytest.raises(KeyError):
+        wms['missing']
+
+    restored = type(wms).from_snapshot(wms.to_snapshot())
+    assert list(restored.contents) == list(wms.contents)
+    assert restored['modis'].crsOptions == layer.crsOptions
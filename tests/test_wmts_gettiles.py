@@ -0,0 +1,162 @@
+import time
+
+import pytest
+from requests.exceptions import HTTPError
+from werkzeug import Response
+
+from owslib.tilecache import TileCache
+from owslib.util import RateLimiter
+from owslib import wmts as wmts_module
+from owslib.wmts import TileURLTemplate, WebMapTileService
+from tests.utils import resource_file
+
+CAPABILITIES = """<Capabilities xmlns="http://www.opengis.net/wmts/1.0" xmlns:ows="http://www.opengis.net/ows/1.1"
+    xmlns:xlink="http://www.w3.org/1999/xlink" version="1.0.0">
+  <ows:OperationsMetadata>
+    <ows:Operation name="GetTile">
+      <ows:DCP><ows:HTTP><ows:Get xlink:href="{url}/kvp?">
+        <ows:Constraint name="GetEncoding"><ows:AllowedValues>
+          <ows:Value>{encoding}</ows:Value>
+        </ows:AllowedValues></ows:Constraint>
+      </ows:Get></ows:HTTP></ows:DCP>
+    </ows:Operation>
+  </ows:OperationsMetadata>
+  <Contents>
+    <Layer>
+      <ows:Identifier>world</ows:Identifier>
+      <Style isDefault="true"><ows:Identifier>default</ows:Identifier></Style>
+      <Format>image/png</Format>
+      <TileMatrixSetLink><TileMatrixSet>grid</TileMatrixSet></TileMatrixSetLink>
+      <ResourceURL format="image/png" resourceType="tile"
+          template="{url}/rest/{{Style}}/{{TileMatrixSet}}/{{TileMatrix}}/{{TileRow}}/{{TileCol}}.png"/>
+    </Layer>
+    <TileMatrixSet>
+      <ows:Identifier>grid</ows:Identifier>
+      <ows:SupportedCRS>urn:ogc:def:crs:EPSG::3857</ows:SupportedCRS>
+      <TileMatrix>
+        <ows:Identifier>1</ows:Identifier>
+        <ScaleDenominator>279541132.0143589</ScaleDenominator>
+        <TopLeftCorner>-20037508.34 20037508.34</TopLeftCorner>
+        <TileWidth>256</TileWidth><TileHeight>256</TileHeight>
+        <MatrixWidth>2</MatrixWidth><MatrixHeight>2</MatrixHeight>
+      </TileMatrix>
+    </TileMatrixSet>
+  </Contents>
+</Capabilities>"""
+
+
+def wmts(httpserver, encoding):
+    url = httpserver.url_for('').rstrip('/')
+    return WebMapTileService(url, xml=CAPABILITIES.format(url=url, encoding=encoding).encode())
+
+
+def test_gettiles_rest(httpserver):
+    for row in range(2):
+        for col in range(2):
+            httpserver.expect_request('/rest/default/grid/1/%d/%d.png' % (row, col)).respond_with_data(
+                b'%d-%d' % (row, col), content_type='image/png')
+
+    service = wmts(httpserver, 'RESTful')
+    assert service.restonly
+    tiles = service.gettiles('world', 'grid', '1', [(0, 0), (0, 1), (1, 0), (1, 1)], max_workers=2)
+    assert sorted(tiles) == [(0, 0, b'0-0'), (0, 1, b'0-1'), (1, 0, b'1-0'), (1, 1, b'1-1')]
+
+
+def test_gettiles_tile_cache(httpserver, tmp_path):
+    httpserver.expect_request('/rest/default/grid/1/0/1.png').respond_with_data(b'tile', content_type='image/png')
+
+    service = wmts(httpserver, 'RESTful')
+    service.tile_cache = cache = TileCache(str(tmp_path / 'tiles.sqlite'))
+    for _ in range(2):
+        assert list(service.gettiles('world', 'grid', '1', [(0, 1)])) == [(0, 1, b'tile')]
+    assert service.gettile(layer='world', tilematrix='1', row=0, column=1).read() == b'tile'
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert len(httpserver.log) == 1
+
+
+def test_tile_cache_services(httpserver, tmp_path):
+    httpserver.expect_request('/rest/default/grid/1/0/1.png').respond_with_data(b'a', content_type='image/png')
+    httpserver.expect_request('/b/rest/default/grid/1/0/1.png').respond_with_data(b'b', content_type='image/png')
+
+    url = httpserver.url_for('/b')
+    other = WebMapTileService(url, xml=CAPABILITIES.format(url=url, encoding='RESTful').encode())
+    cache = TileCache(str(tmp_path / 'tiles.sqlite'))
+    for service, tile in ((wmts(httpserver, 'RESTful'), b'a'), (other, b'b')):
+        service.tile_cache = cache
+        # same layer, style, format and tile matrix set, but another service
+        assert service.gettile(layer='world', tilematrix='1', row=0, column=1).read() == tile
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_gettiles_kvp_retries(httpserver):
+    calls = []
+
+    def handler(request):
+        calls.append((request.args['TILEROW'], request.args['TILECOL']))
+        if len(calls) == 1:
+            return Response(status=503)
+        return Response(request.args['TILEROW'] + request.args['TILECOL'], content_type='image/png')
+
+    httpserver.expect_request('/kvp', query_string={
+        'SERVICE': 'WMTS', 'REQUEST': 'GetTile', 'VERSION': '1.0.0', 'LAYER': 'world', 'STYLE': 'default',
+        'TILEMATRIXSET': 'grid', 'TILEMATRIX': '1', 'TILEROW': '1', 'TILECOL': '0', 'FORMAT': 'image/png',
+        'map': 'x'}).respond_with_handler(handler)
+
+    service = wmts(httpserver, 'KVP')
+    assert not service.restonly
+    tiles = list(service.gettiles('world', 'grid', '1', [(1, 0)], backoff=0, map='x'))
+    assert tiles == [(1, 0, b'10')]
+    assert len(calls) == 2
+
+    with pytest.raises(HTTPError):
+        list(service.gettiles('world', 'grid', '1', [(5, 5)], retries=1, backoff=0))
+
+
+def test_tile_templates():
+    with open(resource_file('geoserver21-wmts-cap.xml'), 'rb') as f:
+        service = WebMapTileService('http://example.org/wmts', xml=f.read())
+
+    template = service.tiletemplate('geonode:LMEs_64', tilematrixset='EPSG:4326', map='x')
+    assert isinstance(template, TileURLTemplate)
+    assert template.url('EPSG:4326:3', 1, 2) == 'http://geonode.iwlearn.org/geoserver/gwc/service/wmts?' + \
+        service.buildTileRequest(layer='geonode:LMEs_64', tilematrixset='EPSG:4326', tilematrix='EPSG:4326:3',
+                                 row=1, column=2, map='x')
+    # resolved once, until the capabilities are reloaded
+    assert service.tiletemplate('geonode:LMEs_64', tilematrixset='EPSG:4326', map='x') is template
+    service._buildMetadata()
+    assert service.tiletemplate('geonode:LMEs_64', tilematrixset='EPSG:4326', map='x') is not template
+
+    # ResourceURL template variables are matched without regard to case
+    with open(resource_file('sfs-wmts-cap-world.xml'), 'rb') as f:
+        service = WebMapTileService('http://example.org/wmts', xml=f.read())
+    assert service.buildTileResource(layer='World', tilematrix='0', row=1, column=2) == \
+        'http://server.caris.com/spatialfusionserver/services/ows/wmts/World/World/default/GlobalCRS84Scale/0/1/2.png'
+
+    template = TileURLTemplate(['http://a/{0}/{1}/{2:03d}', 'http://b/{0}/{1}/{2:03d}'])
+    assert [template.url('z', 1, 2) for _ in range(3)] == ['http://a/z/1/002', 'http://b/z/1/002', 'http://a/z/1/002']
+
+
+def test_tile_templates_bounded(monkeypatch):
+    monkeypatch.setattr(wmts_module, 'TILEROUTING_CACHE_SIZE', 8)
+    with open(resource_file('geoserver21-wmts-cap.xml'), 'rb') as f:
+        service = WebMapTileService('http://example.org/wmts', xml=f.read())
+
+    # a template per dimension value, the least recently used being dropped
+    first = service.tiletemplate('geonode:LMEs_64', tilematrixset='EPSG:4326', TIME='2000')
+    for year in range(2001, 2020):
+        template = service.tiletemplate('geonode:LMEs_64', tilematrixset='EPSG:4326', TIME=str(year))
+        assert 'TIME=%d' % year in template.url('EPSG:4326:3', 1, 2)
+    assert len(service._tilerouting) == 8
+    assert service.tiletemplate('geonode:LMEs_64', tilematrixset='EPSG:4326', TIME='2019') is template
+    assert service.tiletemplate('geonode:LMEs_64', tilematrixset='EPSG:4326', TIME='2000') is not first
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(50)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.wait()
+    assert time.monotonic() - start >= 0.1
+
+    with pytest.raises(ValueError):
+        RateLimiter(0)
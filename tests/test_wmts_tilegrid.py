@@ -0,0 +1,104 @@
+import subprocess
+import sys
+
+import pytest
+
+from owslib.wmts import WebMapTileService
+from tests.utils import resource_file
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.fixture(scope='module')
+def wmts():
+    with open(resource_file('geoserver21-wmts-cap.xml'), 'rb') as f:
+        return WebMapTileService('http://example.org/wmts', xml=f.read())
+
+
+def test_tile_ranges(wmts):
+    tms = wmts.tilematrixsets['EPSG:4326']  # urn:ogc:def:crs:EPSG::4326, in latitude, longitude order
+    assert tms.metersperunit == pytest.approx(111319.49079327358)
+
+    ranges = tms.tile_ranges((-180, -90, 180, 90))
+    assert list(ranges) == list(tms.tilematrix)
+    assert ranges['EPSG:4326:0'].tolist() == [0, 1, 0, 0]
+    assert ranges['EPSG:4326:3'].tolist() == [0, 15, 0, 7]
+
+    # tiles sharing only an edge with the bounding box are not included
+    assert tms.tile_ranges((0, 0, 22.5, 22.5), ['EPSG:4326:3'])['EPSG:4326:3'].tolist() == [8, 8, 3, 3]
+
+    # outside of the tile matrix
+    mincol, maxcol, minrow, maxrow = tms.tile_ranges((200, 0, 210, 10), ['EPSG:4326:3'])['EPSG:4326:3']
+    assert mincol > maxcol
+
+    # batches of bounding boxes
+    boxes = np.array([[-180, -90, 180, 90], [0, 0, 22.5, 22.5], [-1, -1, 1, 1]])
+    assert tms.tile_ranges(boxes, ['EPSG:4326:3'])['EPSG:4326:3'].tolist() == [
+        [0, 15, 0, 7], [8, 8, 3, 3], [7, 8, 3, 4]]
+
+    merc = wmts.tilematrixsets['EPSG:900913']
+    assert merc.metersperunit == 1
+    extent = 20037508.34
+    assert merc.tile_ranges((0, 0, extent, extent), ['EPSG:900913:2'])['EPSG:900913:2'].tolist() == [2, 3, 0, 1]
+
+
+def test_tile_ranges_limits(wmts):
+    tms = wmts.tilematrixsets['EPSG:4326']
+    link = wmts.contents['geonode:LMEs_64'].tilematrixsetlinks['EPSG:4326']
+    limits = link.tilematrixlimits['EPSG:4326:3']
+
+    ranges = tms.tile_ranges((-180, -90, 180, 90), ['EPSG:4326:3'], limits=link)
+    assert ranges['EPSG:4326:3'].tolist() == [
+        max(0, limits.mintilecol), min(15, limits.maxtilecol),
+        max(0, limits.mintilerow), min(7, limits.maxtilerow)]
+
+    tiles = tms.tiles((-180, -90, 180, 90), 'EPSG:4326:3')
+    assert tiles.shape == (128, 2)
+    assert tiles[:3].tolist() == [[0, 0], [0, 1], [0, 2]]
+    inside = link.contains('EPSG:4326:3', tiles[:, 0], tiles[:, 1])
+    assert inside.sum() == len(tms.tiles((-180, -90, 180, 90), 'EPSG:4326:3', limits=link))
+    assert link.contains('unknown', [0, 1], [0, 1]).all()
+
+
+def test_tile_bounds_and_transforms(wmts):
+    tms = wmts.tilematrixsets['EPSG:4326']
+
+    bounds = tms.tile_bounds('EPSG:4326:3', [0, 1], [0, 8])
+    np.testing.assert_allclose(bounds, [[-180, 67.5, -157.5, 90], [0, 45, 22.5, 67.5]])
+
+    px, py = tms.map_to_pixel('EPSG:4326:0', [-180, 0], [90, 0])
+    np.testing.assert_allclose(px, [0, 256])
+    np.testing.assert_allclose(py, [0, 128])
+
+    x, y = tms.pixel_to_map('EPSG:4326:0', px, py)
+    np.testing.assert_allclose(x, [-180, 0])
+    np.testing.assert_allclose(y, [90, 0])
+
+
+def test_metersperunit():
+    with open(resource_file('geoserver21-wmts-cap.xml'), 'rb') as f:
+        tms = WebMapTileService('http://example.org/wmts', xml=f.read()).tilematrixsets['EPSG:4326']
+    # projected CRSs of the EPSG 4000 to 4999 range are not in degrees
+    tms.crs = 'EPSG:4087'
+    assert tms.metersperunit == 1
+
+    # given by the caller, for CRSs in other units
+    tms.metersperunit = 0.3048
+    span = tms.tilematrix['EPSG:4326:0'].scaledenominator * 0.28e-3 / 0.3048
+    assert tms.pixelspan('EPSG:4326:0') == pytest.approx(span)
+
+
+def test_metersperunit_pyproj():
+    pytest.importorskip('pyproj')
+    with open(resource_file('geoserver21-wmts-cap.xml'), 'rb') as f:
+        tms = WebMapTileService('http://example.org/wmts', xml=f.read()).tilematrixsets['EPSG:4326']
+    tms.crs = 'EPSG:2263'  # NAD83 / New York Long Island (ftUS)
+    assert tms.metersperunit == pytest.approx(0.3048006)
+
+
+def test_optional_imports():
+    # numpy and pyproj are only imported once used
+    code = 'import sys, owslib.wmts, owslib.swe.common, owslib.waterml.wml; print("numpy" in sys.modules, ' \
+           '"pyproj" in sys.modules)'
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ['False', 'False']
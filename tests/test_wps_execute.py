@@ -2,6 +2,7 @@
 # This test does not execute any live HTTP request, rather it parses XML files containing pre-made HTTP responses.
 
 from tests.utils import resource_file
+from owslib.util import HTTPSession
 from owslib.wps import WebProcessingService
 
 
@@ -27,3 +28,19 @@ def test_wps_execute():
     output = execution.processOutputs[0]
     assert output.reference == \
         'http://cida.usgs.gov/climate/gdp/process/RetrieveResultServlet?id=1318528582026OUTPUT.601bb3d0-547f-4eab-8642-7c7d2834459e'  # noqa
+
+
+def test_wps_execute_output_session(httpserver, tmp_path):
+    httpserver.expect_request('/output').respond_with_data('1,2,3', content_type='text/csv')
+    session = HTTPSession()
+    wps = WebProcessingService('http://cida.usgs.gov/gdp/process/WebProcessingService', skip_caps=True,
+                               session=session)
+    request = open(resource_file('wps_USGSExecuteRequest1.xml'), 'rb').read()
+    response = open(resource_file('wps_USGSExecuteResponse1b.xml'), 'rb').read()
+    execution = wps.execute(None, [], request=request, response=response)
+
+    # the referenced outputs are retrieved with the session of the service
+    execution.processOutputs[0].reference = httpserver.url_for('/output')
+    execution.getOutput(filepath=str(tmp_path / 'output.csv'))
+    assert (tmp_path / 'output.csv').read_bytes() == b'1,2,3'
+    assert session.stats['localhost']['requests'] == 1